@@ -38,6 +38,8 @@ Architecture:
 Version: 1.1.0
 """
 
+import asyncio
+import functools
 import hashlib
 import json
 import logging
@@ -60,6 +62,8 @@ from fda_tools.lib.subprocess_helpers import (
     SubprocessAllowlistError,
 )
 
+from fda_tools.lib.quantile_sketch import QuantileSketch
+
 # FDA-312: Training records — §11.10(i) compliance
 from fda_tools.lib.training_records import training_store, TrainingTopic, PART_11_CORE_TOPICS
 
@@ -118,6 +122,34 @@ PLUGIN_ROOT = Path(__file__).parent.parent
 COMMANDS_DIR = PLUGIN_ROOT / "commands"
 SCRIPTS_DIR = PLUGIN_ROOT / "scripts"
 
+# Warm worker pool for /execute (0 workers = spawn a subprocess per request)
+BRIDGE_WORKERS = int(os.getenv("FDA_BRIDGE_WORKERS", "2"))
+BRIDGE_WORKER_MAX_JOBS = int(os.getenv("FDA_BRIDGE_WORKER_MAX_JOBS", "100"))
+BRIDGE_WORKER_MAX_RSS_MB = int(os.getenv("FDA_BRIDGE_WORKER_MAX_RSS_MB", "1024"))
+_worker_pool: Optional[Any] = None
+_worker_pool_lock = threading.Lock()
+
+
+def _get_worker_pool() -> Optional[Any]:
+    """Return the shared WarmWorkerPool, creating it on first use (None if disabled)."""
+    global _worker_pool
+    if BRIDGE_WORKERS <= 0:
+        return None
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            from fda_tools.bridge.worker_pool import WarmWorkerPool
+            _worker_pool = WarmWorkerPool(
+                scripts_dir=SCRIPTS_DIR,
+                cwd=PLUGIN_ROOT,
+                size=BRIDGE_WORKERS,
+                max_jobs=BRIDGE_WORKER_MAX_JOBS,
+                max_rss_mb=BRIDGE_WORKER_MAX_RSS_MB,
+                extra_sys_path=[str(PLUGIN_ROOT.parent)],
+            )
+            _worker_pool.start()
+        return _worker_pool
+
+
 # Security gateway (lazy-initialized on first use to avoid circular imports)
 _security_gateway: Optional[Any] = None
 
@@ -161,8 +193,11 @@ AUDIT_LOG: List[Dict[str, Any]] = []
 _metrics_lock = threading.Lock()
 _total_requests: int = 0
 _total_errors: int = 0
-# Sliding window of recent response durations (max 1000 entries)
-_request_durations_ms: List[float] = []
+# Recent response durations as quantile sketches: the current window and the
+# previous one, each covering REQUEST_DURATION_WINDOW requests (fixed memory)
+REQUEST_DURATION_WINDOW = 1000
+_request_durations_ms = QuantileSketch()
+_prev_request_durations_ms = QuantileSketch()
 _last_request_time: Optional[float] = None
 _consecutive_health_failures: int = 0
 
@@ -506,6 +541,7 @@ async def require_api_key(api_key: Optional[str] = Security(api_key_header)) ->
 async def log_requests(request: Request, call_next):
     """Log all incoming requests with timing, sanitized details, and metrics tracking."""
     global _total_requests, _total_errors, _last_request_time
+    global _request_durations_ms, _prev_request_durations_ms
     start = time.time()
     client_ip = request.client.host if request.client else "unknown"
     method = request.method
@@ -524,9 +560,10 @@ async def log_requests(request: Request, call_next):
         _last_request_time = time.time()
         if response.status_code >= 400:
             _total_errors += 1
-        _request_durations_ms.append(float(duration_ms))
-        if len(_request_durations_ms) > 1000:
-            _request_durations_ms.pop(0)
+        _request_durations_ms.add(float(duration_ms))
+        if _request_durations_ms.count >= REQUEST_DURATION_WINDOW:
+            _prev_request_durations_ms = _request_durations_ms
+            _request_durations_ms = QuantileSketch()
 
     # Audit log for non-health/metrics endpoints
     if path not in ("/health", "/ready", "/metrics"):
@@ -625,10 +662,11 @@ def execute_fda_command(
     channel: str,
 ) -> Dict[str, Any]:
     """
-    Execute FDA command via subprocess.
+    Execute FDA command in a warm worker (or a subprocess if the pool is disabled).
 
     Executes the corresponding Python script for the command with timeout
-    enforcement, output capture, and signal handling.
+    enforcement, output capture, and signal handling. Blocking: call from a
+    thread, not the event loop.
 
     Args:
         command: Command name (e.g., "batchfetch", "review")
@@ -679,16 +717,21 @@ def execute_fda_command(
     cmd_env = {"PYTHONPATH": str(PLUGIN_ROOT.parent)}
 
     try:
-        # Execute command using shared subprocess utility
-        result = run_command(
-            cmd_parts,
-            timeout=timeout,
-            cwd=PLUGIN_ROOT,
-            env=cmd_env,
-            capture_output=True,
-            text=True,
-            allowlist=["python3", "python"],
-        )
+        pool = _get_worker_pool()
+        if pool is not None:
+            # Pre-imported worker; same CompletedProcess/exception contract as run_command
+            result = pool.run(script_path, cmd_parts[2:], timeout=timeout)
+        else:
+            # Execute command using shared subprocess utility
+            result = run_command(
+                cmd_parts,
+                timeout=timeout,
+                cwd=PLUGIN_ROOT,
+                env=cmd_env,
+                capture_output=True,
+                text=True,
+                allowlist=["python3", "python"],
+            )
 
         # Combine stdout and stderr for complete output
         output = result.stdout
@@ -804,6 +847,13 @@ def execute_fda_command(
 # Alert Helpers (FDA-141)
 # ============================================================
 
+def _recent_request_durations() -> QuantileSketch:
+    """Merge the current and previous duration windows. Call with _metrics_lock held."""
+    durations = _prev_request_durations_ms.copy()
+    durations.merge(_request_durations_ms)
+    return durations
+
+
 def _check_alerts() -> List[Dict[str, Any]]:
     """Return active alerts based on current metrics thresholds.
 
@@ -817,7 +867,7 @@ def _check_alerts() -> List[Dict[str, Any]]:
     with _metrics_lock:
         total = _total_requests
         errors = _total_errors
-        durations = list(_request_durations_ms)
+        durations = _recent_request_durations()
         consecutive = _consecutive_health_failures
 
     if total > 0:
@@ -831,10 +881,8 @@ def _check_alerts() -> List[Dict[str, Any]]:
                 "message": f"Error rate {error_rate:.1f}% exceeds threshold {ALERT_ERROR_RATE_PCT}%",
             })
 
-    if durations:
-        sorted_durations = sorted(durations)
-        p95_index = max(0, int(len(sorted_durations) * 0.95) - 1)
-        p95_ms = sorted_durations[p95_index]
+    if durations.count:
+        p95_ms = durations.quantile(0.95)
         if p95_ms > ALERT_RESPONSE_TIME_MS:
             alerts.append({
                 "type": "slow_responses",
@@ -983,22 +1031,20 @@ async def get_metrics(
     with _metrics_lock:
         total = _total_requests
         errors = _total_errors
-        durations = list(_request_durations_ms)
+        durations = _recent_request_durations()
         last_req = _last_request_time
 
     error_rate_pct = round(errors / total * 100, 2) if total > 0 else 0.0
 
     # Response time percentiles
-    sorted_durations = sorted(durations) if durations else []
-    n = len(sorted_durations)
+    n = durations.count
 
     def _percentile(pct: float) -> float:
-        if not sorted_durations:
+        if not n:
             return 0.0
-        idx = max(0, int(n * pct) - 1)
-        return round(sorted_durations[idx], 1)
+        return round(durations.quantile(pct), 1)
 
-    avg_ms = round(sum(durations) / n, 1) if n > 0 else 0.0
+    avg_ms = round(durations.sum / n, 1) if n > 0 else 0.0
 
     # Memory usage (RSS in MB)
     memory_mb = round(
@@ -1106,13 +1152,16 @@ async def execute_command(
 
     # Execute command
     try:
-        result = execute_fda_command(
+        # Run in a thread so a long command does not block other requests
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, functools.partial(
+            execute_fda_command,
             command=request_obj.command,
             args=request_obj.args,
             user_id=request_obj.user_id,
             session_id=session_id,
             channel=request_obj.channel,
-        )
+        ))
 
         # Merge security decision into result
         result["classification"] = decision.classification
@@ -1581,6 +1630,176 @@ def _match_guidance_keywords(query: str, limit: int = 5) -> List["ResearchHit"]:
     return hits[:limit]
 
 
+# Shared openFDA client and response cache for /research/search.
+# TTL 0 disables the cache.
+RESEARCH_CACHE_TTL = int(os.getenv("FDA_BRIDGE_RESEARCH_CACHE_TTL", "300"))
+RESEARCH_CACHE_ENTRIES = int(os.getenv("FDA_BRIDGE_RESEARCH_CACHE_ENTRIES", "512"))
+RESEARCH_HTTP_TIMEOUT = 8.0
+_research_client: Optional[Any] = None
+_research_cache: Optional[Any] = None
+
+
+def _get_research_client() -> Any:
+    """Return the application-lifetime httpx.AsyncClient, creating it on first use."""
+    global _research_client
+    if _research_client is None or _research_client.is_closed:
+        import httpx  # local import — available via FastAPI dependency chain
+        _research_client = httpx.AsyncClient(
+            timeout=RESEARCH_HTTP_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _research_client
+
+
+def _get_research_cache() -> Optional[Any]:
+    """Return the /research/search response cache (None if disabled)."""
+    global _research_cache
+    if RESEARCH_CACHE_TTL <= 0:
+        return None
+    if _research_cache is None:
+        from fda_tools.lib.memory_cache import MemoryLRUCache
+        _research_cache = MemoryLRUCache(
+            max_entries=RESEARCH_CACHE_ENTRIES,
+            max_bytes=16 * 1024 * 1024,
+            ttl_seconds=RESEARCH_CACHE_TTL,
+        )
+    return _research_cache
+
+
+def _research_cache_key(query: str, sources: List[str], product_code: Optional[str], limit: int) -> str:
+    """Cache key for a search; source order and duplicates do not matter."""
+    return json.dumps([query, sorted(set(sources)), product_code, limit])
+
+
+def _openfda_results(r: Any) -> Optional[List[Dict[str, Any]]]:
+    """Results of an openFDA response; [] for 404 (openFDA's "no matches"), None on failure."""
+    if r.status_code == 404:
+        return []
+    if r.status_code != 200:
+        return None
+    return r.json().get("results", [])
+
+
+async def _search_510k(client: Any, query: str, limit: int,
+                       product_code: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+    """Query openFDA 510(k) clearances. Returns None if the source failed."""
+    search_str = f'device_name:"{query}"'
+    if product_code:
+        search_str += f"+AND+product_code:{product_code}"
+    r = await client.get(
+        "https://api.fda.gov/device/510k.json",
+        params={"search": search_str, "limit": min(limit, 10)},
+    )
+    results = _openfda_results(r)
+    if results is None:
+        return None
+    return [
+        ResearchHit(
+            id=item.get("k_number", ""),
+            title=f'{item.get("device_name", "Unknown")} ({item.get("k_number", "")})',
+            source="510k",
+            score=0.85,
+            excerpt=(
+                f'Applicant: {item.get("applicant", "N/A")}. '
+                f'Decision: {item.get("decision_description", "N/A")}. '
+                f'Date: {item.get("decision_date_str", "N/A")}.'
+            ),
+            metadata={
+                "k_number": item.get("k_number"),
+                "applicant": item.get("applicant"),
+                "product_code": item.get("product_code"),
+                "decision_date": item.get("decision_date_str"),
+                "device_class": item.get("device_class"),
+                "decision_code": item.get("decision_code"),
+            },
+            url=None,
+        ).model_dump()
+        for item in results
+    ]
+
+
+async def _search_maude(client: Any, query: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+    """Query openFDA MAUDE adverse events. Returns None if the source failed."""
+    r = await client.get(
+        "https://api.fda.gov/device/event.json",
+        params={
+            "search": f'device.brand_name:"{query}"',
+            "limit": min(limit, 5),
+        },
+    )
+    results = _openfda_results(r)
+    if results is None:
+        return None
+    hits = []
+    for item in results:
+        mdr_text = ""
+        mdr_entries = item.get("mdr_text") or []
+        if mdr_entries:
+            mdr_text = str(mdr_entries[0].get("text", ""))[:200]
+        hits.append(ResearchHit(
+            id=item.get("report_number", ""),
+            title=(
+                f'MDR {item.get("report_number", "")}: '
+                f'{item.get("event_type", "Adverse Event")} — '
+                f'{item.get("date_report", "")}'
+            ),
+            source="maude",
+            score=0.70,
+            excerpt=mdr_text or "No narrative text available.",
+            metadata={
+                "report_number": item.get("report_number"),
+                "event_type": item.get("event_type"),
+                "date_report": item.get("date_report"),
+                "remedial_action": item.get("remedial_action"),
+            },
+            url=None,
+        ).model_dump())
+    return hits
+
+
+async def _search_recalls(client: Any, query: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+    """Query openFDA device recalls. Returns None if the source failed."""
+    r = await client.get(
+        "https://api.fda.gov/device/recall.json",
+        params={
+            "search": f'product_description:"{query}"',
+            "limit": min(limit, 5),
+        },
+    )
+    results = _openfda_results(r)
+    if results is None:
+        return None
+    return [
+        ResearchHit(
+            id=item.get("recall_number", ""),
+            title=f'Recall {item.get("recall_number", "")}: {item.get("recalling_firm", "")}',
+            source="recalls",
+            score=0.75,
+            excerpt=item.get("reason_for_recall", "")[:200],
+            metadata={
+                "recall_number": item.get("recall_number"),
+                "recalling_firm": item.get("recalling_firm"),
+                "recall_class": item.get("recall_class"),
+                "status": item.get("status"),
+            },
+            url=None,
+        ).model_dump()
+        for item in results
+    ]
+
+
+async def _timed_source(source: str, coro: Any) -> tuple:
+    """Await one source query; returns (source, hits or None on failure, latency ms)."""
+    t0 = time.monotonic()
+    try:
+        hits = await coro
+    except Exception as exc:
+        logger.warning("%s search failed: %s", source, exc)
+        hits = None
+    return source, hits, round((time.monotonic() - t0) * 1000, 1)
+
+
 @app.post("/research/search")
 @_rate_limit(RATE_LIMIT_DEFAULT)
 async def research_search(
@@ -1594,137 +1813,70 @@ async def research_search(
     Searches across openFDA 510(k) database, MAUDE adverse events,
     and a keyword-ranked FDA guidance corpus.  Pgvector cosine search
     will replace the guidance tier once embeddings are seeded (FDA-315).
-    """
-    import httpx  # local import — available via FastAPI dependency chain
 
+    openFDA sources are queried concurrently over a shared pooled
+    httpx.AsyncClient.  Complete responses are cached for
+    FDA_BRIDGE_RESEARCH_CACHE_TTL seconds keyed on (query, sources,
+    product_code, limit); ``source_latency_ms`` reports per-source timing.
+    """
     t0 = time.monotonic()
-    results: List[Dict[str, Any]] = []
-    sources_searched: List[str] = []
     query = body.query.strip()
 
     audit_log_entry("research_search", {"query": query[:100], "sources": body.sources})
 
-    async with httpx.AsyncClient(timeout=8.0, follow_redirects=True) as client:
-
-        # ── 510(k) database ──────────────────────────────────────────────────
-        if "510k" in body.sources:
-            try:
-                search_str = f'device_name:"{query}"'
-                if body.product_code:
-                    search_str += f"+AND+product_code:{body.product_code}"
-                r = await client.get(
-                    "https://api.fda.gov/device/510k.json",
-                    params={"search": search_str, "limit": min(body.limit, 10)},
-                )
-                if r.status_code == 200:
-                    for item in r.json().get("results", []):
-                        results.append(ResearchHit(
-                            id=item.get("k_number", ""),
-                            title=f'{item.get("device_name", "Unknown")} ({item.get("k_number", "")})',
-                            source="510k",
-                            score=0.85,
-                            excerpt=(
-                                f'Applicant: {item.get("applicant", "N/A")}. '
-                                f'Decision: {item.get("decision_description", "N/A")}. '
-                                f'Date: {item.get("decision_date_str", "N/A")}.'
-                            ),
-                            metadata={
-                                "k_number": item.get("k_number"),
-                                "applicant": item.get("applicant"),
-                                "product_code": item.get("product_code"),
-                                "decision_date": item.get("decision_date_str"),
-                                "device_class": item.get("device_class"),
-                                "decision_code": item.get("decision_code"),
-                            },
-                            url=None,
-                        ).model_dump())
-                    sources_searched.append("510k")
-            except Exception as exc:
-                logger.warning("510k search failed: %s", exc)
-
-        # ── MAUDE adverse events ─────────────────────────────────────────────
-        if "maude" in body.sources:
-            try:
-                r = await client.get(
-                    "https://api.fda.gov/device/event.json",
-                    params={
-                        "search": f'device.brand_name:"{query}"',
-                        "limit": min(body.limit, 5),
-                    },
-                )
-                if r.status_code == 200:
-                    for item in r.json().get("results", []):
-                        mdr_text = ""
-                        mdr_entries = item.get("mdr_text") or []
-                        if mdr_entries:
-                            mdr_text = str(mdr_entries[0].get("text", ""))[:200]
-                        results.append(ResearchHit(
-                            id=item.get("report_number", ""),
-                            title=(
-                                f'MDR {item.get("report_number", "")}: '
-                                f'{item.get("event_type", "Adverse Event")} — '
-                                f'{item.get("date_report", "")}'
-                            ),
-                            source="maude",
-                            score=0.70,
-                            excerpt=mdr_text or "No narrative text available.",
-                            metadata={
-                                "report_number": item.get("report_number"),
-                                "event_type": item.get("event_type"),
-                                "date_report": item.get("date_report"),
-                                "remedial_action": item.get("remedial_action"),
-                            },
-                            url=None,
-                        ).model_dump())
-                    sources_searched.append("maude")
-            except Exception as exc:
-                logger.warning("MAUDE search failed: %s", exc)
-
-        # ── Recalls ──────────────────────────────────────────────────────────
-        if "recalls" in body.sources:
-            try:
-                r = await client.get(
-                    "https://api.fda.gov/device/recall.json",
-                    params={
-                        "search": f'product_description:"{query}"',
-                        "limit": min(body.limit, 5),
-                    },
-                )
-                if r.status_code == 200:
-                    for item in r.json().get("results", []):
-                        results.append(ResearchHit(
-                            id=item.get("recall_number", ""),
-                            title=f'Recall {item.get("recall_number", "")}: {item.get("recalling_firm", "")}',
-                            source="recalls",
-                            score=0.75,
-                            excerpt=item.get("reason_for_recall", "")[:200],
-                            metadata={
-                                "recall_number": item.get("recall_number"),
-                                "recalling_firm": item.get("recalling_firm"),
-                                "recall_class": item.get("recall_class"),
-                                "status": item.get("status"),
-                            },
-                            url=None,
-                        ).model_dump())
-                    sources_searched.append("recalls")
-            except Exception as exc:
-                logger.warning("Recall search failed: %s", exc)
+    cache = _get_research_cache()
+    cache_key = _research_cache_key(query, body.sources, body.product_code, body.limit)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            cached["cached"] = True
+            cached["duration_ms"] = round((time.monotonic() - t0) * 1000, 1)
+            return cached
+
+    client = _get_research_client()
+    tasks = []
+    if "510k" in body.sources:
+        tasks.append(_timed_source("510k", _search_510k(client, query, body.limit, body.product_code)))
+    if "maude" in body.sources:
+        tasks.append(_timed_source("maude", _search_maude(client, query, body.limit)))
+    if "recalls" in body.sources:
+        tasks.append(_timed_source("recalls", _search_recalls(client, query, body.limit)))
+    outcomes = await asyncio.gather(*tasks)
+
+    results: List[Dict[str, Any]] = []
+    sources_searched: List[str] = []
+    source_latency_ms: Dict[str, float] = {}
+    complete = True
+    for source, hits, latency in outcomes:
+        source_latency_ms[source] = latency
+        if hits is None:
+            complete = False
+            continue
+        results.extend(hits)
+        sources_searched.append(source)
 
     # ── Guidance (keyword corpus) ────────────────────────────────────────────
     if "guidance" in body.sources:
+        g0 = time.monotonic()
         guidance_hits = _match_guidance_keywords(query, limit=min(body.limit, 5))
         results.extend([h.model_dump() for h in guidance_hits])
         if guidance_hits:
             sources_searched.append("guidance")
+        source_latency_ms["guidance"] = round((time.monotonic() - g0) * 1000, 1)
 
-    duration_ms = round((time.monotonic() - t0) * 1000, 1)
-    return {
+    response = {
         "results": results,
         "total": len(results),
         "sources_searched": sources_searched,
+        "source_latency_ms": source_latency_ms,
         "query": query,
-        "duration_ms": duration_ms,
+        "cached": False,
     }
+    # Partial results (a source errored or was rate limited) are not cached
+    if cache is not None and complete:
+        cache.set(cache_key, response)
+    response["duration_ms"] = round((time.monotonic() - t0) * 1000, 1)
+    return response
 
 
 # ── FDA-309: HITL gate endpoints ─────────────────────────────────────────────
@@ -2211,6 +2363,13 @@ async def startup_event():
     active = store.count()
     logger.info(f"Sessions loaded from persistent store: {active} active.")
 
+    # Warm worker pool for /execute
+    if _get_worker_pool() is not None:
+        logger.info(f"Command workers: {BRIDGE_WORKERS} warm worker(s) "
+                    f"(recycle after {BRIDGE_WORKER_MAX_JOBS} jobs or {BRIDGE_WORKER_MAX_RSS_MB} MB)")
+    else:
+        logger.info("Command workers: DISABLED (subprocess per request)")
+
     logger.info("=" * 70)
     logger.info("Server is ready to accept authenticated connections.")
     logger.info("=" * 70)
@@ -2222,6 +2381,11 @@ async def shutdown_event():
     logger.info("Server shutting down...")
     logger.info(f"Total sessions active: {_get_session_store().count()}")
     logger.info(f"Total audit entries: {len(AUDIT_LOG)}")
+    if _worker_pool is not None:
+        logger.info(f"Command worker stats: {_worker_pool.get_stats()}")
+        _worker_pool.shutdown()
+    if _research_client is not None:
+        await _research_client.aclose()
 
 
 # ============================================================
@@ -0,0 +1,315 @@
+"""
+Warm worker pool for the bridge server's /execute endpoint.
+
+Running ``python3 scripts/<command>.py`` per request pays interpreter
+startup plus the import of requests, pandas, etc. every time. This pool
+keeps a few long-lived worker processes that have already imported the
+heavy dependencies and run command scripts in-process with ``runpy``
+(``__name__ == "__main__"``, ``sys.argv`` set, stdout/stderr captured).
+
+  - Same contract as run_command(): returns subprocess.CompletedProcess,
+    raises SubprocessTimeoutError / SubprocessAllowlistError
+  - Allowlist: only ``*.py`` files directly inside the scripts directory
+  - Timeouts: a worker that overruns is killed and replaced
+  - Recycling: a worker is replaced after ``max_jobs`` jobs or when its RSS
+    exceeds ``max_rss_mb`` (scripts may leak module state or memory)
+  - Per-job isolation: sys.argv, sys.path, os.environ, the working
+    directory and the root logger's handlers/level are restored after every
+    job (a script's logging.basicConfig() would otherwise stay bound to that
+    job's captured stderr)
+  - Workers are started with the "spawn" method so they never inherit the
+    server's event loop or threads
+
+Usage:
+    from fda_tools.bridge.worker_pool import WarmWorkerPool
+
+    pool = WarmWorkerPool(scripts_dir=SCRIPTS_DIR, cwd=PLUGIN_ROOT, size=2)
+    pool.start()
+    result = pool.run(SCRIPTS_DIR / "batchfetch.py", ["--product-code", "DQY"], timeout=60)
+    pool.shutdown()
+"""
+
+import contextlib
+import importlib
+import io
+import logging
+import multiprocessing
+import os
+import queue
+import resource
+import runpy
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from fda_tools.lib.subprocess_helpers import (
+    SubprocessAllowlistError,
+    SubprocessTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+# Imported once per worker at startup; missing optional packages are skipped
+DEFAULT_PRELOAD = (
+    "json",
+    "csv",
+    "requests",
+    "pandas",
+    "numpy",
+    "fda_tools.lib.config",
+    "fda_tools.scripts.fda_api_client",
+)
+
+
+def _current_rss_mb() -> float:
+    """Resident set size of this process in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is KB on Linux, bytes on macOS
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_script(script: str, argv: List[str], cwd: str) -> Dict[str, Any]:
+    """Run one script in this process, restoring interpreter state afterwards."""
+    saved_argv, saved_path = sys.argv[:], sys.path[:]
+    saved_env, saved_cwd = dict(os.environ), os.getcwd()
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    try:
+        sys.argv = [script] + list(argv)
+        # Same as `python3 script.py`: the script's directory comes first
+        sys.path.insert(0, os.path.dirname(script))
+        os.chdir(cwd)
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                runpy.run_path(script, run_name="__main__")
+            except SystemExit as e:
+                if e.code is None:
+                    returncode = 0
+                elif isinstance(e.code, int):
+                    returncode = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except BaseException:  # noqa: BLE001 - mirror the interpreter's top level
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        sys.argv, sys.path[:] = saved_argv, saved_path
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+        for handler in root.handlers:
+            if handler not in saved_handlers:
+                handler.close()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+    return {
+        "returncode": returncode,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "rss_mb": _current_rss_mb(),
+    }
+
+
+def _worker_main(conn, extra_sys_path: List[str], preload: Sequence[str]):
+    """Worker process entry point: preload modules, then serve jobs until told to stop."""
+    for path in reversed(extra_sys_path):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    for module in preload:
+        try:
+            importlib.import_module(module)
+        except Exception:  # noqa: BLE001 - preload is best effort
+            pass
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if job is None:
+            break
+        conn.send(_run_script(job["script"], job["argv"], job["cwd"]))
+
+
+class _Worker:
+    def __init__(self, ctx, extra_sys_path: List[str], preload: Sequence[str]):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, extra_sys_path, list(preload)), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        self.rss_mb = 0.0
+
+    def stop(self, timeout: float = 2.0):
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join(5)
+
+
+class WarmWorkerPool:
+    """Pool of pre-imported worker processes running scripts in-process.
+
+    Args:
+        scripts_dir: Only scripts directly inside this directory may run.
+        cwd: Working directory for every job.
+        size: Number of worker processes.
+        max_jobs: Replace a worker after this many jobs.
+        max_rss_mb: Replace a worker whose RSS exceeds this after a job.
+        preload: Modules each worker imports at startup.
+        extra_sys_path: Paths prepended to workers' sys.path (the subprocess
+            path set these through PYTHONPATH).
+    """
+
+    def __init__(
+        self,
+        scripts_dir: Path,
+        cwd: Path,
+        size: int = 2,
+        max_jobs: int = 100,
+        max_rss_mb: float = 1024,
+        preload: Sequence[str] = DEFAULT_PRELOAD,
+        extra_sys_path: Optional[List[str]] = None,
+    ):
+        if size < 1:
+            raise ValueError("size must be positive")
+        self.scripts_dir = Path(scripts_dir).resolve()
+        self.cwd = Path(cwd)
+        self.size = size
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self.preload = tuple(preload)
+        self.extra_sys_path = list(extra_sys_path or [])
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+        self._stats = {"jobs": 0, "recycled": 0, "timeouts": 0, "crashes": 0}
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def _spawn(self) -> _Worker:
+        return _Worker(self._ctx, self.extra_sys_path, self.preload)
+
+    def start(self):
+        """Start the workers (idempotent). Preloading happens in the background."""
+        with self._lock:
+            if self._started:
+                return
+            for _ in range(self.size):
+                self._idle.put(self._spawn())
+            self._started = True
+
+    def _check_allowed(self, script_path: Path) -> Path:
+        resolved = Path(script_path).resolve()
+        if resolved.suffix != ".py" or resolved.parent != self.scripts_dir:
+            raise SubprocessAllowlistError(f"Script not allowed in worker pool: {script_path}")
+        return resolved
+
+    def run(self, script_path: Path, args: Sequence[str], timeout: Optional[float] = None
+            ) -> subprocess.CompletedProcess:
+        """Run a script in a warm worker.
+
+        ``timeout`` covers waiting for a free worker and running the job.
+
+        Raises:
+            SubprocessAllowlistError: Script is outside the scripts directory.
+            SubprocessTimeoutError: No result within ``timeout`` seconds.
+        """
+        script = self._check_allowed(script_path)
+        if self._closed:
+            raise RuntimeError("Worker pool is shut down")
+        self.start()
+        cmd = ["python3", str(script)] + list(args)
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise SubprocessTimeoutError(f"No worker available within {timeout}s: {cmd}") from None
+
+        replace = False
+        try:
+            if not worker.process.is_alive():
+                worker.conn.close()
+                worker.process.join(5)
+                worker = self._spawn()
+            worker.conn.send({"script": str(script), "argv": list(args), "cwd": str(self.cwd)})
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not worker.conn.poll(remaining):
+                self._count("timeouts")
+                replace = True
+                worker.kill()
+                raise SubprocessTimeoutError(f"Command timed out after {timeout}s: {cmd}")
+            try:
+                reply = worker.conn.recv()
+            except EOFError:
+                # The script killed the interpreter (os._exit, fatal signal)
+                self._count("crashes")
+                replace = True
+                worker.process.join(5)
+                code = worker.process.exitcode
+                return subprocess.CompletedProcess(
+                    cmd, code if code is not None else -1, "", "Worker process exited unexpectedly\n"
+                )
+
+            self._count("jobs")
+            worker.jobs += 1
+            worker.rss_mb = reply["rss_mb"]
+            if worker.jobs >= self.max_jobs or worker.rss_mb > self.max_rss_mb:
+                logger.info("Recycling bridge worker after %d jobs (RSS %.0f MB)",
+                            worker.jobs, worker.rss_mb)
+                self._count("recycled")
+                replace = True
+                worker.stop()
+            return subprocess.CompletedProcess(cmd, reply["returncode"], reply["stdout"], reply["stderr"])
+        finally:
+            if replace:
+                worker.conn.close()
+                worker = None if self._closed else self._spawn()
+            if worker is not None:
+                if self._closed:
+                    worker.stop()
+                else:
+                    self._idle.put(worker)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return job, recycle, timeout and crash counters."""
+        with self._lock:
+            stats = dict(self._stats)
+        return {**stats, "size": self.size, "idle": self._idle.qsize(),
+                "max_jobs": self.max_jobs, "max_rss_mb": self.max_rss_mb}
+
+    def shutdown(self):
+        """Stop all idle workers. Busy workers are stopped when their job returns."""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.stop()
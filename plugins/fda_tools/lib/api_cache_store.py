@@ -0,0 +1,386 @@
+"""
+Single-file SQLite store for openFDA API responses.
+
+Replaces the one-JSON-file-per-response layout of ``~/fda-510k-data/api_cache/``
+for large caches, where directory listings, per-file checksum scans and inode
+usage dominate.  All entries live in one WAL-mode database file next to the
+legacy files (``api_cache.db``):
+
+  - Same keys as ``FDAClient._cache_key`` (sha256 prefix of endpoint+params)
+  - Per-entry SHA-256 checksum of the canonical JSON payload, verified on
+    every read; mismatching rows are invalidated and reported to the audit
+    callback like ``cache_integrity`` does for files
+  - Per-entry ``cached_at`` timestamp for TTL checks (indexed)
+  - Entry count and byte totals maintained by triggers, so stats are O(1)
+  - WAL journal: concurrent readers across processes, one writer at a time
+
+Checksums use the same canonical serialization as ``cache_integrity``
+envelopes, so migrated entries keep their original checksum.
+
+Usage:
+    from fda_tools.lib.api_cache_store import SQLiteCacheStore
+
+    store = SQLiteCacheStore("~/fda-510k-data/api_cache/api_cache.db")
+    store.set(key, data)
+    data = store.get(key, ttl_seconds=604800)
+    store.stats(ttl_seconds=604800)
+
+    # One-time migration from the legacy directory
+    store.migrate_from_directory("~/fda-510k-data/api_cache")
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Database file name inside the API cache directory
+DEFAULT_DB_NAME = "api_cache.db"
+
+# Seconds to wait for a competing writer before raising "database is locked"
+BUSY_TIMEOUT_MS = 10000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key        TEXT PRIMARY KEY,
+    payload    BLOB NOT NULL,
+    checksum   TEXT NOT NULL,
+    cached_at  REAL NOT NULL,
+    size_bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_cached_at ON entries(cached_at);
+
+CREATE TABLE IF NOT EXISTS totals (
+    id          INTEGER PRIMARY KEY CHECK (id = 1),
+    entry_count INTEGER NOT NULL,
+    total_bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, entry_count, total_bytes) VALUES (1, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entry_count = entry_count + 1,
+                      total_bytes = total_bytes + NEW.size_bytes WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entry_count = entry_count - 1,
+                      total_bytes = total_bytes - OLD.size_bytes WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_entries_update AFTER UPDATE OF size_bytes ON entries BEGIN
+    UPDATE totals SET total_bytes = total_bytes - OLD.size_bytes + NEW.size_bytes
+    WHERE id = 1;
+END;
+"""
+
+
+def _serialize(data: Any) -> bytes:
+    """Canonical JSON bytes (identical to cache_integrity's checksum input)."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _checksum(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
+class SQLiteCacheStore:
+    """Checksummed key/value store for API responses in a single SQLite file.
+
+    Thread-safe: each thread uses its own connection. Safe for concurrent
+    use from several processes through SQLite WAL locking.
+
+    Args:
+        db_path: Database file path. Parent directories are created.
+        audit_logger: Optional callable(event_dict) receiving integrity events
+            (``checksum_mismatch``, ``file_invalidated``), using the same event
+            shape as ``cache_integrity``.
+    """
+
+    def __init__(self, db_path, audit_logger: Optional[Callable] = None):
+        self.db_path = Path(os.path.expanduser(str(db_path)))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._audit_logger = audit_logger
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+        conn.commit()
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=BUSY_TIMEOUT_MS / 1000)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self):
+        """Close all connections opened by this store."""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections = []
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Entry access
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, ttl_seconds: Optional[float] = None) -> Optional[Any]:
+        """Return the cached data for ``key``, or None if missing/expired/corrupt.
+
+        Corrupt entries (checksum mismatch or undecodable payload) are deleted.
+        """
+        row = self._conn().execute(
+            "SELECT payload, checksum, cached_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        payload, stored_checksum, cached_at = row
+        payload = bytes(payload)
+
+        computed = _checksum(payload)
+        if computed != stored_checksum:
+            self._invalidate(key, "checksum_mismatch", {
+                "stored_checksum": stored_checksum[:16] + "...",
+                "computed_checksum": computed[:16] + "...",
+            })
+            return None
+
+        if ttl_seconds is not None and time.time() - cached_at > ttl_seconds:
+            return None
+
+        try:
+            return json.loads(payload)
+        except ValueError as e:
+            self._invalidate(key, "corruption_detected", {"error": f"Invalid JSON: {e}"})
+            return None
+
+    def set(self, key: str, data: Any, cached_at: Optional[float] = None):
+        """Store ``data`` under ``key`` with a fresh checksum and timestamp."""
+        payload = _serialize(data)
+        conn = self._conn()
+        with conn:
+            # UPSERT rather than INSERT OR REPLACE: REPLACE's implicit delete
+            # does not fire the totals triggers
+            conn.execute(
+                "INSERT INTO entries (key, payload, checksum, cached_at, size_bytes)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET payload = excluded.payload,"
+                " checksum = excluded.checksum, cached_at = excluded.cached_at,"
+                " size_bytes = excluded.size_bytes",
+                (key, payload, _checksum(payload), cached_at or time.time(), len(payload)),
+            )
+
+    def contains(self, key: str, ttl_seconds: Optional[float] = None) -> bool:
+        """Return True if ``key`` has an entry (fresh, if ``ttl_seconds`` given).
+
+        Does not verify the checksum; use get() for verified reads.
+        """
+        row = self._conn().execute(
+            "SELECT cached_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False
+        return ttl_seconds is None or time.time() - row[0] <= ttl_seconds
+
+    def delete(self, key: str) -> bool:
+        """Delete one entry. Returns True if it existed."""
+        conn = self._conn()
+        with conn:
+            return conn.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount > 0
+
+    def delete_expired(self, ttl_seconds: float) -> int:
+        """Delete entries older than ``ttl_seconds``. Returns the count removed."""
+        conn = self._conn()
+        with conn:
+            return conn.execute(
+                "DELETE FROM entries WHERE cached_at < ?", (time.time() - ttl_seconds,)
+            ).rowcount
+
+    def clear(self) -> int:
+        """Delete all entries. Returns the count removed."""
+        conn = self._conn()
+        with conn:
+            return conn.execute("DELETE FROM entries").rowcount
+
+    def _invalidate(self, key: str, event_type: str, details: Dict):
+        self.delete(key)
+        self._log_event(event_type, key, details)
+        self._log_event("file_invalidated", key, {"reason": event_type})
+
+    def _log_event(self, event_type: str, key: str, details: Optional[Dict] = None):
+        event = {
+            "event": event_type,
+            "file": f"{self.db_path}#{key}",
+            "timestamp": time.time(),
+        }
+        if details:
+            event.update(details)
+        if event_type in ("corruption_detected", "checksum_mismatch"):
+            logger.warning("Cache integrity: %s -- %s", event_type, event["file"])
+        if self._audit_logger:
+            try:
+                self._audit_logger(event)
+            except Exception:
+                pass  # Audit logging failures must not break cache operations
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def stats(self, ttl_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Return entry count, payload bytes and (optionally) expired count.
+
+        Totals come from the trigger-maintained ``totals`` row; the expired
+        figures are an index range scan on ``cached_at``. No payload is read.
+        """
+        conn = self._conn()
+        entry_count, total_bytes = conn.execute(
+            "SELECT entry_count, total_bytes FROM totals WHERE id = 1"
+        ).fetchone()
+        expired = expired_bytes = 0
+        if ttl_seconds is not None:
+            expired, expired_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries"
+                " WHERE cached_at < ?",
+                (time.time() - ttl_seconds,),
+            ).fetchone()
+        try:
+            file_bytes = self.db_path.stat().st_size
+        except OSError:
+            file_bytes = 0
+        return {
+            "entries": entry_count,
+            "valid": entry_count - expired,
+            "expired": expired,
+            "payload_bytes": total_bytes,
+            "expired_bytes": expired_bytes,
+            "file_bytes": file_bytes,
+        }
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def migrate_from_directory(
+        self,
+        directory,
+        remove_source: bool = False,
+        ttl_seconds: Optional[float] = None,
+    ) -> Dict[str, int]:
+        """Import legacy ``<key>.json`` cache files into the store.
+
+        Integrity envelopes are checksum-verified before import and keep
+        their original ``_cached_at``; legacy (pre-envelope) files are
+        imported with a fresh checksum. Corrupt files are skipped. Existing
+        store entries are only replaced by files that are newer.
+
+        Args:
+            directory: Legacy API cache directory.
+            remove_source: Delete each file once imported (or skipped as
+                corrupt/expired).
+            ttl_seconds: If given, skip files already older than the TTL.
+
+        Returns:
+            Counts: ``migrated``, ``corrupt``, ``expired``, ``errors``.
+        """
+        directory = Path(os.path.expanduser(str(directory)))
+        counts = {"migrated": 0, "corrupt": 0, "expired": 0, "errors": 0}
+        conn = self._conn()
+        now = time.time()
+        batch = []
+        imported_paths = []
+
+        def flush():
+            with conn:
+                conn.executemany(
+                    "INSERT INTO entries (key, payload, checksum, cached_at, size_bytes)"
+                    " VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT(key) DO UPDATE SET payload = excluded.payload,"
+                    " checksum = excluded.checksum, cached_at = excluded.cached_at,"
+                    " size_bytes = excluded.size_bytes"
+                    " WHERE excluded.cached_at > entries.cached_at",
+                    batch,
+                )
+            batch.clear()
+            # Source files are only removed once their rows are committed
+            for path in imported_paths:
+                self._remove(path, remove_source)
+            imported_paths.clear()
+
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                key = entry.name[:-5]
+                try:
+                    with open(entry.path, "r", encoding="utf-8") as f:
+                        envelope = json.load(f)
+                except ValueError:
+                    counts["corrupt"] += 1
+                    self._remove(entry.path, remove_source)
+                    continue
+                except OSError as e:
+                    logger.warning("Cache migration: cannot read %s: %s", entry.path, e)
+                    counts["errors"] += 1
+                    continue
+
+                if not isinstance(envelope, dict) or "data" not in envelope:
+                    counts["corrupt"] += 1
+                    self._remove(entry.path, remove_source)
+                    continue
+
+                payload = _serialize(envelope["data"])
+                checksum = _checksum(payload)
+                stored = envelope.get("_checksum")
+                if stored is not None and stored != checksum:
+                    counts["corrupt"] += 1
+                    self._remove(entry.path, remove_source)
+                    continue
+
+                cached_at = float(envelope.get("_cached_at") or 0)
+                if ttl_seconds is not None and now - cached_at > ttl_seconds:
+                    counts["expired"] += 1
+                    self._remove(entry.path, remove_source)
+                    continue
+
+                batch.append((key, payload, checksum, cached_at, len(payload)))
+                imported_paths.append(entry.path)
+                counts["migrated"] += 1
+                if len(batch) >= 500:
+                    flush()
+
+        if batch:
+            flush()
+        logger.info(
+            "Migrated %d cache files from %s (%d corrupt, %d expired skipped)",
+            counts["migrated"], directory, counts["corrupt"], counts["expired"],
+        )
+        return counts
+
+    @staticmethod
+    def _remove(path, remove_source: bool):
+        if remove_source:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
@@ -52,6 +52,8 @@ from fda_tools.lib.auth import AuthManager, User, Role
 
 Architecture:
     - SQLite database for user/session storage (~/.fda-tools/users.db)
+    - Per-thread pooled WAL connection and validated-session cache for
+      validate_session(); last_activity updates are written behind
     - Argon2id for password hashing (resistance to side-channel attacks)
     - JWT tokens for stateless session validation
     - Audit trail in separate database (~/.fda-tools/audit.db)
@@ -67,6 +69,7 @@ Compliance Mapping:
 Version: 1.0.0 (FDA-185)
 """
 
+import atexit
 import hashlib
 import hmac
 import json
@@ -75,7 +78,9 @@ import os
 import re
 import secrets
 import sqlite3
+import threading
 import time
+import weakref
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -106,6 +111,10 @@ SESSION_TIMEOUT_MINUTES = 30
 SESSION_ABSOLUTE_TIMEOUT_HOURS = 8
 TOKEN_LENGTH = 64  # bytes (512 bits)
 
+# Validated-session cache (validate_session hot path)
+SESSION_CACHE_TTL_SECONDS = 30
+ACTIVITY_FLUSH_INTERVAL_SECONDS = 30  # Coalesce last_activity writes
+
 # Account lockout policy
 MAX_LOGIN_ATTEMPTS = 5
 LOCKOUT_DURATION_MINUTES = 30
@@ -535,6 +544,22 @@ def _init_database():
     logger.info("Initialized authentication databases at %s", FDA_TOOLS_DIR)
 
 
+# Managers with deferred session activity, flushed at interpreter exit
+_live_managers: "weakref.WeakSet[AuthManager]" = weakref.WeakSet()
+
+
+def _flush_live_managers():
+    """Write deferred session activity of every live AuthManager."""
+    for manager in list(_live_managers):
+        try:
+            manager.flush_session_activity()
+        except sqlite3.Error as e:
+            logger.warning("Could not flush session activity at exit: %s", e)
+
+
+atexit.register(_flush_live_managers)
+
+
 # ============================================================
 # AuthManager - Main Authentication Interface
 # ============================================================
@@ -549,7 +574,20 @@ class AuthManager:
     def __init__(self):
         """Initialize AuthManager and ensure database exists."""
         _init_database()
+        self._local = threading.local()
+        self._pending_lock = threading.Lock()
+        self._pending_activity: Dict[int, Tuple[str, str]] = {}
+        self._last_flush = time.monotonic()
         self._cleanup_expired_sessions()
+        _live_managers.add(self)
+
+    def close(self):
+        """Flush deferred session activity and close this thread's pooled connection."""
+        self.flush_session_activity()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
     # --------------------------------------------------------
     # User Management
@@ -646,13 +684,9 @@ class AuthManager:
         Returns:
             User object or None if not found
         """
-        conn = sqlite3.connect(USERS_DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
-        row = cursor.fetchone()
-        conn.close()
+        row = self._users_conn().execute(
+            "SELECT * FROM users WHERE user_id = ?", (user_id,)
+        ).fetchone()
 
         if not row:
             return None
@@ -1196,29 +1230,47 @@ class AuthManager:
     def validate_session(self, token: str) -> Optional[User]:
         """Validate session token and return authenticated user.
 
+        Validated sessions are cached per thread for up to
+        SESSION_CACHE_TTL_SECONDS. The cache is emptied whenever another
+        connection commits to the users database (logout, revocation, user
+        updates, other processes), and expiry is re-checked on every call.
+        Cache hits defer their last_activity update (see
+        flush_session_activity); misses write it through.
+
         Args:
             token: Session token
 
         Returns:
             User object if valid, None if invalid/expired
         """
+        now = datetime.now()
+        sessions = self._session_cache()
+        cached = sessions.pop(token, None)
+        if cached is not None:
+            session, user, cached_at = cached
+            if (time.monotonic() - cached_at < SESSION_CACHE_TTL_SECONDS
+                    and now <= session.expires_at
+                    and now <= session.absolute_expires_at):
+                self._touch_session(session, now, write_through=False)
+                sessions[token] = cached
+                return user
+
+        # The database must reflect deferred extensions before deciding expiry
+        self.flush_session_activity()
+
         session = self._get_session_by_token(token)
         if not session:
             return None
 
-        now = datetime.now()
-
         # Check expiration
         if now > session.expires_at or now > session.absolute_expires_at:
             # Session expired
             user = self.get_user_by_id(session.user_id)
 
             # Delete expired session
-            conn = sqlite3.connect(USERS_DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM sessions WHERE session_id = ?", (session.session_id,))
-            conn.commit()
-            conn.close()
+            conn = self._users_conn()
+            with conn:
+                conn.execute("DELETE FROM sessions WHERE session_id = ?", (session.session_id,))
 
             # Audit log
             self._log_audit_event(
@@ -1236,23 +1288,38 @@ class AuthManager:
             return None
 
         # Update last activity and extend timeout
-        new_expires_at = now + timedelta(minutes=SESSION_TIMEOUT_MINUTES)
-        # Don't extend beyond absolute timeout
-        if new_expires_at > session.absolute_expires_at:
-            new_expires_at = session.absolute_expires_at
-
-        conn = sqlite3.connect(USERS_DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE sessions
-            SET last_activity = ?, expires_at = ?
-            WHERE session_id = ?
-        """, (now.isoformat(), new_expires_at.isoformat(), session.session_id))
-        conn.commit()
-        conn.close()
+        self._touch_session(session, now, write_through=True)
 
         # Return user
-        return self.get_user_by_id(session.user_id)
+        user = self.get_user_by_id(session.user_id)
+        if user:
+            sessions[token] = (session, user, time.monotonic())
+        return user
+
+    def flush_session_activity(self) -> int:
+        """Write deferred last_activity/expires_at updates to the database.
+
+        Called automatically every ACTIVITY_FLUSH_INTERVAL_SECONDS of
+        validate_session() traffic, by close(), and at interpreter exit.
+
+        Returns:
+            Number of sessions updated
+        """
+        with self._pending_lock:
+            pending, self._pending_activity = self._pending_activity, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return 0
+
+        conn = self._users_conn()
+        with conn:
+            conn.executemany("""
+                UPDATE sessions
+                SET last_activity = ?, expires_at = ?
+                WHERE session_id = ?
+            """, [(last_activity, expires_at, session_id)
+                  for session_id, (last_activity, expires_at) in pending.items()])
+        return len(pending)
 
     def get_active_sessions(self, user_id: int) -> List[Session]:
         """Get all active sessions for a user.
@@ -1598,19 +1665,81 @@ class AuthManager:
         Returns:
             Session object or None if not found
         """
-        conn = sqlite3.connect(USERS_DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM sessions WHERE token = ?", (token,))
-        row = cursor.fetchone()
-        conn.close()
+        row = self._users_conn().execute(
+            "SELECT * FROM sessions WHERE token = ?", (token,)
+        ).fetchone()
 
         if not row:
             return None
 
         return self._row_to_session(row)
 
+    def _users_conn(self) -> sqlite3.Connection:
+        """Get this thread's pooled connection to the users database.
+
+        The connection runs in WAL mode so that readers do not block on
+        writers, and is reopened if USERS_DB_PATH changes.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.path != USERS_DB_PATH:
+            if conn is not None:
+                conn.close()
+            conn = sqlite3.connect(USERS_DB_PATH)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.path = USERS_DB_PATH
+            self._local.data_version = None
+            self._local.sessions = {}
+        return conn
+
+    def _session_cache(self) -> Dict[str, Tuple[Session, User, float]]:
+        """Get this thread's validated-session cache.
+
+        PRAGMA data_version changes when any other connection commits to the
+        users database, which empties the cache.
+        """
+        conn = self._users_conn()
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._local.data_version:
+            self._local.data_version = data_version
+            self._local.sessions.clear()
+        return self._local.sessions
+
+    def _touch_session(self, session: Session, now: datetime, write_through: bool):
+        """Record session activity and extend its idle timeout.
+
+        Args:
+            session: Session to update (modified in place)
+            now: Activity time
+            write_through: Write immediately instead of deferring
+        """
+        new_expires_at = now + timedelta(minutes=SESSION_TIMEOUT_MINUTES)
+        # Don't extend beyond absolute timeout
+        if new_expires_at > session.absolute_expires_at:
+            new_expires_at = session.absolute_expires_at
+        session.last_activity = now
+        session.expires_at = new_expires_at
+
+        if write_through:
+            conn = self._users_conn()
+            with conn:
+                conn.execute("""
+                    UPDATE sessions
+                    SET last_activity = ?, expires_at = ?
+                    WHERE session_id = ?
+                """, (now.isoformat(), new_expires_at.isoformat(), session.session_id))
+            return
+
+        with self._pending_lock:
+            self._pending_activity[session.session_id] = (
+                now.isoformat(), new_expires_at.isoformat()
+            )
+            due = time.monotonic() - self._last_flush >= ACTIVITY_FLUSH_INTERVAL_SECONDS
+        if due:
+            self.flush_session_activity()
+
     def _cleanup_expired_sessions(self):
         """Delete all expired sessions."""
         conn = sqlite3.connect(USERS_DB_PATH)
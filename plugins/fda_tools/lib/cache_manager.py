@@ -20,6 +20,10 @@ Usage
     stale = mgr.purge_stale()
     mgr.purge_all()
 
+The openFDA cache may also live in a single SQLite file
+(``api_cache/api_cache.db``, see :mod:`fda_tools.lib.api_cache_store`); its
+entries are counted and purged through the store rather than file scans.
+
 CLI entry point is ``fda_tools.scripts.cache_cli``.
 """
 
@@ -199,6 +203,15 @@ class CacheManager:
                     if entry.is_stale:
                         s.stale_files += 1
                         s.stale_size_bytes += entry.size_bytes
+            if cache_type == "openfda":
+                store = self._api_cache_store()
+                if store is not None:
+                    db = store.stats(ttl_seconds=ttl)
+                    s.total_files += db["entries"]
+                    s.stale_files += db["expired"]
+                    s.total_size_bytes += db["payload_bytes"]
+                    s.stale_size_bytes += db["expired_bytes"]
+                    store.close()
             stats[cache_type] = s
         return stats
 
@@ -221,6 +234,10 @@ class CacheManager:
                             result.bytes_freed += entry.size_bytes
                         except OSError as e:
                             result.errors.append(f"{entry.path}: {e}")
+        store = self._api_cache_store()
+        if store is not None:
+            result.files_removed += store.delete_expired(self._ttls["openfda"])
+            store.close()
         return result
 
     def purge_all(self) -> PurgeResult:
@@ -241,8 +258,32 @@ class CacheManager:
                         result.bytes_freed += entry.size_bytes
                     except OSError as e:
                         result.errors.append(f"{entry.path}: {e}")
+        store = self._api_cache_store()
+        if store is not None:
+            result.files_removed += store.clear()
+            store.close()
         return result
 
+    def migrate_api_cache(self, remove_source: bool = False) -> Dict[str, int]:
+        """Move openFDA cache files into the single-file SQLite store.
+
+        Args:
+            remove_source: Delete each JSON file once it has been imported.
+
+        Returns:
+            Counts from :meth:`SQLiteCacheStore.migrate_from_directory`.
+        """
+        from fda_tools.lib.api_cache_store import DEFAULT_DB_NAME, SQLiteCacheStore
+
+        api_dir = self._dirs["openfda"][0]
+        store = SQLiteCacheStore(api_dir / DEFAULT_DB_NAME)
+        try:
+            return store.migrate_from_directory(
+                api_dir, remove_source=remove_source, ttl_seconds=self._ttls["openfda"]
+            )
+        finally:
+            store.close()
+
     def get_ttls(self) -> Dict[str, int]:
         """Return a copy of the active TTL map (seconds per cache type)."""
         return dict(self._ttls)
@@ -251,6 +292,15 @@ class CacheManager:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _api_cache_store(self):
+        """Open the openFDA SQLite store if one exists, else None."""
+        from fda_tools.lib.api_cache_store import DEFAULT_DB_NAME, SQLiteCacheStore
+
+        db_path = self._dirs["openfda"][0] / DEFAULT_DB_NAME
+        if not db_path.exists():
+            return None
+        return SQLiteCacheStore(db_path)
+
     def _iter_json_files(self, directory: Path):
         """Yield :class:`CacheEntryInfo` for every .json file under *directory*."""
         now = time.time()
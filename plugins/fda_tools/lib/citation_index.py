@@ -0,0 +1,170 @@
+"""
+Reverse citation index for 510(k)/PMA/De Novo document corpora.
+
+Finding which documents mention a device number used to mean a substring
+scan of every document's text for every device -- O(N^2) over the corpus.
+This module builds an Aho-Corasick automaton over all device numbers of
+interest (K/P/N/DEN) and runs it once per document, so the complete
+"cites" / "cited by" maps cost one pass over the total text.
+
+  - Exact, case-sensitive substring semantics (same as ``number in text``)
+  - Overlapping matches are all reported (K123456 inside K1234567 counts)
+  - The scan skips straight to the next possible pattern start while the
+    automaton is at its root, so text without device numbers moves at
+    regex-search speed
+
+Usage:
+    from fda_tools.lib.citation_index import CitationIndex
+
+    index = CitationIndex(['K241335', 'K190001', 'P170019'])
+    index.add_document('K241335', text_a)
+    index.add_document('K250002', text_b)
+    index.cited_by('K190001')        # -> ['K241335', ...]
+    index.citations('K250002')       # -> ['K241335', ...]
+
+    # Or from a {path: text} mapping, indexing every document's own number:
+    index = CitationIndex.from_documents(pdf_data, doc_id=lambda p: basename(p)[:-4])
+"""
+
+import re
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set
+
+
+class AhoCorasick:
+    """Multi-pattern exact string matcher.
+
+    Args:
+        patterns: Strings to search for. Empty strings are ignored.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[str]] = [[]]
+        count = 0
+        for pattern in dict.fromkeys(p for p in patterns if p):
+            self._insert(pattern)
+            count += 1
+        self.pattern_count = count
+        self._build_failure_links()
+        first_chars = "".join(sorted(self._goto[0]))
+        self._first_re = re.compile("[" + re.escape(first_chars) + "]") if first_chars else None
+
+    def _insert(self, pattern: str):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][ch] = nxt
+            state = nxt
+        self._out[state].append(pattern)
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Inherit matches that end here via the failure chain
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return the set of patterns occurring anywhere in ``text``."""
+        found: Set[str] = set()
+        if not text or self._first_re is None:
+            return found
+        goto, fail, out = self._goto, self._fail, self._out
+        search_first = self._first_re.search
+        state = 0
+        i = 0
+        n = len(text)
+        while i < n:
+            if state == 0:
+                m = search_first(text, i)
+                if m is None:
+                    break
+                i = m.start()
+            ch = text[i]
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+            i += 1
+        return found
+
+
+class CitationIndex:
+    """Cites / cited-by maps for a document corpus.
+
+    Args:
+        device_numbers: Device numbers to look for in document text.
+    """
+
+    def __init__(self, device_numbers: Iterable[str]):
+        self._matcher = AhoCorasick(device_numbers)
+        self._cites: Dict[str, Set[str]] = {}
+        self._cited_by: Dict[str, Set[str]] = defaultdict(set)
+
+    @classmethod
+    def from_documents(
+        cls,
+        documents: Mapping[str, Optional[str]],
+        doc_id: Optional[Callable[[str], str]] = None,
+        device_numbers: Optional[Iterable[str]] = None,
+    ) -> "CitationIndex":
+        """Build an index over ``{key: text}``.
+
+        Args:
+            documents: Document text keyed by path or ID. Empty/None texts
+                are indexed as citing nothing.
+            doc_id: Maps a key to the document's device number
+                (default: the key itself).
+            device_numbers: Numbers to search for (default: the device
+                numbers of the documents themselves).
+        """
+        doc_id = doc_id or (lambda key: key)
+        ids = {key: doc_id(key) for key in documents}
+        index = cls(device_numbers if device_numbers is not None else ids.values())
+        for key, text in documents.items():
+            index.add_document(ids[key], text or "")
+        return index
+
+    def add_document(self, doc_id: str, text: str) -> Set[str]:
+        """Index one document. Returns the device numbers it mentions (excluding itself)."""
+        previous = self._cites.pop(doc_id, set())
+        for number in previous:
+            self._cited_by[number].discard(doc_id)
+        found = self._matcher.find_all(text)
+        found.discard(doc_id)
+        self._cites[doc_id] = found
+        for number in found:
+            self._cited_by[number].add(doc_id)
+        return found
+
+    def citations(self, doc_id: str) -> List[str]:
+        """Device numbers mentioned by a document, sorted."""
+        return sorted(self._cites.get(doc_id, ()))
+
+    def cited_by(self, device_number: str) -> List[str]:
+        """Documents that mention a device number, sorted."""
+        return sorted(self._cited_by.get(device_number, ()))
+
+    def cited_by_map(self) -> Dict[str, List[str]]:
+        """``device_number -> [citing documents]`` for every cited number."""
+        return {number: sorted(docs) for number, docs in sorted(self._cited_by.items()) if docs}
+
+    def __len__(self) -> int:
+        return len(self._cites)
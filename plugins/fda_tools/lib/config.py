@@ -437,12 +437,19 @@ class Config:
                 'honest_ua_only': False,
                 'max_retries': 5,
                 'base_backoff': 1.0,
+                'connection_pool_size': 10,
+                'pool_idle_timeout': 60,
+                'keep_alive': False,
                 'verify_ssl': True,
             },
             'cache': {
                 'default_ttl': 604800,  # 7 days
                 'enable_integrity_checks': True,
                 'atomic_writes': True,
+                'api_cache_backend': 'files',
+                'memory_cache_entries': 2048,
+                'memory_cache_mb': 64,
+                'memory_cache_ttl': 3600,
                 # Per-cache-type TTLs (seconds) — FDA-135
                 'ttl_openfda': 2592000,    # 30 days  (openFDA API responses)
                 'ttl_literature': 7776000, # 90 days  (PubMed articles)
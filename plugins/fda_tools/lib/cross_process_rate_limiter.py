@@ -17,6 +17,14 @@ openFDA rate limits:
 Lock file: ~/fda-510k-data/.rate_limit.lock
 State file: ~/fda-510k-data/.rate_limit_state.json
 
+Backends:
+    "file" (default)  JSON timestamp list under a polled flock, as above
+    "mmap"            fixed-size shared-memory ring of timestamps
+                      (lib/shared_rate_window.py): O(1) in-place updates and
+                      waiters sleep exactly until the next slot frees.
+                      Window file: ~/fda-510k-data/.rate_limit_<limit>.window
+    Select with backend="mmap" or FDA_RATE_LIMIT_BACKEND=mmap.
+
 Usage:
 from fda_tools.lib.cross_process_rate_limiter import CrossProcessRateLimiter
 
@@ -29,6 +37,7 @@ from fda_tools.lib.cross_process_rate_limiter import CrossProcessRateLimiter
     print(f"Requests in last minute: {status['requests_last_minute']}")
 """
 
+import asyncio
 import fcntl
 import functools
 import json
@@ -42,6 +51,8 @@ from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, TypeVar
 
+from fda_tools.lib.shared_rate_window import SharedRequestWindow
+
 T = TypeVar('T')
 
 logger = logging.getLogger(__name__)
@@ -50,6 +61,11 @@ logger = logging.getLogger(__name__)
 DEFAULT_DATA_DIR = os.path.expanduser("~/fda-510k-data")
 LOCK_FILE = ".rate_limit.lock"
 STATE_FILE = ".rate_limit_state.json"
+WINDOW_FILE = ".rate_limit_{limit}.window"
+
+# Rate limiter backends ("file" = JSON state file, "mmap" = shared-memory ring)
+RATE_LIMIT_BACKENDS = ("file", "mmap")
+DEFAULT_BACKEND = os.getenv("FDA_RATE_LIMIT_BACKEND", "file")
 
 # openFDA rate limits
 RATE_LIMIT_WITH_KEY = 240      # requests per minute with API key
@@ -69,6 +85,10 @@ MAX_WAIT_SECONDS = 120
 #   0.50s         → passes, but slower recovery when rate-limit slot opens
 POLL_INTERVAL = 0.25
 
+# Upper bound on the random delay added to an mmap-backend wait so that
+# processes woken for the same freed slot do not all retry at once
+WAKE_JITTER_SECONDS = 0.01
+
 # Rate limit validation bounds (Security Hardening - FDA-86)
 VALID_RATE_LIMIT_PERIODS = {"second", "minute", "hour", "day"}
 MIN_RATE_LIMIT = 1
@@ -95,6 +115,7 @@ class CrossProcessRateLimiter:
         requests_per_5min: Optional[int] = None,
         min_delay_seconds: float = 0.0,
         burst_capacity: Optional[int] = None,
+        backend: Optional[str] = None,
     ):
         """Initialize the cross-process rate limiter.
 
@@ -113,6 +134,13 @@ class CrossProcessRateLimiter:
                 acquire() calls within this process. 0.0 = no forced delay.
                 Set to 0.25 to enforce 4 req/sec maximum burst rate.
             burst_capacity: Informational only; stored for stats display.
+            backend: "file" or "mmap". Default: FDA_RATE_LIMIT_BACKEND
+                environment variable, else "file". Processes only share
+                a window with processes using the same backend (and, for
+                "mmap", the same requests_per_minute).
+
+        Raises:
+            ValueError: If backend is not a known backend.
         """
         self.data_dir = Path(data_dir or DEFAULT_DATA_DIR)
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -129,6 +157,19 @@ class CrossProcessRateLimiter:
 
         self.burst_capacity = burst_capacity
 
+        self.backend = backend or DEFAULT_BACKEND
+        if self.backend not in RATE_LIMIT_BACKENDS:
+            raise ValueError(
+                f"Unknown rate limiter backend: {self.backend!r}. "
+                f"Must be one of: {', '.join(RATE_LIMIT_BACKENDS)}"
+            )
+        self._window: Optional[SharedRequestWindow] = None
+        if self.backend == "mmap":
+            self.state_path = self.data_dir / WINDOW_FILE.format(limit=self.requests_per_minute)
+            self._window = SharedRequestWindow(
+                self.state_path, self.requests_per_minute, WINDOW_SIZE_SECONDS
+            )
+
         self._pid = os.getpid()
 
         # Dual-bucket (5-minute) enforcement — in-process memory only
@@ -151,10 +192,11 @@ class CrossProcessRateLimiter:
         self._stats_lock = threading.Lock()
 
         logger.info(
-            "CrossProcessRateLimiter initialized: %d req/min%s, pid=%d, "
+            "CrossProcessRateLimiter initialized: %d req/min%s, backend=%s, pid=%d, "
             "lock=%s, state=%s",
             self.requests_per_minute,
             f", {requests_per_5min}/5min" if requests_per_5min else "",
+            self.backend,
             self._pid,
             self.lock_path,
             self.state_path,
@@ -254,6 +296,9 @@ class CrossProcessRateLimiter:
         deadline = time.time() + timeout
         acquire_start = time.time()
 
+        if self._window is not None:
+            return self._acquire_window(timeout, deadline, acquire_start)
+
         while True:
             now = time.time()
             if now >= deadline:
@@ -315,41 +360,71 @@ class CrossProcessRateLimiter:
                 logger.warning("Lock file error: %s. Retrying.", e)
 
             if acquired:
-                # Per-minute slot acquired; now check 5-minute bucket (in-process)
-                wait_5min = self._check_and_consume_5min_bucket()
-                while wait_5min > 0:
-                    if time.time() >= deadline:
-                        return False
-                    time.sleep(wait_5min)
-                    wait_5min = self._check_and_consume_5min_bucket()
-
-                # Enforce minimum inter-request delay (in-process)
-                if self._min_delay_seconds > 0:
-                    with self._min_delay_lock:
-                        elapsed = time.time() - self._last_acquire_time
-                        delay_needed = max(0.0, self._min_delay_seconds - elapsed)
-                        self._last_acquire_time = time.time() + delay_needed
-                    if delay_needed > 0:
-                        time.sleep(delay_needed)
-
-                # Update in-process stats
-                wait_time = time.time() - acquire_start
-                with self._stats_lock:
-                    self._total_requests += 1
-                    if wait_time > 0.05:
-                        self._total_waits += 1
-                        self._total_wait_time_seconds += wait_time
-                return True
+                return self._finish_acquire(deadline, acquire_start)
 
             # Wait before retrying (with jitter to reduce thundering herd)
             time.sleep(POLL_INTERVAL)
 
+    def _acquire_window(self, timeout: float, deadline: float, acquire_start: float) -> bool:
+        """acquire() for the mmap backend: sleep until the next slot frees, no polling."""
+        while True:
+            wait_seconds = self._window.try_acquire()
+            if wait_seconds <= 0:
+                return self._finish_acquire(deadline, acquire_start)
+            # Slots only free up as requests age out, so give up early if
+            # the next one frees after the deadline
+            if wait_seconds > deadline - time.time():
+                logger.warning(
+                    "CrossProcessRateLimiter: next slot in %.1fs exceeds %.1fs timeout",
+                    wait_seconds,
+                    timeout,
+                )
+                return False
+            logger.debug(
+                "Rate limit full: %d/min. Waiting %.2fs (pid=%d)",
+                self.requests_per_minute,
+                wait_seconds,
+                self._pid,
+            )
+            time.sleep(wait_seconds + WAKE_JITTER_SECONDS * random.random())
+
+    def _finish_acquire(self, deadline: float, acquire_start: float) -> bool:
+        """Apply the in-process limits after a per-minute slot was taken."""
+        # Per-minute slot acquired; now check 5-minute bucket (in-process)
+        wait_5min = self._check_and_consume_5min_bucket()
+        while wait_5min > 0:
+            if time.time() >= deadline:
+                return False
+            time.sleep(wait_5min)
+            wait_5min = self._check_and_consume_5min_bucket()
+
+        # Enforce minimum inter-request delay (in-process)
+        if self._min_delay_seconds > 0:
+            with self._min_delay_lock:
+                elapsed = time.time() - self._last_acquire_time
+                delay_needed = max(0.0, self._min_delay_seconds - elapsed)
+                self._last_acquire_time = time.time() + delay_needed
+            if delay_needed > 0:
+                time.sleep(delay_needed)
+
+        # Update in-process stats
+        wait_time = time.time() - acquire_start
+        with self._stats_lock:
+            self._total_requests += 1
+            if wait_time > 0.05:
+                self._total_waits += 1
+                self._total_wait_time_seconds += wait_time
+        return True
+
     def record_request(self) -> None:
         """Record a request timestamp without rate-limit checking.
 
         Useful when the caller manages its own timing but wants to
         share the request count with other processes.
         """
+        if self._window is not None:
+            self._window.record()
+            return
         try:
             lock_fd = open(self.lock_path, "w")
             try:
@@ -382,6 +457,10 @@ class CrossProcessRateLimiter:
                 - lock_file: Path to lock file
                 - pid: Current process ID
         """
+        if self._window is not None:
+            now = time.time()
+            timestamps = self._window.timestamps(now)
+            return self._status_from_timestamps(timestamps, now)
         try:
             lock_fd = open(self.lock_path, "w")
             try:
@@ -389,25 +468,7 @@ class CrossProcessRateLimiter:
                 state = self._read_state()
                 now = time.time()
                 timestamps = self._prune_old_timestamps(state["timestamps"], now)
-
-                count = len(timestamps)
-                available = max(0, self.requests_per_minute - count)
-                utilization = (count / self.requests_per_minute * 100) if self.requests_per_minute > 0 else 0
-
-                oldest_age = (now - min(timestamps)) if timestamps else 0
-                newest_age = (now - max(timestamps)) if timestamps else 0
-
-                return {
-                    "requests_last_minute": count,
-                    "requests_per_minute": self.requests_per_minute,
-                    "utilization_percent": round(utilization, 1),
-                    "available": available,
-                    "oldest_request_age_seconds": round(oldest_age, 1),
-                    "newest_request_age_seconds": round(newest_age, 1),
-                    "state_file": str(self.state_path),
-                    "lock_file": str(self.lock_path),
-                    "pid": self._pid,
-                }
+                return self._status_from_timestamps(timestamps, now)
             finally:
                 fcntl.flock(lock_fd.fileno(), fcntl.LOCK_UN)
                 lock_fd.close()
@@ -422,11 +483,37 @@ class CrossProcessRateLimiter:
                 "pid": self._pid,
             }
 
+    def _status_from_timestamps(self, timestamps: List[float], now: float) -> Dict[str, Any]:
+        """Build the get_status() dictionary from in-window timestamps."""
+        count = len(timestamps)
+        available = max(0, self.requests_per_minute - count)
+        utilization = (count / self.requests_per_minute * 100) if self.requests_per_minute > 0 else 0
+
+        oldest_age = (now - min(timestamps)) if timestamps else 0
+        newest_age = (now - max(timestamps)) if timestamps else 0
+
+        return {
+            "requests_last_minute": count,
+            "requests_per_minute": self.requests_per_minute,
+            "utilization_percent": round(utilization, 1),
+            "available": available,
+            "oldest_request_age_seconds": round(oldest_age, 1),
+            "newest_request_age_seconds": round(newest_age, 1),
+            "state_file": str(self.state_path),
+            "lock_file": str(self.lock_path),
+            "backend": self.backend,
+            "pid": self._pid,
+        }
+
     def reset(self) -> None:
         """Reset the shared rate limit state.
 
         Clears all recorded timestamps. Useful for testing or recovery.
         """
+        if self._window is not None:
+            self._window.reset()
+            logger.info("Rate limit window reset by pid=%d", self._pid)
+            return
         try:
             lock_fd = open(self.lock_path, "w")
             try:
@@ -462,18 +549,23 @@ class CrossProcessRateLimiter:
         state_exists = self.state_path.exists()
         state_readable = False
 
-        if not lock_exists:
-            warnings.append("Lock file does not exist (will be created on first use)")
-
-        if state_exists:
-            try:
-                with open(self.state_path) as f:
-                    json.load(f)
-                state_readable = True
-            except (json.JSONDecodeError, OSError):
-                warnings.append("State file exists but is not readable/valid JSON")
+        if self._window is not None:
+            # The window file (which is also the lock) is created and
+            # validated when the limiter is constructed
+            lock_exists = state_readable = state_exists
         else:
-            warnings.append("State file does not exist (will be created on first use)")
+            if not lock_exists:
+                warnings.append("Lock file does not exist (will be created on first use)")
+
+            if state_exists:
+                try:
+                    with open(self.state_path) as f:
+                        json.load(f)
+                    state_readable = True
+                except (json.JSONDecodeError, OSError):
+                    warnings.append("State file exists but is not readable/valid JSON")
+            else:
+                warnings.append("State file does not exist (will be created on first use)")
 
         status = self.get_status()
         healthy = status.get("requests_last_minute", -1) >= 0
@@ -503,6 +595,12 @@ class CrossProcessRateLimiter:
         Returns:
             True if slot acquired, False if at limit.
         """
+        if self._window is not None:
+            if self._window.try_acquire() > 0:
+                return False
+            with self._stats_lock:
+                self._total_requests += 1
+            return True
         try:
             lock_fd = open(self.lock_path, "w")
             try:
@@ -530,6 +628,75 @@ class CrossProcessRateLimiter:
             logger.warning("try_acquire lock file error: %s", e)
             return False
 
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """Asyncio-friendly acquire(): waits without blocking the event loop.
+
+        Polls try_acquire() (in the default executor, since it takes the
+        file lock) with jittered ``asyncio.sleep`` between attempts; the
+        mmap backend's slot check also runs in the executor (it flocks the
+        window file) and sleeps until the next slot frees. Then
+        enforces the optional 5-minute bucket and minimum inter-request
+        delay exactly like acquire().
+
+        Args:
+            timeout: Maximum seconds to wait. None defaults to MAX_WAIT_SECONDS.
+
+        Returns:
+            True if permission acquired, False if timeout expired.
+        """
+        timeout = timeout if timeout is not None else MAX_WAIT_SECONDS
+        loop = asyncio.get_running_loop()
+        deadline = time.time() + timeout
+        acquire_start = time.time()
+
+        if self._window is not None:
+            while True:
+                wait_seconds = await loop.run_in_executor(None, self._window.try_acquire)
+                if wait_seconds <= 0:
+                    break
+                if wait_seconds > deadline - time.time():
+                    logger.warning(
+                        "CrossProcessRateLimiter: next slot in %.1fs exceeds %.1fs async timeout",
+                        wait_seconds,
+                        timeout,
+                    )
+                    return False
+                await asyncio.sleep(wait_seconds + WAKE_JITTER_SECONDS * random.random())
+            with self._stats_lock:
+                self._total_requests += 1
+        else:
+            while not await loop.run_in_executor(None, self.try_acquire):
+                if time.time() >= deadline:
+                    logger.warning(
+                        "CrossProcessRateLimiter: async timeout after %.1fs waiting for rate limit",
+                        timeout,
+                    )
+                    return False
+                await asyncio.sleep(POLL_INTERVAL * (0.5 + 0.5 * random.random()))
+
+        wait_5min = self._check_and_consume_5min_bucket()
+        while wait_5min > 0:
+            if time.time() >= deadline:
+                return False
+            await asyncio.sleep(wait_5min)
+            wait_5min = self._check_and_consume_5min_bucket()
+
+        if self._min_delay_seconds > 0:
+            with self._min_delay_lock:
+                elapsed = time.time() - self._last_acquire_time
+                delay_needed = max(0.0, self._min_delay_seconds - elapsed)
+                self._last_acquire_time = time.time() + delay_needed
+            if delay_needed > 0:
+                await asyncio.sleep(delay_needed)
+
+        # try_acquire() already counted the request; record any wait
+        wait_time = time.time() - acquire_start
+        if wait_time > 0.05:
+            with self._stats_lock:
+                self._total_waits += 1
+                self._total_wait_time_seconds += wait_time
+        return True
+
     def update_from_headers(
         self,
         headers: Dict[str, str],
@@ -166,6 +166,9 @@ class FDAEnrichment:
             has_api_key=bool(api_key),
             min_delay_seconds=0.25,
         )
+        # K-number -> 510(k) record (None = confirmed not found), primed by
+        # prefetch_510k_validations() so batch enrichment avoids one query per device
+        self._510k_prefetch: Dict[str, Optional[Dict]] = {}
 
     # ========================================================================
     # PHASE 1: DATA INTEGRITY FUNCTIONS
@@ -318,13 +321,19 @@ class FDAEnrichment:
             # Returns: {'api_validated': 'Yes', 'decision': 'Substantially Equivalent', ...}
         """
         try:
-            data = self.api_query('510k', {
-                'search': f'k_number:"{k_number}"',
-                'limit': 1
-            })
-
-            if data and 'results' in data and len(data['results']) > 0:
-                device = data['results'][0]
+            prefetched = k_number.upper() in self._510k_prefetch
+            if prefetched:
+                device = self._510k_prefetch[k_number.upper()]
+            else:
+                data = self.api_query('510k', {
+                    'search': f'k_number:"{k_number}"',
+                    'limit': 1
+                })
+                device = None
+                if data and 'results' in data and len(data['results']) > 0:
+                    device = data['results'][0]
+
+            if device:
                 return {
                     'api_validated': 'Yes',
                     'decision': device.get('decision_description', 'Unknown'),
@@ -341,6 +350,61 @@ class FDAEnrichment:
             'statement_or_summary': 'Unknown'
         }
 
+    def prefetch_510k_validations(self, k_numbers: List[str], batch_size: int = 50) -> int:
+        """
+        Fetch 510(k) records for many K-numbers with OR-batched queries.
+
+        Each query covers up to ``batch_size`` K-numbers
+        (``k_number:"A" OR k_number:"B" ...``). Records are kept in memory and
+        served by get_510k_validation(). Failed batches are skipped so those
+        K-numbers fall back to single lookups.
+
+        Args:
+            k_numbers: K-numbers to prefetch
+            batch_size: Maximum K-numbers per query
+
+        Returns:
+            Number of K-numbers resolved (found or confirmed missing)
+
+        Example:
+            enricher.prefetch_510k_validations(['K123456', 'K234567'])
+        """
+        # Order-preserving de-duplication
+        pending = [
+            k_number for k_number in dict.fromkeys(str(k).strip().upper() for k in k_numbers)
+            if k_number and k_number not in self._510k_prefetch
+        ]
+
+        resolved = 0
+        for i in range(0, len(pending), max(1, batch_size)):
+            chunk = pending[i:i + batch_size]
+            data = self.api_query('510k', {
+                'search': ' OR '.join(f'k_number:"{k}"' for k in chunk),
+                'limit': len(chunk)
+            })
+            if not data or 'results' not in data:
+                continue
+
+            records = {}
+            for device in data['results']:
+                k = str(device.get('k_number', '')).upper()
+                if k and k not in records:
+                    records[k] = device
+            total = data.get('meta', {}).get('results', {}).get('total', len(records))
+            complete = total <= len(data['results'])
+
+            for k in chunk:
+                if k in records:
+                    self._510k_prefetch[k] = records[k]
+                elif complete:
+                    self._510k_prefetch[k] = None
+                else:
+                    continue
+                resolved += 1
+
+        logger.debug("Prefetched %d/%d K-numbers in batched queries", resolved, len(pending))
+        return resolved
+
     def calculate_enrichment_completeness_score(self, row: Dict[str, Any], api_log: List[Dict]) -> float:
         """
         Calculate Enrichment Data Completeness Score (0-100).
@@ -815,6 +879,9 @@ class FDAEnrichment:
 
         logger.info("Enriching %d devices with FDA API data...", total)
 
+        if total > 1:
+            self.prefetch_510k_validations([row.get('KNUMBER', '') for row in device_rows])
+
         for i, row in enumerate(device_rows, 1):
             k_number = row['KNUMBER']
             enriched = self.enrich_single_device(row, api_log)
@@ -0,0 +1,257 @@
+"""
+Columnar cache of the FDA pipe-delimited flat files (pmn*.txt, pma.txt).
+
+batchfetch, full_text_search and predicate_extractor each re-parse the
+multi-hundred-megabyte pmn text files on every run, and batchfetch
+re-derives the date columns each time. This module converts a flat file
+once into an uncompressed Arrow IPC file next to it:
+
+  - Every column is stored as a string, except DATERECEIVED and
+    DECISIONDATE (date32) and the derived REVIEWTIME (days, int32)
+  - The cache is memory-mapped on load, so selecting a few columns reads
+    only those columns' pages
+  - The source's size and mtime are recorded in the schema metadata; a
+    re-downloaded flat file is converted again on next load
+
+Without pyarrow, read_columns() falls back to parsing the flat file and
+returns the raw strings, so consumers keep working (just slower).
+
+Files:
+    <name>.txt      FDA flat file (latin-1, pipe-delimited, header row)
+    <name>.arrow    Arrow IPC cache
+
+Usage:
+    from fda_tools.lib.flat_file_cache import load_table, read_columns
+
+    table = load_table('fda_data/pmn96cur.txt', ['KNUMBER', 'REVIEWTIME'])
+    codes = read_columns('pmn96cur.txt', ['KNUMBER', 'PRODUCTCODE'])
+"""
+
+import csv
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    _ARROW_AVAILABLE = True
+except ImportError:
+    _ARROW_AVAILABLE = False
+
+CACHE_SUFFIX = ".arrow"
+CACHE_VERSION = "1"
+FLAT_FILE_ENCODING = "latin-1"
+DATE_COLUMNS = ("DATERECEIVED", "DECISIONDATE")
+DATE_FORMAT = "%m/%d/%Y"
+REVIEW_TIME_COLUMN = "REVIEWTIME"
+
+PathLike = Union[str, Path]
+
+logger = logging.getLogger(__name__)
+
+# A UTF-8 byte-order mark read as latin-1
+_LATIN1_BOM = "ï»¿"
+
+
+def arrow_available() -> bool:
+    """Return True if pyarrow is installed and the columnar cache can be used."""
+    return _ARROW_AVAILABLE
+
+
+def cache_path(txt_path: PathLike) -> Path:
+    """Return the columnar cache path for a flat file."""
+    return Path(txt_path).with_suffix(CACHE_SUFFIX)
+
+
+def _source_stamp(txt_path: Path) -> Dict[bytes, bytes]:
+    stat = txt_path.stat()
+    return {
+        b"fda_flat_file_version": CACHE_VERSION.encode(),
+        b"source_size": str(stat.st_size).encode(),
+        b"source_mtime_ns": str(stat.st_mtime_ns).encode(),
+    }
+
+
+def _header(txt_path: Path) -> List[str]:
+    with open(txt_path, encoding=FLAT_FILE_ENCODING, newline="") as f:
+        header = next(csv.reader(f, delimiter="|"), [])
+    if header and header[0].startswith(_LATIN1_BOM):
+        header[0] = header[0][len(_LATIN1_BOM):]
+    return [name.strip() for name in header]
+
+
+def _require_arrow() -> None:
+    if not _ARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for the columnar flat-file cache")
+
+
+def _read_rows_by_position(txt_path: Path, names: List[str]) -> "pa.Table":
+    """Parse a flat file with the csv module, as the non-cached consumers do.
+
+    Each row is truncated or padded (with nulls) to the header's width, so
+    rows with a stray delimiter or missing trailing fields are kept.
+    """
+    columns: List[List[Optional[str]]] = [[] for _ in names]
+    with open(txt_path, encoding=FLAT_FILE_ENCODING, newline="") as f:
+        reader = csv.reader(f, delimiter="|")
+        next(reader, None)
+        for row in reader:
+            if not row:
+                continue
+            for index, column in enumerate(columns):
+                column.append(row[index] if index < len(row) else None)
+    return pa.table({name: pa.array(column, pa.string()) for name, column in zip(names, columns)})
+
+
+def build_cache(txt_path: PathLike) -> Path:
+    """Convert a flat file to its Arrow cache, replacing any existing one.
+
+    Rows whose field count does not match the header are kept by position;
+    fields missing from a short row are null.
+
+    Returns:
+        Path of the written cache file.
+    """
+    _require_arrow()
+    txt_path = Path(txt_path)
+    names = _header(txt_path)
+    invalid_rows = []
+
+    def on_invalid_row(row):
+        invalid_rows.append(row.number)
+        return "skip"
+
+    table = pa_csv.read_csv(
+        txt_path,
+        read_options=pa_csv.ReadOptions(
+            encoding=FLAT_FILE_ENCODING, column_names=names, skip_rows=1,
+        ),
+        parse_options=pa_csv.ParseOptions(delimiter="|", invalid_row_handler=on_invalid_row),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in names},
+            strings_can_be_null=False,
+        ),
+    )
+    if invalid_rows:
+        # The Arrow reader can only drop malformed rows; reparse by position
+        logger.warning(
+            "%s: %d row(s) do not match the %d-column header; parsing by position",
+            txt_path.name, len(invalid_rows), len(names),
+        )
+        table = _read_rows_by_position(txt_path, names)
+
+    for name in DATE_COLUMNS:
+        if name in table.column_names:
+            dates = pc.strptime(table[name], format=DATE_FORMAT, unit="s", error_is_null=True)
+            table = table.set_column(
+                table.column_names.index(name), name, pc.cast(dates, pa.date32())
+            )
+    if all(name in table.column_names for name in DATE_COLUMNS):
+        review_time = pc.cast(
+            pc.days_between(table[DATE_COLUMNS[0]], table[DATE_COLUMNS[1]]), pa.int32()
+        )
+        table = table.append_column(REVIEW_TIME_COLUMN, review_time)
+
+    table = table.replace_schema_metadata(_source_stamp(txt_path))
+    target = cache_path(txt_path)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix=".tmp")
+    os.close(fd)
+    try:
+        with pa.OSFile(tmp_name, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return target
+
+
+def _cache_is_current(txt_path: Path, target: Path) -> bool:
+    if not target.exists():
+        return False
+    try:
+        with pa.memory_map(str(target)) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (pa.ArrowInvalid, OSError):
+        return False
+    return all(metadata.get(key) == value for key, value in _source_stamp(txt_path).items())
+
+
+def load_table(
+    txt_path: PathLike,
+    columns: Optional[Sequence[str]] = None,
+    isin: Optional[Dict[str, Iterable[str]]] = None,
+) -> "pa.Table":
+    """Load a flat file as an Arrow table, converting it on first use.
+
+    The cache is memory-mapped, so unselected columns are never read.
+
+    Args:
+        txt_path: FDA flat file (the cache lives next to it).
+        columns: Columns to return (default: all).
+        isin: Keep only rows whose column value is in the given values,
+            e.g. ``{"PRODUCTCODE": ["DQY"]}``.
+
+    Raises:
+        ImportError: pyarrow is not installed.
+        FileNotFoundError: Neither the flat file nor a cache exists.
+    """
+    _require_arrow()
+    txt_path = Path(txt_path)
+    target = cache_path(txt_path)
+    if txt_path.exists():
+        if not _cache_is_current(txt_path, target):
+            build_cache(txt_path)
+    elif not target.exists():
+        raise FileNotFoundError(txt_path)
+
+    # The table's buffers keep the mapping open
+    table = pa.ipc.open_file(pa.memory_map(str(target))).read_all()
+    for name, values in (isin or {}).items():
+        table = table.filter(pc.is_in(table[name], value_set=pa.array(list(values), pa.string())))
+    if columns is not None:
+        table = table.select(list(columns))
+    return table
+
+
+def read_columns(
+    txt_path: PathLike,
+    columns: Sequence[str],
+    isin: Optional[Dict[str, Iterable[str]]] = None,
+) -> Dict[str, List]:
+    """Return the named columns of a flat file as Python lists.
+
+    Uses the columnar cache when pyarrow is installed (dates as
+    ``datetime.date``); otherwise parses the flat file and returns raw
+    strings. Fields missing from a short row are None either way.
+
+    Raises:
+        KeyError: A column is not in the file's header row.
+    """
+    if _ARROW_AVAILABLE:
+        return load_table(txt_path, columns, isin).to_pydict()
+
+    txt_path = Path(txt_path)
+    header = _header(txt_path)
+    filters = {name: set(values) for name, values in (isin or {}).items()}
+    missing = [name for name in [*columns, *filters] if name not in header]
+    if missing:
+        raise KeyError(f"{txt_path.name} has no column(s) {missing}")
+    indices = [header.index(name) for name in columns]
+    filter_indices = [(header.index(name), values) for name, values in filters.items()]
+    result: Dict[str, List] = {name: [] for name in columns}
+    with open(txt_path, encoding=FLAT_FILE_ENCODING, newline="") as f:
+        reader = csv.reader(f, delimiter="|")
+        next(reader, None)
+        for row in reader:
+            if not row:
+                continue
+            if all(index < len(row) and row[index] in values for index, values in filter_indices):
+                for name, index in zip(columns, indices):
+                    result[name].append(row[index] if index < len(row) else None)
+    return result
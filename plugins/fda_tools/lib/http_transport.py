@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Pluggable HTTP transport layer for openFDA API requests.
+
+FDAClient historically built a new ``urllib.request.Request`` and a new
+``ssl.create_default_context()`` for every call, so every cache miss paid a
+full TCP + TLS handshake against api.fda.gov.  During bulk enrichment runs
+(thousands of K-numbers) the handshakes dominate wall time.
+
+This module provides two interchangeable transports:
+
+    UrllibTransport     -- one-shot ``urllib.request.urlopen`` per request
+                           (legacy behaviour), but with a single reused
+                           SSL context.
+    KeepAliveTransport  -- per-host pool of persistent HTTP/1.1
+                           connections with a shared SSL context,
+                           configurable pool size and idle eviction.
+
+Both expose the same ``open(url, headers, timeout)`` contract: they return a
+response object usable as a context manager with ``read()`` and ``headers``,
+and raise ``urllib.error.HTTPError`` for HTTP status >= 400 -- so callers
+written against ``urlopen`` (retry/backoff logic in FDAClient) work
+unchanged.
+
+Configuration (config.toml ``[http]`` section, or FDA_HTTP_* env vars):
+    keep_alive = false          # true = use KeepAliveTransport by default
+    connection_pool_size = 10   # max idle connections kept per host
+    pool_idle_timeout = 60      # seconds before an idle connection is evicted
+
+Usage:
+    from fda_tools.lib.http_transport import get_default_transport
+
+    transport = get_default_transport()
+    with transport.open("https://api.fda.gov/device/510k.json?limit=1") as resp:
+        data = json.loads(resp.read())
+
+    print(transport.get_stats())
+    # {'transport': 'keep_alive', 'requests': 1, 'connections_opened': 1,
+    #  'connections_reused': 0, ...}
+"""
+
+import http.client
+import io
+import logging
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Defaults -- overridden by config (see get_default_transport)
+DEFAULT_POOL_SIZE = 10
+DEFAULT_IDLE_TIMEOUT = 60.0  # seconds
+DEFAULT_TIMEOUT = 15.0  # seconds
+
+# Maximum number of redirects KeepAliveTransport will follow
+MAX_REDIRECTS = 5
+
+# Exceptions indicating a pooled connection was closed by the server
+# between requests; the request is retried once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class TransportResponse:
+    """Fully-read HTTP response returned by KeepAliveTransport.
+
+    Mirrors the subset of ``http.client.HTTPResponse`` used by callers of
+    ``urlopen``: ``read()``, ``headers``, ``status``/``getcode()`` and the
+    context manager protocol.
+    """
+
+    def __init__(self, url: str, status: int, reason: str,
+                 headers: http.client.HTTPMessage, body: bytes):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = io.BytesIO(body)
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """Read the response body (or up to ``amt`` bytes of it)."""
+        return self._body.read() if amt is None else self._body.read(amt)
+
+    def getcode(self) -> int:
+        """Return the HTTP status code."""
+        return self.status
+
+    def geturl(self) -> str:
+        """Return the final request URL."""
+        return self.url
+
+    def close(self) -> None:
+        """Release the buffered body."""
+        self._body.close()
+
+    def __enter__(self) -> "TransportResponse":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+class HTTPTransport(ABC):
+    """Abstract base class for FDAClient HTTP transports."""
+
+    name = "base"
+
+    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None):
+        # FDA-107: certificate verification enabled; context is reused
+        # across requests instead of being rebuilt per call.
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "idle_evictions": 0,
+            "stale_retries": 0,
+        }
+
+    def _incr(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    @abstractmethod
+    def open(self, url: str, headers: Optional[Dict[str, str]] = None,
+             timeout: float = DEFAULT_TIMEOUT) -> Any:
+        """Perform a GET request.
+
+        Returns:
+            Response object supporting ``with``, ``read()`` and ``headers``.
+
+        Raises:
+            urllib.error.HTTPError: On HTTP status >= 400.
+            OSError: On network errors / timeouts.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release any pooled resources. Safe to call multiple times."""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return connection reuse statistics."""
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        stats["transport"] = self.name
+        opened = stats["connections_opened"]
+        reused = stats["connections_reused"]
+        total = opened + reused
+        stats["reuse_ratio"] = round(reused / total, 3) if total else 0.0
+        return stats
+
+
+class UrllibTransport(HTTPTransport):
+    """One connection per request via ``urllib.request.urlopen``.
+
+    Keeps the legacy request path (and therefore compatibility with code
+    and tests that patch ``urllib.request.urlopen``) while sharing a single
+    SSL context across calls.
+    """
+
+    name = "urllib"
+
+    def open(self, url: str, headers: Optional[Dict[str, str]] = None,
+             timeout: float = DEFAULT_TIMEOUT) -> Any:
+        req = urllib.request.Request(url, headers=headers or {})
+        self._incr("requests")
+        self._incr("connections_opened")
+        return urllib.request.urlopen(req, timeout=timeout, context=self.ssl_context)
+
+
+class KeepAliveTransport(HTTPTransport):
+    """Per-host pool of persistent HTTP/1.1 connections.
+
+    Thread-safe: connections are checked out exclusively for the duration of
+    one request/response cycle and returned to the pool afterwards.  Idle
+    connections older than ``idle_timeout`` are closed on checkout.  At most
+    ``pool_size`` idle connections are retained per host; extra connections
+    opened under concurrency are closed when released.
+    """
+
+    name = "keep_alive"
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ):
+        """Initialize the connection pool.
+
+        Args:
+            pool_size: Maximum idle connections retained per host.
+            idle_timeout: Seconds an idle connection may sit in the pool
+                before it is evicted.
+            ssl_context: SSL context shared by all HTTPS connections.
+                Default: ``ssl.create_default_context()``.
+        """
+        super().__init__(ssl_context)
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be >= 1, got {pool_size}")
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self._pools: Dict[Tuple[str, str, int], Deque[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._pool_lock = threading.Lock()
+
+    # --- Pool management ---
+
+    def _new_connection(self, scheme: str, host: str, port: int,
+                        timeout: float) -> http.client.HTTPConnection:
+        self._incr("connections_opened")
+        if scheme == "https":
+            return http.client.HTTPSConnection(
+                host, port, timeout=timeout, context=self.ssl_context
+            )
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _checkout(self, key: Tuple[str, str, int],
+                  timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Get an idle pooled connection for ``key`` or open a new one.
+
+        Returns:
+            Tuple of (connection, reused flag).
+        """
+        now = time.monotonic()
+        evicted = []
+        conn = None
+        with self._pool_lock:
+            pool = self._pools.get(key)
+            while pool:
+                candidate, last_used = pool.pop()
+                if now - last_used > self.idle_timeout:
+                    evicted.append(candidate)
+                    continue
+                conn = candidate
+                break
+        for stale in evicted:
+            stale.close()
+        if evicted:
+            self._incr("idle_evictions", len(evicted))
+        if conn is not None:
+            conn.timeout = timeout
+            try:
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+            except OSError:
+                conn.close()  # Socket already torn down; open a new one
+            else:
+                self._incr("connections_reused")
+                return conn, True
+        return self._new_connection(*key, timeout=timeout), False
+
+    def _release(self, key: Tuple[str, str, int],
+                 conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, or close it if the pool is full."""
+        with self._pool_lock:
+            pool = self._pools.setdefault(key, deque())
+            if len(pool) < self.pool_size:
+                pool.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._pool_lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            for conn, _ in pool:
+                conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        with self._pool_lock:
+            stats["idle_connections"] = sum(len(p) for p in self._pools.values())
+        stats["pool_size"] = self.pool_size
+        stats["idle_timeout_seconds"] = self.idle_timeout
+        return stats
+
+    # --- Request path ---
+
+    def _send(self, key: Tuple[str, str, int], target: str,
+              headers: Dict[str, str], timeout: float):
+        """Send one GET on a pooled connection and read the full body.
+
+        A reused connection the server already closed is retried once on a
+        fresh connection.
+        """
+        conn, reused = self._checkout(key, timeout)
+        try:
+            conn.request("GET", target, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except _STALE_CONNECTION_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            self._incr("stale_retries")
+            conn = self._new_connection(*key, timeout=timeout)
+            try:
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return resp, body
+
+    def open(self, url: str, headers: Optional[Dict[str, str]] = None,
+             timeout: float = DEFAULT_TIMEOUT) -> TransportResponse:
+        request_headers = {"Connection": "keep-alive"}
+        request_headers.update(headers or {})
+
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            scheme = parts.scheme.lower()
+            if scheme not in ("http", "https"):
+                raise urllib.error.URLError(f"unsupported URL scheme: {scheme!r}")
+            default_port = 443 if scheme == "https" else 80
+            key = (scheme, parts.hostname or "", parts.port or default_port)
+            target = parts.path or "/"
+            if parts.query:
+                target = f"{target}?{parts.query}"
+
+            self._incr("requests")
+            resp, body = self._send(key, target, request_headers, timeout)
+
+            if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+                url = urllib.parse.urljoin(url, resp.getheader("Location"))
+                continue
+
+            if resp.status >= 400:
+                raise urllib.error.HTTPError(
+                    url, resp.status, resp.reason, resp.headers, io.BytesIO(body)
+                )
+            return TransportResponse(url, resp.status, resp.reason, resp.headers, body)
+
+        raise urllib.error.URLError(f"too many redirects (> {MAX_REDIRECTS})")
+
+
+# ------------------------------------------------------------------
+# Shared default transport
+# ------------------------------------------------------------------
+
+_default_transport: Optional[HTTPTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> HTTPTransport:
+    """Return the process-wide transport shared by all FDAClient instances.
+
+    Selects KeepAliveTransport when ``http.keep_alive`` is enabled in
+    config, otherwise UrllibTransport.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            keep_alive = False
+            pool_size = DEFAULT_POOL_SIZE
+            idle_timeout = DEFAULT_IDLE_TIMEOUT
+            try:
+                from fda_tools.lib.config import get_config  # type: ignore
+                cfg = get_config()
+                keep_alive = cfg.get_bool("http.keep_alive", default=False)
+                pool_size = cfg.get_int("http.connection_pool_size", default=pool_size)
+                idle_timeout = cfg.get_float("http.pool_idle_timeout", default=idle_timeout)
+            except Exception:
+                pass  # fall back to hardcoded defaults above
+
+            if keep_alive:
+                _default_transport = KeepAliveTransport(
+                    pool_size=pool_size, idle_timeout=idle_timeout
+                )
+            else:
+                _default_transport = UrllibTransport()
+            logger.debug("Default HTTP transport: %s", _default_transport.name)
+        return _default_transport
+
+
+def reset_default_transport() -> None:
+    """Close and discard the shared transport (for tests / config reload)."""
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is not None:
+            _default_transport.close()
+        _default_transport = None
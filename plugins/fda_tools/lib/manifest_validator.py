@@ -419,7 +419,7 @@ def validate_and_repair(
         "schema_version", "project", "created_at", "last_updated",
         "product_codes", "queries", "fingerprints", "total_pmas",
         "total_sseds_downloaded", "total_sections_extracted",
-        "pma_entries", "search_cache",
+        "journal_generation", "pma_entries", "search_cache",
     }
     extra_keys = set(repaired.keys()) - allowed_top_level
     for key in extra_keys:
@@ -0,0 +1,122 @@
+"""
+Bounded in-process LRU cache for API responses.
+
+Sits in front of a disk cache so repeated lookups in long-running processes
+(bridge server, approval monitor, refresh orchestrator) skip the file open,
+JSON parse and SHA-256 verification of every hit.
+
+  - Capped by entry count and by total serialized size
+  - Per-entry TTL (entries expire even if still recently used)
+  - Thread-safe (single lock around an OrderedDict)
+  - Values are stored as their JSON serialization and decoded on each hit,
+    so callers get a private copy they can mutate, exactly like a disk read,
+    and the size cap measures real payload bytes
+
+Usage:
+    from fda_tools.lib.memory_cache import MemoryLRUCache
+
+    lru = MemoryLRUCache(max_entries=2048, max_bytes=64 * 1024 * 1024, ttl_seconds=3600)
+    lru.set(key, data)
+    data = lru.get(key)        # None on miss/expiry
+    lru.get_stats()
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class MemoryLRUCache:
+    """Size- and entry-capped, TTL-aware, thread-safe LRU cache.
+
+    Args:
+        max_entries: Maximum number of entries. Must be positive.
+        max_bytes: Maximum total size of serialized values in bytes.
+            Values larger than this are not cached.
+        ttl_seconds: Lifetime of an entry from the time it was stored.
+    """
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 64 * 1024 * 1024,
+                 ttl_seconds: float = 3600):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (json, size, expires_at)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh copy of the cached value, or None."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            raw, size, expires_at = entry
+            if now >= expires_at:
+                del self._entries[key]
+                self._bytes -= size
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any):
+        """Store ``value`` (JSON-serializable), evicting least recently used entries."""
+        raw = json.dumps(value, separators=(",", ":"))
+        size = len(raw)
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (raw, size, expires_at)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats["evictions"] += 1
+
+    def invalidate(self, key: str):
+        """Drop one entry if present."""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+    def clear(self) -> int:
+        """Drop all entries. Returns the number removed."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return count
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+            }
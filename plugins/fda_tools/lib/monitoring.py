@@ -36,6 +36,7 @@ from fda_tools.lib.monitoring import get_metrics_collector, get_health_checker
     metrics_output = metrics.export_prometheus()
 """
 
+import bisect
 import json
 import logging
 import os
@@ -49,6 +50,8 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from fda_tools.lib.quantile_sketch import QuantileSketch
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,6 +84,9 @@ LATENCY_BUCKETS = [
     0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
 ]
 
+# Relative error of Histogram percentiles (quantile sketch accuracy)
+PERCENTILE_RELATIVE_ACCURACY = 0.01
+
 
 # ---------------------------------------------------------------------------
 # Data Structures
@@ -168,11 +174,17 @@ class Gauge:
 
 @dataclass
 class Histogram:
-    """Thread-safe histogram metric for tracking distributions."""
+    """Thread-safe histogram metric for tracking distributions.
+
+    Percentiles come from a fixed-size quantile sketch per label set
+    (within ``relative_accuracy`` of the exact value), so memory does not
+    grow with the number of observations.
+    """
     name: str
     help_text: str
     buckets: List[float] = field(default_factory=lambda: LATENCY_BUCKETS.copy())
-    _observations: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    relative_accuracy: float = PERCENTILE_RELATIVE_ACCURACY
+    _sketches: Dict[str, QuantileSketch] = field(default_factory=dict)
     _bucket_counts: Dict[str, List[int]] = field(default_factory=dict)
     _sum: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
     _count: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
@@ -183,8 +195,11 @@ class Histogram:
         with self._lock:
             label_key = Counter._serialize_labels(labels) if labels else ""
 
-            # Store observation for percentile calculation
-            self._observations[label_key].append(value)
+            # Add observation to the quantile sketch for percentile calculation
+            sketch = self._sketches.get(label_key)
+            if sketch is None:
+                sketch = self._sketches[label_key] = QuantileSketch(self.relative_accuracy)
+            sketch.add(value)
 
             # Update sum and count
             self._sum[label_key] += value
@@ -194,28 +209,25 @@ class Histogram:
             if label_key not in self._bucket_counts:
                 self._bucket_counts[label_key] = [0] * (len(self.buckets) + 1)
 
-            # Find appropriate bucket
-            for i, bucket in enumerate(self.buckets):
-                if value <= bucket:
-                    self._bucket_counts[label_key][i] += 1
-                    break
-            else:
-                # Value exceeds all buckets
-                self._bucket_counts[label_key][-1] += 1
+            # First bucket with value <= bound; index len(buckets) is the
+            # overflow slot for values exceeding all buckets
+            self._bucket_counts[label_key][bisect.bisect_left(self.buckets, value)] += 1
 
     def get_percentile(self, percentile: float, labels: Optional[Dict[str, str]] = None) -> float:
-        """Calculate percentile from observations."""
+        """Calculate percentile (0-100) from the quantile sketch."""
         with self._lock:
             label_key = Counter._serialize_labels(labels) if labels else ""
-            observations = self._observations.get(label_key, [])
-
-            if not observations:
+            sketch = self._sketches.get(label_key)
+            if sketch is None or sketch.count == 0:
                 return 0.0
+            return sketch.quantile(min(max(percentile, 0.0), 100.0) / 100.0)
 
-            sorted_obs = sorted(observations)
-            index = int(len(sorted_obs) * percentile / 100.0)
-            index = min(index, len(sorted_obs) - 1)
-            return sorted_obs[index]
+    def get_sketch(self, labels: Optional[Dict[str, str]] = None) -> Optional[QuantileSketch]:
+        """Return a copy of the quantile sketch for a label set (for merging)."""
+        with self._lock:
+            label_key = Counter._serialize_labels(labels) if labels else ""
+            sketch = self._sketches.get(label_key)
+            return sketch.copy() if sketch is not None else None
 
     def get_sum(self, labels: Optional[Dict[str, str]] = None) -> float:
         """Get sum of all observations."""
@@ -17,10 +17,10 @@ import logging
 import os
 from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from psycopg2 import pool, sql
-from psycopg2.extras import RealDictCursor, Json
+from psycopg2.extras import RealDictCursor, Json, execute_values
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +153,119 @@ class PostgreSQLDatabase:
             hashlib.sha256
         ).hexdigest()
 
+    # Columns written by upserts, primary key first (all endpoints also
+    # write openfda_json, cached_at and checksum)
+    UPSERT_COLUMNS = {
+        '510k': ['k_number', 'product_code', 'device_name', 'applicant',
+                 'decision_date', 'decision_description'],
+        'classification': ['product_code', 'device_name', 'device_class',
+                           'regulation_number', 'review_panel'],
+        'maude': ['event_key', 'product_code', 'event_type',
+                  'date_received', 'adverse_event_flag'],
+        'recalls': ['recall_number', 'product_code', 'classification',
+                    'recalling_firm', 'event_date_initiated'],
+        'pma': ['pma_number', 'product_code', 'device_name',
+                'applicant', 'decision_date'],
+        'udi': ['di', 'product_code', 'brand_name', 'company_name'],
+        'enforcement': ['recall_number', 'product_code', 'classification',
+                        'status', 'center_classification_date'],
+    }
+
+    # Endpoints whose tables also track updated_at on conflict
+    TRACK_UPDATED_AT = {'510k'}
+
+    # Rows per multi-row INSERT page in upsert_many()
+    UPSERT_PAGE_SIZE = 1000
+
+    def compute_checksums(self, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Compute HMAC-SHA256 checksums for many records.
+
+        Same digests as compute_checksum(), but the keyed HMAC state is
+        built once and copied per record.
+
+        Args:
+            records: Dictionaries to checksum
+
+        Returns:
+            Hex-encoded digests, in input order
+        """
+        base = hmac.new(self.secret_key.encode(), digestmod=hashlib.sha256)
+        checksums = []
+        for data in records:
+            mac = base.copy()
+            mac.update(json.dumps(data, sort_keys=True, separators=(',', ':')).encode())
+            checksums.append(mac.hexdigest())
+        return checksums
+
+    def _record_values(
+        self,
+        endpoint: str,
+        record_id: str,
+        data: Dict[str, Any],
+        checksum: str,
+        cached_at: datetime
+    ) -> tuple:
+        """Build the UPSERT_COLUMNS row (plus JSON, cached_at, checksum) for a record."""
+        openfda_codes = data.get('openfda', {}).get('product_code')
+        product_code = data.get('product_code', openfda_codes[0] if isinstance(openfda_codes, list) and openfda_codes else '')
+
+        if endpoint == '510k':
+            values = (record_id, product_code, data.get('device_name', ''),
+                      data.get('applicant', ''),
+                      data.get('decision_date', data.get('date_received')),
+                      data.get('decision_description', ''))
+        elif endpoint == 'classification':
+            values = (record_id, data.get('device_name', ''), data.get('device_class', ''),
+                      data.get('regulation_number', ''), data.get('review_panel', ''))
+        elif endpoint == 'maude':
+            values = (record_id, product_code, data.get('event_type', ''),
+                      data.get('date_received'), data.get('adverse_event_flag', 'N'))
+        elif endpoint == 'recalls':
+            values = (record_id, product_code, data.get('classification', ''),
+                      data.get('recalling_firm', ''), data.get('event_date_initiated'))
+        elif endpoint == 'pma':
+            values = (record_id, product_code, data.get('device_name', ''),
+                      data.get('applicant', ''),
+                      data.get('decision_date', data.get('date_received')))
+        elif endpoint == 'udi':
+            values = (record_id, product_code, data.get('brand_name', ''),
+                      data.get('company_name', ''))
+        else:  # enforcement
+            values = (record_id, product_code, data.get('classification', ''),
+                      data.get('status', ''), data.get('center_classification_date'))
+
+        return values + (Json(data), cached_at, checksum)
+
+    def _upsert_query(self, endpoint: str, values_sql: str) -> sql.Composed:
+        """INSERT ... ON CONFLICT statement for an endpoint table.
+
+        Args:
+            endpoint: Endpoint name
+            values_sql: Row placeholder(s), e.g. one ``(%s, ...)`` group or
+                ``%s`` for psycopg2.extras.execute_values
+        """
+        columns = self.UPSERT_COLUMNS[endpoint] + ['openfda_json', 'cached_at', 'checksum']
+        pk_column = columns[0]
+        updates = [
+            sql.SQL("{col} = EXCLUDED.{col}").format(col=sql.Identifier(col))
+            for col in columns[1:]
+        ]
+        if endpoint in self.TRACK_UPDATED_AT:
+            updates.append(sql.SQL("updated_at = NOW()"))
+
+        return sql.SQL("""
+            INSERT INTO {table} ({columns})
+            VALUES {values}
+            ON CONFLICT ({pk}) DO UPDATE SET {updates}
+        """).format(
+            table=sql.Identifier(self.ENDPOINT_TABLES[endpoint]),
+            columns=sql.SQL(', ').join(sql.Identifier(col) for col in columns),
+            values=sql.SQL(values_sql),
+            pk=sql.Identifier(pk_column),
+            updates=sql.SQL(', ').join(updates),
+        )
+
     def upsert_record(
         self,
         endpoint: str,
@@ -175,238 +288,71 @@ class PostgreSQLDatabase:
         if endpoint not in self.ENDPOINT_TABLES:
             raise ValueError(f"Unknown endpoint: {endpoint}")
 
-        table_name = self.ENDPOINT_TABLES[endpoint]
-        # pk_column available for validation if needed: self.PRIMARY_KEYS[endpoint]
-
         # Compute checksum for integrity
         checksum = self.compute_checksum(data)
+        values = self._record_values(endpoint, record_id, data, checksum, datetime.now())
+        placeholders = "(" + ", ".join(["%s"] * len(values)) + ")"
 
-        # Extract common fields from data
-        product_code = data.get('product_code', data.get('openfda', {}).get('product_code', [''])[0] if isinstance(data.get('openfda', {}).get('product_code'), list) else '')
-        device_name = data.get('device_name', '')
-        applicant = data.get('applicant', '')
-        decision_date = data.get('decision_date', data.get('date_received'))
-
-        # Build upsert query based on endpoint
         with self.get_connection() as conn:
             with conn.cursor() as cur:
                 # Set user_id for audit trail
                 cur.execute("SET LOCAL app.user_id = %s", (os.getenv('USER', 'system'),))
-
-                if endpoint == '510k':
-                    query = sql.SQL("""
-                        INSERT INTO {table} (
-                            k_number, product_code, device_name, applicant,
-                            decision_date, decision_description, openfda_json,
-                            cached_at, checksum
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                        ON CONFLICT (k_number) DO UPDATE SET
-                            product_code = EXCLUDED.product_code,
-                            device_name = EXCLUDED.device_name,
-                            applicant = EXCLUDED.applicant,
-                            decision_date = EXCLUDED.decision_date,
-                            decision_description = EXCLUDED.decision_description,
-                            openfda_json = EXCLUDED.openfda_json,
-                            cached_at = EXCLUDED.cached_at,
-                            checksum = EXCLUDED.checksum,
-                            updated_at = NOW()
-                    """).format(table=sql.Identifier(table_name))
-
-                    cur.execute(query, (
-                        record_id,
-                        product_code,
-                        device_name,
-                        applicant,
-                        decision_date,
-                        data.get('decision_description', ''),
-                        Json(data),  # Store as JSONB
-                        datetime.now(),
-                        checksum
-                    ))
-
-                elif endpoint == 'classification':
-                    query = sql.SQL("""
-                        INSERT INTO {table} (
-                            product_code, device_name, device_class,
-                            regulation_number, review_panel, openfda_json,
-                            cached_at, checksum
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                        ON CONFLICT (product_code) DO UPDATE SET
-                            device_name = EXCLUDED.device_name,
-                            device_class = EXCLUDED.device_class,
-                            regulation_number = EXCLUDED.regulation_number,
-                            review_panel = EXCLUDED.review_panel,
-                            openfda_json = EXCLUDED.openfda_json,
-                            cached_at = EXCLUDED.cached_at,
-                            checksum = EXCLUDED.checksum
-                    """).format(table=sql.Identifier(table_name))
-
-                    cur.execute(query, (
-                        record_id,
-                        data.get('device_name', ''),
-                        data.get('device_class', ''),
-                        data.get('regulation_number', ''),
-                        data.get('review_panel', ''),
-                        Json(data),
-                        datetime.now(),
-                        checksum
-                    ))
-
-                elif endpoint == 'maude':
-                    query = sql.SQL("""
-                        INSERT INTO {table} (
-                            event_key, product_code, event_type,
-                            date_received, adverse_event_flag, openfda_json,
-                            cached_at, checksum
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                        ON CONFLICT (event_key) DO UPDATE SET
-                            product_code = EXCLUDED.product_code,
-                            event_type = EXCLUDED.event_type,
-                            date_received = EXCLUDED.date_received,
-                            adverse_event_flag = EXCLUDED.adverse_event_flag,
-                            openfda_json = EXCLUDED.openfda_json,
-                            cached_at = EXCLUDED.cached_at,
-                            checksum = EXCLUDED.checksum
-                    """).format(table=sql.Identifier(table_name))
-
-                    cur.execute(query, (
-                        record_id,
-                        product_code,
-                        data.get('event_type', ''),
-                        data.get('date_received'),
-                        data.get('adverse_event_flag', 'N'),
-                        Json(data),
-                        datetime.now(),
-                        checksum
-                    ))
-
-                elif endpoint == 'recalls':
-                    query = sql.SQL("""
-                        INSERT INTO {table} (
-                            recall_number, product_code, classification,
-                            recalling_firm, event_date_initiated, openfda_json,
-                            cached_at, checksum
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                        ON CONFLICT (recall_number) DO UPDATE SET
-                            product_code = EXCLUDED.product_code,
-                            classification = EXCLUDED.classification,
-                            recalling_firm = EXCLUDED.recalling_firm,
-                            event_date_initiated = EXCLUDED.event_date_initiated,
-                            openfda_json = EXCLUDED.openfda_json,
-                            cached_at = EXCLUDED.cached_at,
-                            checksum = EXCLUDED.checksum
-                    """).format(table=sql.Identifier(table_name))
-
-                    cur.execute(query, (
-                        record_id,
-                        product_code,
-                        data.get('classification', ''),
-                        data.get('recalling_firm', ''),
-                        data.get('event_date_initiated'),
-                        Json(data),
-                        datetime.now(),
-                        checksum
-                    ))
-
-                elif endpoint == 'pma':
-                    query = sql.SQL("""
-                        INSERT INTO {table} (
-                            pma_number, product_code, device_name,
-                            applicant, decision_date, openfda_json,
-                            cached_at, checksum
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                        ON CONFLICT (pma_number) DO UPDATE SET
-                            product_code = EXCLUDED.product_code,
-                            device_name = EXCLUDED.device_name,
-                            applicant = EXCLUDED.applicant,
-                            decision_date = EXCLUDED.decision_date,
-                            openfda_json = EXCLUDED.openfda_json,
-                            cached_at = EXCLUDED.cached_at,
-                            checksum = EXCLUDED.checksum
-                    """).format(table=sql.Identifier(table_name))
-
-                    cur.execute(query, (
-                        record_id,
-                        product_code,
-                        device_name,
-                        applicant,
-                        decision_date,
-                        Json(data),
-                        datetime.now(),
-                        checksum
-                    ))
-
-                elif endpoint == 'udi':
-                    query = sql.SQL("""
-                        INSERT INTO {table} (
-                            di, product_code, brand_name,
-                            company_name, openfda_json,
-                            cached_at, checksum
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s
-                        )
-                        ON CONFLICT (di) DO UPDATE SET
-                            product_code = EXCLUDED.product_code,
-                            brand_name = EXCLUDED.brand_name,
-                            company_name = EXCLUDED.company_name,
-                            openfda_json = EXCLUDED.openfda_json,
-                            cached_at = EXCLUDED.cached_at,
-                            checksum = EXCLUDED.checksum
-                    """).format(table=sql.Identifier(table_name))
-
-                    cur.execute(query, (
-                        record_id,
-                        product_code,
-                        data.get('brand_name', ''),
-                        data.get('company_name', ''),
-                        Json(data),
-                        datetime.now(),
-                        checksum
-                    ))
-
-                elif endpoint == 'enforcement':
-                    query = sql.SQL("""
-                        INSERT INTO {table} (
-                            recall_number, product_code, classification,
-                            status, center_classification_date, openfda_json,
-                            cached_at, checksum
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                        ON CONFLICT (recall_number) DO UPDATE SET
-                            product_code = EXCLUDED.product_code,
-                            classification = EXCLUDED.classification,
-                            status = EXCLUDED.status,
-                            center_classification_date = EXCLUDED.center_classification_date,
-                            openfda_json = EXCLUDED.openfda_json,
-                            cached_at = EXCLUDED.cached_at,
-                            checksum = EXCLUDED.checksum
-                    """).format(table=sql.Identifier(table_name))
-
-                    cur.execute(query, (
-                        record_id,
-                        product_code,
-                        data.get('classification', ''),
-                        data.get('status', ''),
-                        data.get('center_classification_date'),
-                        Json(data),
-                        datetime.now(),
-                        checksum
-                    ))
+                cur.execute(self._upsert_query(endpoint, placeholders), values)
 
                 logger.debug(f"Upserted {endpoint} record: {record_id}")
                 return True
 
+    def upsert_many(
+        self,
+        endpoint: str,
+        records: Iterable[Tuple[str, Dict[str, Any]]],
+        page_size: Optional[int] = None
+    ) -> int:
+        """
+        Insert or update many records in one transaction.
+
+        Uses one pooled connection, one ``SET LOCAL`` and multi-row
+        ``INSERT ... ON CONFLICT`` statements of ``page_size`` rows
+        (psycopg2.extras.execute_values) instead of a round-trip per record.
+        If a record ID appears more than once, the last one wins.
+
+        Args:
+            endpoint: Endpoint name ('510k', 'maude', etc.)
+            records: (record_id, data) pairs, e.g. ``{k_number: record}.items()``
+            page_size: Rows per INSERT statement (default: UPSERT_PAGE_SIZE)
+
+        Returns:
+            Number of records upserted
+        """
+        if endpoint not in self.ENDPOINT_TABLES:
+            raise ValueError(f"Unknown endpoint: {endpoint}")
+
+        # A multi-row ON CONFLICT cannot touch the same row twice
+        latest = {record_id: data for record_id, data in records if record_id}
+        if not latest:
+            return 0
+
+        checksums = self.compute_checksums(list(latest.values()))
+        cached_at = datetime.now()
+        rows = [
+            self._record_values(endpoint, record_id, data, checksum, cached_at)
+            for (record_id, data), checksum in zip(latest.items(), checksums)
+        ]
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                # Set user_id for audit trail
+                cur.execute("SET LOCAL app.user_id = %s", (os.getenv('USER', 'system'),))
+                execute_values(
+                    cur,
+                    self._upsert_query(endpoint, "%s"),
+                    rows,
+                    page_size=page_size or self.UPSERT_PAGE_SIZE,
+                )
+
+        logger.debug(f"Upserted {len(rows)} {endpoint} records")
+        return len(rows)
+
     def get_record(
         self,
         endpoint: str,
@@ -0,0 +1,162 @@
+"""
+Bounded-memory streaming quantile sketch (DDSketch).
+
+Keeping every observation to answer percentile queries grows without bound
+in a long-running process and costs a full sort per query. This sketch
+stores counts in logarithmically sized buckets instead:
+
+  - O(1) add: the bucket index is ``ceil(log(value) / log(gamma))``
+  - Relative-accuracy guarantee: any returned quantile is within
+    ``relative_accuracy`` (default 1%) of the true value at that rank
+  - Fixed memory: at most ``max_buckets`` buckets per sign; beyond that the
+    lowest buckets are collapsed together, so only the smallest quantiles
+    lose accuracy
+  - Mergeable: sketches with the same accuracy combine by adding bucket
+    counts (e.g. per-window or per-process sketches)
+
+Rank convention matches ``sorted(values)[int(n * q)]`` (index clamped), the
+convention used by lib/monitoring.Histogram before it used this sketch.
+
+Usage:
+    from fda_tools.lib.quantile_sketch import QuantileSketch
+
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for ms in durations:
+        sketch.add(ms)
+    p95 = sketch.quantile(0.95)
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+# Values with magnitude below this are counted as zero
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class QuantileSketch:
+    """DDSketch with a bounded number of buckets.
+
+    Not thread-safe; callers serialize access (Histogram holds its lock).
+
+    Args:
+        relative_accuracy: Maximum relative error of returned quantiles.
+        max_buckets: Bucket cap per sign (positive and negative values).
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 1:
+            raise ValueError("max_buckets must be positive")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint (in relative terms) of the bucket (gamma^(i-1), gamma^i]
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def _collapse(self, store: Dict[int, int]):
+        """Fold the buckets holding the lowest values into one so at most
+        max_buckets remain (lowest indices for positive values, highest
+        indices, i.e. the most negative values, for negative ones)."""
+        keys = sorted(store, reverse=store is self._negative)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        for key in keys[:excess]:
+            store[target] += store.pop(key)
+
+    def add(self, value: float, count: int = 1):
+        """Record ``value`` (``count`` times)."""
+        if count <= 0:
+            return
+        if value > MIN_INDEXABLE_VALUE:
+            store, index = self._positive, self._index(value)
+        elif value < -MIN_INDEXABLE_VALUE:
+            store, index = self._negative, self._index(-value)
+        else:
+            store, index = None, 0
+        if store is None:
+            self.zero_count += count
+        elif index in store:
+            store[index] += count
+        else:
+            store[index] = count
+            if len(store) > self.max_buckets:
+                self._collapse(store)
+        self.count += count
+        self.sum += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def update(self, values: Iterable[float]):
+        """Record every value in ``values``."""
+        for value in values:
+            self.add(value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the value at quantile ``q`` (0..1), or None if empty."""
+        if self.count == 0:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        rank = min(int(self.count * q), self.count - 1)
+        # The extremes are tracked exactly
+        if rank == 0:
+            return self.min
+        if rank == self.count - 1:
+            return self.max
+
+        seen = 0
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                return self._clamp(-self._value(index))
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._positive):
+            seen += self._positive[index]
+            if seen > rank:
+                return self._clamp(self._value(index))
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+    def merge(self, other: "QuantileSketch"):
+        """Add ``other``'s observations into this sketch."""
+        if not math.isclose(other.gamma, self.gamma):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for mine, theirs in ((self._positive, other._positive), (self._negative, other._negative)):
+            for index, count in theirs.items():
+                mine[index] = mine.get(index, 0) + count
+            if len(mine) > self.max_buckets:
+                self._collapse(mine)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "QuantileSketch":
+        sketch = QuantileSketch(self.relative_accuracy, self.max_buckets)
+        sketch.merge(self)
+        return sketch
+
+    @property
+    def num_buckets(self) -> int:
+        return len(self._positive) + len(self._negative)
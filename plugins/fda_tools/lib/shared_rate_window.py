@@ -0,0 +1,155 @@
+"""
+Shared-memory sliding request window for CrossProcessRateLimiter.
+
+The file backend of CrossProcessRateLimiter re-reads, prunes and atomically
+rewrites a JSON list of up to ``requests_per_minute`` timestamps on every
+request, and waiters poll a non-blocking ``flock``. This backend keeps the
+same sliding window in a fixed-size memory-mapped ring buffer instead:
+
+  - One slot per allowed request (``capacity`` doubles), so the slot at the
+    ring head always holds the oldest timestamp in the window
+  - Acquiring is O(1): if the oldest slot has aged out of the window,
+    overwrite it with ``now`` and advance the head
+  - Updates happen in place in shared pages, under a blocking ``flock`` held
+    for a few microseconds (no JSON, no rename, no fsync)
+  - A caller that finds the window full gets back the exact number of
+    seconds until the oldest slot expires, so waiters sleep once instead
+    of polling
+
+File layout (little-endian):
+    magic (8 bytes) | capacity (uint32) | head (uint32) | capacity x float64
+
+Usage:
+    from fda_tools.lib.shared_rate_window import SharedRequestWindow
+
+    window = SharedRequestWindow('~/fda-510k-data/.rate_limit_240.window', capacity=240)
+    wait = window.try_acquire()   # 0.0 = slot taken, else seconds until one frees
+"""
+
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+MAGIC = b"FDARLW01"
+_HEADER = struct.Struct("<8sII")
+_SLOT = struct.Struct("<d")
+
+
+class SharedRequestWindow:
+    """Cross-process sliding window of the last ``capacity`` request times.
+
+    Every process that opens the same path shares the window. All processes
+    must use the same ``capacity`` (callers encode it in the file name); a
+    file with a different capacity or a bad header is re-initialized.
+
+    Args:
+        path: Backing file, created if missing.
+        capacity: Requests allowed per window.
+        window_seconds: Length of the sliding window.
+    """
+
+    def __init__(self, path: Union[str, Path], capacity: int, window_seconds: float = 60.0):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.path = Path(path)
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        self._size = _HEADER.size + capacity * _SLOT.size
+        # flock excludes other processes only; threads sharing this fd need a lock too
+        self._thread_lock = threading.Lock()
+        self._fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                if not self._header_valid():
+                    os.ftruncate(self._fd, 0)
+                    os.ftruncate(self._fd, self._size)
+                    os.pwrite(self._fd, _HEADER.pack(MAGIC, capacity, 0), 0)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self._map = mmap.mmap(self._fd, self._size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _header_valid(self) -> bool:
+        if os.fstat(self._fd).st_size != self._size:
+            return False
+        magic, capacity, head = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0))
+        return magic == MAGIC and capacity == self.capacity and head < capacity
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._thread_lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _head(self) -> int:
+        return _HEADER.unpack_from(self._map, 0)[2]
+
+    def _slot_offset(self, index: int) -> int:
+        return _HEADER.size + index * _SLOT.size
+
+    def _push(self, head: int, now: float):
+        _SLOT.pack_into(self._map, self._slot_offset(head), now)
+        _HEADER.pack_into(self._map, 0, MAGIC, self.capacity, (head + 1) % self.capacity)
+
+    def try_acquire(self, now: Optional[float] = None) -> float:
+        """Take a slot if the window has room.
+
+        Returns:
+            0.0 if a slot was taken, otherwise the seconds until the oldest
+            request leaves the window.
+        """
+        with self._locked():
+            now = time.time() if now is None else now
+            head = self._head()
+            oldest = _SLOT.unpack_from(self._map, self._slot_offset(head))[0]
+            age = now - oldest
+            # A slot stamped far in the future means the clock went backwards
+            if age >= self.window_seconds or age < -self.window_seconds:
+                self._push(head, now)
+                return 0.0
+            return self.window_seconds - age
+
+    def record(self, now: Optional[float] = None):
+        """Record a request without checking the limit (overwrites the oldest slot)."""
+        with self._locked():
+            self._push(self._head(), time.time() if now is None else now)
+
+    def timestamps(self, now: Optional[float] = None) -> List[float]:
+        """Return the request times still inside the window, oldest first."""
+        with self._locked():
+            now = time.time() if now is None else now
+            head = self._head()
+            slots = [_SLOT.unpack_from(self._map, self._slot_offset((head + i) % self.capacity))[0]
+                     for i in range(self.capacity)]
+        cutoff = now - self.window_seconds
+        return [ts for ts in slots if ts > cutoff]
+
+    def reset(self):
+        """Clear all recorded requests."""
+        with self._locked():
+            self._map[:] = b"\0" * self._size
+            _HEADER.pack_into(self._map, 0, MAGIC, self.capacity, 0)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            os.close(self._fd)
+
+    def __enter__(self) -> "SharedRequestWindow":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
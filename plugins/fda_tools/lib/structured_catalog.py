@@ -0,0 +1,356 @@
+"""
+Metadata catalog for the structured 510(k) text cache.
+
+``compare_sections`` used to ``json.load`` every file in
+``structured_text_cache/``, full text included, only to keep the devices of
+one product code. This module keeps a SQLite catalog next to the cache with
+one row per document, so documents are selected with a query and only the
+section texts a caller touches are read from disk.
+
+  - Per-document metadata: product code, decision date, device name, OCR
+    quality and the section list
+  - Section offsets: byte offset and length of each section's JSON-encoded
+    ``text`` value inside the file; a section is loaded by reading that slice
+  - Files whose section texts cannot be located (e.g. written with
+    ``ensure_ascii=False``) or that changed since they were catalogued are
+    parsed whole, on first access only
+  - Incremental: ``build_structured_cache.py`` catalogs each file as it
+    writes it; ``sync()`` picks up files added, changed or removed otherwise
+
+Usage:
+    from fda_tools.lib.structured_catalog import StructuredCatalog
+
+    catalog = StructuredCatalog(structured_dir)
+    catalog.sync()
+    docs = catalog.select(product_codes=['DQY'], year_start=2020)
+    text = docs['K231152']['sections']['biocompatibility']['text']  # read on access
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+CATALOG_DB_NAME = "catalog.db"
+SCHEMA_VERSION = 1
+
+# Key/value separators json.dump may have used in front of a section's text
+_TEXT_KEY_PREFIXES = (b'"text":', b'"text": ')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    k_number TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    product_code TEXT NOT NULL,
+    decision_date TEXT NOT NULL,
+    device_name TEXT NOT NULL,
+    ocr_quality TEXT,
+    ocr_confidence REAL,
+    sections TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_documents_product_code ON documents(product_code, decision_date);
+CREATE INDEX IF NOT EXISTS idx_documents_decision_date ON documents(decision_date);
+"""
+
+
+def section_offsets(raw: bytes, doc: Dict) -> Dict[str, Optional[Tuple[int, int]]]:
+    """Locate each section's JSON-encoded text in the serialized document.
+
+    Returns:
+        ``section -> (byte_offset, byte_length)``, or None for a section
+        whose text is not found verbatim in ``raw``.
+    """
+    offsets: Dict[str, Optional[Tuple[int, int]]] = {}
+    for name, section in (doc.get("sections") or {}).items():
+        offsets[name] = None
+        text = (section or {}).get("text")
+        if not isinstance(text, str):
+            continue
+        encoded = json.dumps(text).encode("ascii")
+        for prefix in _TEXT_KEY_PREFIXES:
+            found = raw.find(prefix + encoded)
+            if found >= 0:
+                offsets[name] = (found + len(prefix), len(encoded))
+                break
+    return offsets
+
+
+def _document_fields(doc: Dict) -> Dict:
+    metadata = doc.get("metadata") or {}
+    return {
+        "product_code": (metadata.get("product_code") or doc.get("product_code") or "").upper(),
+        "decision_date": doc.get("decision_date") or metadata.get("decision_date") or "",
+        "device_name": doc.get("device_name") or metadata.get("device_name") or "",
+    }
+
+
+class LazySections(Mapping):
+    """Read-only ``section -> section dict`` mapping that reads texts on access.
+
+    Membership and iteration come from the catalog; ``sections[name]``
+    reads that section's text from the structured file.
+    """
+
+    def __init__(self, path: str, mtime_ns: int, size: int, entries: Dict[str, Dict]):
+        self._path = path
+        self._mtime_ns = mtime_ns
+        self._size = size
+        self._entries = entries
+        self._parsed: Optional[Dict] = None
+
+    def __getitem__(self, name: str) -> Dict:
+        entry = self._entries[name]
+        if self._parsed is None and entry["offset"] is not None and self._unchanged():
+            with open(self._path, "rb") as f:
+                f.seek(entry["offset"])
+                chunk = f.read(entry["length"])
+            try:
+                text = json.loads(chunk)
+            except ValueError:
+                text = None
+            if isinstance(text, str):
+                return dict(entry["info"], text=text)
+        return self._parsed_sections()[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name) -> bool:
+        return name in self._entries
+
+    def _unchanged(self) -> bool:
+        try:
+            st = os.stat(self._path)
+        except OSError:
+            return False
+        return st.st_mtime_ns == self._mtime_ns and st.st_size == self._size
+
+    def _parsed_sections(self) -> Dict:
+        if self._parsed is None:
+            with open(self._path) as f:
+                sections = json.load(f).get("sections") or {}
+            # A file rewritten since cataloguing may have lost a section
+            self._parsed = {name: sections.get(name, dict(self._entries[name]["info"], text=""))
+                            for name in self._entries}
+        return self._parsed
+
+
+class StructuredCatalog:
+    """SQLite-backed document catalog for a structured text cache directory.
+
+    Args:
+        structured_dir: Directory of ``<K-number>.json`` structured files.
+        db_path: Catalog location (default: ``structured_dir/catalog.db``).
+    """
+
+    def __init__(self, structured_dir: Path, db_path: Optional[Path] = None):
+        self.structured_dir = Path(structured_dir)
+        self.db_path = Path(db_path or self.structured_dir / CATALOG_DB_NAME)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        conn = self._conn()
+        with conn:
+            conn.executescript(_SCHEMA)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None:
+                conn.execute("INSERT INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+
+    @classmethod
+    def exists(cls, structured_dir: Path) -> bool:
+        """Return True if a catalog has been built for ``structured_dir``."""
+        return (Path(structured_dir) / CATALOG_DB_NAME).exists()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, conn: sqlite3.Connection, key: str, value: str):
+        conn.execute(
+            "INSERT INTO meta VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def add_document(self, doc: Dict, path: Path, raw: Optional[bytes] = None):
+        """Catalog (or re-catalog) one structured document written at ``path``.
+
+        Args:
+            doc: The parsed document.
+            path: File it was read from or written to.
+            raw: The file's bytes, if already in hand (read from ``path`` otherwise).
+        """
+        st = os.stat(path)
+        if raw is None:
+            with open(path, "rb") as f:
+                raw = f.read()
+        offsets = section_offsets(raw, doc)
+        sections = {}
+        for name, section in (doc.get("sections") or {}).items():
+            offset = offsets[name]
+            sections[name] = {
+                "offset": offset[0] if offset else None,
+                "length": offset[1] if offset else None,
+                "info": {key: value for key, value in (section or {}).items() if key != "text"},
+            }
+        fields = _document_fields(doc)
+
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (doc["k_number"], str(path), st.st_mtime_ns, st.st_size,
+                 fields["product_code"], fields["decision_date"], fields["device_name"],
+                 doc.get("ocr_quality"), doc.get("ocr_confidence"),
+                 json.dumps(sections, separators=(",", ":"))),
+            )
+
+    def remove_document(self, k_number: str) -> bool:
+        """Drop a document. Returns True if it was catalogued."""
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute("DELETE FROM documents WHERE k_number = ?", (k_number,))
+        return cursor.rowcount > 0
+
+    def sync(self, force: bool = False) -> Dict[str, int]:
+        """Bring the catalog up to date with the structured cache directory.
+
+        Each file's mtime and size are compared with the catalogued values,
+        so files rewritten in place (which leave the directory mtime alone)
+        are picked up. Only new or changed files are parsed. ``force`` is
+        kept for existing callers; every sync rescans.
+
+        Returns:
+            Counts of ``added``, ``updated``, ``removed`` and ``unchanged`` documents.
+        """
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        if not self.structured_dir.exists():
+            return counts
+        catalogued = {
+            path: (k_number, mtime_ns, size)
+            for k_number, path, mtime_ns, size in self._conn().execute(
+                "SELECT k_number, path, mtime_ns, size FROM documents")
+        }
+        seen = set()
+        for file_path in self.structured_dir.glob("*.json"):
+            if file_path.name == "manifest.json":
+                continue
+            st = file_path.stat()
+            current = catalogued.get(str(file_path))
+            if current and current[1] == st.st_mtime_ns and current[2] == st.st_size:
+                seen.add(current[0])
+                counts["unchanged"] += 1
+                continue
+            try:
+                with open(file_path, "rb") as f:
+                    raw = f.read()
+                doc = json.loads(raw)
+            except (OSError, ValueError):
+                continue
+            if not isinstance(doc, dict) or "k_number" not in doc:
+                continue
+            self.add_document(doc, file_path, raw)
+            seen.add(doc["k_number"])
+            counts["updated" if current else "added"] += 1
+
+        for k_number, _, _ in catalogued.values():
+            if k_number not in seen:
+                self.remove_document(k_number)
+                counts["removed"] += 1
+        return counts
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def select(
+        self,
+        product_codes: Optional[Iterable[str]] = None,
+        year_start: Optional[int] = None,
+        year_end: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Dict]:
+        """Select documents by product code and decision-date year.
+
+        With a year range, documents without a parseable decision date are
+        excluded. With ``limit``, the most recent decisions are kept.
+
+        Returns:
+            ``k_number -> document`` in the structured-file layout
+            (``k_number``, ``product_code``, ``decision_date``,
+            ``device_name`` when known, ``ocr_quality``, ``ocr_confidence``,
+            ``metadata.product_code``), where ``sections`` is a
+            :class:`LazySections` and no ``full_text`` is loaded.
+        """
+        clauses, params = [], []
+        if product_codes is not None:
+            codes = [code.upper() for code in product_codes]
+            if not codes:
+                return {}
+            clauses.append(f"product_code IN ({','.join('?' * len(codes))})")
+            params.extend(codes)
+        if year_start or year_end:
+            clauses.append("substr(decision_date, 1, 4) GLOB '[0-9][0-9][0-9][0-9]'")
+            if year_start:
+                clauses.append("substr(decision_date, 1, 4) >= ?")
+                params.append(f"{year_start:04d}")
+            if year_end:
+                clauses.append("substr(decision_date, 1, 4) <= ?")
+                params.append(f"{year_end:04d}")
+        sql = ("SELECT k_number, path, mtime_ns, size, product_code, decision_date, device_name,"
+               " ocr_quality, ocr_confidence, sections FROM documents")
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY decision_date DESC, k_number"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        documents = {}
+        for (k_number, path, mtime_ns, size, product_code, decision_date, device_name,
+             ocr_quality, ocr_confidence, sections) in self._conn().execute(sql, params):
+            document = {
+                "k_number": k_number,
+                "product_code": product_code,
+                "decision_date": decision_date,
+                "ocr_quality": ocr_quality,
+                "ocr_confidence": ocr_confidence,
+                "metadata": {"product_code": product_code} if product_code else {},
+                "sections": LazySections(path, mtime_ns, size, json.loads(sections)),
+            }
+            if device_name:
+                document["device_name"] = device_name
+            documents[k_number] = document
+        return documents
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
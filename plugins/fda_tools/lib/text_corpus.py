@@ -0,0 +1,128 @@
+"""
+Read-only memory-mapped text corpus for multiprocessing workers.
+
+Passing a ``{path: text}`` dict to ``multiprocessing.Pool`` workers pickles
+the whole corpus into every worker. This module stores the corpus as one
+concatenated UTF-8 blob plus a small offset index; each worker maps the blob
+read-only, so the text lives once in the OS page cache no matter how many
+workers read it, and attaching costs only loading the index.
+
+Files:
+    <name>        concatenated UTF-8 text of all documents
+    <name>.idx    JSON: {"version": 1, "documents": {key: [offset, length]}}
+
+Usage:
+    from fda_tools.lib.text_corpus import MappedCorpus, write_corpus
+
+    write_corpus('/tmp/pdf_corpus', pdf_data.items())
+
+    # In each worker (e.g. a Pool initializer):
+    corpus = MappedCorpus('/tmp/pdf_corpus')
+    text = corpus.get('/pdfs/K241335.pdf')
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+CORPUS_VERSION = 1
+INDEX_SUFFIX = ".idx"
+
+PathLike = Union[str, Path]
+
+
+def _index_path(path: PathLike) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def write_corpus(path: PathLike, documents: Iterable[Tuple[str, Optional[str]]]) -> int:
+    """Write documents to a corpus blob and offset index.
+
+    Both files are written to temporary names and renamed into place, so a
+    reader never sees a partial corpus. ``None`` texts are stored as empty.
+
+    Returns:
+        Number of documents written.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_blob = path.with_name(path.name + ".tmp")
+    offsets = {}
+    offset = 0
+    with open(tmp_blob, "wb") as f:
+        for key, text in documents:
+            data = (text or "").encode("utf-8")
+            f.write(data)
+            offsets[key] = [offset, len(data)]
+            offset += len(data)
+
+    tmp_index = path.with_name(path.name + INDEX_SUFFIX + ".tmp")
+    with open(tmp_index, "w") as f:
+        json.dump({"version": CORPUS_VERSION, "documents": offsets}, f)
+    os.replace(tmp_blob, path)
+    os.replace(tmp_index, _index_path(path))
+    return len(offsets)
+
+
+class MappedCorpus:
+    """Read-only, memory-mapped view of a corpus written by ``write_corpus``.
+
+    Safe to open in any number of processes; pages are shared through the
+    OS page cache.
+    """
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        with open(_index_path(self.path)) as f:
+            index = json.load(f)
+        if index.get("version") != CORPUS_VERSION:
+            raise ValueError(f"Unsupported corpus version: {index.get('version')}")
+        self._offsets = index["documents"]
+        self._file = open(self.path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap cannot map an empty file
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Return a document's text, or ``default`` if the key is absent."""
+        entry = self._offsets.get(key)
+        if entry is None:
+            return default
+        offset, length = entry
+        if not length:
+            return ""
+        return self._map[offset:offset + length].decode("utf-8")
+
+    def __getitem__(self, key: str) -> str:
+        text = self.get(key)
+        if text is None:
+            raise KeyError(key)
+        return text
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def keys(self):
+        return self._offsets.keys()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+        return False
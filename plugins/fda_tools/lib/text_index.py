@@ -0,0 +1,340 @@
+"""
+Persistent inverted index over the structured 510(k) text cache.
+
+``full_text_search`` used to open every JSON file in
+``structured_text_cache/`` and run one regex per term over every section of
+every document. This module keeps a SQLite index next to the cache so a
+search only touches the documents that actually contain the terms.
+
+  - Postings: (term, document, section) -> token positions and character
+    offsets; ``full_text`` is indexed as its own section
+  - Phrase queries: multi-word terms match on consecutive token positions
+  - Section filtering happens in the postings query
+  - Incremental: documents are re-indexed only when their file's mtime/size
+    changes; ``build_structured_cache.py`` indexes each file as it writes it
+  - Product-code map from ``pmn96cur.txt``/``pmn9195.txt`` is parsed once and
+    stored in the index, re-parsed only when those files change
+
+Usage:
+    from fda_tools.lib.text_index import StructuredTextIndex
+
+    index = StructuredTextIndex(structured_dir)
+    index.sync()                                  # pick up added/changed/removed files
+    hits = index.find('bluetooth low energy', sections=['device_description'])
+    # -> [(k_number, section, char_offset), ...]
+"""
+
+import csv
+import json
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+INDEX_DB_NAME = "text_index.db"
+FULL_TEXT_SECTION = "full_text"
+SCHEMA_VERSION = 1
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Columns of the pmn*.txt pipe-delimited releases
+_PMN_K_NUMBER_COL = 0
+_PMN_PRODUCT_CODE_COL = 14
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS docs (
+    doc_id INTEGER PRIMARY KEY,
+    k_number TEXT NOT NULL UNIQUE,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sections TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    section TEXT NOT NULL,
+    positions TEXT NOT NULL,
+    PRIMARY KEY (term, doc_id, section)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_doc ON postings(doc_id);
+CREATE TABLE IF NOT EXISTS product_codes (
+    k_number TEXT PRIMARY KEY,
+    product_code TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_product_codes_code ON product_codes(product_code);
+"""
+
+
+def tokenize(text: str) -> List[Tuple[str, int]]:
+    """Split text into lowercase word tokens with their character offsets."""
+    return [(m.group().lower(), m.start()) for m in _TOKEN_RE.finditer(text)]
+
+
+def _section_texts(doc: Dict) -> List[Tuple[str, str]]:
+    texts = [(name, (sec or {}).get("text", "")) for name, sec in (doc.get("sections") or {}).items()]
+    texts.append((FULL_TEXT_SECTION, doc.get("full_text", "")))
+    return texts
+
+
+class StructuredTextIndex:
+    """SQLite-backed inverted index for a structured text cache directory.
+
+    Args:
+        structured_dir: Directory of ``<K-number>.json`` structured files.
+        db_path: Index location (default: ``structured_dir/text_index.db``).
+    """
+
+    def __init__(self, structured_dir: Path, db_path: Optional[Path] = None):
+        self.structured_dir = Path(structured_dir)
+        self.db_path = Path(db_path or self.structured_dir / INDEX_DB_NAME)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        conn = self._conn()
+        with conn:
+            conn.executescript(_SCHEMA)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None:
+                conn.execute("INSERT INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+
+    @classmethod
+    def exists(cls, structured_dir: Path) -> bool:
+        """Return True if an index has been built for ``structured_dir``."""
+        return (Path(structured_dir) / INDEX_DB_NAME).exists()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, conn: sqlite3.Connection, key: str, value: str):
+        conn.execute(
+            "INSERT INTO meta VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def add_document(self, doc: Dict, path: Path):
+        """Index (or re-index) one structured document written at ``path``."""
+        k_number = doc["k_number"]
+        st = os.stat(path)
+        postings: Dict[Tuple[str, str], List[List[int]]] = {}
+        for section, text in _section_texts(doc):
+            for pos, (term, offset) in enumerate(tokenize(text)):
+                postings.setdefault((term, section), []).append([pos, offset])
+
+        conn = self._conn()
+        with conn:
+            row = conn.execute("SELECT doc_id FROM docs WHERE k_number = ?", (k_number,)).fetchone()
+            if row:
+                doc_id = row[0]
+                conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+                conn.execute(
+                    "UPDATE docs SET path = ?, mtime_ns = ?, size = ?, sections = ? WHERE doc_id = ?",
+                    (str(path), st.st_mtime_ns, st.st_size,
+                     json.dumps(list(doc.get("sections") or {})), doc_id),
+                )
+            else:
+                doc_id = conn.execute(
+                    "INSERT INTO docs (k_number, path, mtime_ns, size, sections) VALUES (?, ?, ?, ?, ?)",
+                    (k_number, str(path), st.st_mtime_ns, st.st_size,
+                     json.dumps(list(doc.get("sections") or {}))),
+                ).lastrowid
+            conn.executemany(
+                "INSERT INTO postings VALUES (?, ?, ?, ?)",
+                ((term, doc_id, section, json.dumps(pos, separators=(",", ":")))
+                 for (term, section), pos in postings.items()),
+            )
+
+    def remove_document(self, k_number: str) -> bool:
+        """Drop a document and its postings. Returns True if it was indexed."""
+        conn = self._conn()
+        with conn:
+            row = conn.execute("SELECT doc_id FROM docs WHERE k_number = ?", (k_number,)).fetchone()
+            if not row:
+                return False
+            conn.execute("DELETE FROM postings WHERE doc_id = ?", (row[0],))
+            conn.execute("DELETE FROM docs WHERE doc_id = ?", (row[0],))
+        return True
+
+    def sync(self, force: bool = False) -> Dict[str, int]:
+        """Bring the index up to date with the structured cache directory.
+
+        Each file's mtime and size are compared with the indexed values, so
+        files rewritten in place (which leave the directory mtime alone) are
+        picked up. Only new or changed files are parsed. ``force`` is kept
+        for existing callers; every sync rescans.
+
+        Returns:
+            Counts of ``added``, ``updated``, ``removed`` and ``unchanged`` documents.
+        """
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        if not self.structured_dir.exists():
+            return counts
+        indexed = {
+            path: (k_number, mtime_ns, size)
+            for k_number, path, mtime_ns, size in self._conn().execute(
+                "SELECT k_number, path, mtime_ns, size FROM docs")
+        }
+        seen = set()
+        for file_path in self.structured_dir.glob("*.json"):
+            if file_path.name == "manifest.json":
+                continue
+            key = str(file_path)
+            st = file_path.stat()
+            current = indexed.get(key)
+            if current and current[1] == st.st_mtime_ns and current[2] == st.st_size:
+                seen.add(current[0])
+                counts["unchanged"] += 1
+                continue
+            try:
+                with open(file_path) as f:
+                    doc = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if "k_number" not in doc:
+                continue
+            self.add_document(doc, file_path)
+            seen.add(doc["k_number"])
+            counts["updated" if current else "added"] += 1
+
+        for k_number, _, _ in indexed.values():
+            if k_number not in seen:
+                self.remove_document(k_number)
+                counts["removed"] += 1
+        return counts
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def find(
+        self,
+        phrase: str,
+        k_numbers: Optional[Iterable[str]] = None,
+        sections: Optional[Sequence[str]] = None,
+    ) -> List[Tuple[str, str, int]]:
+        """Locate a word or phrase.
+
+        Postings for the phrase's tokens are intersected per (document,
+        section) and checked for consecutive positions.
+
+        Returns:
+            ``(k_number, section, char_offset)`` for each occurrence, where
+            ``char_offset`` is the start of the first token in that
+            section's text.
+        """
+        tokens = [t for t, _ in tokenize(phrase)]
+        if not tokens:
+            return []
+        doc_filter = set(k_numbers) if k_numbers is not None else None
+        section_filter = set(sections) if sections else None
+
+        candidates: Optional[Dict[Tuple[int, str], List[Dict[int, int]]]] = None
+        for token in dict.fromkeys(tokens):
+            rows = self._conn().execute(
+                "SELECT doc_id, section, positions FROM postings WHERE term = ?", (token,)
+            ).fetchall()
+            found = {}
+            for doc_id, section, positions in rows:
+                if section_filter is not None and section not in section_filter:
+                    continue
+                if candidates is not None and (doc_id, section) not in candidates:
+                    continue
+                found[(doc_id, section)] = positions
+            if candidates is None:
+                candidates = {key: {token: pos} for key, pos in found.items()}
+            else:
+                candidates = {key: dict(candidates[key], **{token: found[key]})
+                              for key in found}
+            if not candidates:
+                return []
+
+        doc_names = dict(self._conn().execute("SELECT doc_id, k_number FROM docs"))
+        hits = []
+        for (doc_id, section), raw in candidates.items():
+            k_number = doc_names.get(doc_id)
+            if k_number is None or (doc_filter is not None and k_number not in doc_filter):
+                continue
+            by_token = {t: json.loads(p) for t, p in raw.items()}
+            first = by_token[tokens[0]]
+            if len(tokens) == 1:
+                hits.extend((k_number, section, offset) for _, offset in first)
+                continue
+            following = [{pos for pos, _ in by_token[t]} for t in tokens[1:]]
+            for pos, offset in first:
+                if all(pos + j + 1 in later for j, later in enumerate(following)):
+                    hits.append((k_number, section, offset))
+        hits.sort(key=lambda h: (h[0], h[1], h[2]))
+        return hits
+
+    def documents(self) -> Dict[str, Tuple[str, List[str]]]:
+        """Return ``k_number -> (path, section names in document order)``."""
+        return {
+            k_number: (path, json.loads(sections))
+            for k_number, path, sections in self._conn().execute(
+                "SELECT k_number, path, sections FROM docs")
+        }
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Product code map
+    # ------------------------------------------------------------------
+
+    def k_numbers_for_product_codes(
+        self, product_codes: Iterable[str], pmn_files: Sequence[Path]
+    ) -> Dict[str, str]:
+        """Return ``k_number -> product_code`` for the given product codes.
+
+        The pmn releases are parsed into the index once and re-parsed only
+        when a file's mtime or size changes.
+        """
+        existing = [Path(p) for p in pmn_files if Path(p).exists()]
+        signature = json.dumps([[str(p), p.stat().st_mtime_ns, p.stat().st_size] for p in existing])
+        if self._get_meta("pmn_signature") != signature:
+            conn = self._conn()
+            with conn:
+                conn.execute("DELETE FROM product_codes")
+                for pmn_file in existing:
+                    with open(pmn_file, encoding="latin-1") as f:
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO product_codes VALUES (?, ?)",
+                            ((row[_PMN_K_NUMBER_COL], row[_PMN_PRODUCT_CODE_COL])
+                             for row in csv.reader(f, delimiter="|")
+                             if len(row) > _PMN_PRODUCT_CODE_COL),
+                        )
+                self._set_meta(conn, "pmn_signature", signature)
+
+        codes = list(product_codes)
+        if not codes:
+            return {}
+        placeholders = ",".join("?" * len(codes))
+        return dict(self._conn().execute(
+            f"SELECT k_number, product_code FROM product_codes WHERE product_code IN ({placeholders})",
+            codes,
+        ))
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Asyncio FDA API client with bounded concurrency.
+
+AsyncFDAClient wraps an FDAClient and exposes the same lookup methods as
+coroutines, so independent requests (e.g. the three round-trips of
+get_device_characteristics, or one lookup per product code in a batch) run
+concurrently instead of back to back.
+
+Semantics are shared with the wrapped FDAClient:
+    - Same cache keys and integrity-verified disk cache
+      (FDAClient._cache_key / _get_cached / _set_cached), including
+      caching of 404 responses as empty result sets
+    - Same retry policy (429 Retry-After, 5xx and network errors with
+      exponential backoff) and degraded-mode error dicts
+    - Same HTTP transport (keep-alive pool when enabled) and session stats
+    - Same single-flight de-duplication: concurrent coroutines asking for
+      the same cache key await one fetch (counted as "coalesced")
+
+Concurrency is bounded by an asyncio.Semaphore (default from
+``performance.max_concurrent_requests``) and every API call acquires a token
+from the shared CrossProcessRateLimiter via acquire_async(), so many
+in-flight requests still respect the per-minute quota across processes.
+Without it, the client's in-process RateLimiter is used, its blocking
+acquire() running in the executor.
+
+Blocking work (cache file I/O and the HTTP exchange itself) runs in the
+default thread pool executor; the event loop never blocks on it.
+
+Usage:
+    import asyncio
+    from async_fda_client import AsyncFDAClient
+
+    async def main():
+        client = AsyncFDAClient(max_concurrency=8)
+        results = await client.gather_510k(["K241335", "K192345"])
+        chars = await client.get_device_characteristics("DQY")
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import copy
+import functools
+import json
+import logging
+import urllib.error
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from fda_tools.scripts.fda_api_client import (  # type: ignore
+        FDAClient,
+        BASE_BACKOFF,
+        MAX_RETRIES,
+        USER_AGENT,
+    )
+except ImportError:
+    from fda_api_client import (  # type: ignore
+        FDAClient,
+        BASE_BACKOFF,
+        MAX_RETRIES,
+        USER_AGENT,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Default in-flight request bound -- overridden by config
+DEFAULT_MAX_CONCURRENCY = 5
+try:
+    from fda_tools.lib.config import get_config as _get_config  # type: ignore
+    DEFAULT_MAX_CONCURRENCY = _get_config().get_int(
+        "performance.max_concurrent_requests", default=DEFAULT_MAX_CONCURRENCY
+    )
+    del _get_config
+except Exception:
+    pass  # fall back to hardcoded default above
+
+# Rate limit acquisition timeout (matches FDAClient._request)
+RATE_LIMIT_TIMEOUT = 120.0
+
+
+class AsyncFDAClient:
+    """Asyncio front-end for FDAClient with bounded concurrency.
+
+    Args:
+        client: FDAClient to share cache, transport, rate limiter and stats
+            with. A new FDAClient(**client_kwargs) is created if omitted.
+        max_concurrency: Maximum number of requests in flight at once.
+        **client_kwargs: Passed to FDAClient() when ``client`` is None.
+    """
+
+    def __init__(
+        self,
+        client: Optional[FDAClient] = None,
+        max_concurrency: Optional[int] = None,
+        **client_kwargs: Any,
+    ):
+        self.client = client or FDAClient(**client_kwargs)
+        self.max_concurrency = max(1, max_concurrency or DEFAULT_MAX_CONCURRENCY)
+        # Created lazily per event loop (a semaphore is bound to one loop)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        # Single-flight registry: cache key -> future of the in-flight fetch
+        self._inflight: Dict[str, "asyncio.Future"] = {}
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run_blocking(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def _acquire_rate_limit(self) -> bool:
+        limiter = self.client._cross_process_limiter or self.client._rate_limiter
+        if limiter is None:
+            return True
+        if hasattr(limiter, "acquire_async"):
+            return await limiter.acquire_async(timeout=RATE_LIMIT_TIMEOUT)
+        # In-process RateLimiter: only the blocking acquire() is available
+        return await self._run_blocking(
+            functools.partial(limiter.acquire, tokens=1, timeout=RATE_LIMIT_TIMEOUT))
+
+    def _retry_delay(self, attempt: int, headers: Optional[Dict] = None,
+                     rate_limited: bool = False) -> Optional[float]:
+        policy = self.client._retry_policy
+        if policy:
+            return policy.get_retry_delay(attempt, headers)
+        if attempt >= MAX_RETRIES:
+            return None
+        # Fallback to simple exponential backoff (doubled for 429)
+        return BASE_BACKOFF * (2 ** attempt) * (2 if rate_limited else 1)
+
+    def _fetch(self, url: str) -> Tuple[Any, Dict]:
+        """Blocking HTTP exchange, run in the executor."""
+        with self.client._open(url, {"User-Agent": USER_AGENT}) as resp:
+            return json.loads(resp.read()), dict(resp.headers)
+
+    async def request(self, endpoint: str, params: Dict[str, str]) -> Dict:
+        """Coroutine equivalent of FDAClient._request().
+
+        Args:
+            endpoint: API endpoint (e.g., '510k', 'classification')
+            params: Query parameters dict
+
+        Returns:
+            Parsed JSON response dict, or error dict with 'degraded': True
+        """
+        client = self.client
+        if not client.enabled:
+            return {"error": "API disabled", "degraded": True}
+
+        params = dict(params)
+
+        # Tier 1: PostgreSQL cache (if enabled) - FDA-191
+        if client.use_postgres and client.db:
+            try:
+                pg_cached = await self._run_blocking(
+                    client._get_postgres_cached, endpoint, params
+                )
+                if pg_cached is not None:
+                    client._stats["postgres_hits"] += 1
+                    return pg_cached
+            except Exception as e:
+                logger.warning("PostgreSQL cache query failed, falling back to JSON: %s", e)
+
+        # Tier 2: JSON file cache
+        key = client._cache_key(endpoint, params)
+        cached = await self._run_blocking(client._get_cached, key)
+        if cached is not None:
+            return cached
+
+        # Single-flight: concurrent identical requests await one fetch
+        pending = self._inflight.get(key)
+        if pending is not None:
+            client._stats["coalesced"] += 1
+            return copy.deepcopy(await asyncio.shield(pending))
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        result = {"error": "In-flight request failed", "degraded": True}
+        try:
+            client._stats["misses"] += 1
+            async with self._get_semaphore():
+                self._in_flight += 1
+                self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+                try:
+                    result = await self._request_api(endpoint, params, key)
+                finally:
+                    self._in_flight -= 1
+            return result
+        finally:
+            del self._inflight[key]
+            future.set_result(result)
+
+    async def _request_api(self, endpoint: str, params: Dict[str, str], key: str) -> Dict:
+        client = self.client
+        if not await self._acquire_rate_limit():
+            client._stats["errors"] += 1
+            logger.error("Rate limit acquisition timeout (%ds)", RATE_LIMIT_TIMEOUT)
+            return {
+                "error": f"Rate limit acquisition timeout after {RATE_LIMIT_TIMEOUT:.0f}s",
+                "degraded": True,
+            }
+
+        url = client._build_url(endpoint, params)
+        last_error = None
+        for attempt in range(MAX_RETRIES):
+            try:
+                data, headers = await self._run_blocking(self._fetch, url)
+                if client._rate_limiter:
+                    client._rate_limiter.update_from_headers(headers)
+                await self._run_blocking(client._set_cached, key, data)
+                return data
+
+            except urllib.error.HTTPError as e:
+                error_headers = dict(e.headers) if getattr(e, "headers", None) else {}
+                if e.code == 404:
+                    # Not found is a valid response, cache it
+                    result = {"results": [], "meta": {"results": {"total": 0}}}
+                    await self._run_blocking(client._set_cached, key, result)
+                    return result
+                if e.code == 429 or e.code >= 500:
+                    logger.warning(
+                        "HTTP %d on attempt %d/%d for %s (async)",
+                        e.code, attempt + 1, MAX_RETRIES, endpoint,
+                    )
+                    if e.code == 429 and client._rate_limiter and error_headers:
+                        client._rate_limiter.update_from_headers(error_headers)
+                    retry_delay = self._retry_delay(
+                        attempt,
+                        error_headers if e.code == 429 else None,
+                        rate_limited=e.code == 429,
+                    )
+                    if retry_delay is None:
+                        break
+                    await asyncio.sleep(retry_delay)
+                    last_error = e
+                    continue
+                # Client error (400, 403, etc.) -- don't retry
+                client._stats["errors"] += 1
+                logger.error("Client error %d for %s: %s", e.code, endpoint, e.reason)
+                return {"error": f"HTTP {e.code}: {e.reason}", "degraded": True}
+
+            except Exception as e:
+                # Network error, timeout, etc. -- retry
+                logger.warning(
+                    "Request error on attempt %d/%d for %s (async): %s",
+                    attempt + 1, MAX_RETRIES, endpoint, e,
+                )
+                retry_delay = self._retry_delay(attempt)
+                if retry_delay is None:
+                    break
+                await asyncio.sleep(retry_delay)
+                last_error = e
+
+        client._stats["errors"] += 1
+        logger.error(
+            "API request failed after %d retries for %s: %s",
+            MAX_RETRIES, endpoint, last_error,
+        )
+        return {
+            "error": f"API unavailable after {MAX_RETRIES} retries: {last_error}",
+            "degraded": True,
+        }
+
+    async def gather(self, requests: Iterable[Tuple[str, Dict[str, str]]]) -> List[Dict]:
+        """Run many (endpoint, params) requests concurrently, preserving order."""
+        return list(await asyncio.gather(
+            *(self.request(endpoint, params) for endpoint, params in requests)
+        ))
+
+    # --- Convenience Methods (mirror FDAClient) ---
+
+    async def get_510k(self, k_number):
+        """Look up a 510(k) clearance by K-number."""
+        return await self.request("510k", {"search": f'k_number:"{k_number}"', "limit": "1"})
+
+    async def get_classification(self, product_code):
+        """Look up device classification by product code."""
+        return await self.request(
+            "classification", {"search": f'product_code:"{product_code}"', "limit": "1"}
+        )
+
+    async def get_clearances(self, product_code, limit=100, sort="decision_date:desc"):
+        """Get all 510(k) clearances for a product code."""
+        params = {"search": f'product_code:"{product_code}"', "limit": str(limit)}
+        if sort:
+            params["sort"] = sort
+        return await self.request("510k", params)
+
+    async def get_events(self, product_code, count=None, limit=100):
+        """Get MAUDE adverse events for a product code."""
+        params = {
+            "search": f'device.device_report_product_code:"{product_code}"',
+            "limit": str(limit),
+        }
+        if count:
+            params["count"] = count
+            del params["limit"]
+        return await self.request("event", params)
+
+    async def get_recalls(self, product_code, limit=10):
+        """Get recall events for a product code."""
+        return await self.request(
+            "recall", {"search": f'product_code:"{product_code}"', "limit": str(limit)}
+        )
+
+    async def get_pma(self, pma_number):
+        """Look up a PMA approval by P-number."""
+        return await self.request("pma", {"search": f'pma_number:"{pma_number}"', "limit": "1"})
+
+    async def gather_510k(self, k_numbers: Iterable[str]) -> Dict[str, Dict]:
+        """Look up many K-numbers concurrently.
+
+        Returns:
+            Dict mapping each K-number to its API response.
+        """
+        k_numbers = list(k_numbers)
+        results = await asyncio.gather(*(self.get_510k(k) for k in k_numbers))
+        return dict(zip(k_numbers, results))
+
+    async def gather_classifications(self, product_codes: Iterable[str]) -> Dict[str, Dict]:
+        """Look up many product codes concurrently.
+
+        Returns:
+            Dict mapping each product code to its classification response.
+        """
+        codes = list(product_codes)
+        results = await asyncio.gather(*(self.get_classification(c) for c in codes))
+        return dict(zip(codes, results))
+
+    async def get_device_characteristics(self, product_code):
+        """Concurrent version of FDAClient.get_device_characteristics().
+
+        The classification lookup and both clearance queries are issued
+        together instead of as three serial round-trips.
+        """
+        classification, clearances, volume_result = await asyncio.gather(
+            self.get_classification(product_code),
+            self.get_clearances(product_code, limit=5, sort="decision_date:desc"),
+            self.get_clearances(product_code, limit=1),
+        )
+
+        if not classification.get("results"):
+            return {
+                "product_code": product_code,
+                "name": "Unknown Device",
+                "class": "",
+                "regulation": "",
+                "review_panel": "",
+                "medical_specialty": "",
+                "error": "Product code not found in classification database"
+            }
+
+        device = classification["results"][0]
+        recent_clearances = [
+            {
+                "k_number": item.get("k_number"),
+                "decision_date": item.get("decision_date"),
+                "device_name": item.get("device_name", "")[:100],
+            }
+            for item in clearances.get("results") or []
+        ]
+        submission_volume = volume_result.get("meta", {}).get("results", {}).get("total", 0)
+
+        return {
+            "product_code": product_code,
+            "name": device.get("device_name", "Unknown Device"),
+            "class": device.get("device_class", ""),
+            "regulation": device.get("regulation_number", ""),
+            "review_panel": device.get("review_panel", ""),
+            "medical_specialty": device.get("medical_specialty", ""),
+            "recent_clearances": recent_clearances,
+            "submission_volume": submission_volume
+        }
+
+    # --- Stats ---
+
+    def concurrency_stats(self) -> Dict[str, int]:
+        """Return in-flight request counters for this async client."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+        }
+
+    def cache_stats(self) -> Dict:
+        """Cache statistics of the wrapped FDAClient plus concurrency counters."""
+        stats = self.client.cache_stats()
+        stats["async"] = self.concurrency_stats()
+        return stats
+
+    def close(self) -> None:
+        """Close the wrapped FDAClient."""
+        self.client.close()
@@ -53,6 +53,7 @@ import random
 import argparse
 import requests
 import zipfile
+import tempfile
 import textwrap
 import numpy as np
 import pandas as pd
@@ -103,6 +104,13 @@ try:
 except ImportError:
     _CROSS_PROCESS_LIMITER_AVAILABLE = False
 
+# Columnar (Arrow) cache of the pmn flat files
+try:
+    from fda_tools.lib.flat_file_cache import arrow_available, load_table  # type: ignore
+    _FLAT_FILE_CACHE_AVAILABLE = arrow_available()
+except ImportError:
+    _FLAT_FILE_CACHE_AVAILABLE = False
+
 # Initialize colorama
 init(autoreset=True)
 
@@ -521,6 +529,39 @@ def display_date_range_table(data_dir):
     return date_range_df
 
 
+def load_pmn_file(file_path):
+    """Load an extracted pmn flat file with typed date and REVIEWTIME columns.
+
+    With pyarrow installed the file is converted once to a memory-mapped
+    Arrow cache next to it (lib/flat_file_cache.py), so later runs skip
+    CSV parsing and date conversion.
+    """
+    if _FLAT_FILE_CACHE_AVAILABLE:
+        df = load_table(file_path).to_pandas(date_as_object=False)
+    else:
+        df = pd.read_csv(file_path, sep="|", encoding='ISO-8859-1')
+        df["DATERECEIVED"] = pd.to_datetime(df["DATERECEIVED"])
+        df["DECISIONDATE"] = pd.to_datetime(df["DECISIONDATE"])
+        df["REVIEWTIME"] = (df["DECISIONDATE"] - df["DATERECEIVED"]).dt.days
+    df["APPLICANT"] = df["APPLICANT"].str.upper()
+    return df
+
+
+def download_and_extract_zip(zip_url, headers, extract_path):
+    """Download a zip to a temporary file and extract it.
+
+    The archive is streamed to disk instead of being held in memory.
+    """
+    with tempfile.NamedTemporaryFile(dir=extract_path, suffix=".zip.part") as tmp:
+        with requests.get(zip_url, headers=headers, allow_redirects=True, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                tmp.write(chunk)
+        tmp.flush()
+        with zipfile.ZipFile(tmp.name) as zip_file:
+            zip_file.extractall(path=extract_path)
+
+
 def process_zip_file(key, data_dir):
     key = key.strip()
     zip_url = zip_dict[key]
@@ -536,46 +577,26 @@ def process_zip_file(key, data_dir):
         file_age_days = (time.time() - os.path.getmtime(file_path)) / 86400
         if file_age_days < 5:
             print(f"File found! (<5 days old): {file_path}")
-            df = pd.read_csv(file_path, sep="|", encoding='ISO-8859-1')
-            df["APPLICANT"] = df["APPLICANT"].str.upper()
-            df["DATERECEIVED"] = pd.to_datetime(df["DATERECEIVED"])
-            df["DECISIONDATE"] = pd.to_datetime(df["DECISIONDATE"])
-            df["REVIEWTIME"] = (df["DECISIONDATE"] - df["DATERECEIVED"]).dt.days
-            return df
+            return load_pmn_file(file_path)
 
     try:
-        response = requests.get(zip_url, headers=headers, allow_redirects=True, timeout=60)
-        response.raise_for_status()
-        zip_file = zipfile.ZipFile(BytesIO(response.content))
+        download_and_extract_zip(zip_url, headers, extract_path)
+    except PermissionError:
+        print(f"Permission denied: unable to write to {extract_path}. Please check permissions.")
+        return pd.DataFrame()
     except (requests.exceptions.RequestException, zipfile.BadZipFile) as e:
         print(f"Failed to download or open zip file {zip_url}: {e}")
         # Fall back to existing file if present
         if os.path.exists(file_path):
             print(f"Using existing (possibly stale) file: {file_path}")
-            df = pd.read_csv(file_path, sep="|", encoding='ISO-8859-1')
-            df["APPLICANT"] = df["APPLICANT"].str.upper()
-            df["DATERECEIVED"] = pd.to_datetime(df["DATERECEIVED"])
-            df["DECISIONDATE"] = pd.to_datetime(df["DECISIONDATE"])
-            df["REVIEWTIME"] = (df["DECISIONDATE"] - df["DATERECEIVED"]).dt.days
-            return df
-        return pd.DataFrame()
-
-    try:
-        zip_file.extractall(path=extract_path)
-    except PermissionError:
-        print(f"Permission denied: unable to write to {extract_path}. Please check permissions.")
+            return load_pmn_file(file_path)
         return pd.DataFrame()
 
     if not os.path.exists(file_path):
         print(f"File {file_path} does not exist after extraction.")
         return pd.DataFrame()
 
-    df = pd.read_csv(file_path, sep="|", encoding='ISO-8859-1')
-    df["APPLICANT"] = df["APPLICANT"].str.upper()
-    df["DATERECEIVED"] = pd.to_datetime(df["DATERECEIVED"])
-    df["DECISIONDATE"] = pd.to_datetime(df["DECISIONDATE"])
-    df["REVIEWTIME"] = (df["DECISIONDATE"] - df["DATERECEIVED"]).dt.days
-    return df
+    return load_pmn_file(file_path)
 
 
 def ocr_from_pdf(file_path):
@@ -10,6 +10,18 @@ Usage:
     python3 build_structured_cache.py --cache-dir ~/fda-510k-data/extraction/cache
     python3 build_structured_cache.py --legacy ~/fda-510k-data/extraction/pdf_data.json
     python3 build_structured_cache.py --both  # Process both if available
+    python3 build_structured_cache.py --cache-dir ... --incremental --workers 8
+
+Each structured file is also added to the full-text search index
+(text_index.db in the output directory) and to the metadata catalog
+(catalog.db, used by compare_sections.py) as it is written.
+
+Every build records a fingerprint of each document's source text in
+.build_state.jsonl in the output directory, appending one line per document
+as it is written. With --incremental, documents whose fingerprint is
+unchanged are skipped, which also resumes an interrupted build where it
+stopped. Section detection runs across a process pool (--workers), and
+legacy-mode openFDA metadata is fetched with one batched query per chunk.
 """
 
 import os
@@ -17,10 +29,12 @@ import sys
 import json
 import re
 import argparse
-import time
+import hashlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional, Set
 from collections import Counter
 
 # Import FDA API client for metadata enrichment
@@ -30,6 +44,28 @@ except ImportError:
     # Fallback if not in same directory
     from fda_api_client import FDAClient
 
+try:
+    from fda_tools.lib.text_index import StructuredTextIndex
+    _TEXT_INDEX_AVAILABLE = True
+except ImportError:
+    _TEXT_INDEX_AVAILABLE = False
+
+try:
+    from fda_tools.lib.structured_catalog import StructuredCatalog
+    _CATALOG_AVAILABLE = True
+except ImportError:
+    _CATALOG_AVAILABLE = False
+
+# Bump when detect_sections() output changes, so incremental builds redo every document
+STRUCTURE_VERSION = 1
+
+# Fingerprints of built documents, one JSON line per document
+BUILD_STATE_FILE = '.build_state.jsonl'
+
+# Documents per process-pool chunk (per worker) and per batched 510(k) query
+CHUNK_DOCS_PER_WORKER = 8
+METADATA_BATCH_SIZE = 100
+
 # Section detection patterns (Tier 1: Regex)
 # Expanded with Priority 3 enhancements (15 new section types)
 SECTION_PATTERNS = {
@@ -430,50 +466,118 @@ def enrich_metadata_from_openfda(k_number: str, client: FDAClient) -> Dict:
             return {}
 
         # Extract metadata from first result
-        device = results[0]
-        metadata = {}
+        return _metadata_from_510k(results[0])
+
+    except Exception:
+        # Silently fail - metadata enrichment is optional
+        return {}
 
-        # Product code (REQUIRED for filtering)
-        if device.get('product_code'):
-            metadata['product_code'] = device['product_code']
 
-        # Review advisory committee (available in 510k response)
-        if device.get('review_advisory_committee'):
-            metadata['review_panel'] = device['review_advisory_committee']
+def _metadata_from_510k(device: Dict) -> Dict:
+    """Structured-cache metadata fields from one openFDA 510(k) record."""
+    metadata = {}
 
-        # Device class and regulation number would require a second API call
-        # to the classification endpoint - not included to avoid doubling API calls
-        # Users can enhance metadata manually if needed for specific use cases
+    # Product code (REQUIRED for filtering)
+    if device.get('product_code'):
+        metadata['product_code'] = device['product_code']
 
-        return metadata
+    # Review advisory committee (available in 510k response)
+    if device.get('review_advisory_committee'):
+        metadata['review_panel'] = device['review_advisory_committee']
 
-    except Exception:
-        # Silently fail - metadata enrichment is optional
-        return {}
+    # Device class and regulation number would require a second API call
+    # to the classification endpoint - not included to avoid doubling API calls
+    # Users can enhance metadata manually if needed for specific use cases
+
+    return metadata
 
 
-def build_structured_cache(source_path: Path, output_dir: Path, source_type: str = 'per-device'):
+def enrich_metadata_batch(k_numbers: List[str], client: FDAClient,
+                          batch_size: int = METADATA_BATCH_SIZE,
+                          failed: Optional[Set[str]] = None) -> Dict[str, Dict]:
     """
-    Build structured cache from source PDF text data.
+    Enrich metadata for many K-numbers with batched openFDA OR queries.
 
     Args:
-        source_path: Path to source data (index.json or pdf_data.json)
-        output_dir: Path to structured cache output directory
-        source_type: 'per-device' or 'legacy'
-    """
-    output_dir.mkdir(parents=True, exist_ok=True)
+        failed: If given, K-numbers of batches that could not be fetched are
+            added to it (as opposed to K-numbers that openFDA does not know)
 
-    # Initialize FDA API client for metadata enrichment (legacy cache only)
-    fda_client = None
-    if source_type == 'legacy':
+    Returns:
+        Dictionary of K-number -> metadata (as enrich_metadata_from_openfda);
+        K-numbers not found or in a failed batch are omitted
+    """
+    enriched = {}
+    for i in range(0, len(k_numbers), batch_size):
+        batch = k_numbers[i:i + batch_size]
         try:
-            fda_client = FDAClient()
-            print("✓ FDA API client initialized for metadata enrichment")
-        except Exception as e:
-            print(f"⚠ Could not initialize FDA API client: {e}")
-            print("  Continuing without metadata enrichment...")
+            result = client.batch_510k(batch)
+        except Exception:
+            result = {'error': 'request failed'}
+        if result.get('error') or result.get('degraded'):
+            if failed is not None:
+                failed.update(batch)
+            continue
+        for device in result.get('results', []):
+            k_number = device.get('k_number')
+            if k_number in batch and k_number not in enriched:
+                enriched[k_number] = _metadata_from_510k(device)
+    return enriched
+
+
+def source_fingerprint(text: str, extra: Optional[Dict] = None) -> str:
+    """Hash of a document's source text (and source metadata) for incremental builds."""
+    digest = hashlib.sha256(f"v{STRUCTURE_VERSION}\0".encode())
+    digest.update(text.encode('utf-8', errors='surrogatepass'))
+    if extra:
+        digest.update(b"\0" + json.dumps(extra, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def load_build_state(output_dir: Path) -> Dict[str, str]:
+    """Read K-number -> source fingerprint for documents already built."""
+    state = {}
+    state_path = output_dir / BUILD_STATE_FILE
+    if state_path.exists():
+        with open(state_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    state[record['k_number']] = record['fingerprint']
+                except (ValueError, KeyError, TypeError):
+                    continue  # Line torn by an interrupted build
+    return state
+
+
+def _compact_build_state(output_dir: Path, state: Dict[str, str]):
+    """Rewrite the build state with one line per document."""
+    state_path = output_dir / BUILD_STATE_FILE
+    tmp_path = state_path.with_name(state_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for k_number, fingerprint in state.items():
+            f.write(json.dumps({'k_number': k_number, 'fingerprint': fingerprint}) + '\n')
+    tmp_path.replace(state_path)
+
+
+def _write_structured(output_file: Path, structured: Dict) -> bytes:
+    """Write a structured file atomically, so an interrupted build never leaves a partial one.
+
+    Returns:
+        The bytes written (for the catalog's section offsets)
+    """
+    raw = json.dumps(structured, separators=(',', ':')).encode('ascii')
+    fd, tmp_name = tempfile.mkstemp(dir=output_file.parent, prefix=output_file.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_name, output_file)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return raw
+
 
-    # Load source data
+def _iter_source_documents(source_path: Path, source_type: str) -> Iterator[Tuple[str, str, Dict]]:
+    """Yield (k_number, text, base structured fields) for each source document."""
     if source_type == 'per-device':
         with open(source_path) as f:
             index = json.load(f)
@@ -494,35 +598,13 @@ def build_structured_cache(source_path: Path, output_dir: Path, source_type: str
                 print(f"  ⚠ Empty: {k_number}")
                 continue
 
-            # Detect sections with OCR correction and quality assessment
-            sections, detection_metadata = detect_sections(text)
-
-            # Build structured output
-            structured = {
-                'k_number': k_number,
+            yield k_number, text, {
                 'source': 'per-device-cache',
                 'source_path': str(device_path),
                 'extracted_at': device_data.get('extracted_at', meta.get('extracted_at', 'unknown')),
-                'structured_at': datetime.now().isoformat(),
-                'full_text': text,
-                'full_text_length': len(text),
-                'sections': sections,
-                'section_count': len(sections),
-                'ocr_quality': detection_metadata['ocr_quality'],
-                'ocr_confidence': detection_metadata['ocr_confidence'],
-                'tier1_sections': detection_metadata['tier1_sections'],
-                'tier2_sections': detection_metadata['tier2_sections'],
-                'tier2_corrections': detection_metadata.get('tier2_corrections'),
-                'metadata': device_data.get('metadata', {})
+                'metadata': device_data.get('metadata', {}),
             }
 
-            # Write structured file
-            output_file = output_dir / f"{k_number}.json"
-            with open(output_file, 'w') as f:
-                json.dump(structured, f, indent=2)
-
-            print(f"  ✓ {k_number}: {len(text)} chars, {len(sections)} sections")
-
     elif source_type == 'legacy':
         with open(source_path) as f:
             pdf_data = json.load(f)
@@ -543,24 +625,84 @@ def build_structured_cache(source_path: Path, output_dir: Path, source_type: str
                 print(f"  ⚠ Empty: {k_number}")
                 continue
 
-            # Detect sections with OCR correction and quality assessment
-            sections, detection_metadata = detect_sections(text)
+            yield k_number, text, {
+                'source': 'legacy-pdf_data.json',
+                'source_path': str(source_path),
+                'extracted_at': 'unknown',
+                'metadata': {},
+            }
+
+    else:
+        raise ValueError(f"Unknown source_type: {source_type}")
+
+
+def build_structured_cache(source_path: Path, output_dir: Path, source_type: str = 'per-device',
+                           update_index: bool = True, incremental: bool = False,
+                           workers: int = 1) -> Dict[str, int]:
+    """
+    Build structured cache from source PDF text data.
+
+    Args:
+        source_path: Path to source data (index.json or pdf_data.json)
+        output_dir: Path to structured cache output directory
+        source_type: 'per-device' or 'legacy'
+        update_index: Add each written file to the full-text search index
+        incremental: Skip documents whose source fingerprint matches the
+            last build (also resumes an interrupted build)
+        workers: Processes running section detection (1 = in-process)
+
+    Returns:
+        Counts of 'structured' and 'unchanged' documents
+    """
+    if source_type not in ('per-device', 'legacy'):
+        raise ValueError(f"Unknown source_type: {source_type}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    text_index = None
+    if update_index and _TEXT_INDEX_AVAILABLE:
+        text_index = StructuredTextIndex(output_dir)
+    catalog = StructuredCatalog(output_dir) if _CATALOG_AVAILABLE else None
+
+    # Initialize FDA API client for metadata enrichment (legacy cache only)
+    fda_client = None
+    if source_type == 'legacy':
+        try:
+            fda_client = FDAClient()
+            print("✓ FDA API client initialized for metadata enrichment")
+        except Exception as e:
+            print(f"⚠ Could not initialize FDA API client: {e}")
+            print("  Continuing without metadata enrichment...")
 
-            # Enrich metadata from openFDA API
-            metadata = {}
-            if fda_client:
-                metadata = enrich_metadata_from_openfda(k_number, fda_client)
-                # Rate limiting: 500ms delay between API calls (2 req/sec)
-                if metadata:
-                    time.sleep(0.5)
+    state = load_build_state(output_dir)
+    counts = {'structured': 0, 'unchanged': 0}
+    workers = max(1, workers)
+    chunk_size = workers * CHUNK_DOCS_PER_WORKER
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def process_chunk(chunk: List[Tuple[str, str, Dict, str]], state_file):
+        metadata_by_k = {}
+        # Legacy documents whose metadata could not be fetched are written but
+        # not checkpointed, so an incremental build retries their enrichment
+        unenriched = set()
+        if fda_client:
+            metadata_by_k = enrich_metadata_batch(
+                [k for k, _, _, _ in chunk], fda_client, failed=unenriched)
+        elif source_type == 'legacy':
+            unenriched = {k for k, _, _, _ in chunk}
+        texts = [text for _, text, _, _ in chunk]
+        results = pool.map(detect_sections, texts) if pool else map(detect_sections, texts)
+
+        for (k_number, text, base, fingerprint), (sections, detection_metadata) in zip(chunk, results):
+            metadata = metadata_by_k.get(k_number, base['metadata'])
 
             # Build structured output
             structured = {
                 'k_number': k_number,
-                'source': 'legacy-pdf_data.json',
-                'source_path': str(source_path),
-                'extracted_at': 'unknown',
+                'source': base['source'],
+                'source_path': base['source_path'],
+                'extracted_at': base['extracted_at'],
                 'structured_at': datetime.now().isoformat(),
+                'source_fingerprint': fingerprint,
                 'full_text': text,
                 'full_text_length': len(text),
                 'sections': sections,
@@ -575,17 +717,59 @@ def build_structured_cache(source_path: Path, output_dir: Path, source_type: str
 
             # Write structured file
             output_file = output_dir / f"{k_number}.json"
-            with open(output_file, 'w') as f:
-                json.dump(structured, f, indent=2)
+            raw = _write_structured(output_file, structured)
+            if text_index is not None:
+                text_index.add_document(structured, output_file)
+            if catalog is not None:
+                catalog.add_document(structured, output_file, raw)
+
+            # Checkpoint: this document is done even if the build stops now
+            if k_number in unenriched:
+                state.pop(k_number, None)
+            else:
+                state[k_number] = fingerprint
+                state_file.write(json.dumps({'k_number': k_number, 'fingerprint': fingerprint}) + '\n')
+                state_file.flush()
+            counts['structured'] += 1
 
             # Enhanced output showing metadata enrichment
             metadata_info = ""
-            if metadata.get('product_code'):
+            if source_type == 'legacy' and metadata.get('product_code'):
                 metadata_info = f" [{metadata['product_code']}]"
             print(f"  ✓ {k_number}: {len(text)} chars, {len(sections)} sections{metadata_info}")
 
-    else:
-        raise ValueError(f"Unknown source_type: {source_type}")
+    try:
+        with open(output_dir / BUILD_STATE_FILE, 'a', encoding='utf-8') as state_file:
+            chunk = []
+            for k_number, text, base in _iter_source_documents(source_path, source_type):
+                fingerprint = source_fingerprint(
+                    text, base['metadata'] if source_type == 'per-device' else None)
+                if (incremental and state.get(k_number) == fingerprint
+                        and (output_dir / f"{k_number}.json").exists()):
+                    counts['unchanged'] += 1
+                    continue
+                chunk.append((k_number, text, base, fingerprint))
+                if len(chunk) >= chunk_size:
+                    process_chunk(chunk, state_file)
+                    chunk = []
+            if chunk:
+                process_chunk(chunk, state_file)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    _compact_build_state(output_dir, state)
+    print(f"Structured {counts['structured']} documents, {counts['unchanged']} unchanged")
+
+    # Drop entries for files removed since the last build
+    if text_index is not None:
+        text_index.sync(force=True)
+        text_index.close()
+    if catalog is not None:
+        catalog.sync(force=True)
+        catalog.close()
+
+    return counts
 
 
 def generate_coverage_manifest(structured_dir: Path):
@@ -713,6 +897,13 @@ def main():
     parser.add_argument('--output', type=Path,
                         default=Path.home() / 'fda-510k-data' / 'extraction' / 'structured_text_cache',
                         help='Output directory for structured cache (default: ~/fda-510k-data/extraction/structured_text_cache)')
+    parser.add_argument('--no-index', action='store_true',
+                        help='Do not update the full-text search index')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Skip documents whose source text is unchanged since the last build '
+                             '(also resumes an interrupted build)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Processes used for section detection (default: CPU count)')
 
     args = parser.parse_args()
 
@@ -731,7 +922,9 @@ def main():
 
         if index_file.exists():
             print(f"Processing per-device cache: {cache_dir}")
-            build_structured_cache(index_file, args.output, source_type='per-device')
+            build_structured_cache(index_file, args.output, source_type='per-device',
+                                   update_index=not args.no_index,
+                                   incremental=args.incremental, workers=args.workers)
         else:
             print(f"⚠ Per-device cache not found at {index_file}")
 
@@ -741,7 +934,9 @@ def main():
 
         if legacy_file.exists():
             print(f"Processing legacy cache: {legacy_file}")
-            build_structured_cache(legacy_file, args.output, source_type='legacy')
+            build_structured_cache(legacy_file, args.output, source_type='legacy',
+                                   update_index=not args.no_index,
+                                   incremental=args.incremental, workers=args.workers)
         else:
             print(f"⚠ Legacy cache not found at {legacy_file}")
 
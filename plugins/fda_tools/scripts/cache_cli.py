@@ -12,6 +12,7 @@ Usage
     python3 -m fda_tools.scripts.cache_cli --purge-stale
     python3 -m fda_tools.scripts.cache_cli --purge-all
     python3 -m fda_tools.scripts.cache_cli --list-ttls
+    python3 -m fda_tools.scripts.cache_cli --migrate-api-cache [--remove-source]
 
 Exit codes: 0 = success, 1 = error
 """
@@ -52,6 +53,16 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print the TTL (seconds) for each cache type",
     )
+    group.add_argument(
+        "--migrate-api-cache",
+        action="store_true",
+        help="Import openFDA JSON cache files into the single-file SQLite store",
+    )
+    p.add_argument(
+        "--remove-source",
+        action="store_true",
+        help="With --migrate-api-cache: delete JSON files once imported",
+    )
     p.add_argument(
         "--base-dir",
         default=None,
@@ -156,6 +167,18 @@ def cmd_list_ttls(mgr: CacheManager, output_json: bool) -> None:
         print(f"{ct:<18} {seconds:>14}  {human:>12}")
 
 
+def cmd_migrate_api_cache(mgr: CacheManager, output_json: bool, remove_source: bool) -> None:
+    counts = mgr.migrate_api_cache(remove_source=remove_source)
+    if output_json:
+        print(json.dumps(counts, indent=2))
+        return
+    print(f"Migrated {counts['migrated']} openFDA cache files "
+          f"({counts['corrupt']} corrupt, {counts['expired']} expired skipped)")
+    if counts["errors"]:
+        print(f"Unreadable files: {counts['errors']}", file=sys.stderr)
+    print("Set [cache] api_cache_backend = \"sqlite\" in config.toml to use the store.")
+
+
 def main(argv: List[str] | None = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(argv)
@@ -178,6 +201,8 @@ def main(argv: List[str] | None = None) -> int:
             cmd_purge_all(mgr, args.output_json)
         elif args.list_ttls:
             cmd_list_ttls(mgr, args.output_json)
+        elif args.migrate_api_cache:
+            cmd_migrate_api_cache(mgr, args.output_json, args.remove_source)
     except Exception as e:
         if args.output_json:
             print(json.dumps({"error": str(e)}))
@@ -9,15 +9,22 @@ Optionally triggers the batchfetch + extraction pipeline for new devices.
 Fingerprints are stored in the project's data_manifest.json under the
 "fingerprints" key, enabling persistent tracking across sessions.
 
+Incremental mode (detect_changes_incremental, --incremental) keeps
+decision_date/event_date_posted watermarks in fingerprints.db and queries
+only records newer than them, for all product codes in OR'd batches.
+
 Usage:
-    from change_detector import detect_changes, find_new_clearances, trigger_pipeline
+    from change_detector import (detect_changes, detect_changes_incremental,
+                                 find_new_clearances, trigger_pipeline)
 
     changes = detect_changes("my_project", client, verbose=True)
+    changes = detect_changes_incremental("my_project", client, verbose=True)
     new_k = find_new_clearances("DQY", known_k_numbers, client, max_fetch=100)
     trigger_pipeline("my_project", new_k, "DQY", dry_run=False, verbose=True)
 
     # CLI usage:
     python3 change_detector.py --project my_project
+    python3 change_detector.py --project my_project --incremental
     python3 change_detector.py --project my_project --dry-run
     python3 change_detector.py --project my_project --product-code DQY --max-fetch 200
 """
@@ -29,14 +36,15 @@ import os
 import sqlite3
 import sys
 import time
-from datetime import datetime, timezone
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
 # Import sibling modules
-from fda_api_client import FDAClient
+from fda_api_client import OR_BATCH_SIZE, FDAClient, RecordIterationError
 from fda_data_store import get_projects_dir, load_manifest, save_manifest
 from fda_tools.lib.subprocess_helpers import run_subprocess  # type: ignore
 
@@ -121,7 +129,7 @@ def _get_sqlite_path(project_dir: str) -> str:
 def _init_sqlite_db(db_path: str) -> sqlite3.Connection:
     """Initialize the SQLite fingerprint database.
 
-    Creates the key-value table if it does not exist.
+    Creates the key-value and watermark tables if they do not exist.
 
     Args:
         db_path: Path to the SQLite database file.
@@ -143,6 +151,13 @@ def _init_sqlite_db(db_path: str) -> sqlite3.Connection:
             value TEXT NOT NULL
         )
     """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS watermarks (
+            name       TEXT PRIMARY KEY,
+            value      TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
     conn.commit()
     return conn
 
@@ -327,6 +342,67 @@ def _delete_fingerprint_sqlite(project_dir: str, product_code: str) -> bool:
         conn.close()
 
 
+def _load_watermarks_sqlite(project_dir: str) -> Dict[str, str]:
+    """Load the incremental-detection watermarks from the SQLite database.
+
+    Args:
+        project_dir: Absolute path to the project directory.
+
+    Returns:
+        Dict mapping watermark name (e.g. '510k.decision_date') to a
+        YYYYMMDD date.
+    """
+    db_path = _get_sqlite_path(project_dir)
+    if not os.path.exists(db_path):
+        return {}
+
+    conn = _init_sqlite_db(db_path)
+    try:
+        return dict(conn.execute("SELECT name, value FROM watermarks").fetchall())
+    except sqlite3.Error as e:
+        logger.warning("Error loading watermarks from SQLite: %s", e)
+        return {}
+    finally:
+        conn.close()
+
+
+def _save_incremental_state_sqlite(
+    project_dir: str,
+    fingerprints: Dict[str, Dict[str, Any]],
+    watermarks: Dict[str, str],
+) -> None:
+    """Save fingerprints and watermarks to the SQLite database atomically.
+
+    All rows are written in one transaction, so an interrupted run leaves
+    either the previous state or the new one, never a watermark that is
+    ahead of the fingerprints.
+
+    Args:
+        project_dir: Absolute path to the project directory.
+        fingerprints: Dict mapping product code to fingerprint data.
+        watermarks: Dict mapping watermark name to YYYYMMDD date.
+
+    Raises:
+        sqlite3.Error: The transaction failed and was rolled back.
+    """
+    conn = _init_sqlite_db(_get_sqlite_path(project_dir))
+    try:
+        now = datetime.now(timezone.utc).isoformat()
+        with conn:
+            conn.executemany(
+                """INSERT OR REPLACE INTO fingerprints
+                   (product_code, data, updated_at) VALUES (?, ?, ?)""",
+                [(pc.upper(), json.dumps(fp), now) for pc, fp in fingerprints.items()],
+            )
+            conn.executemany(
+                """INSERT OR REPLACE INTO watermarks
+                   (name, value, updated_at) VALUES (?, ?, ?)""",
+                [(name, value, now) for name, value in watermarks.items()],
+            )
+    finally:
+        conn.close()
+
+
 # ------------------------------------------------------------------
 # Unified fingerprint access (respects --use-sqlite flag)
 # ------------------------------------------------------------------
@@ -841,6 +917,322 @@ def detect_changes(
     }
 
 
+# ------------------------------------------------------------------
+# Watermark-based incremental detection
+# ------------------------------------------------------------------
+
+# Watermark names in fingerprints.db and the date field each one tracks
+CLEARANCE_WATERMARK = "510k.decision_date"
+CLEARANCE_DATE_FIELD = "decision_date"
+RECALL_WATERMARK = "recall.event_date_posted"
+RECALL_DATE_FIELD = "event_date_posted"
+RECALL_ID_FIELD = "product_res_number"
+
+# openFDA publishes records weeks after their decision/posting date, so each
+# window reopens this many days before the watermark; known IDs dedupe them
+WATERMARK_LOOKBACK_DAYS = 45
+
+
+def _normalize_date(value: str) -> str:
+    """Return an openFDA date ('2026-01-15' or '20260115') as YYYYMMDD."""
+    return (value or "").replace("-", "")[:8]
+
+
+def _window_start(watermark: Optional[str]) -> Optional[str]:
+    """Return the YYYYMMDD start of the query window for a watermark."""
+    if not watermark:
+        return None
+    start = datetime.strptime(watermark, "%Y%m%d") - timedelta(days=WATERMARK_LOOKBACK_DAYS)
+    return start.strftime("%Y%m%d")
+
+
+def _iter_product_code_records(
+    client: FDAClient,
+    endpoint: str,
+    date_field: str,
+    product_codes: Iterable[str],
+    since: Optional[str],
+) -> Iterator[Dict[str, Any]]:
+    """Yield every record for the product codes dated on or after ``since``.
+
+    Product codes are OR'd together, OR_BATCH_SIZE per query, and each
+    query is paged to the end, so the number of API calls grows with the
+    number of matching records rather than with the number of codes.
+    ``since=None`` fetches every record for the codes.
+
+    Raises:
+        RecordIterationError: A page could not be fetched.
+    """
+    codes = sorted(product_codes)
+    for i in range(0, len(codes), OR_BATCH_SIZE):
+        search = "(" + "+OR+".join(f'product_code:"{pc}"' for pc in codes[i:i + OR_BATCH_SIZE]) + ")"
+        if since:
+            today = datetime.now(timezone.utc).strftime("%Y%m%d")
+            search = f"{date_field}:[{since}+TO+{today}]+AND+{search}"
+        for page in client.iter_pages(endpoint, search=search, sort=f"{date_field}:asc"):
+            yield from page
+
+
+def detect_changes_incremental(
+    project_name: str,
+    client: Optional[FDAClient] = None,
+    verbose: bool = False,
+    detect_field_diffs: bool = False,
+) -> Dict[str, Any]:
+    """Detect changes from records newer than the project's watermarks.
+
+    Unlike detect_changes(), which fetches the latest 100 clearances and
+    the recalls of each product code in turn, this queries only the
+    clearances (decision_date) and recalls (event_date_posted) dated after
+    the project's watermarks, for all tracked product codes at once in OR'd
+    batches, paging through every match. Product codes without a fingerprint
+    are synced in full once. Fingerprints and the advanced watermarks are
+    written to fingerprints.db in a single transaction (and mirrored to
+    data_manifest.json), so a failed run leaves the previous state intact.
+
+    Args:
+        project_name: Name of the project directory.
+        client: FDAClient instance (created if None).
+        verbose: If True, print progress information.
+        detect_field_diffs: If True, detect field-level changes in the
+            re-fetched records of known devices.
+
+    Returns:
+        Dictionary in the detect_changes() format, plus "mode",
+        "watermarks" and "records_fetched".
+    """
+    if client is None:
+        client = FDAClient()
+
+    projects_dir = get_projects_dir()
+    project_dir = os.path.join(projects_dir, project_name)
+
+    if not os.path.exists(project_dir):
+        return {
+            "project": project_name,
+            "status": "error",
+            "error": f"Project directory not found: {project_dir}",
+            "changes": [],
+        }
+
+    _migrate_json_to_sqlite(project_dir)
+    manifest = load_manifest(project_dir)
+    fingerprints = {pc.upper(): fp for pc, fp in manifest.get("fingerprints", {}).items()}
+    fingerprints.update(_list_fingerprints_sqlite(project_dir))
+    codes_to_check = {pc.upper() for pc in manifest.get("product_codes", [])}
+    codes_to_check.update(fingerprints)
+
+    if not codes_to_check:
+        return {
+            "project": project_name,
+            "status": "no_fingerprints",
+            "message": "No product codes or fingerprints found. Run batchfetch first.",
+            "changes": [],
+            "total_new_clearances": 0,
+            "total_new_recalls": 0,
+            "total_field_changes": 0,
+        }
+
+    watermarks = _load_watermarks_sqlite(project_dir)
+    tracked = {pc for pc in codes_to_check if pc in fingerprints}
+    # Fingerprints from detect_changes() carry the newest decision date seen
+    clearance_mark = watermarks.get(CLEARANCE_WATERMARK) or max(
+        (_normalize_date(fingerprints[pc].get("latest_decision_date", "")) for pc in tracked),
+        default="",
+    )
+    clearance_since = _window_start(clearance_mark)
+    recall_mark = watermarks.get(RECALL_WATERMARK)
+    recall_tracked = {pc for pc in tracked if "known_recall_ids" in fingerprints[pc]}
+    recall_since = _window_start(recall_mark)
+
+    if verbose:
+        print(f"Checking {len(codes_to_check)} product code(s) for project "
+              f"'{project_name}' since {clearance_mark or 'the beginning'}...")
+
+    clearances: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    recalls: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    records_fetched = 0
+    try:
+        for codes, since in ((tracked, clearance_since), (codes_to_check - tracked, None)):
+            if not codes:
+                continue
+            for item in _iter_product_code_records(client, "510k", CLEARANCE_DATE_FIELD, codes, since):
+                clearances[item.get("product_code", "").upper()].append(item)
+                records_fetched += 1
+        for codes, since in ((recall_tracked, recall_since), (codes_to_check - recall_tracked, None)):
+            if not codes:
+                continue
+            for item in _iter_product_code_records(client, "recall", RECALL_DATE_FIELD, codes, since):
+                recalls[item.get("product_code", "").upper()].append(item)
+                records_fetched += 1
+    except RecordIterationError as e:
+        return {
+            "project": project_name,
+            "status": "error",
+            "error": f"FDA API query failed; watermarks not advanced: {e}",
+            "changes": [],
+        }
+
+    all_changes = []
+    total_new_clearances = 0
+    total_new_recalls = 0
+    total_field_changes = 0
+    now = datetime.now(timezone.utc).isoformat()
+    new_fingerprints = {}
+    new_clearance_mark = clearance_mark
+    new_recall_mark = recall_mark or ""
+
+    for product_code in sorted(codes_to_check):
+        fp = fingerprints.get(product_code) or {}
+        delta = product_code in tracked and clearance_since is not None
+        known_set = set(fp.get("known_k_numbers", []))
+        device_data = dict(fp.get("device_data", {}))
+        latest_k = fp.get("latest_k_number", "")
+        latest_date = fp.get("latest_decision_date", "")
+        fetched_k_numbers = set()
+        new_clearances = []
+
+        for item in clearances.get(product_code, []):
+            k_num = item.get("k_number", "").upper()
+            if not k_num:
+                continue
+            fetched_k_numbers.add(k_num)
+            device_data[k_num] = {
+                "k_number": k_num,
+                "device_name": item.get("device_name", ""),
+                "applicant": item.get("applicant", ""),
+                "decision_date": item.get("decision_date", ""),
+                "decision_code": item.get("decision_code", ""),
+                "clearance_type": item.get("clearance_type", ""),
+                "product_code": item.get("product_code", product_code),
+            }
+            if k_num not in known_set:
+                known_set.add(k_num)
+                new_clearances.append({
+                    "k_number": k_num,
+                    "device_name": item.get("device_name", ""),
+                    "applicant": item.get("applicant", ""),
+                    "decision_date": item.get("decision_date", ""),
+                })
+            decision_date = _normalize_date(item.get("decision_date", ""))
+            if decision_date >= _normalize_date(latest_date):
+                latest_k, latest_date = k_num, decision_date
+            new_clearance_mark = max(new_clearance_mark, decision_date)
+
+        prev_clearance_count = fp.get("clearance_count", 0)
+        current_total = (prev_clearance_count + len(new_clearances) if delta
+                         else len(fetched_k_numbers))
+        if new_clearances:
+            all_changes.append({
+                "product_code": product_code,
+                "change_type": "new_clearances",
+                "count": len(new_clearances),
+                "details": {
+                    "previous_total": prev_clearance_count,
+                    "current_total": current_total,
+                },
+                "new_items": new_clearances,
+            })
+            total_new_clearances += len(new_clearances)
+
+        if detect_field_diffs and fp.get("device_data"):
+            field_changes = _detect_field_changes(fp["device_data"], clearances.get(product_code, []))
+            if field_changes:
+                all_changes.append({
+                    "product_code": product_code,
+                    "change_type": "field_changes",
+                    "count": len(field_changes),
+                    "details": {
+                        "devices_affected": len(set(c["k_number"] for c in field_changes)),
+                    },
+                    "new_items": field_changes,
+                })
+                total_field_changes += len(field_changes)
+
+        # -- Recalls: new IDs in the window, or a full recount --
+        prev_recall_count = fp.get("recall_count", 0)
+        recall_dates = {}
+        for item in recalls.get(product_code, []):
+            recall_id = item.get(RECALL_ID_FIELD)
+            if recall_id:
+                recall_dates[recall_id] = item.get(RECALL_DATE_FIELD, "")
+            new_recall_mark = max(new_recall_mark, _normalize_date(item.get(RECALL_DATE_FIELD, "")))
+        known_recalls = set(fp.get("known_recall_ids", []))
+        if product_code in recall_tracked and recall_since is not None:
+            new_recall_ids = sorted(set(recall_dates) - known_recalls)
+            known_recalls.update(new_recall_ids)
+            current_recall_count = prev_recall_count + len(new_recall_ids)
+            new_recall_count = len(new_recall_ids)
+        else:
+            new_recall_ids = [] if prev_recall_count else sorted(recall_dates)
+            known_recalls = set(recall_dates)
+            current_recall_count = len(recall_dates)
+            new_recall_count = max(0, current_recall_count - prev_recall_count)
+        if new_recall_count:
+            all_changes.append({
+                "product_code": product_code,
+                "change_type": "new_recalls",
+                "count": new_recall_count,
+                "details": {
+                    "previous_count": prev_recall_count,
+                    "current_count": current_recall_count,
+                },
+                "new_items": [{"recall_id": rid, RECALL_DATE_FIELD: recall_dates[rid]}
+                              for rid in new_recall_ids],
+            })
+            total_new_recalls += new_recall_count
+
+        new_fingerprints[product_code] = {
+            "last_checked": now,
+            "clearance_count": current_total,
+            "latest_k_number": latest_k,
+            "latest_decision_date": latest_date,
+            "recall_count": current_recall_count,
+            "known_k_numbers": sorted(known_set),
+            "known_recall_ids": sorted(known_recalls),
+            "device_data": device_data,
+        }
+
+        if verbose:
+            print(f"  {product_code}: {len(new_clearances)} new clearance(s), "
+                  f"{new_recall_count} new recall(s)")
+
+    new_watermarks = {}
+    if new_clearance_mark:
+        new_watermarks[CLEARANCE_WATERMARK] = new_clearance_mark
+    if new_recall_mark or recall_mark is None:
+        # An empty recall watermark still records that recalls were synced
+        new_watermarks[RECALL_WATERMARK] = new_recall_mark or datetime.now(timezone.utc).strftime("%Y%m%d")
+
+    try:
+        _save_incremental_state_sqlite(project_dir, new_fingerprints, new_watermarks)
+    except sqlite3.Error as e:
+        return {
+            "project": project_name,
+            "status": "error",
+            "error": f"Could not save fingerprints: {e}",
+            "changes": [],
+        }
+    # Mirror to JSON for backward compatibility, in one manifest write
+    manifest = load_manifest(project_dir)
+    manifest.setdefault("fingerprints", {}).update(new_fingerprints)
+    save_manifest(project_dir, manifest)
+
+    return {
+        "project": project_name,
+        "status": "completed",
+        "mode": "incremental",
+        "checked_at": now,
+        "product_codes_checked": len(codes_to_check),
+        "records_fetched": records_fetched,
+        "watermarks": new_watermarks,
+        "changes": all_changes,
+        "total_new_clearances": total_new_clearances,
+        "total_new_recalls": total_new_recalls,
+        "total_field_changes": total_field_changes,
+    }
+
+
 def trigger_pipeline(
     project_name: str,
     new_k_numbers: List[str],
@@ -937,6 +1329,7 @@ def trigger_pipeline(
             sys.executable,
             str(build_cache_script),
             "--cache-dir", str(cache_dir),
+            "--incremental",
         ]
 
         if verbose:
@@ -1012,6 +1405,11 @@ def main():
         "--diff-report", action="store_true", dest="diff_report",
         help="Generate markdown diff report for field-level changes"
     )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Query only clearances and recalls newer than the project's "
+             "watermarks, for all product codes at once (uses fingerprints.db)"
+    )
     parser.add_argument(
         "--use-sqlite", action="store_true", dest="use_sqlite",
         help="Use SQLite database (fingerprints.db) for fingerprint storage "
@@ -1032,7 +1430,8 @@ def main():
     client = FDAClient()
 
     # Detect changes
-    result = detect_changes(
+    detect = detect_changes_incremental if args.incremental else detect_changes
+    result = detect(
         project_name=args.project,
         client=client,
         verbose=verbose,
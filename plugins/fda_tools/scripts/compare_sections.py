@@ -50,6 +50,12 @@ from trend_visualization import (  # type: ignore
     format_trend_table,
 )
 
+try:
+    from fda_tools.lib.structured_catalog import StructuredCatalog
+    _CATALOG_AVAILABLE = True
+except ImportError:
+    _CATALOG_AVAILABLE = False
+
 # Import similarity cache stats for reporting
 from fda_tools.lib.import_helpers import safe_import
 _cache_stats_result = safe_import('fda_tools.scripts.similarity_cache', 'get_cache_stats')
@@ -172,8 +178,20 @@ def get_structured_cache_dir():
     return Path(os.path.expanduser("~/fda-510k-data/extraction/structured_text_cache"))
 
 
-def load_structured_cache():
-    """Load all structured cache files.
+def load_structured_cache(product_codes: Optional[List[str]] = None,
+                          year_start: Optional[int] = None,
+                          year_end: Optional[int] = None) -> Dict:
+    """Load structured cache documents, optionally by product code and year range.
+
+    Documents are selected through the metadata catalog (catalog.db in the
+    cache directory, kept current by build_structured_cache.py) and their
+    ``sections`` read each section's text only when it is accessed; no
+    ``full_text`` is loaded. Without the catalog module every file is parsed.
+
+    Args:
+        product_codes: Product codes to select (default: all documents)
+        year_start: Start year (inclusive) or None
+        year_end: End year (inclusive) or None
 
     Returns:
         Dict[str, dict]: K-number -> structured data mapping
@@ -182,8 +200,18 @@ def load_structured_cache():
     if not cache_dir.exists():
         return {}
 
+    if _CATALOG_AVAILABLE:
+        catalog = StructuredCatalog(cache_dir)
+        try:
+            catalog.sync()
+            return catalog.select(product_codes, year_start, year_end)
+        finally:
+            catalog.close()
+
     cache = {}
     for cache_file in cache_dir.glob("*.json"):
+        if cache_file.name == "manifest.json":
+            continue
         try:
             with open(cache_file) as f:
                 data = json.load(f)
@@ -192,7 +220,12 @@ def load_structured_cache():
         except (json.JSONDecodeError, OSError) as e:
             print(f"Warning: Failed to load cache file {cache_file}: {e}", file=sys.stderr)
 
-    return cache
+    if product_codes is not None:
+        selected = {}
+        for product_code in product_codes:
+            selected.update(filter_by_product_code(cache, product_code))
+        cache = selected
+    return filter_by_year_range(cache, year_start, year_end)
 
 
 def filter_by_product_code(structured_cache: Dict, product_code: str) -> Dict:
@@ -1168,8 +1201,8 @@ def main():
     if verbose:
         print("Loading structured cache...")
 
-    cache = load_structured_cache()
-    if not cache:
+    cache = load_structured_cache(all_product_codes)
+    if not cache and not any(get_structured_cache_dir().glob("*.json")):
         # Attempt auto-build
         build_script = Path(__file__).resolve().parent / "build_structured_cache.py"
         cache_dir = Path(os.path.expanduser("~/fda-510k-data/extraction/cache"))
@@ -1185,12 +1218,12 @@ def main():
             )
 
             if result["status"] == "success":
-                cache = load_structured_cache()
+                cache = load_structured_cache(all_product_codes)
             elif result["status"] == "timeout" and verbose:
                 print("  Suggestion: Check that extraction cache files exist in "
                       f"{cache_dir} and try running build_structured_cache.py manually.")
 
-        if not cache:
+        if not cache and not any(get_structured_cache_dir().glob("*.json")):
             print("Error: No structured cache found. Run build_structured_cache.py first.")
             sys.exit(1)
 
@@ -18,12 +18,14 @@ Usage:
     result = client.get_recalls("OVE")
 """
 
+import copy
 import hashlib
 import json
 import logging
 import os
 import re
 import ssl
+import threading
 import time
 import sys
 import urllib.error
@@ -65,6 +67,32 @@ except ImportError:
     _CROSS_PROCESS_LIMITER_AVAILABLE = False
     CrossProcessRateLimiter = None  # type: ignore
 
+# Import pluggable HTTP transport (keep-alive connection pool)
+try:
+    from fda_tools.lib.http_transport import HTTPTransport, get_default_transport  # type: ignore
+    _TRANSPORT_AVAILABLE = True
+except ImportError:
+    _TRANSPORT_AVAILABLE = False
+    HTTPTransport = None  # type: ignore
+    get_default_transport = None  # type: ignore
+
+# Import single-file SQLite API cache backend
+try:
+    from fda_tools.lib.api_cache_store import SQLiteCacheStore, DEFAULT_DB_NAME  # type: ignore
+    _CACHE_STORE_AVAILABLE = True
+except ImportError:
+    _CACHE_STORE_AVAILABLE = False
+    SQLiteCacheStore = None  # type: ignore
+    DEFAULT_DB_NAME = "api_cache.db"
+
+# Import in-process LRU tier
+try:
+    from fda_tools.lib.memory_cache import MemoryLRUCache  # type: ignore
+    _MEMORY_CACHE_AVAILABLE = True
+except ImportError:
+    _MEMORY_CACHE_AVAILABLE = False
+    MemoryLRUCache = None  # type: ignore
+
 # Import PostgreSQL database module (FDA-191)
 try:
     from fda_tools.lib.postgres_database import PostgreSQLDatabase  # type: ignore
@@ -105,9 +133,37 @@ try:
 except Exception:
     pass  # fall back to hardcoded defaults above
 
+# API response cache backend: "files" or "sqlite" -- overridden by config
+CACHE_BACKEND = "files"
+
+# In-process LRU tier above the disk cache -- overridden by config
+MEMORY_CACHE_ENTRIES = 2048       # 0 disables the tier
+MEMORY_CACHE_MB = 64
+MEMORY_CACHE_TTL = 3600           # seconds
+try:
+    from fda_tools.lib.config import get_config as _get_config  # type: ignore
+    _cfg = _get_config()
+    CACHE_BACKEND = _cfg.get_str("cache.api_cache_backend", default=CACHE_BACKEND)
+    MEMORY_CACHE_ENTRIES = _cfg.get_int("cache.memory_cache_entries", default=MEMORY_CACHE_ENTRIES)
+    MEMORY_CACHE_MB = _cfg.get_int("cache.memory_cache_mb", default=MEMORY_CACHE_MB)
+    MEMORY_CACHE_TTL = _cfg.get_int("cache.memory_cache_ttl", default=MEMORY_CACHE_TTL)
+    del _get_config, _cfg
+except Exception:
+    pass
+
 # API base URL
 BASE_URL = "https://api.fda.gov/device"
 
+# Max IDs fused into one OR query by the lookup micro-batcher
+OR_BATCH_SIZE = 50
+
+# Single-record lookups that can be fused into OR queries:
+# lookup name -> (endpoint, unique id field)
+BATCHABLE_LOOKUPS = {
+    "510k": ("510k", "k_number"),
+    "classification": ("classification", "product_code"),
+}
+
 # User agent
 try:
     from version import PLUGIN_VERSION
@@ -116,15 +172,96 @@ except Exception:
     USER_AGENT = "Mozilla/5.0 (FDA-Plugin/0.0.0)"
 
 
+# Page size for iter_records (openFDA maximum per request)
+ITER_PAGE_SIZE = 1000
+
+# Link: <https://api.fda.gov/device/510k.json?...&search_after=...>; rel="Next"
+_LINK_NEXT_RE = re.compile(r'<([^>]+)>\s*;\s*rel="?next"?', re.IGNORECASE)
+
+
+class RecordIterationError(Exception):
+    """iter_records() could not fetch the next page.
+
+    Attributes:
+        resume_token: search_after token of the page that failed (None for
+            the first page). Also persisted in the checkpoint file, if any.
+        yielded: Records yielded before the failure.
+    """
+
+    def __init__(self, message, resume_token=None, yielded=0):
+        super().__init__(message)
+        self.resume_token = resume_token
+        self.yielded = yielded
+
+
+class _InFlightRequest:
+    """An API fetch in progress, shared by concurrent identical requests."""
+
+    __slots__ = ("done", "result")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = {"error": "In-flight request failed", "degraded": True}
+
+
+class _LookupBatcher:
+    """Collects concurrent single-record lookups for a short window.
+
+    The first caller in a window becomes the flusher: it waits up to
+    ``window`` seconds (or until ``max_batch`` IDs are queued), then calls
+    ``flush(ids)`` once for everything queued.  Other callers block until
+    that flush completes.  ``flush`` primes the per-ID cache entries, so
+    each caller's normal cached lookup then hits.
+    """
+
+    def __init__(self, flush, window, max_batch):
+        self._flush = flush
+        self.window = window
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending = []
+        self._flushed = threading.Event()
+        self._full = threading.Event()
+        self._flusher_active = False
+
+    def wait_for(self, value):
+        with self._lock:
+            self._pending.append(value)
+            flushed = self._flushed
+            is_flusher = not self._flusher_active
+            self._flusher_active = True
+            if len(self._pending) >= self.max_batch:
+                self._full.set()
+            full = self._full
+
+        if not is_flusher:
+            flushed.wait()
+            return
+
+        full.wait(self.window)
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._flushed = threading.Event()
+            self._full = threading.Event()
+            self._flusher_active = False
+        try:
+            self._flush(batch)
+        finally:
+            flushed.set()
+
+
 class FDAClient:
     """Centralized openFDA API client with caching, retry, and rate limiting.
 
     Features:
-    - LRU caching with 7-day TTL
+    - Disk caching with 7-day TTL behind a bounded in-process LRU tier
     - SHA-256 integrity verification (GAP-011)
     - Thread-safe token bucket rate limiting (FDA-20)
     - Exponential backoff with retry (FDA-20)
     - Rate limit header inspection and warnings (FDA-20)
+    - Pluggable HTTP transport with keep-alive connection pooling
+    - Single-flight de-duplication of concurrent identical requests
+    - OR-batching of single-record lookups (prefetch / micro-batch window)
     """
 
     def __init__(
@@ -135,6 +272,11 @@ class FDAClient:
         use_postgres: bool = False,
         postgres_host: str = 'localhost',
         postgres_port: int = 6432,
+        transport: Optional["HTTPTransport"] = None,
+        batch_window: Optional[float] = None,
+        batch_size: int = OR_BATCH_SIZE,
+        cache_backend: Optional[str] = None,
+        memory_cache_entries: Optional[int] = None,
     ):
         """Initialize the FDA API client.
 
@@ -146,14 +288,78 @@ class FDAClient:
             use_postgres: Enable PostgreSQL caching (FDA-191). Default: False for backward compatibility.
             postgres_host: PostgreSQL/PgBouncer host. Default: localhost
             postgres_port: PostgreSQL/PgBouncer port. Default: 6432 (PgBouncer)
+            transport: HTTP transport used for all API requests. Default: the
+                process-wide shared transport (keep-alive pool when
+                ``http.keep_alive`` is enabled in config).
+            batch_window: Micro-batching window in seconds. When set,
+                concurrent get_510k()/get_classification() cache misses
+                arriving within the window are fused into one OR query.
+                Default: None (disabled).
+            batch_size: Maximum IDs fused into one OR query.
+            cache_backend: "files" (one JSON file per response) or "sqlite"
+                (single WAL-mode ``api_cache.db`` in cache_dir).
+                Default: ``cache.api_cache_backend`` from config ("files").
+            memory_cache_entries: Entry cap of the in-process LRU tier in
+                front of the disk cache; 0 disables it.
+                Default: ``cache.memory_cache_entries`` from config (2048).
         """
         self.api_key = api_key or self._load_api_key()
         self.cache_dir = Path(cache_dir or os.path.expanduser("~/fda-510k-data/api_cache"))
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.enabled = self._check_enabled()
-        self._stats = {"hits": 0, "misses": 0, "errors": 0, "corruptions": 0, "postgres_hits": 0}
+        self._stats = {
+            "hits": 0, "misses": 0, "errors": 0, "corruptions": 0,
+            "postgres_hits": 0, "coalesced": 0,
+            "batched_queries": 0, "batched_ids": 0,
+        }
         self._audit_events = []  # In-memory audit log for cache integrity events
 
+        # Optional single-file cache backend
+        self.cache_backend = (cache_backend or CACHE_BACKEND).lower()
+        self._cache_store = None
+        if self.cache_backend == "sqlite":
+            if _CACHE_STORE_AVAILABLE:
+                self._cache_store = SQLiteCacheStore(  # type: ignore
+                    self.cache_dir / DEFAULT_DB_NAME, audit_logger=self._audit_logger
+                )
+            else:
+                logger.warning("SQLite cache backend not available, using JSON files")
+                self.cache_backend = "files"
+
+        # In-process LRU tier (size-, entry- and TTL-bounded)
+        if memory_cache_entries is None:
+            memory_cache_entries = MEMORY_CACHE_ENTRIES
+        self._memory_cache = None
+        if memory_cache_entries > 0 and _MEMORY_CACHE_AVAILABLE:
+            self._memory_cache = MemoryLRUCache(  # type: ignore
+                max_entries=memory_cache_entries,
+                max_bytes=MEMORY_CACHE_MB * 1024 * 1024,
+                ttl_seconds=min(MEMORY_CACHE_TTL, CACHE_TTL),
+            )
+
+        # Single-flight registry: cache key -> in-flight fetch
+        self._inflight: Dict[str, _InFlightRequest] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Lookup OR-batching
+        self.batch_size = max(1, batch_size)
+        self._batchers: Dict[str, _LookupBatcher] = {}
+        if batch_window:
+            for lookup in BATCHABLE_LOOKUPS:
+                self._batchers[lookup] = _LookupBatcher(
+                    lambda ids, lookup=lookup: self.prefetch(lookup, ids),
+                    window=batch_window,
+                    max_batch=self.batch_size,
+                )
+
+        # HTTP transport shared by all request methods
+        if transport is not None:
+            self._transport = transport
+        elif _TRANSPORT_AVAILABLE:
+            self._transport = get_default_transport()  # type: ignore
+        else:
+            self._transport = None
+
         # Initialize PostgreSQL database (FDA-191)
         self.use_postgres = use_postgres and _POSTGRES_AVAILABLE
         self.db = None
@@ -285,11 +491,34 @@ class FDAClient:
         return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
     def _get_cached(self, cache_key):
-        """Get a cached response if valid, with integrity verification.
+        """Get a cached response from the in-process LRU tier, then disk.
+
+        Verified disk hits are promoted into the LRU tier, so repeated
+        lookups in long-running processes skip the file read and checksum.
+        """
+        if self._memory_cache is not None:
+            data = self._memory_cache.get(cache_key)
+            if data is not None:
+                self._stats["hits"] += 1
+                return data
+
+        data = self._get_disk_cached(cache_key)
+        if data is not None and self._memory_cache is not None:
+            self._memory_cache.set(cache_key, data)
+        return data
+
+    def _get_disk_cached(self, cache_key):
+        """Get a cached response from disk if valid, with integrity verification.
 
         GAP-011: Reads cache file through integrity_read() which verifies
         the SHA-256 checksum. Corrupt files are auto-invalidated and logged.
         """
+        if self._cache_store is not None:
+            data = self._cache_store.get(cache_key, ttl_seconds=CACHE_TTL)
+            if data is not None:
+                self._stats["hits"] += 1
+            return data
+
         cache_file = self.cache_dir / f"{cache_key}.json"
         if not cache_file.exists():
             return None
@@ -385,12 +614,41 @@ class FDAClient:
 
         return None
 
+    def _is_cached(self, cache_key):
+        """Return True if a fresh entry exists for the key.
+
+        Applies the same CACHE_TTL rule as _get_disk_cached(), so expired
+        entries are re-batched by prefetch(); skips checksum verification
+        and hit accounting.
+        """
+        if self._cache_store is not None:
+            return self._cache_store.contains(cache_key, ttl_seconds=CACHE_TTL)
+        cache_file = self.cache_dir / f"{cache_key}.json"
+        try:
+            with open(cache_file) as f:
+                cached_at = json.load(f).get("_cached_at", 0)
+        except (OSError, ValueError, AttributeError):
+            return False
+        return time.time() - cached_at <= CACHE_TTL
+
     def _set_cached(self, cache_key, data):
         """Cache a response with integrity envelope and atomic write.
 
         GAP-011: Uses integrity_write() for atomic writes with SHA-256
         checksum envelope. Prevents partial file corruption on crash.
         """
+        # Only integrity-verified disk reads are promoted to the LRU tier;
+        # drop any older in-memory copy of this key.
+        if self._memory_cache is not None:
+            self._memory_cache.invalidate(cache_key)
+
+        if self._cache_store is not None:
+            try:
+                self._cache_store.set(cache_key, data)
+            except Exception as e:
+                logger.warning("Cache store write failed: %s", e)  # Non-fatal
+            return
+
         cache_file = self.cache_dir / f"{cache_key}.json"
 
         if _INTEGRITY_AVAILABLE:
@@ -445,8 +703,48 @@ class FDAClient:
         if cached is not None:
             return cached
 
+        # Single-flight: concurrent identical requests share one API fetch
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            is_leader = pending is None
+            if is_leader:
+                pending = self._inflight[key] = _InFlightRequest()
+
+        if not is_leader:
+            pending.done.wait()
+            self._stats["coalesced"] += 1
+            return copy.deepcopy(pending.result)
+
+        try:
+            # Another leader may have filled the cache since our lookup
+            cached = self._get_cached(key)
+            pending.result = cached if cached is not None else self._fetch(endpoint, params, key)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            pending.done.set()
+        return pending.result
+
+    def _fetch(self, endpoint: str, params: Dict[str, str], key: str) -> Dict:
+        """Fetch from the API after a cache miss and cache the response.
+
+        Called by _request() for the single in-flight leader of a cache key.
+        """
         self._stats["misses"] += 1
+        result, _ = self._call_api(endpoint, params)
+        if not result.get("degraded"):
+            # Successful responses and 404 (valid empty result) are cached
+            self._set_cached(key, result)
+        return result
+
+    def _call_api(self, endpoint: str, params: Dict[str, str]):
+        """Call the API under the rate limiter with retry and backoff.
 
+        Returns:
+            Tuple of (response dict, response headers dict). The response is
+            the parsed JSON, an empty result for 404, or an error dict with
+            'degraded': True. Headers are empty unless the call succeeded.
+        """
         # Rate limiting: Use cross-process limiter (FDA-104) when available,
         # fall back to in-memory limiter for single-process use
         if self._cross_process_limiter:
@@ -461,7 +759,7 @@ class FDAClient:
                 return {
                     "error": "Cross-process rate limit timeout after 120s",
                     "degraded": True,
-                }
+                }, {}
         elif self._rate_limiter:
             # Fallback to in-memory rate limiter (single-process only)
             acquired = self._rate_limiter.acquire(tokens=1, timeout=120.0)
@@ -471,50 +769,38 @@ class FDAClient:
                 return {
                     "error": "Rate limit acquisition timeout after 120s",
                     "degraded": True,
-                }
-
-        # Add API key if available
-        if self.api_key:
-            params["api_key"] = self.api_key
-
-        # openFDA expects + as URL-encoded spaces in search queries;
-        # urlencode converts spaces to + but literal + to %2B (which breaks AND/OR).
-        # Fix: replace + with space in search before encoding.
-        if "search" in params:
-            params["search"] = params["search"].replace("+", " ")
-        url = f"{BASE_URL}/{endpoint}.json?{urllib.parse.urlencode(params)}"
-        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+                }, {}
 
-        # FDA-107: Create SSL context with certificate verification enabled
-        ssl_context = ssl.create_default_context()
+        url = self._build_url(endpoint, params)
+        headers = {"User-Agent": USER_AGENT}
 
         last_error = None
         for attempt in range(MAX_RETRIES):
             try:
-                with urllib.request.urlopen(req, timeout=15, context=ssl_context) as resp:
+                with self._open(url, headers) as resp:
                     # Parse response
                     data = json.loads(resp.read())
 
+                    # urllib.request.urlopen returns http.client.HTTPResponse
+                    # Headers accessible via .headers (HTTPMessage object)
+                    try:
+                        headers_dict = dict(resp.headers)
+                    except (TypeError, ValueError):
+                        headers_dict = {}
+
                     # Update rate limiter from response headers
                     if self._rate_limiter:
-                        # urllib.request.urlopen returns http.client.HTTPResponse
-                        # Headers accessible via .headers (HTTPMessage object)
-                        headers_dict = dict(resp.headers)
                         self._rate_limiter.update_from_headers(headers_dict)
 
-                    # Cache and return
-                    self._set_cached(key, data)
-                    return data
+                    return data, headers_dict
 
             except urllib.error.HTTPError as e:
                 # Parse headers from HTTPError (has .headers attribute)
                 error_headers = dict(e.headers) if hasattr(e, "headers") else {}
 
                 if e.code == 404:
-                    # Not found is a valid response, cache it
-                    result = {"results": [], "meta": {"results": {"total": 0}}}
-                    self._set_cached(key, result)
-                    return result
+                    # Not found is a valid response (cached by _fetch)
+                    return {"results": [], "meta": {"results": {"total": 0}}}, {}
 
                 elif e.code == 429:
                     # Rate limited -- use retry policy
@@ -580,7 +866,7 @@ class FDAClient:
                         endpoint,
                         e.reason,
                     )
-                    return {"error": f"HTTP {e.code}: {e.reason}", "degraded": True}
+                    return {"error": f"HTTP {e.code}: {e.reason}", "degraded": True}, {}
 
             except Exception as e:
                 # Network error, timeout, etc. -- retry
@@ -615,19 +901,127 @@ class FDAClient:
         return {
             "error": f"API unavailable after {MAX_RETRIES} retries: {last_error}",
             "degraded": True,
-        }
+        }, {}
+
+    def _build_url(self, endpoint, params):
+        """Build the request URL, adding the API key to ``params``."""
+        # Add API key if available
+        if self.api_key:
+            params["api_key"] = self.api_key
+
+        # openFDA expects + as URL-encoded spaces in search queries;
+        # urlencode converts spaces to + but literal + to %2B (which breaks AND/OR).
+        # Fix: replace + with space in search before encoding.
+        if "search" in params:
+            params["search"] = params["search"].replace("+", " ")
+        return f"{BASE_URL}/{endpoint}.json?{urllib.parse.urlencode(params)}"
+
+    def _open(self, url, headers, timeout=15):
+        """Open a URL through the configured HTTP transport."""
+        if self._transport is not None:
+            return self._transport.open(url, headers=headers, timeout=timeout)
+        # Fallback: one-shot urlopen if lib.http_transport is not importable
+        # FDA-107: Create SSL context with certificate verification enabled
+        ssl_context = ssl.create_default_context()
+        req = urllib.request.Request(url, headers=headers)
+        return urllib.request.urlopen(req, timeout=timeout, context=ssl_context)
 
     # --- Convenience Methods ---
 
+    def _lookup_params(self, lookup, value):
+        """Query params of a single-record lookup (shared with prefetch)."""
+        _, id_field = BATCHABLE_LOOKUPS[lookup]
+        return {"search": f'{id_field}:"{value}"', "limit": "1"}
+
+    def _lookup(self, lookup, value):
+        """Single-record lookup, routed through the micro-batcher if enabled."""
+        endpoint, _ = BATCHABLE_LOOKUPS[lookup]
+        params = self._lookup_params(lookup, value)
+        batcher = self._batchers.get(lookup)
+        if batcher is not None and self.enabled:
+            key = self._cache_key(endpoint, params)
+            if not self._is_cached(key):
+                batcher.wait_for(value)
+        return self._request(endpoint, params)
+
+    def prefetch(self, lookup, values, batch_size=None):
+        """Fetch many single-record lookups with fused OR queries.
+
+        Uncached IDs are queried ``batch_size`` at a time as
+        ``id:"A" OR id:"B" ...`` and each returned record is written to the
+        exact cache entry the single lookup (e.g. get_510k) would use, so
+        subsequent per-ID calls are cache hits. IDs absent from a complete
+        batch response are cached as not found, like a 404.
+
+        Args:
+            lookup: Lookup name from BATCHABLE_LOOKUPS ('510k', 'classification').
+            values: IDs to prefetch (K-numbers, product codes).
+            batch_size: Max IDs per OR query. Default: client batch_size.
+
+        Returns:
+            Number of IDs whose cache entries were written.
+        """
+        endpoint, id_field = BATCHABLE_LOOKUPS[lookup]
+        batch_size = max(1, batch_size or self.batch_size)
+
+        # Keep the caller's spelling: it is part of the single-lookup cache key
+        todo = {}
+        for value in values:
+            value = str(value).strip()
+            if not value or value.upper() in todo:
+                continue
+            key = self._cache_key(endpoint, self._lookup_params(lookup, value))
+            if not self._is_cached(key):
+                todo[value.upper()] = value
+
+        written = 0
+        pending = list(todo.values())
+        for i in range(0, len(pending), batch_size):
+            chunk = pending[i:i + batch_size]
+            search = "+OR+".join(f'{id_field}:"{v}"' for v in chunk)
+            response = self._request(endpoint, {"search": search, "limit": str(len(chunk))})
+            if response.get("degraded"):
+                logger.warning(
+                    "Batched %s lookup degraded for %d IDs: %s",
+                    lookup, len(chunk), response.get("error"),
+                )
+                continue
+            self._stats["batched_queries"] += 1
+            self._stats["batched_ids"] += len(chunk)
+
+            by_id = {}
+            for record in response.get("results", []):
+                record_id = str(record.get(id_field, "")).upper()
+                if record_id and record_id not in by_id:
+                    by_id[record_id] = record
+            total = response.get("meta", {}).get("results", {}).get("total", len(by_id))
+            complete = total <= len(response.get("results", []))
+
+            for value in chunk:
+                record = by_id.get(value.upper())
+                if record is not None:
+                    single = {"meta": {"results": {"skip": 0, "limit": 1, "total": 1}},
+                              "results": [record]}
+                elif complete:
+                    single = {"results": [], "meta": {"results": {"total": 0}}}
+                else:
+                    continue  # Truncated response: leave to the single lookup
+                key = self._cache_key(endpoint, self._lookup_params(lookup, value))
+                self._set_cached(key, single)
+                written += 1
+        return written
+
+    def prefetch_510k(self, k_numbers, batch_size=None):
+        """Prime the get_510k() cache for many K-numbers with OR queries."""
+        return self.prefetch("510k", k_numbers, batch_size=batch_size)
+
     def get_510k(self, k_number):
         """Look up a 510(k) clearance by K-number."""
-        return self._request("510k", {"search": f'k_number:"{k_number}"', "limit": "1"})
+        return self._lookup("510k", k_number)
 
     def get_classification(self, product_code):
         """Look up device classification by product code."""
-        return self._request(
-            "classification", {"search": f'product_code:"{product_code}"', "limit": "1"}
-        )
+        return self._lookup("classification", product_code)
 
     def get_clearances(self, product_code, limit=100, sort="decision_date:desc"):
         """Get all 510(k) clearances for a product code."""
@@ -646,6 +1040,126 @@ class FDAClient:
             "limit": str(limit or len(k_numbers))
         })
 
+    def iter_records(self, endpoint, search=None, sort=None, page_size=ITER_PAGE_SIZE,
+                     checkpoint=None, resume_token=None):
+        """Stream every record matching a query using search_after pagination.
+
+        openFDA caps ``skip`` at 25,000; past that, result sets can only be
+        walked with the ``search_after`` token returned in each response's
+        ``Link: <...>; rel="Next"`` header. Records are yielded one page at a
+        time (constant memory) and each page request goes through the rate
+        limiter and retry policy. Pages are not written to the response cache.
+
+        Args:
+            endpoint: API endpoint (e.g., '510k', 'classification').
+            search: openFDA search expression, or None for all records.
+            sort: Sort expression (e.g., 'decision_date:asc'). A stable sort
+                keeps pagination consistent while records are being added.
+            page_size: Records per request (max 1000).
+            checkpoint: Optional JSON file path. The next page's token is saved
+                there after each page is consumed, a rerun with the same
+                endpoint/search/sort resumes from it, and the file is removed
+                once iteration completes.
+            resume_token: Explicit search_after token to start from
+                (overrides the checkpoint).
+
+        Yields:
+            Record dicts.
+
+        Raises:
+            RecordIterationError: A page could not be fetched after retries.
+                The checkpoint (if any) still points at that page.
+        """
+        for page in self.iter_pages(endpoint, search=search, sort=sort, page_size=page_size,
+                                    checkpoint=checkpoint, resume_token=resume_token):
+            yield from page
+
+    def iter_pages(self, endpoint, search=None, sort=None, page_size=ITER_PAGE_SIZE,
+                   checkpoint=None, resume_token=None):
+        """Page-at-a-time form of iter_records().
+
+        Yields each page's list of records. The checkpoint for the following
+        page is written only when the consumer asks for it, so a consumer that
+        persists its own progress per page can resume without gaps.
+        """
+        query = {"endpoint": endpoint, "search": search, "sort": sort}
+        checkpoint_path = Path(checkpoint) if checkpoint else None
+        yielded = 0
+        token = resume_token
+        if token is None and checkpoint_path is not None:
+            state = self._load_iter_checkpoint(checkpoint_path)
+            if state and state.get("query") == query:
+                token = state.get("search_after")
+                yielded = state.get("yielded", 0)
+                logger.info("Resuming %s iteration after %d records", endpoint, yielded)
+
+        while True:
+            params = {"limit": str(min(page_size, ITER_PAGE_SIZE))}
+            if search:
+                params["search"] = search
+            if sort:
+                params["sort"] = sort
+            if token:
+                params["search_after"] = token
+
+            result, headers = self._call_api(endpoint, params)
+            if result.get("degraded"):
+                raise RecordIterationError(
+                    f"{endpoint} page fetch failed after {yielded} records: "
+                    f"{result.get('error')}",
+                    resume_token=token,
+                    yielded=yielded,
+                )
+
+            results = result.get("results", [])
+            if results:
+                yield results
+            yielded += len(results)
+
+            token = self._next_search_after(headers) if results else None
+            if not token:
+                break
+            if checkpoint_path is not None:
+                self._save_iter_checkpoint(checkpoint_path, {
+                    "query": query,
+                    "search_after": token,
+                    "yielded": yielded,
+                    "updated_at": time.time(),
+                })
+
+        if checkpoint_path is not None:
+            checkpoint_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _next_search_after(headers):
+        """Extract the search_after token from a Link rel="Next" header."""
+        link = next((v for k, v in headers.items() if k.lower() == "link"), None)
+        if not link:
+            return None
+        match = _LINK_NEXT_RE.search(link)
+        if not match:
+            return None
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(match.group(1)).query)
+        values = query.get("search_after")
+        return values[0] if values else None
+
+    @staticmethod
+    def _load_iter_checkpoint(path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _save_iter_checkpoint(path, state):
+        """Write the checkpoint atomically (temp file + os.replace)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
     def get_events(self, product_code, count=None, limit=100):
         """Get MAUDE adverse events for a product code."""
         params = {
@@ -838,39 +1352,21 @@ class FDAClient:
                 except (json.JSONDecodeError, OSError) as e:
                     logger.warning("Failed to read product code cache: %s", e)
 
-        # Fetch all product codes via pagination
+        # Stream every classification record (search_after pagination, not
+        # capped at openFDA's 25k skip limit)
         all_codes = set()
-        limit = 1000  # Max per request
-        skip = 0
 
         logger.info("Enumerating all FDA product codes (this may take a minute)...")
 
-        while True:
-            result = self._request("classification", {"limit": str(limit), "skip": str(skip)})
-
-            if result.get("degraded"):
-                logger.warning("API degraded during enumeration: %s", result.get('error'))
-                break
-
-            results = result.get("results", [])
-            if not results:
-                break
-
-            # Extract product codes
-            for item in results:
+        try:
+            for item in self.iter_records("classification", sort="product_code:asc"):
                 code = item.get("product_code")
                 if code:
                     all_codes.add(code.upper())
-
-            logger.debug("Fetched %d devices (total codes: %d)", len(results), len(all_codes))
-
-            # Check if there are more results
-            total = result.get("meta", {}).get("results", {}).get("total", 0)
-            if skip + len(results) >= total:
-                break
-
-            skip += limit
-            time.sleep(0.3)  # Rate limiting
+        except RecordIterationError as e:
+            # Partial enumeration: return what we have but don't cache it
+            logger.warning("API degraded during enumeration: %s", e)
+            return sorted(all_codes)
 
         codes_list = sorted(list(all_codes))
 
@@ -954,14 +1450,29 @@ class FDAClient:
     # --- Cache Management ---
 
     def cache_stats(self) -> Dict:
-        """Return cache statistics including integrity and rate limiting metrics."""
-        cache_files = list(self.cache_dir.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in cache_files)
-        expired = 0
-        valid = 0
-        integrity_verified = 0
-        legacy_format = 0
-        corrupt = 0
+        """Return cache statistics including integrity and rate limiting metrics.
+
+        With the SQLite backend, counts come from the store's maintained
+        totals instead of opening and checksumming every file; entries are
+        checksum-verified on read, and corruption is reported per session.
+        """
+        if self._cache_store is not None:
+            store_stats = self._cache_store.stats(ttl_seconds=CACHE_TTL)
+            cache_files = []
+            total_size = store_stats["file_bytes"]
+            expired = store_stats["expired"]
+            valid = store_stats["valid"]
+            integrity_verified = store_stats["entries"]
+            legacy_format = 0
+            corrupt = self._stats["corruptions"]
+        else:
+            cache_files = list(self.cache_dir.glob("*.json"))
+            total_size = sum(f.stat().st_size for f in cache_files)
+            expired = 0
+            valid = 0
+            integrity_verified = 0
+            legacy_format = 0
+            corrupt = 0
 
         for f in cache_files:
             try:
@@ -988,7 +1499,10 @@ class FDAClient:
 
         stats = {
             "cache_dir": str(self.cache_dir),
-            "total_files": len(cache_files),
+            "cache_backend": self.cache_backend,
+            "total_files": (
+                store_stats["entries"] if self._cache_store is not None else len(cache_files)
+            ),
             "valid": valid,
             "expired": expired,
             "total_size_bytes": total_size,
@@ -997,6 +1511,9 @@ class FDAClient:
             "session_misses": self._stats["misses"],
             "session_errors": self._stats["errors"],
             "session_corruptions": self._stats["corruptions"],
+            "session_coalesced": self._stats["coalesced"],
+            "session_batched_queries": self._stats["batched_queries"],
+            "session_batched_ids": self._stats["batched_ids"],
             "integrity_verified": integrity_verified,
             "legacy_format": legacy_format,
             "corrupt_detected": corrupt,
@@ -1025,6 +1542,14 @@ class FDAClient:
         if self._cross_process_limiter:
             stats["cross_process_rate_limit"] = self._cross_process_limiter.get_status()
 
+        # In-process LRU tier
+        if self._memory_cache is not None:
+            stats["memory_cache"] = self._memory_cache.get_stats()
+
+        # HTTP connection reuse metrics
+        if self._transport is not None:
+            stats["http_transport"] = self._transport.get_stats()
+
         return stats
 
     def rate_limit_stats(self) -> Optional[Dict]:
@@ -1053,6 +1578,14 @@ class FDAClient:
         Args:
             category: None for all, or 'api', 'expired' to clear specific types.
         """
+        if self._memory_cache is not None:
+            self._memory_cache.clear()
+
+        if self._cache_store is not None:
+            if category == "expired":
+                return self._cache_store.delete_expired(CACHE_TTL)
+            return self._cache_store.clear()
+
         count = 0
         if category == "expired":
             for f in self.cache_dir.glob("*.json"):
@@ -1094,6 +1627,8 @@ class FDAClient:
                 logger.warning("Error closing PostgreSQL connection pool: %s", e)
             finally:
                 self.db = None
+        if getattr(self, "_cache_store", None) is not None:
+            self._cache_store.close()
 
     def __del__(self):
         """Cleanup on object deletion (FDA-193)."""
@@ -1140,13 +1675,16 @@ def main():
         print("=" * 60)
         print("CACHE STATISTICS")
         print("=" * 60)
-        print(f"Cache directory: {stats['cache_dir']}")
+        print(f"Cache directory: {stats['cache_dir']} ({stats['cache_backend']} backend)")
         print(f"Files: {stats['total_files']} ({stats['valid']} valid, {stats['expired']} expired)")
         print(f"Size: {stats['total_size_mb']} MB")
         print(f"Integrity: {stats['integrity_verified']} verified, "
               f"{stats['legacy_format']} legacy, {stats['corrupt_detected']} corrupt")
         print(f"Session: {stats['session_hits']} hits, {stats['session_misses']} misses, "
-              f"{stats['session_errors']} errors")
+              f"{stats['session_errors']} errors, {stats['session_coalesced']} coalesced")
+        if stats["session_batched_queries"]:
+            print(f"Batched: {stats['session_batched_ids']} IDs in "
+                  f"{stats['session_batched_queries']} OR queries")
 
         # Show rate limiting stats if available
         if "rate_limiting" in stats:
@@ -1176,6 +1714,28 @@ def main():
             print(f"State file: {xp.get('state_file', 'N/A')}")
             print(f"Lock file: {xp.get('lock_file', 'N/A')}")
             print(f"Current PID: {xp.get('pid', 'N/A')}")
+
+        if "memory_cache" in stats:
+            mc = stats["memory_cache"]
+            print("\n" + "=" * 60)
+            print("MEMORY CACHE (LRU)")
+            print("=" * 60)
+            print(f"Entries: {mc['entries']} / {mc['max_entries']} "
+                  f"({mc['bytes'] / (1024 * 1024):.1f} / {mc['max_bytes'] // (1024 * 1024)} MB)")
+            print(f"Lookups: {mc['hits']} hits, {mc['misses']} misses "
+                  f"(hit rate {mc['hit_rate']:.1%})")
+            print(f"Evictions: {mc['evictions']} (+{mc['expirations']} expired)")
+
+        if "http_transport" in stats:
+            ht = stats["http_transport"]
+            print("\n" + "=" * 60)
+            print("HTTP TRANSPORT")
+            print("=" * 60)
+            print(f"Transport: {ht['transport']}")
+            print(f"Requests: {ht['requests']}")
+            print(f"Connections: {ht['connections_opened']} opened, "
+                  f"{ht['connections_reused']} reused "
+                  f"(reuse ratio {ht['reuse_ratio']:.1%})")
         print("=" * 60)
 
     elif args.clear:
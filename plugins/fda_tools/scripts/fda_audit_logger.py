@@ -5,7 +5,8 @@ FDA Decision Audit Logger — Zero-Trust Audit Trail.
 Standalone CLI that commands call via bash to append structured decision entries
 to $PROJECT_DIR/audit_log.jsonl. Every autonomous decision documents what was
 chosen, what alternatives were considered, why each was excluded, and what data
-informed the decision.
+informed the decision. Older entries are rotated into indexed segments under
+$PROJECT_DIR/audit_segments/ (see "Segment storage" below).
 
 Usage:
     # Append a decision entry
@@ -32,12 +33,14 @@ Usage:
 """
 
 import argparse
+import fcntl
 import json
 import logging
 import os
 import re
 import sys
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
@@ -156,77 +159,287 @@ def append_entry(project_dir, entry):
 
     os.makedirs(project_dir, exist_ok=True)
     log_path = get_log_path(project_dir)
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+    with _locked_active_segment(log_path, exclusive=True) as f:
+        if _should_rotate(os.fstat(f.fileno()), len(line)):
+            _seal_active_segment(project_dir, log_path)
+            with open(log_path, "ab") as fresh:
+                fcntl.flock(fresh, fcntl.LOCK_EX)
+                fresh.write(line)
+        else:
+            f.write(line)
 
     return entry_id, []
 
 
+# ── Segment storage ──
+#
+# audit_log.jsonl is the active segment and the only file appended to. When it
+# reaches AUDIT_SEGMENT_MAX_BYTES, or on the first append in a new calendar
+# month, it is renamed into audit_segments/ as audit_log.NNNNNN.jsonl and never
+# written again. Each sealed segment gets a sidecar index (built by the first
+# reader, not the appender) so queries and summaries can skip segments and
+# parse only the lines that can match.
+
+AUDIT_SEGMENT_DIR = "audit_segments"
+AUDIT_SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+SEGMENT_INDEX_VERSION = 1
+INDEXED_FIELDS = ("command", "action", "subject")
+
+_SEGMENT_RE = re.compile(r"^audit_log\.(\d{6})\.jsonl$")
+
+
+@contextmanager
+def _locked_active_segment(log_path, exclusive):
+    """Open and flock the active segment, retrying if it was rotated meanwhile.
+
+    Appenders hold LOCK_EX (creating the file if needed); readers hold LOCK_SH
+    so that rotation cannot move entries between segments mid-read. Readers get
+    None when there is no active segment.
+    """
+    while True:
+        try:
+            f = open(log_path, "ab" if exclusive else "rb")
+        except FileNotFoundError:
+            yield None
+            return
+        fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            current = os.path.samestat(os.fstat(f.fileno()), os.stat(log_path))
+        except FileNotFoundError:
+            current = False
+        if current:
+            break
+        f.close()
+    try:
+        yield f
+    finally:
+        f.close()
+
+
+def _should_rotate(stat, incoming_bytes):
+    """Whether the active segment must be sealed before the next append."""
+    if stat.st_size == 0:
+        return False
+    if stat.st_size + incoming_bytes > AUDIT_SEGMENT_MAX_BYTES:
+        return True
+    last_write = datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+    return last_write.strftime("%Y-%m") != datetime.now(timezone.utc).strftime("%Y-%m")
+
+
+def _segment_paths(project_dir):
+    """Sealed segment paths, oldest first."""
+    segment_dir = os.path.join(project_dir, AUDIT_SEGMENT_DIR)
+    try:
+        names = os.listdir(segment_dir)
+    except FileNotFoundError:
+        return []
+    return [os.path.join(segment_dir, name) for name in sorted(names) if _SEGMENT_RE.match(name)]
+
+
+def _seal_active_segment(project_dir, log_path):
+    """Move the active segment into the segment directory (caller holds LOCK_EX)."""
+    segment_dir = os.path.join(project_dir, AUDIT_SEGMENT_DIR)
+    os.makedirs(segment_dir, exist_ok=True)
+    existing = _segment_paths(project_dir)
+    seq = int(_SEGMENT_RE.match(os.path.basename(existing[-1])).group(1)) + 1 if existing else 1
+    segment_path = os.path.join(segment_dir, f"audit_log.{seq:06d}.jsonl")
+    os.rename(log_path, segment_path)
+    return segment_path
+
+
+def _iter_lines(f, path):
+    """Yield (byte_offset, entry) for each well-formed line of an open segment."""
+    offset = 0
+    for line_num, raw in enumerate(f, 1):
+        line_offset, offset = offset, offset + len(raw)
+        if not raw.strip():
+            continue
+        try:
+            yield line_offset, json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            logger.warning("Malformed entry at %s line %d", os.path.basename(path), line_num)
+
+
+def _index_path(segment_path):
+    return segment_path[:-len(".jsonl")] + ".idx.json"
+
+
+def _build_segment_index(segment_path):
+    """Scan a sealed segment once and write its sidecar index."""
+    offsets, timestamps = [], []
+    fields = {field: {} for field in INDEXED_FIELDS}
+    decisions, exclusions = [], []
+    with open(segment_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        entries = []
+        for offset, entry in _iter_lines(f, segment_path):
+            line = len(offsets)
+            offsets.append(offset)
+            ts = entry.get("timestamp", "")
+            timestamps.append(ts if isinstance(ts, str) else "")
+            for field in INDEXED_FIELDS:
+                value = entry.get(field)
+                if value is not None:
+                    fields[field].setdefault(str(value), []).append(line)
+            if entry.get("decision"):
+                decisions.append(line)
+            if entry.get("exclusion_records"):
+                exclusions.append(line)
+            entries.append(entry)
+
+    index = {
+        "version": SEGMENT_INDEX_VERSION,
+        "size": size,
+        "min_timestamp": min(timestamps, default=""),
+        "max_timestamp": max(timestamps, default=""),
+        "offsets": offsets,
+        "timestamps": timestamps,
+        "fields": fields,
+        "decisions": decisions,
+        "exclusions": exclusions,
+        "summary": _summarize_entries(entries),
+    }
+
+    index_path = _index_path(segment_path)
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        logger.warning("Could not write audit segment index %s: %s", index_path, e)
+    return index
+
+
+def _load_segment_index(segment_path):
+    """Load a segment's sidecar index, rebuilding it if missing or stale."""
+    try:
+        with open(_index_path(segment_path), encoding="utf-8") as f:
+            index = json.load(f)
+        if (index.get("version") == SEGMENT_INDEX_VERSION
+                and index.get("size") == os.path.getsize(segment_path)):
+            return index
+    except (OSError, ValueError):
+        pass
+    return _build_segment_index(segment_path)
+
+
+def _candidate_lines(index, filters):
+    """Line numbers of a segment that can match the filters, per its index."""
+    after, before = filters.get("after"), filters.get("before")
+    if after and index["max_timestamp"] < after:
+        return []
+    if before and index["min_timestamp"] > before:
+        return []
+
+    candidates = None
+    for field in INDEXED_FIELDS:
+        if filters.get(field):
+            lines = set(index["fields"][field].get(str(filters[field]), ()))
+            candidates = lines if candidates is None else candidates & lines
+    if filters.get("decisions_only"):
+        lines = set(index["decisions"])
+        candidates = lines if candidates is None else candidates & lines
+    if filters.get("exclusions_only"):
+        lines = set(index["exclusions"])
+        candidates = lines if candidates is None else candidates & lines
+    if candidates is None:
+        candidates = range(len(index["offsets"]))
+
+    timestamps = index["timestamps"]
+    return sorted(
+        line for line in candidates
+        if not (after and timestamps[line] < after) and not (before and timestamps[line] > before)
+    )
+
+
+def _read_segment_lines(segment_path, index, lines):
+    """Parse only the given lines of a sealed segment."""
+    entries = []
+    if not lines:
+        return entries
+    offsets = index["offsets"]
+    with open(segment_path, "rb") as f:
+        for line in lines:
+            f.seek(offsets[line])
+            entries.append(json.loads(f.readline()))
+    return entries
+
+
 def read_log(project_dir):
-    """Read all entries from the audit log."""
+    """Read all entries from the audit log, oldest segment first."""
     log_path = get_log_path(project_dir)
     entries = []
-    if not os.path.exists(log_path):
-        return entries
-    with open(log_path, "r", encoding="utf-8") as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                logger.warning("Malformed entry at line %d", line_num)
+    with _locked_active_segment(log_path, exclusive=False) as active:
+        for segment_path in _segment_paths(project_dir):
+            with open(segment_path, "rb") as f:
+                entries.extend(entry for _, entry in _iter_lines(f, segment_path))
+        if active is not None:
+            entries.extend(entry for _, entry in _iter_lines(active, log_path))
     return entries
 
 
-def query_log(project_dir, filters):
-    """Read and filter the audit log."""
-    entries = read_log(project_dir)
-    filtered = []
+def _entry_matches(entry, filters):
+    """Whether a single entry passes the query_log filters."""
+    if filters.get("command") and entry.get("command") != filters["command"]:
+        return False
+    if filters.get("action") and entry.get("action") != filters["action"]:
+        return False
+    if filters.get("subject") and entry.get("subject") != filters["subject"]:
+        return False
+    if filters.get("after"):
+        ts = entry.get("timestamp", "")
+        if ts < filters["after"]:
+            return False
+    if filters.get("before"):
+        ts = entry.get("timestamp", "")
+        if ts > filters["before"]:
+            return False
+    if filters.get("decisions_only"):
+        if not entry.get("decision"):
+            return False
+    if filters.get("exclusions_only"):
+        if not entry.get("exclusion_records"):
+            return False
+    return True
 
-    for entry in entries:
-        if filters.get("command") and entry.get("command") != filters["command"]:
-            continue
-        if filters.get("action") and entry.get("action") != filters["action"]:
-            continue
-        if filters.get("subject") and entry.get("subject") != filters["subject"]:
-            continue
-        if filters.get("after"):
-            ts = entry.get("timestamp", "")
-            if ts < filters["after"]:
-                continue
-        if filters.get("before"):
-            ts = entry.get("timestamp", "")
-            if ts > filters["before"]:
-                continue
-        if filters.get("decisions_only"):
-            if not entry.get("decision"):
-                continue
-        if filters.get("exclusions_only"):
-            if not entry.get("exclusion_records"):
-                continue
-        filtered.append(entry)
 
+def query_log(project_dir, filters):
+    """Read and filter the audit log.
+
+    Sealed segments are consulted newest first through their indexes, so a
+    filtered or limited query parses only the lines that can match and stops
+    once ``limit`` results are collected.
+    """
+    log_path = get_log_path(project_dir)
     limit = filters.get("limit")
+    chunks = []
+    found = 0
+    with _locked_active_segment(log_path, exclusive=False) as active:
+        if active is not None:
+            chunks.append([entry for _, entry in _iter_lines(active, log_path)
+                           if _entry_matches(entry, filters)])
+            found = len(chunks[0])
+        for segment_path in reversed(_segment_paths(project_dir)):
+            if limit and found >= limit:
+                break
+            index = _load_segment_index(segment_path)
+            lines = _candidate_lines(index, filters)
+            matched = [entry for entry in _read_segment_lines(segment_path, index, lines)
+                       if _entry_matches(entry, filters)]
+            chunks.append(matched)
+            found += len(matched)
+
+    filtered = [entry for chunk in reversed(chunks) for entry in chunk]
     if limit:
         filtered = filtered[-limit:]
 
     return filtered
 
 
-def summarize_log(project_dir):
-    """Generate summary statistics from the audit log."""
-    entries = read_log(project_dir)
-    if not entries:
-        return {
-            "total_entries": 0,
-            "commands": {},
-            "decision_types": {"auto": 0, "manual": 0, "deferred": 0},
-            "exclusions_documented": 0,
-            "date_range": {"earliest": None, "latest": None},
-        }
-
+def _summarize_entries(entries):
+    """Summary statistics for a list of entries (see summarize_log)."""
     commands = {}
     decision_types = {"auto": 0, "manual": 0, "deferred": 0}
     exclusions = 0
@@ -261,6 +474,32 @@ def summarize_log(project_dir):
     }
 
 
+def summarize_log(project_dir):
+    """Generate summary statistics from the audit log.
+
+    Sealed segments contribute the summary stored in their index; only the
+    active segment is parsed.
+    """
+    log_path = get_log_path(project_dir)
+    with _locked_active_segment(log_path, exclusive=False) as active:
+        parts = [_load_segment_index(path)["summary"] for path in _segment_paths(project_dir)]
+        if active is not None:
+            parts.append(_summarize_entries([entry for _, entry in _iter_lines(active, log_path)]))
+
+    summary = _summarize_entries([])
+    for part in parts:
+        summary["total_entries"] += part["total_entries"]
+        for cmd, count in part["commands"].items():
+            summary["commands"][cmd] = summary["commands"].get(cmd, 0) + count
+        for dt, count in part["decision_types"].items():
+            summary["decision_types"][dt] += count
+        summary["exclusions_documented"] += part["exclusions_documented"]
+        for bound, pick in (("earliest", min), ("latest", max)):
+            values = [v for v in (summary["date_range"][bound], part["date_range"][bound]) if v]
+            summary["date_range"][bound] = pick(values) if values else None
+    return summary
+
+
 def consolidate_pipeline(project_dir, project_name):
     """Write a pipeline_audit.json from the audit log entries."""
     entries = read_log(project_dir)
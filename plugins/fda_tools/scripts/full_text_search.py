@@ -5,6 +5,10 @@ Full-Text Search Module for FDA 510(k) Predicate Discovery
 Enables comprehensive searching across ALL sections of 510(k) summaries,
 not just the Substantial Equivalence section.
 
+Searches are answered from the inverted index (lib/text_index.py) that
+build_structured_cache.py maintains in the structured cache directory, and
+fall back to scanning every cached document when no index exists.
+
 Usage:
     from full_text_search import search_all_sections, find_predicates_by_feature
 
@@ -22,13 +26,44 @@ import os
 import json
 import re
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Iterable, Set, Optional
 from collections import defaultdict, Counter
 
 
-def load_structured_cache() -> Dict:
-    """Load the structured text cache index."""
-    structured_dir = Path.home() / 'fda-510k-data' / 'extraction' / 'structured_text_cache'
+try:
+    from fda_tools.lib.text_index import StructuredTextIndex
+    _TEXT_INDEX_AVAILABLE = True
+except ImportError:
+    _TEXT_INDEX_AVAILABLE = False
+
+try:
+    from fda_tools.lib.flat_file_cache import arrow_available, read_columns
+    _FLAT_FILE_CACHE_AVAILABLE = arrow_available()
+except ImportError:
+    _FLAT_FILE_CACHE_AVAILABLE = False
+
+
+def get_structured_cache_dir() -> Path:
+    """Return the structured text cache directory."""
+    return Path.home() / 'fda-510k-data' / 'extraction' / 'structured_text_cache'
+
+
+def _pmn_files() -> List[Path]:
+    return [
+        Path.home() / 'fda-510k-data' / 'extraction' / 'pmn96cur.txt',
+        Path.home() / 'fda-510k-data' / 'extraction' / 'pmn9195.txt',
+    ]
+
+
+def load_structured_cache(k_numbers: Optional[Iterable[str]] = None) -> Dict:
+    """Load the structured text cache index.
+
+    Args:
+        k_numbers: Load only these documents (default: all), so a filtered
+            search does not parse every file in the cache
+    """
+    structured_dir = get_structured_cache_dir()
+    wanted = set(k_numbers) if k_numbers is not None else None
 
     if not structured_dir.exists():
         # Try legacy cache
@@ -40,13 +75,22 @@ def load_structured_cache() -> Dict:
             structured = {}
             for filename, content in data.items():
                 k_number = filename.replace('.pdf', '').upper()
+                if wanted is not None and k_number not in wanted:
+                    continue
                 text = content.get('text', '') if isinstance(content, dict) else str(content)
                 structured[k_number] = {'full_text': text, 'sections': {}}
             return structured
 
     # Load from structured cache
+    if wanted is not None:
+        files = [structured_dir / f'{k_number}.json' for k_number in sorted(wanted)]
+        files = [file_path for file_path in files if file_path.exists()]
+    else:
+        files = structured_dir.glob('*.json')
     structured = {}
-    for file_path in structured_dir.glob('*.json'):
+    for file_path in files:
+        if file_path.name == 'manifest.json':
+            continue
         with open(file_path) as f:
             data = json.load(f)
         structured[data['k_number']] = data
@@ -54,56 +98,184 @@ def load_structured_cache() -> Dict:
     return structured
 
 
+def _load_product_code_map(product_codes: List[str]) -> Dict[str, str]:
+    """Map K-number -> product code by parsing the FDA pmn database files."""
+    product_code_map = {}
+    for pmn_file in _pmn_files():
+        if pmn_file.exists():
+            if _FLAT_FILE_CACHE_AVAILABLE:
+                try:
+                    columns = read_columns(pmn_file, ['KNUMBER', 'PRODUCTCODE'],
+                                           isin={'PRODUCTCODE': product_codes})
+                    product_code_map.update(zip(columns['KNUMBER'], columns['PRODUCTCODE']))
+                    continue
+                except KeyError:
+                    pass  # No FDA header row; parse by column position
+            with open(pmn_file, encoding='latin-1') as f:
+                import csv
+                reader = csv.reader(f, delimiter='|')
+                for row in reader:
+                    if len(row) > 14:
+                        k_num = row[0]
+                        prod_code = row[14]
+                        if prod_code in product_codes:
+                            product_code_map[k_num] = prod_code
+    return product_code_map
+
+
+def _section_confidence(section_name: str) -> int:
+    """Confidence score for a match based on the section it was found in."""
+    if section_name == 'predicate_se':
+        return 40  # SE section
+    elif section_name in ['performance_testing', 'clinical_testing', 'biocompatibility']:
+        return 25  # Testing sections
+    elif section_name == 'device_description':
+        return 20  # Device description
+    return 10  # General
+
+
+def _section_text(doc: Dict, section_name: str) -> Optional[str]:
+    if section_name == 'full_text':
+        return doc.get('full_text', '')
+    doc_sections = doc.get('sections', {})
+    if section_name not in doc_sections:
+        return None
+    return doc_sections[section_name].get('text', '')
+
+
+def _make_result(k_number: str, section_name: str, term: str, text: str, match) -> Dict:
+    # Extract context window (500 chars around match)
+    start = max(0, match.start() - 250)
+    end = min(len(text), match.end() + 250)
+    snippet = text[start:end]
+
+    # Clean up snippet
+    snippet = snippet.replace('\n', ' ').strip()
+    snippet = re.sub(r'\s+', ' ', snippet)
+
+    return {
+        'k_number': k_number,
+        'section': 'general' if section_name == 'full_text' else section_name,
+        'matched_term': term,
+        'matched_text_snippet': snippet,
+        'confidence': _section_confidence(section_name),
+        'context': section_name,
+        'match_position': match.start()
+    }
+
+
+def _compile_patterns(search_terms: List[str]) -> List[re.Pattern]:
+    # Compile search patterns (case-insensitive)
+    return [re.compile(r'\b' + re.escape(term) + r'\b', re.IGNORECASE) for term in search_terms]
+
+
+def _search_indexed(
+    structured_dir: Path,
+    search_terms: List[str],
+    k_number_list: Optional[List[str]],
+    product_codes: Optional[List[str]],
+    sections: Optional[List[str]],
+) -> List[Dict]:
+    """Answer a search from the inverted index.
+
+    Postings give the candidate (document, section, offset) triples; only
+    the matching documents are loaded, to confirm each hit with the same
+    regex the full scan uses and to cut snippets.
+    """
+    index = StructuredTextIndex(structured_dir)
+    try:
+        index.sync()
+
+        k_filter = k_number_list
+        if product_codes and not k_number_list:
+            k_filter = list(index.k_numbers_for_product_codes(product_codes, _pmn_files()))
+
+        # k_number -> term index -> section -> offsets
+        hits = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        for i, term in enumerate(search_terms):
+            for k_number, section_name, offset in index.find(term, k_filter, sections):
+                hits[k_number][i][section_name].append(offset)
+        if not hits:
+            return []
+        doc_paths = {k: path for k, (path, _) in index.documents().items()}
+    finally:
+        index.close()
+
+    patterns = _compile_patterns(search_terms)
+    results = []
+    for k_number in sorted(hits):
+        try:
+            with open(doc_paths[k_number]) as f:
+                doc = json.load(f)
+        except (KeyError, OSError, json.JSONDecodeError):
+            continue
+        sections_to_search = sections if sections else list(doc.get('sections', {}).keys()) + ['full_text']
+        for section_name in sections_to_search:
+            text = _section_text(doc, section_name)
+            if text is None:
+                continue
+            for i, pattern in enumerate(patterns):
+                next_allowed = 0
+                for offset in sorted(hits[k_number][i].get(section_name, ())):
+                    if offset < next_allowed:
+                        continue  # overlaps the previous match, as finditer would skip it
+                    match = pattern.match(text, offset)
+                    if match:
+                        results.append(_make_result(k_number, section_name, search_terms[i], text, match))
+                        next_allowed = match.end()
+
+    # Sort by confidence (highest first)
+    results.sort(key=lambda x: (-x['confidence'], x['k_number']))
+    return results
+
+
 def search_all_sections(
     search_terms: List[str],
     k_number_list: Optional[List[str]] = None,
     product_codes: Optional[List[str]] = None,
-    sections: Optional[List[str]] = None
+    sections: Optional[List[str]] = None,
+    use_index: bool = True
 ) -> List[Dict]:
     """
     Search across ALL sections of 510(k) summaries.
 
+    Uses the inverted index in the structured cache directory when one has
+    been built (see ``build_structured_cache.py``); otherwise scans every
+    cached document.
+
     Args:
         search_terms: Keywords or phrases to search for
         k_number_list: Optional filter to specific K-numbers
         product_codes: Optional filter to specific product codes
         sections: Optional filter to specific sections (default: all)
+        use_index: Set False to force a full scan
 
     Returns:
         List of {k_number, section, matched_text_snippet, confidence, context}
     """
-    structured_cache = load_structured_cache()
+    structured_dir = get_structured_cache_dir()
+    if (use_index and _TEXT_INDEX_AVAILABLE and StructuredTextIndex.exists(structured_dir)
+            and all(re.search(r'\w', term) for term in search_terms)):
+        return _search_indexed(structured_dir, search_terms, k_number_list, product_codes, sections)
+
     results = []
 
     # Load product code mappings if filtering by product code
     product_code_map = {}
     if product_codes:
-        # Try to load from FDA database files
-        pmn_files = [
-            Path.home() / 'fda-510k-data' / 'extraction' / 'pmn96cur.txt',
-            Path.home() / 'fda-510k-data' / 'extraction' / 'pmn9195.txt',
-        ]
-        for pmn_file in pmn_files:
-            if pmn_file.exists():
-                with open(pmn_file, encoding='latin-1') as f:
-                    import csv
-                    reader = csv.reader(f, delimiter='|')
-                    for row in reader:
-                        if len(row) > 14:
-                            k_num = row[0]
-                            prod_code = row[14]
-                            if prod_code in product_codes:
-                                product_code_map[k_num] = prod_code
-
-    # Filter K-numbers if needed
+        product_code_map = _load_product_code_map(product_codes)
+
+    # Filter K-numbers if needed, and load only those documents
     k_numbers_to_search = k_number_list
     if product_codes and not k_number_list:
         k_numbers_to_search = list(product_code_map.keys())
     elif not k_numbers_to_search:
+        k_numbers_to_search = None
+    structured_cache = load_structured_cache(k_numbers_to_search)
+    if k_numbers_to_search is None:
         k_numbers_to_search = list(structured_cache.keys())
 
-    # Compile search patterns (case-insensitive)
-    patterns = [re.compile(r'\b' + re.escape(term) + r'\b', re.IGNORECASE) for term in search_terms]
+    patterns = _compile_patterns(search_terms)
 
     # Search each document
     for k_number in k_numbers_to_search:
@@ -112,53 +284,18 @@ def search_all_sections(
 
         doc = structured_cache[k_number]
 
-        # Search in sections
-        doc_sections = doc.get('sections', {})
-
         # Section-aware search
-        sections_to_search = sections if sections else list(doc_sections.keys()) + ['full_text']
+        sections_to_search = sections if sections else list(doc.get('sections', {}).keys()) + ['full_text']
 
         for section_name in sections_to_search:
-            if section_name == 'full_text':
-                text = doc.get('full_text', '')
-                section_context = 'general'
-            else:
-                if section_name not in doc_sections:
-                    continue
-                text = doc_sections[section_name].get('text', '')
-                section_context = section_name
+            text = _section_text(doc, section_name)
+            if text is None:
+                continue
 
             # Search for each term
             for i, pattern in enumerate(patterns):
                 for match in pattern.finditer(text):
-                    # Extract context window (500 chars around match)
-                    start = max(0, match.start() - 250)
-                    end = min(len(text), match.end() + 250)
-                    snippet = text[start:end]
-
-                    # Clean up snippet
-                    snippet = snippet.replace('\n', ' ').strip()
-                    snippet = re.sub(r'\s+', ' ', snippet)
-
-                    # Confidence scoring based on section
-                    if section_name == 'predicate_se':
-                        confidence = 40  # SE section
-                    elif section_name in ['performance_testing', 'clinical_testing', 'biocompatibility']:
-                        confidence = 25  # Testing sections
-                    elif section_name == 'device_description':
-                        confidence = 20  # Device description
-                    else:
-                        confidence = 10  # General
-
-                    results.append({
-                        'k_number': k_number,
-                        'section': section_context,
-                        'matched_term': search_terms[i],
-                        'matched_text_snippet': snippet,
-                        'confidence': confidence,
-                        'context': section_name,
-                        'match_position': match.start()
-                    })
+                    results.append(_make_result(k_number, section_name, search_terms[i], text, match))
 
     # Sort by confidence (highest first)
     results.sort(key=lambda x: (-x['confidence'], x['k_number']))
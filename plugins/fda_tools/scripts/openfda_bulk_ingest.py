@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+openFDA Bulk Download Ingestion -- full refreshes from published dataset dumps.
+
+openFDA publishes complete device datasets as zipped JSON partitions listed in
+its ``download.json`` manifest. Loading those is a bulk copy instead of a
+multi-day REST crawl through the rate limiter.
+
+Pipeline:
+    1. Read the manifest and select the partitions for each endpoint
+    2. Download partitions in parallel; interrupted downloads resume from the
+       ``.part`` file with an HTTP Range request
+    3. Stream-parse each zip member's ``results`` array one record at a time
+       (the decompressed JSON is never held in memory)
+    4. Write records to a sink: PostgreSQL tables (``PostgreSQLDatabase``) or
+       the FDAClient response cache
+
+Completed partitions are recorded in ``ingest_state.json`` in the download
+directory, so a rerun skips them.
+
+Usage:
+    python3 openfda_bulk_ingest.py --endpoints 510k classification --sink cache
+    python3 openfda_bulk_ingest.py --endpoints 510k pma --sink postgres --workers 4
+    python3 openfda_bulk_ingest.py --list
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import ssl
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DOWNLOAD_MANIFEST_URL = "https://api.fda.gov/download.json"
+DEFAULT_DOWNLOAD_DIR = Path.home() / "fda-510k-data" / "bulk_downloads"
+DEFAULT_WORKERS = 4
+CHUNK_SIZE = 1024 * 1024  # 1 MB download chunks
+PARSE_CHUNK_SIZE = 64 * 1024  # characters read per parser refill
+STATE_FILE = "ingest_state.json"
+USER_AGENT = "FDA-Plugin-BulkIngest/1.0"
+
+# Repository endpoint name -> openFDA device dataset name in download.json
+DATASETS = {
+    "510k": "510k",
+    "classification": "classification",
+    "maude": "event",
+    "recalls": "recall",
+    "pma": "pma",
+    "udi": "udi",
+    "enforcement": "enforcement",
+}
+
+# Record ID field per endpoint (matches PostgreSQLDatabase.PRIMARY_KEYS)
+ENDPOINT_ID_FIELDS = {
+    "510k": "k_number",
+    "classification": "product_code",
+    "maude": "event_key",
+    "recalls": "recall_number",
+    "pma": "pma_number",
+    "udi": "di",
+    "enforcement": "recall_number",
+}
+
+
+# ------------------------------------------------------------------
+# Manifest
+# ------------------------------------------------------------------
+
+
+def _urlopen(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 60):
+    # FDA-107: certificate verification enabled
+    ssl_context = ssl.create_default_context()
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, **(headers or {})})
+    return urllib.request.urlopen(req, timeout=timeout, context=ssl_context)
+
+
+def fetch_manifest(url: str = DOWNLOAD_MANIFEST_URL) -> Dict:
+    """Fetch and parse the openFDA ``download.json`` manifest."""
+    with _urlopen(url) as resp:
+        return json.loads(resp.read())
+
+
+def get_partitions(manifest: Dict, endpoint: str) -> List[Dict]:
+    """Return the partition entries for an endpoint from the manifest.
+
+    Each entry has at least ``file`` (URL); openFDA also provides
+    ``display_name``, ``records`` and ``size_mb``.
+    """
+    if endpoint not in DATASETS:
+        raise ValueError(f"Unknown endpoint: {endpoint}")
+    device = manifest.get("results", {}).get("device", {})
+    dataset = device.get(DATASETS[endpoint])
+    if not dataset:
+        raise ValueError(f"Manifest has no device/{DATASETS[endpoint]} dataset")
+    return list(dataset.get("partitions", []))
+
+
+# ------------------------------------------------------------------
+# Download with resume
+# ------------------------------------------------------------------
+
+
+def download_partition(url: str, dest: Path, chunk_size: int = CHUNK_SIZE) -> Path:
+    """Download ``url`` to ``dest``, resuming a previous partial download.
+
+    Data is streamed to ``dest.part``; a rerun requests the remaining bytes
+    with ``Range: bytes=<size>-``. If the server ignores the range (200), the
+    download restarts. The file is renamed to ``dest`` only when complete.
+
+    Returns:
+        ``dest``
+    """
+    if dest.exists():
+        return dest
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part = dest.with_name(dest.name + ".part")
+    offset = part.stat().st_size if part.exists() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+    try:
+        resp = _urlopen(url, headers=headers)
+    except urllib.error.HTTPError as e:
+        if e.code != 416:  # 416: .part already holds the whole file
+            raise
+        os.replace(part, dest)
+        return dest
+
+    with resp:
+        status = getattr(resp, "status", None) or resp.getcode()
+        mode = "ab" if offset and status == 206 else "wb"
+        if offset and mode == "wb":
+            logger.info("Server ignored Range for %s; restarting download", url)
+        with open(part, mode) as f:
+            while True:
+                chunk = resp.read(chunk_size)
+                if not chunk:
+                    break
+                f.write(chunk)
+    os.replace(part, dest)
+    return dest
+
+
+# ------------------------------------------------------------------
+# Streaming JSON parsing
+# ------------------------------------------------------------------
+
+
+class _StreamReader:
+    """Incremental JSON tokenizer over a text stream.
+
+    Keeps a sliding buffer and decodes one value at a time with
+    ``json.JSONDecoder.raw_decode``, refilling when a value is cut off.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = PARSE_CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop consumed text so memory stays bounded by one record + chunk
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ('' at end of input)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+def iter_json_array(stream: TextIO, key: str = "results",
+                    chunk_size: int = PARSE_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the items of the top-level ``key`` array of a JSON object stream.
+
+    Other top-level members (e.g. ``meta``, which has its own nested
+    ``results``) are decoded and discarded.
+    """
+    reader = _StreamReader(stream, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key:
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.peek() == ",":
+                        reader.expect(",")
+                        continue
+                    reader.expect("]")
+                    break
+        else:
+            reader.value()
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("}")
+        return
+
+
+def iter_zip_records(zip_path: Path, chunk_size: int = PARSE_CHUNK_SIZE) -> Iterator[Dict]:
+    """Stream records from every JSON member of an openFDA partition zip."""
+    with zipfile.ZipFile(zip_path) as zf:
+        for member in zf.namelist():
+            if not member.endswith(".json"):
+                continue
+            with zf.open(member) as raw:
+                text = io.TextIOWrapper(raw, encoding="utf-8")
+                yield from iter_json_array(text, "results", chunk_size)
+
+
+# ------------------------------------------------------------------
+# Sinks
+# ------------------------------------------------------------------
+
+
+class PostgresSink:
+    """Write records into the ``PostgreSQLDatabase`` endpoint tables."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def write(self, endpoint: str, records: List[Dict]) -> int:
+        id_field = ENDPOINT_ID_FIELDS[endpoint]
+        return self.db.upsert_many(
+            endpoint, ((record.get(id_field), record) for record in records)
+        )
+
+
+class CacheSink:
+    """Write records into the FDAClient response cache.
+
+    Each record is stored under the cache key of its single-record lookup
+    (e.g. ``FDAClient.get_510k``), so later lookups are cache hits.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    def write(self, endpoint: str, records: List[Dict]) -> int:
+        lookup_params = getattr(self.client, "_lookup_params", None)
+        if lookup_params is None or endpoint not in ("510k", "classification"):
+            raise ValueError(f"Cache sink does not support endpoint: {endpoint}")
+        id_field = ENDPOINT_ID_FIELDS[endpoint]
+        written = 0
+        for record in records:
+            record_id = record.get(id_field)
+            if not record_id:
+                continue
+            key = self.client._cache_key(endpoint, lookup_params(endpoint, record_id))
+            self.client._set_cached(key, {
+                "meta": {"results": {"skip": 0, "limit": 1, "total": 1}},
+                "results": [record],
+            })
+            written += 1
+        return written
+
+
+# ------------------------------------------------------------------
+# Pipeline
+# ------------------------------------------------------------------
+
+
+class BulkIngestor:
+    """Download openFDA dataset partitions and load them into a sink.
+
+    Args:
+        sink: Object with ``write(endpoint, records) -> int``.
+        download_dir: Where partition zips and ingest state are kept.
+        manifest_url: URL of ``download.json``.
+        workers: Parallel partition downloads.
+        batch_size: Records passed to the sink per write call.
+        keep_files: Keep partition zips after ingestion.
+    """
+
+    def __init__(
+        self,
+        sink,
+        download_dir: Optional[Path] = None,
+        manifest_url: str = DOWNLOAD_MANIFEST_URL,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = 500,
+        keep_files: bool = False,
+    ):
+        self.sink = sink
+        self.download_dir = Path(download_dir or DEFAULT_DOWNLOAD_DIR)
+        self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_url = manifest_url
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.keep_files = keep_files
+        self._state_path = self.download_dir / STATE_FILE
+        self._state_lock = threading.Lock()
+        self._state = self._load_state()
+
+    def _load_state(self) -> Dict:
+        try:
+            with open(self._state_path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {"completed": {}}
+
+    def _mark_completed(self, url: str, records: int):
+        with self._state_lock:
+            self._state["completed"][url] = {"records": records, "completed_at": time.time()}
+            tmp = self._state_path.with_name(STATE_FILE + ".tmp")
+            with open(tmp, "w") as f:
+                json.dump(self._state, f, indent=2)
+            os.replace(tmp, self._state_path)
+
+    def _local_path(self, endpoint: str, url: str) -> Path:
+        # Mirror the whole URL path: partitions in different quarter
+        # directories (device/event/2023q1/, 2023q2/, ...) share basenames
+        parts = [p for p in urllib.parse.urlsplit(url).path.split("/") if p not in ("", ".", "..")]
+        return self.download_dir.joinpath(DATASETS[endpoint], *parts)
+
+    def ingest_partition(self, endpoint: str, zip_path: Path) -> int:
+        """Stream one downloaded partition into the sink. Returns records written."""
+        written = 0
+        batch: List[Dict] = []
+        for record in iter_zip_records(zip_path):
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                written += self.sink.write(endpoint, batch)
+                batch = []
+        if batch:
+            written += self.sink.write(endpoint, batch)
+        return written
+
+    def run(self, endpoints: List[str], manifest: Optional[Dict] = None) -> Dict[str, Dict]:
+        """Download and ingest all partitions of ``endpoints``.
+
+        Downloads run in a thread pool; each partition is ingested on the
+        calling thread as soon as its download finishes, so the sink is only
+        used from one thread.
+
+        Returns:
+            Per-endpoint summary: partitions, skipped, records, errors.
+        """
+        manifest = manifest or fetch_manifest(self.manifest_url)
+        summary = {ep: {"partitions": 0, "skipped": 0, "records": 0, "errors": []}
+                   for ep in endpoints}
+
+        jobs = []
+        for endpoint in endpoints:
+            for partition in get_partitions(manifest, endpoint):
+                url = partition["file"]
+                summary[endpoint]["partitions"] += 1
+                if url in self._state["completed"]:
+                    summary[endpoint]["skipped"] += 1
+                    continue
+                jobs.append((endpoint, url))
+
+        logger.info("Bulk ingest: %d partitions to load (%d workers)", len(jobs), self.workers)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(download_partition, url, self._local_path(endpoint, url)):
+                (endpoint, url)
+                for endpoint, url in jobs
+            }
+            for future in as_completed(futures):
+                endpoint, url = futures[future]
+                try:
+                    zip_path = future.result()
+                    count = self.ingest_partition(endpoint, zip_path)
+                except Exception as e:
+                    logger.error("Partition %s failed: %s", url, e)
+                    summary[endpoint]["errors"].append(f"{url}: {e}")
+                    continue
+                self._mark_completed(url, count)
+                summary[endpoint]["records"] += count
+                logger.info("Loaded %d %s records from %s", count, endpoint, url)
+                if not self.keep_files:
+                    zip_path.unlink(missing_ok=True)
+        return summary
+
+
+def _build_sink(kind: str, args):
+    if kind == "postgres":
+        from fda_tools.lib.postgres_database import PostgreSQLDatabase
+        return PostgresSink(PostgreSQLDatabase(host=args.postgres_host, port=args.postgres_port))
+    from fda_tools.scripts.fda_api_client import FDAClient
+    return CacheSink(FDAClient(cache_dir=args.cache_dir))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-load openFDA device dataset downloads")
+    parser.add_argument("--endpoints", nargs="+", default=["510k"], choices=sorted(DATASETS),
+                        help="Endpoints to load")
+    parser.add_argument("--sink", choices=["postgres", "cache"], default="postgres",
+                        help="Destination: PostgreSQL tables or the API response cache")
+    parser.add_argument("--download-dir", type=Path, default=DEFAULT_DOWNLOAD_DIR)
+    parser.add_argument("--manifest-url", default=DOWNLOAD_MANIFEST_URL)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Parallel partition downloads")
+    parser.add_argument("--keep-files", action="store_true", help="Keep zips after loading")
+    parser.add_argument("--cache-dir", default=None, help="API cache dir (cache sink)")
+    parser.add_argument("--postgres-host", default="localhost")
+    parser.add_argument("--postgres-port", type=int, default=6432)
+    parser.add_argument("--list", action="store_true", help="List partitions and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    manifest = fetch_manifest(args.manifest_url)
+
+    if args.list:
+        for endpoint in args.endpoints:
+            partitions = get_partitions(manifest, endpoint)
+            total = sum(int(p.get("records") or 0) for p in partitions)
+            print(f"{endpoint}: {len(partitions)} partitions, {total:,} records")
+            for p in partitions:
+                print(f"  {p.get('display_name', '')}  {p.get('size_mb', '?')} MB  {p['file']}")
+        return 0
+
+    ingestor = BulkIngestor(
+        _build_sink(args.sink, args),
+        download_dir=args.download_dir,
+        manifest_url=args.manifest_url,
+        workers=args.workers,
+        keep_files=args.keep_files,
+    )
+    summary = ingestor.run(args.endpoints, manifest=manifest)
+    print(json.dumps(summary, indent=2))
+    return 1 if any(s["errors"] for s in summary.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,9 +9,17 @@ sections. Follows the same patterns as fda_data_store.py for 510(k) data.
 Cache files use SHA-256 integrity envelopes (GAP-011 / FDA-71) to detect
 corruption or tampering. All writes are atomic (temp + replace).
 
+The manifest is a JSON snapshot plus an append-only journal. Each manifest
+change appends one line to the journal under an exclusive ``flock``, after
+first replaying lines appended by other writers, so per-PMA updates cost
+O(1) disk writes and concurrent processes do not lose each other's updates.
+The journal is folded back into the snapshot (compacted) once it holds more
+records than the manifest has PMA entries, or on an explicit save_manifest().
+
 Directory layout:
     ~/fda-510k-data/pma_cache/
         data_manifest.json
+        data_manifest.journal      # Manifest changes since the last compaction
         P170019/
             pma_data.json          # API data from openFDA
             ssed.pdf               # Downloaded SSED PDF
@@ -36,15 +44,18 @@ Usage:
 """
 
 import argparse
+import fcntl
 import json
 import logging
 import os
 import re
 import sys
 import tempfile
+import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import IO, Dict, Iterator, List, Optional
 
 # Import FDAClient from sibling module
 from fda_api_client import FDAClient
@@ -91,6 +102,14 @@ PMA_TTL_TIERS = {
 }
 
 
+MANIFEST_FILE = "data_manifest.json"
+JOURNAL_FILE = "data_manifest.journal"
+
+# Compact once the journal holds more records than this and than the
+# manifest has PMA entries, keeping compaction cost amortized O(1) per update
+JOURNAL_COMPACT_MIN_RECORDS = 256
+
+
 def _get_pma_cache_dir() -> str:
     """Determine the PMA cache directory from settings or default."""
     settings_path = os.path.expanduser("~/.claude/fda-tools.local.md")
@@ -124,6 +143,11 @@ class PMADataStore:
         self.client = client or FDAClient()
         self._manifest: Optional[Dict] = None
         self._integrity_events: List[Dict] = []
+        # Journal generation folded into the loaded snapshot, and how much of
+        # the journal has been applied to the in-memory manifest
+        self._journal_generation: Optional[str] = None
+        self._journal_offset = 0
+        self._journal_records = 0
 
     def _audit_logger(self, event: Dict) -> None:
         """Audit callback for cache integrity events."""
@@ -149,7 +173,15 @@ class PMADataStore:
         if self._manifest is not None:
             return self._manifest
 
-        manifest_path = self.cache_dir / "data_manifest.json"
+        with self._journal_lock(fcntl.LOCK_SH) as journal:
+            return self._load_manifest(journal)
+
+    def _load_manifest(self, journal: IO[bytes]) -> Dict:
+        """Read the snapshot and replay the journal. Caller holds the journal lock."""
+        self._manifest = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        manifest_path = self.cache_dir / MANIFEST_FILE
         if manifest_path.exists():
             try:
                 with open(manifest_path) as f:
@@ -171,36 +203,114 @@ class PMADataStore:
                             )
                     except Exception as e:
                         _logger.debug("PMA manifest validation skipped: %s", e)
-
-                assert self._manifest is not None  # Type narrowing for Pyright
-                return self._manifest
             except (json.JSONDecodeError, OSError):
                 _logger.warning(
                     "PMA manifest corrupt or unreadable, creating new: %s",
                     manifest_path,
                 )
-                pass  # Fall through to create new manifest
-
-        schema_ver = CURRENT_SCHEMA_VERSION if _MANIFEST_VALIDATOR_AVAILABLE else "1.0.0"
-        self._manifest = {
-            "schema_version": schema_ver,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "last_updated": datetime.now(timezone.utc).isoformat(),
-            "total_pmas": 0,
-            "total_sseds_downloaded": 0,
-            "total_sections_extracted": 0,
-            "pma_entries": {},
-            "search_cache": {},
-        }
+                self._manifest = None  # Fall through to create new manifest
+
+        if self._manifest is None:
+            schema_ver = CURRENT_SCHEMA_VERSION if _MANIFEST_VALIDATOR_AVAILABLE else "1.0.0"
+            self._manifest = {
+                "schema_version": schema_ver,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "last_updated": datetime.now(timezone.utc).isoformat(),
+                "total_pmas": 0,
+                "total_sseds_downloaded": 0,
+                "total_sections_extracted": 0,
+                "pma_entries": {},
+                "search_cache": {},
+            }
+        self._manifest.setdefault("pma_entries", {})
+        self._manifest.setdefault("search_cache", {})
+
+        self._recount_totals()
+
+        # A journal from another generation was already folded into this
+        # snapshot (compaction stopped before resetting the journal)
+        self._journal_generation = self._manifest.get("journal_generation")
+        if self._journal_generation and self._journal_header(journal) == self._journal_generation:
+            self._replay_journal(journal)
         return self._manifest
 
-    def save_manifest(self) -> None:
-        """Save the manifest to disk with atomic write."""
-        manifest = self.get_manifest()
-        manifest["last_updated"] = datetime.now(timezone.utc).isoformat()
+    @contextmanager
+    def _journal_lock(self, operation: int = fcntl.LOCK_EX) -> Iterator[IO[bytes]]:
+        """Open the manifest journal and hold an flock on it."""
+        with open(self.cache_dir / JOURNAL_FILE, "a+b") as journal:
+            fcntl.flock(journal.fileno(), operation)
+            try:
+                yield journal
+            finally:
+                fcntl.flock(journal.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _journal_header(journal: IO[bytes]) -> Optional[str]:
+        """Return the generation recorded on the journal's first line."""
+        journal.seek(0)
+        line = journal.readline()
+        try:
+            return json.loads(line).get("generation") if line.endswith(b"\n") else None
+        except (ValueError, AttributeError):
+            return None
 
-        # Count totals
-        entries = manifest.get("pma_entries", {})
+    def _replay_journal(self, journal: IO[bytes]) -> None:
+        """Apply journal records written since this store last read it."""
+        if self._journal_offset == 0:
+            journal.seek(0)
+            journal.readline()  # Header
+        else:
+            journal.seek(self._journal_offset)
+        while True:
+            line = journal.readline()
+            if not line.endswith(b"\n"):
+                break  # EOF, or a record torn by a crashed writer
+            try:
+                self._apply_journal_record(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                _logger.warning("Skipping unreadable PMA manifest journal record")
+            self._journal_records += 1
+        self._journal_offset = journal.tell() - len(line)
+
+    def _apply_journal_record(self, record: Dict) -> None:
+        """Apply one journal record to the in-memory manifest, keeping totals current."""
+        manifest = self._manifest
+        assert manifest is not None
+        op = record["op"]
+        if op == "entry":
+            entries = manifest["pma_entries"]
+            entry = entries.get(record["pma"])
+            if entry is None:
+                entry = entries[record["pma"]] = {}
+            else:
+                self._count_entry(entry, -1)
+            entry.clear()
+            entry.update(record["entry"])
+            self._count_entry(entry, 1)
+        elif op == "remove":
+            removed = manifest["pma_entries"].pop(record["pma"], None)
+            if removed is not None:
+                self._count_entry(removed, -1)
+        elif op == "search":
+            if record["value"] is None:
+                manifest["search_cache"].pop(record["key"], None)
+            else:
+                manifest["search_cache"][record["key"]] = record["value"]
+        manifest["last_updated"] = record["at"]
+
+    def _count_entry(self, entry: Dict, sign: int) -> None:
+        manifest = self._manifest
+        assert manifest is not None
+        manifest["total_pmas"] += sign
+        if entry.get("ssed_downloaded"):
+            manifest["total_sseds_downloaded"] += sign
+        if entry.get("sections_extracted"):
+            manifest["total_sections_extracted"] += sign
+
+    def _recount_totals(self) -> None:
+        manifest = self._manifest
+        assert manifest is not None
+        entries = manifest["pma_entries"]
         manifest["total_pmas"] = len(entries)
         manifest["total_sseds_downloaded"] = sum(
             1 for e in entries.values() if e.get("ssed_downloaded")
@@ -209,7 +319,56 @@ class PMADataStore:
             1 for e in entries.values() if e.get("sections_extracted")
         )
 
-        manifest_path = self.cache_dir / "data_manifest.json"
+    @contextmanager
+    def _journal_transaction(self) -> Iterator[IO[bytes]]:
+        """Lock the journal with the in-memory manifest brought up to date.
+
+        Changes made inside the transaction are read-modify-write safe
+        against other processes sharing the cache directory.
+        """
+        self.get_manifest()
+        with self._journal_lock() as journal:
+            header = self._journal_header(journal)
+            if header and header != self._journal_generation:
+                # Another writer compacted (or started the journal) since we loaded
+                self._load_manifest(journal)
+            elif header:
+                self._replay_journal(journal)
+            if header and header == self._journal_generation:
+                # Drop a record torn by a crashed writer before appending
+                journal.truncate(self._journal_offset)
+            else:
+                self._compact(journal)
+            yield journal
+            assert self._manifest is not None
+            if self._journal_records > max(JOURNAL_COMPACT_MIN_RECORDS,
+                                           len(self._manifest["pma_entries"])):
+                self._compact(journal)
+
+    def _append_journal(self, journal: IO[bytes], record: Dict) -> None:
+        """Append a record inside a _journal_transaction() and apply it."""
+        record["at"] = datetime.now(timezone.utc).isoformat()
+        journal.write(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+        journal.flush()
+        self._journal_offset = journal.tell()
+        self._journal_records += 1
+        self._apply_journal_record(record)
+
+    def _compact(self, journal: IO[bytes]) -> None:
+        """Write the in-memory manifest as a new snapshot and reset the journal.
+
+        The snapshot is replaced before the journal is truncated; a crash in
+        between leaves a journal whose generation no longer matches the
+        snapshot, which _load_manifest() then ignores.
+        """
+        manifest = self._manifest
+        assert manifest is not None
+        manifest["last_updated"] = datetime.now(timezone.utc).isoformat()
+        self._recount_totals()
+        generation = uuid.uuid4().hex
+        manifest["journal_generation"] = generation
+
+        manifest_path = self.cache_dir / MANIFEST_FILE
         tmp_path = manifest_path.with_suffix(".json.tmp")
         try:
             with open(tmp_path, "w") as f:
@@ -218,26 +377,49 @@ class PMADataStore:
         except OSError:
             if tmp_path.exists():
                 tmp_path.unlink(missing_ok=True)
+            manifest["journal_generation"] = self._journal_generation
             raise
 
+        journal.truncate(0)
+        journal.write(json.dumps({"generation": generation}).encode() + b"\n")
+        journal.flush()
+        self._journal_generation = generation
+        self._journal_offset = journal.tell()
+        self._journal_records = 0
+
+    def save_manifest(self) -> None:
+        """Save the manifest to disk with atomic write.
+
+        Folds the journal into a fresh snapshot. Manifest changes made through
+        this class are already durable without calling this; it is needed
+        only after editing the dict returned by get_manifest() directly.
+        """
+        self.get_manifest()
+        with self._journal_lock() as journal:
+            if self._journal_generation and self._journal_header(journal) == self._journal_generation:
+                self._replay_journal(journal)
+            self._compact(journal)
+
     def update_manifest_entry(self, pma_number: str, updates: Dict) -> None:
         """Update a specific PMA entry in the manifest.
 
+        The change is journaled immediately (one appended line).
+
         Args:
             pma_number: PMA number (e.g., 'P170019')
             updates: Dictionary of fields to update/merge.
         """
-        manifest = self.get_manifest()
         pma_key = pma_number.upper()
 
-        if pma_key not in manifest["pma_entries"]:
-            manifest["pma_entries"][pma_key] = {
+        with self._journal_transaction() as journal:
+            assert self._manifest is not None
+            entry = dict(self._manifest["pma_entries"].get(pma_key) or {
                 "pma_number": pma_key,
                 "first_cached_at": datetime.now(timezone.utc).isoformat(),
-            }
-
-        manifest["pma_entries"][pma_key].update(updates)
-        manifest["pma_entries"][pma_key]["last_updated"] = datetime.now(timezone.utc).isoformat()
+            })
+            entry.update(updates)
+            entry["last_updated"] = datetime.now(timezone.utc).isoformat()
+            self._append_journal(journal, {"op": "entry", "pma": pma_key, "entry": entry})
 
     # ------------------------------------------------------------------
     # TTL expiration
@@ -358,7 +540,6 @@ class PMADataStore:
             "decision_date": pma_data.get("decision_date", ""),
             "advisory_committee": pma_data.get("advisory_committee", ""),
         })
-        self.save_manifest()
 
         return pma_data
 
@@ -543,7 +724,6 @@ class PMADataStore:
             "pma_supplements_fetched_at": datetime.now(timezone.utc).isoformat(),
             "supplement_count": len(supplements),
         })
-        self.save_manifest()
 
         return supplements
 
@@ -568,7 +748,6 @@ class PMADataStore:
             "ssed_url": url,
             "ssed_downloaded_at": datetime.now(timezone.utc).isoformat(),
         })
-        self.save_manifest()
 
     def mark_sections_extracted(self, pma_number: str, section_count: int,
                                 word_count: int) -> None:
@@ -585,7 +764,6 @@ class PMADataStore:
             "total_word_count": word_count,
             "sections_extracted_at": datetime.now(timezone.utc).isoformat(),
         })
-        self.save_manifest()
 
     # ------------------------------------------------------------------
     # Extracted sections
@@ -642,13 +820,12 @@ class PMADataStore:
             search_key: Canonical search key (e.g., 'product_code:NMH:year:2024')
             results: List of PMA result dicts.
         """
-        manifest = self.get_manifest()
-        manifest["search_cache"][search_key] = {
-            "results": results,
-            "fetched_at": datetime.now(timezone.utc).isoformat(),
-            "result_count": len(results),
-        }
-        self.save_manifest()
+        with self._journal_transaction() as journal:
+            self._append_journal(journal, {"op": "search", "key": search_key, "value": {
+                "results": results,
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
+                "result_count": len(results),
+            }})
 
     def get_cached_search(self, search_key: str) -> Optional[List[Dict]]:
         """Get cached search results if not expired.
@@ -765,12 +942,12 @@ class PMADataStore:
             shutil.rmtree(pma_dir)
 
         # Remove from manifest
-        manifest = self.get_manifest()
-        removed = manifest.get("pma_entries", {}).pop(pma_key, None)
-        if removed:
-            self.save_manifest()
-            return True
-        return False
+        with self._journal_transaction() as journal:
+            assert self._manifest is not None
+            if pma_key not in self._manifest["pma_entries"]:
+                return False
+            self._append_journal(journal, {"op": "remove", "pma": pma_key})
+        return True
 
     def clear_all(self) -> int:
         """Remove all cached PMA data and reset manifest.
@@ -790,10 +967,12 @@ class PMADataStore:
                 shutil.rmtree(pma_dir)
 
         # Reset manifest
+        with self._journal_lock() as journal:
+            manifest_path = self.cache_dir / MANIFEST_FILE
+            if manifest_path.exists():
+                manifest_path.unlink()
+            journal.truncate(0)
         self._manifest = None
-        manifest_path = self.cache_dir / "data_manifest.json"
-        if manifest_path.exists():
-            manifest_path.unlink()
 
         return count
 
@@ -820,11 +999,10 @@ class PMADataStore:
             except (ValueError, TypeError):
                 to_remove.append(key)
 
-        for key in to_remove:
-            del manifest["search_cache"][key]
-
         if to_remove:
-            self.save_manifest()
+            with self._journal_transaction() as journal:
+                for key in to_remove:
+                    self._append_journal(journal, {"op": "search", "key": key, "value": None})
 
         return len(to_remove)
 
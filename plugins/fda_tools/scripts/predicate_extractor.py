@@ -24,6 +24,7 @@ import json
 import time
 import argparse
 import logging
+import tempfile
 from datetime import datetime, timedelta
 from tqdm import tqdm
 from multiprocessing import Pool
@@ -33,15 +34,17 @@ import pdfplumber
 # Import helpers for safe optional imports (FDA-17 / GAP-015)
 lib_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lib')
 from import_helpers import safe_import_from  # type: ignore
+from citation_index import CitationIndex  # type: ignore
+from text_corpus import MappedCorpus, write_corpus  # type: ignore
+from flat_file_cache import arrow_available, read_columns  # type: ignore
 
 logger = logging.getLogger(__name__)
 
 # Multiprocessing shared state (initialized per worker)
 CSV_DATA = {}
-PDF_FILES = []
-PDF_DATA = {}
 KNOWN_KNUMBERS = set()
 KNOWN_PMA_NUMBERS = set()
+PDF_CORPUS = None  # MappedCorpus of already-extracted PDF text
 
 # Shared HTTP utilities
 try:
@@ -104,6 +107,20 @@ def enrich_knumbers(knumbers, batch_size=100):
     return enrichment
 
 
+def _read_flat_file_columns(filename, columns):
+    """Read columns from the Arrow cache of an FDA flat file (lib/flat_file_cache.py).
+
+    Returns None when pyarrow is unavailable or the file has no FDA header
+    row, in which case the caller parses the text file itself.
+    """
+    if not arrow_available():
+        return None
+    try:
+        return read_columns(filename, columns)
+    except KeyError:
+        return None
+
+
 def download_and_parse_csv(urls, pma_url, data_dir=None):
     csv_data = {}
     knumbers = set()
@@ -198,13 +215,19 @@ def download_and_parse_csv(urls, pma_url, data_dir=None):
                     continue
 
             if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8-sig', errors='replace') as file:
-                    reader = csv.reader(file, delimiter='|')
-                    for row in reader:
-                        if len(row) > 0:
-                            knumbers.add(row[0])
-                            if len(row) > 14:
-                                csv_data[row[0]] = row[14]
+                columns = _read_flat_file_columns(filename, ['KNUMBER', 'PRODUCTCODE'])
+                if columns is not None:
+                    knumbers.update(columns['KNUMBER'])
+                    csv_data.update((k, code) for k, code in zip(columns['KNUMBER'], columns['PRODUCTCODE'])
+                                    if code is not None)
+                else:
+                    with open(filename, 'r', encoding='utf-8-sig', errors='replace') as file:
+                        reader = csv.reader(file, delimiter='|')
+                        for row in reader:
+                            if len(row) > 0:
+                                knumbers.add(row[0])
+                                if len(row) > 14:
+                                    csv_data[row[0]] = row[14]
             else:
                 print(f"Warning: Could not download or find file {filename}")
 
@@ -237,11 +260,15 @@ def download_and_parse_csv(urls, pma_url, data_dir=None):
                 print(f"Unexpected error processing {pma_url}: {e}")
 
         if os.path.exists(pma_filename):
-            with open(pma_filename, 'r', encoding='utf-8-sig', errors='replace') as file:
-                reader = csv.reader(file, delimiter='|')
-                for row in reader:
-                    if len(row) > 0:
-                        pma_numbers.add(row[0])
+            columns = _read_flat_file_columns(pma_filename, ['PMANUMBER'])
+            if columns is not None:
+                pma_numbers.update(columns['PMANUMBER'])
+            else:
+                with open(pma_filename, 'r', encoding='utf-8-sig', errors='replace') as file:
+                    reader = csv.reader(file, delimiter='|')
+                    for row in reader:
+                        if len(row) > 0:
+                            pma_numbers.add(row[0])
         else:
             print(f"Warning: Could not download or find file {pma_filename}")
 
@@ -521,19 +548,21 @@ def parse_text(text, filename, csv_data, known_knumbers, known_pma_numbers, sect
     return data, supplement_matches
 
 
-def _init_pool(csv_data, pdf_files, pdf_data, known_knumbers, known_pma_numbers):
-    global CSV_DATA, PDF_FILES, PDF_DATA, KNOWN_KNUMBERS, KNOWN_PMA_NUMBERS
+def _init_pool(csv_data, known_knumbers, known_pma_numbers, corpus_path=None):
+    global CSV_DATA, KNOWN_KNUMBERS, KNOWN_PMA_NUMBERS, PDF_CORPUS
     CSV_DATA = csv_data
-    PDF_FILES = pdf_files
-    PDF_DATA = pdf_data
     KNOWN_KNUMBERS = known_knumbers
     KNOWN_PMA_NUMBERS = known_pma_numbers
+    # Attach to the shared corpus read-only (zero-copy via the page cache)
+    PDF_CORPUS = MappedCorpus(corpus_path) if corpus_path else None
 
 
 def safe_process_file(args):
     file_path, section_aware = args
     filename = os.path.basename(file_path)
-    text = extract_text_from_pdf(file_path)
+    text = PDF_CORPUS.get(file_path) if PDF_CORPUS is not None else None
+    if text is None:
+        text = extract_text_from_pdf(file_path)
     data, supplement_matches = parse_text(
         text,
         filename,
@@ -542,10 +571,6 @@ def safe_process_file(args):
         KNOWN_PMA_NUMBERS,
         section_aware=section_aware,
     )
-    unique_matches = []
-    for pdf_file in PDF_FILES:
-        if search_knumber_in_pdf(filename[:-4], pdf_file, PDF_DATA):
-            unique_matches.append(os.path.basename(pdf_file)[:-4])
     predicates = [identifier for identifier, type, product_code in data if type == 'Predicate']
     reference_devices = [
         identifier for identifier, type, product_code in data
@@ -561,24 +586,64 @@ def search_knumber_in_pdf(knumber, pdf_file, pdf_data):
     return False
 
 
-def process_batches(pdf_files, batch_size, csv_data, pdf_data, known_knumbers, known_pma_numbers, workers=4, section_aware=False):
+def build_citation_index(pdf_files, pdf_data, known_numbers=None):
+    """Build the reverse citation index for the corpus in one pass.
+
+    Replaces calling search_knumber_in_pdf() for every (document, document)
+    pair: an Aho-Corasick automaton over the device numbers is run once per
+    document's text.
+
+    Args:
+        pdf_files: PDF paths; each file's device number is its basename
+            without the .pdf extension.
+        pdf_data: {pdf_path: extracted text}.
+        known_numbers: Device numbers to index (default: the corpus's own
+            device numbers).
+
+    Returns:
+        CitationIndex with cites / cited-by lists for every document.
+    """
+    documents = {pdf_file: pdf_data.get(pdf_file) for pdf_file in pdf_files}
+    return CitationIndex.from_documents(
+        documents,
+        doc_id=lambda path: os.path.basename(path)[:-4],
+        device_numbers=known_numbers,
+    )
+
+
+def process_batches(pdf_files, batch_size, csv_data, pdf_data, known_knumbers, known_pma_numbers, workers=4, section_aware=False, corpus_path=None):
+    """Run safe_process_file over all PDFs with one long-lived worker pool.
+
+    Already-extracted text reaches the workers through a memory-mapped
+    corpus (see lib/text_corpus.py) instead of being pickled into every
+    worker: pass ``corpus_path`` to reuse an existing corpus, otherwise one
+    is written from ``pdf_data`` to a temporary directory. PDFs missing
+    from the corpus are extracted by the worker.
+
+    Batches only drive progress reporting; the pool and its initializer
+    payload (csv_data, known-number sets) are set up once.
+    """
     results = []
     supplement_data = []
-    for i in tqdm(range(0, len(pdf_files), batch_size), desc="Processing batches"):
-        batch_files = pdf_files[i:i + batch_size]
+    with tempfile.TemporaryDirectory(prefix="pdf_corpus_") as tmp_dir:
+        if corpus_path is None and pdf_data:
+            corpus_path = os.path.join(tmp_dir, "pdf_corpus")
+            write_corpus(corpus_path, ((f, pdf_data.get(f)) for f in pdf_files if f in pdf_data))
         with Pool(
             workers,
             initializer=_init_pool,
-            initargs=(csv_data, pdf_files, pdf_data, known_knumbers, known_pma_numbers),
+            initargs=(csv_data, known_knumbers, known_pma_numbers, corpus_path),
         ) as pool:
-            batch_results = pool.map(
-                safe_process_file,
-                [(file, section_aware) for file in batch_files]
-            )
-            batch_results = [result for result in batch_results if result is not None]
-            results.extend(batch_results)
-            for res in batch_results:
-                supplement_data.extend(res[4])
+            for i in tqdm(range(0, len(pdf_files), batch_size), desc="Processing batches"):
+                batch_files = pdf_files[i:i + batch_size]
+                batch_results = pool.map(
+                    safe_process_file,
+                    [(file, section_aware) for file in batch_files]
+                )
+                batch_results = [result for result in batch_results if result is not None]
+                results.extend(batch_results)
+                for res in batch_results:
+                    supplement_data.extend(res[4])
     return results, supplement_data
 
 
@@ -789,6 +854,26 @@ def main():
         section_aware=args.section_aware,
     )
 
+    # Reverse citation index: which documents in the corpus mention each device,
+    # over every known K/P/N/DEN number (not just the corpus's own documents)
+    corpus_numbers = {os.path.basename(pdf_file)[:-4] for pdf_file in pdf_files}
+    citation_index = build_citation_index(
+        pdf_files,
+        pdf_data,
+        known_numbers=known_knumbers | known_pma_numbers | corpus_numbers,
+    )
+    cited_by_path = os.path.join(output_dir, 'cited_by.json')
+    with open(cited_by_path, 'w', encoding='utf-8') as f:
+        json.dump(
+            {
+                "generated_at": datetime.now().isoformat(),
+                "documents": len(citation_index),
+                "cited_by": citation_index.cited_by_map(),
+            },
+            f,
+            indent=2,
+        )
+
     enrichment_path = None
     if args.enrich:
         knumbers = set()
@@ -936,6 +1021,7 @@ def main():
     print(f"  Time elapsed:              {elapsed:.1f}s")
     print(f"  Output:                    {filename}")
     print(f"  Supplements:               {supplement_filename}")
+    print(f"  Cited-by index:            {cited_by_path}")
     if enrichment_path:
         print(f"  Enrichment:                {enrichment_path}")
     print("="*60)
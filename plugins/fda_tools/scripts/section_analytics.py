@@ -4,7 +4,9 @@ FDA 510(k) Section Analytics -- Advanced section comparison and trend analysis.
 
 Provides text similarity computation, pairwise similarity matrices, temporal
 trend analysis, and cross-product-code comparison for structured 510(k) section
-data. Uses only Python standard library (no scikit-learn or numpy required).
+data. Uses only Python standard library (no scikit-learn or numpy required);
+cosine/Jaccard matrices use scipy.sparse when it is installed (see
+similarity_engine.py).
 
 Core functions:
     auto_select_similarity_method(text_a, text_b) -> str  (FDA-39)
@@ -59,6 +61,19 @@ try:
 except ImportError:
     SIMILARITY_CACHE_AVAILABLE = False
 
+# Import vectorized pairwise similarity engine
+try:
+    from similarity_engine import (  # type: ignore
+        DEFAULT_CHUNK_SIZE,
+        VECTORIZED_METHODS,
+        pairwise_scores,
+    )
+    SIMILARITY_ENGINE_AVAILABLE = True
+except ImportError:
+    SIMILARITY_ENGINE_AVAILABLE = False
+    DEFAULT_CHUNK_SIZE = 256
+    VECTORIZED_METHODS = ()
+
 
 # ---------------------------------------------------------------------------
 # Text Similarity Functions
@@ -257,6 +272,7 @@ def pairwise_similarity_matrix(
     sample_size: Optional[int] = None,
     use_cache: bool = True,
     progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> Dict[str, Any]:
     """Compute pairwise similarity matrix for a given section type.
 
@@ -268,6 +284,10 @@ def pairwise_similarity_matrix(
     Cache key: sha256(sorted_device_keys + section_type + method)
     TTL: 7 days
 
+    'cosine', 'jaccard' and 'auto' are computed by the vectorized engine
+    (similarity_engine.py): each text is tokenized once and all pairs come
+    from a blocked sparse matrix product. 'sequence' is computed per pair.
+
     Args:
         section_data: Output from compare_sections.extract_sections_batch().
             Structure: {k_number: {'sections': {section_type: {'text': str}}}}
@@ -280,6 +300,8 @@ def pairwise_similarity_matrix(
         progress_callback: Optional callback for progress reporting.
             Signature: callback(current: int, total: int, message: str)
             Called periodically during computation with pairs completed so far.
+        chunk_size: Rows per block of the vectorized matrix product (bounds
+            memory for large device sets).
 
     Returns:
         Dictionary with similarity analysis:
@@ -364,21 +386,36 @@ def pairwise_similarity_matrix(
     last_update = 0
     update_interval = max(1, total_pairs // 100)  # Update every 1%
 
-    for i in range(n):
-        for j in range(i + 1, n):
-            k1 = device_keys[i]
-            k2 = device_keys[j]
-            score = compute_similarity(
-                devices_with_section[k1],
-                devices_with_section[k2],
-                method=method,
-            )
-            scores.append((k1, k2, round(score, 4)))
-
-            # Progress callback
-            if progress_callback and (len(scores) - last_update >= update_interval or len(scores) == total_pairs):
-                progress_callback(len(scores), total_pairs, f"Computing similarity")
-                last_update = len(scores)
+    if SIMILARITY_ENGINE_AVAILABLE and method.lower() in VECTORIZED_METHODS:
+        def _engine_progress(done: int, total: int) -> None:
+            nonlocal last_update
+            if done - last_update >= update_interval or done == total:
+                progress_callback(done, total, "Computing similarity")
+                last_update = done
+
+        vectorized = pairwise_scores(
+            [devices_with_section[k] for k in device_keys],
+            method=method,
+            chunk_size=chunk_size,
+            progress_callback=_engine_progress if progress_callback else None,
+        )
+        scores = [(device_keys[i], device_keys[j], round(score, 4)) for i, j, score in vectorized]
+    else:
+        for i in range(n):
+            for j in range(i + 1, n):
+                k1 = device_keys[i]
+                k2 = device_keys[j]
+                score = compute_similarity(
+                    devices_with_section[k1],
+                    devices_with_section[k2],
+                    method=method,
+                )
+                scores.append((k1, k2, round(score, 4)))
+
+                # Progress callback
+                if progress_callback and (len(scores) - last_update >= update_interval or len(scores) == total_pairs):
+                    progress_callback(len(scores), total_pairs, f"Computing similarity")
+                    last_update = len(scores)
 
     # Compute statistics
     score_values = [s[2] for s in scores]
@@ -664,7 +701,9 @@ def cross_product_compare(
     Args:
         product_codes: List of FDA product codes to compare (e.g., ['DQY', 'OVE']).
         section_types: List of section types to analyze.
-        structured_cache: Full structured cache dict (k_number -> device data).
+        structured_cache: Full structured cache dict (k_number -> device data),
+            or a StructuredCatalog (lib/structured_catalog.py) to select only
+            the requested product codes, with section texts read on access.
             Each device needs metadata.product_code or product_code field.
 
     Returns:
@@ -688,6 +727,9 @@ def cross_product_compare(
             }
         }
     """
+    if hasattr(structured_cache, "select"):
+        structured_cache = structured_cache.select(product_codes)
+
     # Group cache by product code
     by_product_code: Dict[str, Dict[str, Dict]] = defaultdict(dict)
     for k_number, data in structured_cache.items():
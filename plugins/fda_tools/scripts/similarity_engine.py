@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Vectorized Pairwise Similarity Engine for FDA 510(k) Section Analytics
+
+Computes all n*(n-1)/2 pairwise cosine / Jaccard scores for a set of section
+texts without calling compute_similarity() per pair. Each text is tokenized
+once into a term-frequency row of a sparse document-term matrix, and every
+pair's dot product (cosine) or shared-term count (Jaccard) comes out of one
+sparse matrix product X @ X.T, computed in row blocks so memory stays
+bounded for large n.
+
+Backends:
+  - scipy.sparse (when numpy/scipy are installed): CSR matrix product per
+    row block
+  - Pure Python fallback: the same sparse product via term posting lists
+    (still tokenizes once and only visits pairs that share a term)
+
+Scores match section_analytics.compute_similarity() exactly: dot products
+and shared-term counts are integers, divided by the same norms.
+
+'sequence' (difflib SequenceMatcher) is character-alignment based and has no
+matrix form; 'auto' is vectorized for the pairs it resolves to jaccard or
+cosine and uses SequenceMatcher only for pairs it resolves to sequence.
+
+Usage:
+    from similarity_engine import pairwise_scores
+
+    scores = pairwise_scores(texts, method='cosine', chunk_size=256)
+    # -> [(i, j, score), ...] for i < j, in row-major order
+"""
+
+import bisect
+import math
+import re
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np  # type: ignore
+    from scipy import sparse  # type: ignore
+    _SCIPY_AVAILABLE = True
+except ImportError:
+    _SCIPY_AVAILABLE = False
+
+VECTORIZED_METHODS = ("cosine", "jaccard", "auto")
+DEFAULT_CHUNK_SIZE = 256
+
+# Thresholds from section_analytics.auto_select_similarity_method (FDA-39)
+AUTO_SHORT_TEXT_WORDS = 100
+AUTO_LOW_DIVERSITY = 0.6
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+class _Corpus:
+    """Tokenized texts: per-document term counts and derived norms."""
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.counts: List[Counter] = [Counter(_TOKEN_RE.findall(t.lower())) for t in texts]
+        self.lengths = [sum(c.values()) for c in self.counts]
+        self.unique = [len(c) for c in self.counts]
+        self.norms = [math.sqrt(sum(v * v for v in c.values())) for c in self.counts]
+
+
+def _cosine(dot: float, norm_a: float, norm_b: float) -> float:
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def _jaccard(shared: int, unique_a: int, unique_b: int) -> float:
+    union = unique_a + unique_b - shared
+    return shared / union if union else 0.0
+
+
+def _auto_method(corpus: _Corpus, i: int, j: int, shared: int) -> str:
+    """Same decision as auto_select_similarity_method, from precomputed counts."""
+    total = corpus.lengths[i] + corpus.lengths[j]
+    if total / 2.0 < AUTO_SHORT_TEXT_WORDS:
+        return "jaccard"
+    diversity = (corpus.unique[i] + corpus.unique[j] - shared) / total if total else 0.0
+    if diversity < AUTO_LOW_DIVERSITY:
+        return "sequence"
+    return "cosine"
+
+
+def _score_row(corpus: _Corpus, method: str, i: int, dots, shared) -> List[float]:
+    """Scores of document ``i`` against documents i+1..n-1.
+
+    ``dots`` / ``shared`` map column -> value (dict or array indexable by j).
+    """
+    n = len(corpus.texts)
+    row = []
+    for j in range(i + 1, n):
+        if method == "cosine":
+            row.append(_cosine(float(dots[j]), corpus.norms[i], corpus.norms[j]))
+            continue
+        s = int(shared[j])
+        m = method if method != "auto" else _auto_method(corpus, i, j, s)
+        if m == "jaccard":
+            row.append(_jaccard(s, corpus.unique[i], corpus.unique[j]))
+        elif m == "cosine":
+            row.append(_cosine(float(dots[j]), corpus.norms[i], corpus.norms[j]))
+        else:
+            row.append(SequenceMatcher(None, corpus.texts[i], corpus.texts[j]).ratio())
+    return row
+
+
+def _rows_python(corpus: _Corpus, method: str, chunk_size: int):
+    """Yield (i, scores) using term posting lists (stdlib sparse product)."""
+    postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    for doc_id, counts in enumerate(corpus.counts):
+        for term, count in counts.items():
+            postings[term].append((doc_id, count))
+    starts = {term: [d for d, _ in plist] for term, plist in postings.items()}
+
+    need_dots = method in ("cosine", "auto")
+    need_shared = method in ("jaccard", "auto")
+    for i, counts in enumerate(corpus.counts):
+        dots: Dict[int, int] = defaultdict(int)
+        shared: Dict[int, int] = defaultdict(int)
+        for term, count in counts.items():
+            plist = postings[term]
+            for j, other in plist[bisect.bisect_right(starts[term], i):]:
+                if need_dots:
+                    dots[j] += count * other
+                if need_shared:
+                    shared[j] += 1
+        yield i, _score_row(corpus, method, i, dots, shared)
+
+
+def _rows_scipy(corpus: _Corpus, method: str, chunk_size: int):
+    """Yield (i, scores) from blocked CSR products X[block] @ X.T."""
+    vocab: Dict[str, int] = {}
+    indptr, indices, data = [0], [], []
+    for counts in corpus.counts:
+        for term, count in counts.items():
+            indices.append(vocab.setdefault(term, len(vocab)))
+            data.append(count)
+        indptr.append(len(indices))
+    n = len(corpus.texts)
+    tf = sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float64), indices, indptr), shape=(n, max(1, len(vocab)))
+    )
+    binary = tf.copy()
+    binary.data[:] = 1.0
+    tf_t = tf.T.tocsc()
+    binary_t = binary.T.tocsc()
+
+    need_dots = method in ("cosine", "auto")
+    need_shared = method in ("jaccard", "auto")
+    for start in range(0, n, chunk_size):
+        stop = min(n, start + chunk_size)
+        dots = (tf[start:stop] @ tf_t).toarray() if need_dots else None
+        shared = (binary[start:stop] @ binary_t).toarray() if need_shared else None
+        for i in range(start, stop):
+            yield i, _score_row(
+                corpus, method, i,
+                dots[i - start] if need_dots else None,
+                shared[i - start] if need_shared else None,
+            )
+
+
+def pairwise_scores(
+    texts: List[str],
+    method: str = "cosine",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> List[Tuple[int, int, float]]:
+    """Compute similarity for every pair of texts.
+
+    Args:
+        texts: Section texts (non-empty).
+        method: 'cosine', 'jaccard' or 'auto'.
+        chunk_size: Rows per block of the matrix product; bounds memory at
+            chunk_size * n scores per block.
+        progress_callback: Optional callback(pairs_done, total_pairs), called
+            after each row.
+
+    Returns:
+        List of (i, j, score) for i < j in row-major order (unrounded).
+
+    Raises:
+        ValueError: If method cannot be vectorized.
+    """
+    method = method.lower()
+    if method not in VECTORIZED_METHODS:
+        raise ValueError(f"Method '{method}' is not supported by the vectorized engine")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    corpus = _Corpus(texts)
+    n = len(texts)
+    total = n * (n - 1) // 2
+    rows = _rows_scipy if _SCIPY_AVAILABLE else _rows_python
+
+    scores: List[Tuple[int, int, float]] = []
+    for i, row in rows(corpus, method, chunk_size):
+        scores.extend((i, i + 1 + k, s) for k, s in enumerate(row))
+        if progress_callback and row:
+            progress_callback(len(scores), total)
+    return scores
+
+
+def get_backend() -> str:
+    """Return the active backend name ('scipy' or 'python')."""
+    return "scipy" if _SCIPY_AVAILABLE else "python"
@@ -941,6 +941,19 @@ class UnifiedPredicateAnalyzer:
         Returns:
             Dict mapping device number to analysis result.
         """
+        # Prime the 510(k) cache with OR-batched queries so the per-device
+        # lookups below are cache hits instead of one API call each.
+        k_numbers = [
+            num.strip().upper() for num in device_numbers
+            if self.detect_device_type(num.strip().upper()) == "510k"
+        ]
+        prefetch = getattr(self.client, "prefetch_510k", None)
+        if len(k_numbers) > 1 and callable(prefetch):
+            try:
+                prefetch(k_numbers)
+            except Exception as e:
+                print(f"Warning: Batched 510(k) prefetch failed: {e}", file=sys.stderr)
+
         results = {}
         for num in device_numbers:
             results[num.upper()] = self.analyze_predicate(num, refresh=refresh)
@@ -35,7 +35,7 @@ _COORDINATOR_ALLOWLIST = ["docker", "docker-compose"]
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 try:
     from fda_tools.lib.postgres_database import PostgreSQLDatabase
@@ -46,7 +46,7 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from fda_tools.scripts.fda_api_client import FDAClient
+    from fda_tools.scripts.fda_api_client import FDAClient, RecordIterationError
     _API_CLIENT_AVAILABLE = True
 except ImportError:
     _API_CLIENT_AVAILABLE = False
@@ -72,6 +72,29 @@ STANDBY_WINDOW_HOURS = 24
 
 ENDPOINTS = ["510k", "classification", "maude", "recalls", "pma", "udi", "enforcement"]
 
+# openFDA field holding each endpoint's record ID
+ID_FIELDS = {
+    "510k": "k_number",
+    "classification": "product_code",
+    "maude": "event_key",
+    "recalls": "recall_number",
+    "pma": "pma_number",
+    "udi": "di",
+    "enforcement": "recall_number",
+}
+
+# Date field bounding the delta window (classification, udi have none)
+DELTA_DATE_FIELDS = {
+    "510k": "decision_date",
+    "pma": "decision_date",
+    "maude": "date_received",
+    "recalls": "date_received",
+    "enforcement": "date_received",
+}
+
+# Record IDs per API call when apply_updates() must look records up
+FETCH_BATCH_SIZE = 50
+
 
 class UpdateCoordinatorError(Exception):
     """Base exception for update coordinator errors."""
@@ -133,6 +156,10 @@ class UpdateCoordinator:
         # Initialize FDA API client for delta detection
         self.api_client = FDAClient()
         
+        # Full records fetched by detect_deltas(), keyed by endpoint then ID,
+        # so apply_updates() does not fetch them again
+        self._delta_records: Dict[str, Dict[str, Dict]] = {}
+        
         # Track switch state
         self.state_file = Path.home() / ".fda-tools" / "blue_green_state.json"
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
@@ -243,77 +270,172 @@ class UpdateCoordinator:
         
         return False
     
-    def detect_deltas(self, endpoint: str, since_timestamp: Optional[float] = None) -> List[str]:
-        """Find records modified since timestamp using FDA API.
+    def _ensure_green_db(self):
+        """Connect to GREEN if prepare_green_database() has not in this process."""
+        if self.green_db is None:
+            self.green_db = PostgreSQLDatabase(host=self.green_host, port=self.green_port, pool_size=5)
+    
+    def _delta_search(self, endpoint: str, since_timestamp: Optional[float]) -> Optional[str]:
+        """Build the openFDA search for records changed since a timestamp.
         
-        Args:
-            endpoint: Endpoint name (510k, classification, etc.)
-            since_timestamp: Unix timestamp of last refresh (None = all records)
-            
         Returns:
-            List of modified record IDs
+            Search string, or None if the endpoint has no delta window
         """
-        logger.info(f"Detecting deltas for {endpoint} since {since_timestamp}...")
-        
         if since_timestamp is None:
             # No previous refresh, return empty (use full migration instead)
             logger.info("No previous refresh timestamp, skipping delta detection")
-            return []
+            return None
+        
+        date_field = DELTA_DATE_FIELDS.get(endpoint)
+        if not date_field:
+            # classification, udi don't have date filters
+            logger.warning(f"Endpoint {endpoint} doesn't support date filtering")
+            return None
         
         # Convert timestamp to date string for FDA API
+        # Example: decision_date:[20260101+TO+20260220]
         since_date = datetime.fromtimestamp(since_timestamp).strftime("%Y%m%d")
         now_date = datetime.now().strftime("%Y%m%d")
+        return f"{date_field}:[{since_date}+TO+{now_date}]"
+    
+    def iter_delta_pages(
+        self, endpoint: str, since_timestamp: Optional[float] = None
+    ) -> Iterator[List[Tuple[str, Dict]]]:
+        """Stream the full records modified since timestamp, one API page at a time.
         
-        # Query FDA API with date range filter
-        # Example: decision_date:[20260101+TO+20260220]
-        date_filter = f"[{since_date}+TO+{now_date}]"
-        
-        # Build search parameter based on endpoint
-        if endpoint == "510k":
-            search_param = f"decision_date:{date_filter}"
-        elif endpoint in ["maude", "recalls", "enforcement"]:
-            search_param = f"date_received:{date_filter}"
-        elif endpoint == "pma":
-            search_param = f"decision_date:{date_filter}"
-        else:
-            # classification, udi don't have date filters
-            logger.warning(f"Endpoint {endpoint} doesn't support date filtering")
-            return []
+        Pages through the whole delta window with search_after. The cursor
+        checkpoint for the next page is only written when the consumer asks
+        for it, so a consumer that stores each page before continuing
+        resumes an interrupted refresh without gaps.
+        
+        Args:
+            endpoint: Endpoint name (510k, classification, etc.)
+            since_timestamp: Unix timestamp of last refresh (None = no deltas)
+            
+        Yields:
+            Lists of (record_id, record) pairs
+            
+        Raises:
+            RecordIterationError: A page could not be fetched
+        """
+        search_param = self._delta_search(endpoint, since_timestamp)
+        if search_param is None:
+            return
         
-        # Fetch records (limit to 1000 for safety)
+        id_field = ID_FIELDS[endpoint]
         logger.info(f"Querying FDA API: {search_param}")
-        response = self.api_client._request(endpoint, {"search": search_param, "limit": "1000"})
+        for page in self.api_client.iter_pages(
+            endpoint,
+            search=search_param,
+            sort=f"{DELTA_DATE_FIELDS[endpoint]}:asc",
+            checkpoint=self.state_file.parent / f"delta_cursor_{endpoint}.json",
+        ):
+            yield [(record[id_field], record) for record in page if record.get(id_field)]
+    
+    def refresh_endpoint(self, endpoint: str, since_timestamp: Optional[float] = None) -> int:
+        """Upsert every record modified since timestamp into GREEN.
         
-        if not response or "error" in response:
-            logger.error(f"FDA API query failed: {response}")
-            return []
+        Each fetched page goes straight into one batched upsert, so a
+        refresh costs one API call per page of changed records and no
+        per-record re-fetches.
         
-        results = response.get("results", [])
-        logger.info(f"Found {len(results)} modified records")
-        
-        # Extract record IDs
-        id_fields = {
-            "510k": "k_number",
-            "classification": "product_code",
-            "maude": "event_key",
-            "recalls": "recall_number",
-            "pma": "pma_number",
-            "udi": "di",
-            "enforcement": "recall_number"
-        }
+        Args:
+            endpoint: Endpoint name
+            since_timestamp: Unix timestamp of last refresh
+            
+        Returns:
+            Number of records upserted
+            
+        Raises:
+            RecordIterationError: A page could not be fetched. Pages already
+                upserted are kept, and the delta cursor checkpoint lets the
+                next refresh of the same window resume after them.
+        """
+        logger.info(f"Refreshing {endpoint} since {since_timestamp}...")
+        self._ensure_green_db()
+        updated_count = 0
+        try:
+            for page in self.iter_delta_pages(endpoint, since_timestamp):
+                updated_count += self.green_db.upsert_many(endpoint, page)
+        except RecordIterationError as e:
+            logger.error(f"FDA API query failed after {updated_count} records: {e}")
+            raise
+        
+        logger.info(f"✅ Applied {updated_count} {endpoint} updates to GREEN")
+        return updated_count
+    
+    def detect_deltas(self, endpoint: str, since_timestamp: Optional[float] = None) -> List[str]:
+        """Find records modified since timestamp using FDA API.
+        
+        The fetched records are kept so that apply_updates() can upsert
+        them without fetching them again.
+        
+        Args:
+            endpoint: Endpoint name (510k, classification, etc.)
+            since_timestamp: Unix timestamp of last refresh (None = all records)
+            
+        Returns:
+            List of modified record IDs
+        """
+        logger.info(f"Detecting deltas for {endpoint} since {since_timestamp}...")
+        
+        search_param = self._delta_search(endpoint, since_timestamp)
+        if search_param is None:
+            return []
         
-        id_field = id_fields.get(endpoint)
-        if not id_field:
+        # The IDs collected so far are checkpointed per page alongside the
+        # search_after cursor, so an interrupted detection resumes where it
+        # stopped.
+        ids_file = self.state_file.parent / f"delta_ids_{endpoint}.json"
+        record_ids = []
+        if ids_file.exists():
+            with open(ids_file) as f:
+                partial = json.load(f)
+            if partial.get("search") == search_param:
+                record_ids = partial.get("ids", [])
+        seen = set(record_ids)
+        fetched = self._delta_records.setdefault(endpoint, {})
+        try:
+            for page in self.iter_delta_pages(endpoint, since_timestamp):
+                for record_id, record in page:
+                    fetched[record_id] = record
+                    if record_id not in seen:
+                        seen.add(record_id)
+                        record_ids.append(record_id)
+                with open(ids_file, 'w') as f:
+                    json.dump({"search": search_param, "ids": record_ids}, f)
+        except RecordIterationError as e:
+            logger.error(f"FDA API query failed: {e}")
             return []
+        ids_file.unlink(missing_ok=True)
         
-        record_ids = [r.get(id_field) for r in results if r.get(id_field)]
         logger.info(f"Extracted {len(record_ids)} record IDs")
         
         return record_ids
     
+    def _fetch_records(self, endpoint: str, record_ids: List[str]) -> Dict[str, Dict]:
+        """Fetch records by ID, FETCH_BATCH_SIZE IDs per API call."""
+        id_field = ID_FIELDS[endpoint]
+        records = {}
+        for i in range(0, len(record_ids), FETCH_BATCH_SIZE):
+            batch = record_ids[i:i + FETCH_BATCH_SIZE]
+            search = "+".join(f'{id_field}:"{record_id}"' for record_id in batch)
+            response = self.api_client._request(endpoint, {"search": search, "limit": str(len(batch))})
+            if not response or "error" in response:
+                continue
+            for record in response.get("results", []):
+                record_id = record.get(id_field)
+                if record_id in batch:
+                    records[record_id] = record
+        return records
+    
     def apply_updates(self, endpoint: str, record_ids: List[str]) -> int:
         """Update GREEN database with modified records.
         
+        Records fetched by detect_deltas() are upserted as-is; only IDs it
+        did not fetch (e.g. after a resumed detection) are looked up, in
+        batches.
+        
         Args:
             endpoint: Endpoint name
             record_ids: List of record IDs to update
@@ -327,24 +449,23 @@ class UpdateCoordinator:
         
         logger.info(f"Applying {len(record_ids)} updates to GREEN database for {endpoint}...")
         
-        updated_count = 0
-        
-        for record_id in record_ids:
-            # Fetch from API
-            response = self.api_client._request(endpoint, {"search": f'{id_fields[endpoint]}:"{record_id}"', "limit": "1"})
-            
-            if not response or "error" in response or not response.get("results"):
+        fetched = self._delta_records.get(endpoint, {})
+        records = {record_id: fetched.pop(record_id) for record_id in record_ids if record_id in fetched}
+        missing = [record_id for record_id in record_ids if record_id not in records]
+        if missing:
+            logger.info(f"Fetching {len(missing)} {endpoint} records not seen during detection")
+            records.update(self._fetch_records(endpoint, missing))
+        for record_id in missing:
+            if record_id not in records:
                 logger.warning(f"Failed to fetch {endpoint} {record_id}")
-                continue
-            
-            data = response["results"][0]
-            
-            # Upsert into GREEN database
-            try:
-                self.green_db.upsert_record(endpoint, record_id, data)
-                updated_count += 1
-            except Exception as e:
-                logger.error(f"Failed to upsert {endpoint} {record_id}: {e}")
+        
+        # Upsert into GREEN database in one batched transaction
+        self._ensure_green_db()
+        try:
+            updated_count = self.green_db.upsert_many(endpoint, records.items())
+        except Exception as e:
+            logger.error(f"Failed to upsert {len(records)} {endpoint} records: {e}")
+            updated_count = 0
         
         logger.info(f"✅ Applied {updated_count}/{len(record_ids)} updates to GREEN")
         return updated_count
@@ -575,10 +696,14 @@ def main():
             state = coordinator._load_state()
             last_refresh = state.get("last_refresh", {}).get(args.endpoint)
             
-            deltas = coordinator.detect_deltas(args.endpoint, last_refresh)
-            updated = coordinator.apply_updates(args.endpoint, deltas)
+            try:
+                updated = coordinator.refresh_endpoint(args.endpoint, last_refresh)
+            except RecordIterationError:
+                # Keep last_refresh so the next run re-queries the same window
+                print(f"ERROR: {args.endpoint} refresh incomplete; last refresh time not advanced")
+                return 1
             
-            # Update last refresh timestamp
+            # The whole window was paged: advance the last refresh timestamp
             state["last_refresh"][args.endpoint] = time.time()
             coordinator._save_state(state)
             
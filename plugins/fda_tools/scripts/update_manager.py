@@ -530,9 +530,17 @@ def clean_system_cache(verbose=True):
             except OSError as e:
                 logger.warning("Failed to remove expired cache file: %s", e)
 
+    total_files = len(cache_files)
+
+    # Single-file SQLite backend: purge expired rows in one statement
+    store = getattr(client, "_cache_store", None)
+    if store is not None:
+        total_files += store.stats()["entries"]
+        expired_count += store.delete_expired(7 * 24 * 60 * 60)
+
     results = {
         "cache_dir": str(cache_dir),
-        "total_files": len(cache_files),
+        "total_files": total_files,
         "expired_files": expired_count,
         "bytes_freed": bytes_freed
     }
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for lib/api_cache_store.py -- single-file SQLite API response cache.
+
+Tests cover:
+- get/set round trip, TTL expiry and checksum-verified reads
+- Corrupt rows invalidated and reported to the audit callback
+- Trigger-maintained O(1) totals across insert/update/delete
+- Migration from the legacy one-JSON-file-per-response directory
+- FDAClient and CacheManager using the SQLite backend
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+from fda_tools.lib.api_cache_store import DEFAULT_DB_NAME, SQLiteCacheStore
+from fda_tools.lib.cache_manager import CacheManager
+from fda_tools.scripts.cache_integrity import integrity_write
+from fda_tools.scripts.fda_api_client import FDAClient
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+        self.headers = {}
+
+    def read(self):
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+
+class _FakeTransport:
+    def __init__(self):
+        self.calls = []
+
+    def open(self, url, headers=None, timeout=15):
+        self.calls.append(url)
+        return _FakeResponse({"results": [{"url": url}]})
+
+    def get_stats(self):
+        return {"transport": "fake"}
+
+
+class TestSQLiteCacheStore:
+
+    def test_round_trip_and_ttl(self, tmp_path):
+        store = SQLiteCacheStore(tmp_path / "c.db")
+        store.set("abc", {"results": [1, 2]})
+        assert store.get("abc") == {"results": [1, 2]}
+        assert store.get("missing") is None
+
+        store.set("old", {"results": []}, cached_at=time.time() - 100)
+        assert store.get("old", ttl_seconds=50) is None
+        assert store.get("old", ttl_seconds=500) == {"results": []}
+        assert store.contains("old")
+        assert not store.contains("old", ttl_seconds=50)
+
+    def test_totals_maintained_by_triggers(self, tmp_path):
+        store = SQLiteCacheStore(tmp_path / "c.db")
+        store.set("a", {"x": "1"})
+        store.set("b", {"x": "22"})
+        store.set("a", {"x": "333"})  # update, not a new entry
+        stats = store.stats()
+        assert stats["entries"] == 2
+        assert stats["payload_bytes"] == len('{"x":"333"}') + len('{"x":"22"}')
+
+        store.set("c", {}, cached_at=time.time() - 1000)
+        stats = store.stats(ttl_seconds=10)
+        assert stats["entries"] == 3
+        assert stats["expired"] == 1
+        assert stats["valid"] == 2
+        assert stats["expired_bytes"] == 2
+
+        assert store.delete_expired(10) == 1
+        assert store.delete("b") is True
+        assert store.stats()["entries"] == 1
+        assert store.clear() == 1
+        stats = store.stats()
+        assert stats["entries"] == 0
+        assert stats["payload_bytes"] == 0
+
+    def test_checksum_mismatch_invalidated(self, tmp_path):
+        events = []
+        store = SQLiteCacheStore(tmp_path / "c.db", audit_logger=events.append)
+        store.set("k", {"results": ["good"]})
+        conn = sqlite3.connect(str(tmp_path / "c.db"))
+        conn.execute("UPDATE entries SET payload = ? WHERE key = 'k'", (b'{"results":["bad"]}',))
+        conn.commit()
+        conn.close()
+
+        assert store.get("k") is None
+        assert not store.contains("k")
+        assert [e["event"] for e in events] == ["checksum_mismatch", "file_invalidated"]
+
+    def test_thread_safe_writes(self, tmp_path):
+        store = SQLiteCacheStore(tmp_path / "c.db")
+
+        def writer(n):
+            for i in range(25):
+                store.set(f"{n}-{i}", {"n": n, "i": i})
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert store.stats()["entries"] == 100
+        store.close()
+
+    def test_migrate_from_directory(self, tmp_path):
+        cache_dir = tmp_path / "api_cache"
+        cache_dir.mkdir()
+        integrity_write(cache_dir / "aaaa.json", {"results": ["enveloped"]}, cached_at=1000.0)
+        (cache_dir / "bbbb.json").write_text(
+            json.dumps({"_cached_at": time.time(), "data": {"results": ["legacy"]}})
+        )
+        (cache_dir / "cccc.json").write_text("{not json")
+        tampered = json.loads((cache_dir / "aaaa.json").read_text())
+        tampered["data"] = {"results": ["tampered"]}
+        (cache_dir / "dddd.json").write_text(json.dumps(tampered))
+
+        store = SQLiteCacheStore(cache_dir / DEFAULT_DB_NAME)
+        counts = store.migrate_from_directory(cache_dir, remove_source=True)
+        assert counts == {"migrated": 2, "corrupt": 2, "expired": 0, "errors": 0}
+        assert store.get("aaaa") == {"results": ["enveloped"]}
+        assert store.get("bbbb") == {"results": ["legacy"]}
+        assert store.get("aaaa", ttl_seconds=60) is None  # original timestamp kept
+        assert list(cache_dir.glob("*.json")) == []
+
+
+class TestSQLiteBackendIntegration:
+
+    def test_fda_client_sqlite_backend(self, tmp_path):
+        transport = _FakeTransport()
+        client = FDAClient(cache_dir=str(tmp_path), transport=transport, cache_backend="sqlite")
+        client._cross_process_limiter = None
+        client._rate_limiter = None
+
+        first = client.get_510k("K241335")
+        assert client.get_510k("K241335") == first
+        assert len(transport.calls) == 1
+        assert list(tmp_path.glob("*.json")) == []
+        assert (tmp_path / DEFAULT_DB_NAME).exists()
+
+        stats = client.cache_stats()
+        assert stats["cache_backend"] == "sqlite"
+        assert stats["total_files"] == 1
+        assert stats["valid"] == 1
+
+        assert client.clear_cache() == 1
+        assert client.cache_stats()["total_files"] == 0
+        client.close()
+
+    def test_cache_manager_migrates_and_counts(self, tmp_path):
+        api_dir = tmp_path / "api_cache"
+        api_dir.mkdir()
+        for i in range(3):
+            integrity_write(api_dir / f"{i:016x}.json", {"results": [i]})
+
+        mgr = CacheManager(base_dir=str(tmp_path))
+        counts = mgr.migrate_api_cache(remove_source=True)
+        assert counts["migrated"] == 3
+        stats = mgr.get_stats()["openfda"]
+        assert stats.total_files == 3
+        assert stats.stale_files == 0
+        assert mgr.purge_all().files_removed == 3
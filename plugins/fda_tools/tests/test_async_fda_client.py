@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/async_fda_client.py -- asyncio FDA API client.
+
+Tests cover:
+- Cache sharing with the wrapped FDAClient (hits, misses, 404 caching)
+- Bounded concurrency via the semaphore
+- Retry on 5xx and no retry on 4xx
+- Rate limiter token acquisition through acquire_async()
+- Concurrent get_device_characteristics
+- Single-flight coalescing of identical coroutines
+"""
+
+import asyncio
+import io
+import json
+import threading
+import time
+import urllib.error
+from unittest.mock import MagicMock
+
+from fda_tools.lib.cross_process_rate_limiter import CrossProcessRateLimiter
+from fda_tools.scripts.async_fda_client import AsyncFDAClient
+from fda_tools.scripts.fda_api_client import FDAClient
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+        self.headers = {}
+
+    def read(self):
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+
+class _FakeTransport:
+    """Transport returning canned payloads, tracking peak concurrency."""
+
+    def __init__(self, handler, delay=0.0):
+        self.handler = handler
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def open(self, url, headers=None, timeout=15):
+        with self._lock:
+            self.calls.append(url)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            return _FakeResponse(self.handler(url))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def get_stats(self):
+        return {"transport": "fake"}
+
+
+def _make_client(tmp_path, transport):
+    client = FDAClient(cache_dir=str(tmp_path), transport=transport)
+    client._cross_process_limiter = None
+    client._rate_limiter = None
+    client._retry_policy = None
+    return client
+
+
+class TestAsyncFDAClient:
+
+    def test_results_cached_in_shared_disk_cache(self, tmp_path):
+        transport = _FakeTransport(lambda url: {"results": [{"url": url}]})
+        client = _make_client(tmp_path, transport)
+        aclient = AsyncFDAClient(client)
+
+        first = asyncio.run(aclient.get_510k("K241335"))
+        second = asyncio.run(aclient.get_510k("K241335"))
+        assert first == second
+        assert len(transport.calls) == 1
+        # Same cache entry is visible to the synchronous client
+        assert client.get_510k("K241335") == first
+        assert len(transport.calls) == 1
+        assert client._stats["misses"] == 1
+        assert client._stats["hits"] == 2
+
+    def test_semaphore_bounds_in_flight_requests(self, tmp_path):
+        transport = _FakeTransport(lambda url: {"results": [1]}, delay=0.05)
+        aclient = AsyncFDAClient(_make_client(tmp_path, transport), max_concurrency=3)
+
+        results = asyncio.run(aclient.gather_510k([f"K{i:06d}" for i in range(12)]))
+        assert len(results) == 12
+        assert len(transport.calls) == 12
+        assert transport.peak <= 3
+        assert aclient.concurrency_stats()["peak_in_flight"] == 3
+
+    def test_404_cached_as_empty_result(self, tmp_path):
+        def handler(url):
+            raise urllib.error.HTTPError(url, 404, "Not Found", {}, io.BytesIO(b""))
+        transport = _FakeTransport(handler)
+        aclient = AsyncFDAClient(_make_client(tmp_path, transport))
+
+        result = asyncio.run(aclient.get_pma("P999999"))
+        assert result == {"results": [], "meta": {"results": {"total": 0}}}
+        asyncio.run(aclient.get_pma("P999999"))
+        assert len(transport.calls) == 1
+
+    def test_server_error_retried(self, tmp_path, monkeypatch):
+        attempts = []
+
+        def handler(url):
+            attempts.append(url)
+            if len(attempts) < 3:
+                raise urllib.error.HTTPError(url, 503, "Unavailable", {}, io.BytesIO(b""))
+            return {"results": [{"ok": True}]}
+
+        monkeypatch.setattr("fda_tools.scripts.async_fda_client.BASE_BACKOFF", 0.0)
+        aclient = AsyncFDAClient(_make_client(tmp_path, _FakeTransport(handler)))
+        result = asyncio.run(aclient.get_classification("DQY"))
+        assert result["results"] == [{"ok": True}]
+        assert len(attempts) == 3
+
+    def test_client_error_not_retried(self, tmp_path):
+        def handler(url):
+            raise urllib.error.HTTPError(url, 400, "Bad Request", {}, io.BytesIO(b""))
+        transport = _FakeTransport(handler)
+        client = _make_client(tmp_path, transport)
+        result = asyncio.run(AsyncFDAClient(client).get_recalls("DQY"))
+        assert result["degraded"] is True
+        assert "HTTP 400" in result["error"]
+        assert len(transport.calls) == 1
+        assert client._stats["errors"] == 1
+
+    def test_rate_limiter_tokens_acquired(self, tmp_path):
+        transport = _FakeTransport(lambda url: {"results": []})
+        client = _make_client(tmp_path, transport)
+        client._cross_process_limiter = CrossProcessRateLimiter(
+            data_dir=str(tmp_path / "rl"), requests_per_minute=100
+        )
+        asyncio.run(AsyncFDAClient(client).gather_classifications(["DQY", "OVE", "MAX"]))
+        assert client._cross_process_limiter.get_status()["requests_last_minute"] == 3
+
+    def test_rate_limit_timeout_returns_degraded(self, tmp_path):
+        transport = _FakeTransport(lambda url: {"results": []})
+        client = _make_client(tmp_path, transport)
+        limiter = MagicMock()
+
+        async def never(timeout=None):
+            return False
+        limiter.acquire_async = never
+        client._cross_process_limiter = limiter
+        result = asyncio.run(AsyncFDAClient(client).get_510k("K000001"))
+        assert result["degraded"] is True
+        assert transport.calls == []
+
+    def test_in_process_rate_limiter_fallback(self, tmp_path):
+        """Without the cross-process limiter, the blocking acquire() runs off the loop."""
+        acquired = []
+
+        class _BlockingLimiter:
+            def acquire(self, tokens=1, timeout=None):
+                acquired.append((tokens, threading.current_thread() is threading.main_thread()))
+                return True
+
+            def update_from_headers(self, headers):
+                pass
+
+        transport = _FakeTransport(lambda url: {"results": []})
+        client = _make_client(tmp_path, transport)
+        client._rate_limiter = _BlockingLimiter()
+        asyncio.run(AsyncFDAClient(client).gather_classifications(["DQY", "OVE"]))
+        assert acquired == [(1, False), (1, False)]
+        assert len(transport.calls) == 2
+
+    def test_device_characteristics_concurrent(self, tmp_path):
+        def handler(url):
+            if "/classification.json" in url:
+                return {"results": [{"device_name": "Catheter", "device_class": "2"}]}
+            if "limit=5" in url:
+                return {"results": [{"k_number": "K1", "decision_date": "20240101",
+                                     "device_name": "X"}]}
+            return {"results": [], "meta": {"results": {"total": 42}}}
+
+        transport = _FakeTransport(handler, delay=0.05)
+        aclient = AsyncFDAClient(_make_client(tmp_path, transport))
+        chars = asyncio.run(aclient.get_device_characteristics("DQY"))
+        assert chars["name"] == "Catheter"
+        assert chars["recent_clearances"][0]["k_number"] == "K1"
+        assert chars["submission_volume"] == 42
+        assert transport.peak == 3
+
+
+class TestAcquireAsync:
+
+    def test_acquire_async_respects_limit(self, tmp_path):
+        limiter = CrossProcessRateLimiter(data_dir=str(tmp_path), requests_per_minute=2)
+
+        async def run():
+            first = await limiter.acquire_async(timeout=1)
+            second = await limiter.acquire_async(timeout=1)
+            third = await limiter.acquire_async(timeout=0.3)
+            return first, second, third
+
+        assert asyncio.run(run()) == (True, True, False)
+
+
+class TestAsyncSingleFlight:
+    """Concurrent identical coroutines share one fetch."""
+
+    def test_async_coalesces_identical_requests(self, tmp_path):
+        transport = _FakeTransport(lambda url: {"results": [1]}, delay=0.1)
+        client = _make_client(tmp_path, transport)
+        aclient = AsyncFDAClient(client, max_concurrency=4)
+
+        async def run():
+            return await asyncio.gather(*(aclient.get_pma("P170019") for _ in range(5)))
+
+        results = asyncio.run(run())
+        assert len(transport.calls) == 1
+        assert all(r == {"results": [1]} for r in results)
+        assert client._stats["coalesced"] == 4
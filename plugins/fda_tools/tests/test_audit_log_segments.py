@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for segment rotation and sidecar indexes in scripts/fda_audit_logger.py.
+
+Tests cover:
+- Rotation by size and by calendar month, appending to a fresh active segment
+- read_log() returning sealed segments and the active segment in order
+- query_log() pruning segments and lines through the indexes
+- summarize_log() combining index summaries with the active segment
+- Stale or missing indexes rebuilt from the segment
+"""
+
+import json
+import os
+
+import pytest
+
+import fda_audit_logger as audit
+from fda_audit_logger import (
+    AUDIT_SEGMENT_DIR,
+    append_entry,
+    query_log,
+    read_log,
+    summarize_log,
+)
+
+
+def _entry(command, action, subject, timestamp, **extra):
+    return dict(command=command, action=action, subject=subject,
+                mode="auto", timestamp=timestamp, **extra)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    # Tiny segments: every few entries rotate
+    monkeypatch.setattr(audit, "AUDIT_SEGMENT_MAX_BYTES", 600)
+    return str(tmp_path)
+
+
+def _fill(project, months=("2026-01", "2026-02", "2026-03")):
+    for month in months:
+        for day in range(1, 5):
+            append_entry(project, _entry("review", "predicate_accepted", f"K{day:06d}",
+                                         f"{month}-{day:02d}T00:00:00Z",
+                                         decision="accepted", decision_type="auto"))
+        append_entry(project, _entry("pathway", "pathway_recommended", "OVE",
+                                     f"{month}-10T00:00:00Z", decision_type="manual",
+                                     exclusion_records=[{"subject": "De Novo", "reason": "x"}]))
+
+
+def _segments(project):
+    return sorted(os.listdir(os.path.join(project, AUDIT_SEGMENT_DIR)))
+
+
+class TestRotation:
+
+    def test_rotates_by_size(self, project):
+        _fill(project)
+        segments = [name for name in _segments(project) if name.endswith(".jsonl")]
+        assert segments[0] == "audit_log.000001.jsonl"
+        assert len(segments) >= 3
+        active = os.path.join(project, "audit_log.jsonl")
+        assert 0 < os.path.getsize(active) <= audit.AUDIT_SEGMENT_MAX_BYTES
+
+        timestamps = [e["timestamp"] for e in read_log(project)]
+        assert len(timestamps) == 15
+        assert timestamps == sorted(timestamps)
+
+    def test_rotates_on_new_month(self, tmp_path):
+        project = str(tmp_path)
+        append_entry(project, _entry("review", "predicate_accepted", "K1", "2026-01-01T00:00:00Z"))
+        log_path = os.path.join(project, "audit_log.jsonl")
+        os.utime(log_path, (0, 0))  # last written in 1970
+        append_entry(project, _entry("review", "predicate_accepted", "K2", "2026-01-02T00:00:00Z"))
+        assert _segments(project) == ["audit_log.000001.jsonl"]
+        assert [e["subject"] for e in read_log(project)] == ["K1", "K2"]
+
+    def test_no_rotation_within_limits(self, tmp_path):
+        project = str(tmp_path)
+        for i in range(3):
+            append_entry(project, _entry("review", "predicate_accepted", f"K{i}", "2026-01-01T00:00:00Z"))
+        assert os.listdir(project) == ["audit_log.jsonl"]
+
+
+class TestIndexedQueries:
+
+    def test_query_matches_full_scan(self, project):
+        _fill(project)
+        all_entries = read_log(project)
+        for filters in ({"command": "pathway"},
+                        {"subject": "K000002", "after": "2026-02-01"},
+                        {"action": "predicate_accepted", "before": "2026-01-03"},
+                        {"exclusions_only": True},
+                        {"decisions_only": True, "after": "2026-03-02"},
+                        {"command": "review", "limit": 3}):
+            expected = [e for e in all_entries if audit._entry_matches(e, filters)]
+            if filters.get("limit"):
+                expected = expected[-filters["limit"]:]
+            assert query_log(project, filters) == expected, filters
+        assert "audit_log.000001.idx.json" in _segments(project)
+
+    def test_only_candidate_lines_parsed(self, project, monkeypatch):
+        _fill(project)
+        query_log(project, {})  # build the indexes
+        parsed = []
+        real_loads = json.loads
+
+        def counting_loads(raw, *args, **kwargs):
+            parsed.append(raw)
+            return real_loads(raw, *args, **kwargs)
+
+        monkeypatch.setattr(audit.json, "loads", counting_loads)
+        active_lines = len(open(os.path.join(project, "audit_log.jsonl")).readlines())
+        results = query_log(project, {"command": "pathway", "before": "2026-01-31"})
+        assert [e["timestamp"] for e in results] == ["2026-01-10T00:00:00Z"]
+        # Index files are str; log lines are bytes
+        assert len([raw for raw in parsed if isinstance(raw, bytes)]) == active_lines + 1
+
+    def test_limit_stops_at_newest_segments(self, project, monkeypatch):
+        _fill(project)
+        opened = []
+        real_load = audit._load_segment_index
+        monkeypatch.setattr(audit, "_load_segment_index",
+                            lambda path: opened.append(path) or real_load(path))
+        results = query_log(project, {"limit": 1})
+        assert results[0]["timestamp"] == "2026-03-10T00:00:00Z"
+        assert opened == []
+
+
+class TestSummary:
+
+    def test_summary_matches_full_scan(self, project):
+        _fill(project)
+        summary = summarize_log(project)
+        assert summary == audit._summarize_entries(read_log(project))
+        assert summary["total_entries"] == 15
+        assert summary["commands"] == {"review": 12, "pathway": 3}
+        assert summary["decision_types"] == {"auto": 12, "manual": 3, "deferred": 0}
+        assert summary["exclusions_documented"] == 3
+        assert summary["date_range"] == {"earliest": "2026-01-01T00:00:00Z",
+                                         "latest": "2026-03-10T00:00:00Z"}
+
+    def test_empty_log(self, tmp_path):
+        assert summarize_log(str(tmp_path))["total_entries"] == 0
+        assert query_log(str(tmp_path), {}) == []
+
+
+class TestIndexMaintenance:
+
+    def test_stale_index_rebuilt(self, project):
+        _fill(project)
+        query_log(project, {})
+        segment = os.path.join(project, AUDIT_SEGMENT_DIR, "audit_log.000001.jsonl")
+        # A writer that bypassed the logger appended to a sealed segment
+        with open(segment, "a", encoding="utf-8") as f:
+            f.write(json.dumps(_entry("safety", "risk_level_assigned", "DQY",
+                                      "2026-01-20T00:00:00Z")) + "\n")
+        assert len(query_log(project, {"command": "safety"})) == 1
+
+    def test_missing_index_and_malformed_lines(self, project):
+        _fill(project)
+        segment_dir = os.path.join(project, AUDIT_SEGMENT_DIR)
+        for name in os.listdir(segment_dir):
+            if name.endswith(".idx.json"):
+                os.remove(os.path.join(segment_dir, name))
+        with open(os.path.join(segment_dir, "audit_log.000001.jsonl"), "a") as f:
+            f.write("{not json\n\n")
+        assert len(query_log(project, {"command": "review"})) == 12
+        assert summarize_log(project)["total_entries"] == 15
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tests for the validate_session() fast path in lib/auth.py.
+
+Tests cover:
+    1. Cache hits served without a session lookup
+    2. Logout and revocation (same or other connection) taking effect at once
+    3. Idle and absolute expiry enforced on cached sessions
+    4. Coalesced write-behind of last_activity
+    5. Per-thread pooled WAL connections
+
+Users are inserted directly so the tests do not need argon2 or bcrypt.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from fda_tools.lib import auth as auth_module
+from fda_tools.lib.auth import AuditEventType, AuthManager, Role
+
+
+@pytest.fixture
+def temp_db_dir(tmp_path, monkeypatch):
+    """Create temporary directory for test databases."""
+    db_dir = tmp_path / '.fda-tools'
+    db_dir.mkdir()
+
+    monkeypatch.setattr('fda_tools.lib.auth.FDA_TOOLS_DIR', db_dir)
+    monkeypatch.setattr('fda_tools.lib.auth.USERS_DB_PATH', db_dir / 'users.db')
+    monkeypatch.setattr('fda_tools.lib.auth.AUDIT_DB_PATH', db_dir / 'audit.db')
+
+    return db_dir
+
+
+@pytest.fixture
+def auth_manager(temp_db_dir):
+    """AuthManager with one user, closed after the test."""
+    manager = AuthManager()
+    now = datetime.now().isoformat()
+    conn = sqlite3.connect(auth_module.USERS_DB_PATH)
+    conn.execute("""
+        INSERT INTO users (username, email, full_name, role, password_hash,
+                           last_password_change, created_at, updated_at)
+        VALUES ('testuser', 'testuser@company.com', 'Test User', ?, 'unused', ?, ?, ?)
+    """, (Role.ANALYST.value, now, now, now))
+    conn.commit()
+    conn.close()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def session(auth_manager):
+    return auth_manager._create_session(1)
+
+
+@pytest.fixture
+def lookups(auth_manager, monkeypatch):
+    """Count session-table lookups made by validate_session()."""
+    calls = []
+    real_lookup = auth_manager._get_session_by_token
+    monkeypatch.setattr(auth_manager, '_get_session_by_token',
+                        lambda token: calls.append(token) or real_lookup(token))
+    return calls
+
+
+def _session_row(session_id):
+    conn = sqlite3.connect(auth_module.USERS_DB_PATH)
+    conn.row_factory = sqlite3.Row
+    row = conn.execute("SELECT * FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+    conn.close()
+    return row
+
+
+def _shift_clock(monkeypatch, delta):
+    class ShiftedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + delta
+
+    monkeypatch.setattr(auth_module, 'datetime', ShiftedDatetime)
+
+
+class TestSessionCache:
+    """Validated sessions are served from memory until something changes."""
+
+    def test_cache_hit_skips_lookup(self, auth_manager, session, lookups):
+        user = auth_manager.validate_session(session.token)
+        assert user.username == "testuser"
+        assert auth_manager.validate_session(session.token) is user
+        assert auth_manager.validate_session(session.token) is user
+        assert lookups == [session.token]
+
+    def test_invalid_token_not_cached(self, auth_manager, lookups):
+        assert auth_manager.validate_session("invalid_token") is None
+        assert auth_manager.validate_session("invalid_token") is None
+        assert len(lookups) == 2
+
+    def test_logout_invalidates(self, auth_manager, session):
+        assert auth_manager.validate_session(session.token) is not None
+        assert auth_manager.logout(session.token)
+        assert auth_manager.validate_session(session.token) is None
+
+    def test_revocation_by_other_manager(self, auth_manager, session):
+        """Another process revoking sessions empties this cache."""
+        assert auth_manager.validate_session(session.token) is not None
+        other = AuthManager()
+        assert other.revoke_all_sessions(1) == 1
+        assert auth_manager.validate_session(session.token) is None
+
+    def test_user_update_refreshes_cached_user(self, auth_manager, session):
+        assert auth_manager.validate_session(session.token).email == "testuser@company.com"
+        auth_manager.update_user(1, email="new@company.com")
+        assert auth_manager.validate_session(session.token).email == "new@company.com"
+
+    def test_ttl_expiry(self, auth_manager, session, lookups, monkeypatch):
+        auth_manager.validate_session(session.token)
+        monkeypatch.setattr(auth_module, 'SESSION_CACHE_TTL_SECONDS', 0)
+        assert auth_manager.validate_session(session.token) is not None
+        assert len(lookups) == 2
+
+
+class TestExpiry:
+    """Expiry is evaluated on every call, cached or not."""
+
+    def test_idle_timeout_on_cached_session(self, auth_manager, session, monkeypatch):
+        assert auth_manager.validate_session(session.token) is not None
+        _shift_clock(monkeypatch, timedelta(minutes=auth_module.SESSION_TIMEOUT_MINUTES + 1))
+        assert auth_manager.validate_session(session.token) is None
+        assert _session_row(session.session_id) is None
+        events = auth_manager.get_audit_events(event_type=AuditEventType.SESSION_EXPIRED)
+        assert events[0].details['reason'] == 'timeout'
+
+    def test_deferred_activity_extends_idle_timeout(self, auth_manager, session, monkeypatch):
+        """A session kept alive by cache hits is not expired by a stale row."""
+        auth_manager.validate_session(session.token)
+        monkeypatch.setattr(auth_module, 'SESSION_CACHE_TTL_SECONDS', 3600)
+        _shift_clock(monkeypatch, timedelta(minutes=20))
+        assert auth_manager.validate_session(session.token) is not None
+        _shift_clock(monkeypatch, timedelta(minutes=40))
+        # Drop the cache: the row's expires_at is still from minute 0
+        auth_manager._local.sessions.clear()
+        assert auth_manager.validate_session(session.token) is not None
+
+    def test_absolute_timeout(self, auth_manager, session, monkeypatch):
+        auth_manager.validate_session(session.token)
+        monkeypatch.setattr(auth_module, 'SESSION_CACHE_TTL_SECONDS', 10 ** 6)
+        for minutes in range(20, auth_module.SESSION_ABSOLUTE_TIMEOUT_HOURS * 60, 20):
+            _shift_clock(monkeypatch, timedelta(minutes=minutes))
+            assert auth_manager.validate_session(session.token) is not None
+        _shift_clock(monkeypatch, timedelta(hours=auth_module.SESSION_ABSOLUTE_TIMEOUT_HOURS,
+                                            minutes=1))
+        assert auth_manager.validate_session(session.token) is None
+
+
+class TestWriteBehind:
+    """last_activity updates from cache hits are coalesced."""
+
+    def test_miss_writes_through(self, auth_manager, session):
+        before = _session_row(session.session_id)['last_activity']
+        auth_manager.validate_session(session.token)
+        assert _session_row(session.session_id)['last_activity'] > before
+
+    def test_hits_coalesced(self, auth_manager, session):
+        auth_manager.validate_session(session.token)
+        written = _session_row(session.session_id)['last_activity']
+        for _ in range(5):
+            auth_manager.validate_session(session.token)
+        assert _session_row(session.session_id)['last_activity'] == written
+
+        assert auth_manager.flush_session_activity() == 1
+        assert _session_row(session.session_id)['last_activity'] > written
+        assert auth_manager.flush_session_activity() == 0
+
+    def test_flush_interval(self, auth_manager, session, monkeypatch):
+        auth_manager.validate_session(session.token)
+        monkeypatch.setattr(auth_module, 'ACTIVITY_FLUSH_INTERVAL_SECONDS', 0)
+        written = _session_row(session.session_id)['last_activity']
+        auth_manager.validate_session(session.token)
+        assert _session_row(session.session_id)['last_activity'] > written
+
+    def test_close_flushes(self, auth_manager, session):
+        auth_manager.validate_session(session.token)
+        auth_manager.validate_session(session.token)
+        auth_manager.close()
+        assert auth_manager._pending_activity == {}
+
+
+class TestPooledConnections:
+    """Each thread reuses one WAL connection."""
+
+    def test_connection_reused_per_thread(self, auth_manager, session):
+        conn = auth_manager._users_conn()
+        assert auth_manager._users_conn() is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        results = {}
+
+        def worker():
+            results['conn'] = auth_manager._users_conn()
+            results['user'] = auth_manager.validate_session(session.token)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert results['conn'] is not conn
+        assert results['user'].username == "testuser"
@@ -23,6 +23,15 @@ pytest.importorskip("httpx", reason="httpx not installed (required by TestClient
 
 from fastapi.testclient import TestClient  # noqa: E402
 
+from fda_tools.lib.quantile_sketch import QuantileSketch  # noqa: E402
+
+
+def _durations(values):
+    """Build a response-duration sketch as the bridge middleware records it."""
+    sketch = QuantileSketch()
+    sketch.update(values)
+    return sketch
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -36,7 +45,8 @@ def _reset_server_state():
 
     srv._total_requests = 0
     srv._total_errors = 0
-    srv._request_durations_ms = []
+    srv._request_durations_ms = QuantileSketch()
+    srv._prev_request_durations_ms = QuantileSketch()
     srv._last_request_time = None
     srv._consecutive_health_failures = 0
     # Provide a dummy API key so auth works in tests
@@ -143,7 +153,7 @@ class TestHealthEndpoint:
 
         srv._total_requests = 0
         srv._total_errors = 0
-        srv._request_durations_ms = []
+        srv._request_durations_ms = QuantileSketch()
         srv._consecutive_health_failures = 0
         data = client.get("/health").json()
         assert data["status"] == "healthy"
@@ -304,7 +314,7 @@ class TestCheckAlerts:
 
         srv._total_requests = 0
         srv._total_errors = 0
-        srv._request_durations_ms = []
+        srv._request_durations_ms = QuantileSketch()
         srv._consecutive_health_failures = 0
         assert self._alerts() == []
 
@@ -313,7 +323,7 @@ class TestCheckAlerts:
 
         srv._total_requests = 100
         srv._total_errors = 50  # 50% > 10% threshold
-        srv._request_durations_ms = []
+        srv._request_durations_ms = QuantileSketch()
         srv._consecutive_health_failures = 0
         alerts = self._alerts()
         assert any(a["type"] == "high_error_rate" for a in alerts)
@@ -323,7 +333,7 @@ class TestCheckAlerts:
 
         srv._total_requests = 100
         srv._total_errors = 5  # 5% < 10%
-        srv._request_durations_ms = []
+        srv._request_durations_ms = QuantileSketch()
         srv._consecutive_health_failures = 0
         assert self._alerts() == []
 
@@ -333,7 +343,7 @@ class TestCheckAlerts:
         # p95 will be > 5000ms threshold
         srv._total_requests = 0
         srv._total_errors = 0
-        srv._request_durations_ms = [6000.0] * 100  # All 6s
+        srv._request_durations_ms = _durations([6000.0] * 100)  # All 6s
         srv._consecutive_health_failures = 0
         alerts = self._alerts()
         assert any(a["type"] == "slow_responses" for a in alerts)
@@ -343,7 +353,7 @@ class TestCheckAlerts:
 
         srv._total_requests = 0
         srv._total_errors = 0
-        srv._request_durations_ms = [100.0] * 100  # All 100ms
+        srv._request_durations_ms = _durations([100.0] * 100)  # All 100ms
         srv._consecutive_health_failures = 0
         assert self._alerts() == []
 
@@ -352,7 +362,7 @@ class TestCheckAlerts:
 
         srv._total_requests = 0
         srv._total_errors = 0
-        srv._request_durations_ms = []
+        srv._request_durations_ms = QuantileSketch()
         srv._consecutive_health_failures = 5  # >= 3 threshold
         alerts = self._alerts()
         assert any(a["type"] == "consecutive_health_failures" for a in alerts)
@@ -362,7 +372,7 @@ class TestCheckAlerts:
 
         srv._total_requests = 0
         srv._total_errors = 0
-        srv._request_durations_ms = []
+        srv._request_durations_ms = QuantileSketch()
         srv._consecutive_health_failures = 2  # < 3 threshold
         assert self._alerts() == []
 
@@ -371,7 +381,7 @@ class TestCheckAlerts:
 
         srv._total_requests = 100
         srv._total_errors = 50  # High error rate
-        srv._request_durations_ms = [6000.0] * 100  # Slow responses
+        srv._request_durations_ms = _durations([6000.0] * 100)  # Slow responses
         srv._consecutive_health_failures = 10  # Many failures
         alerts = self._alerts()
         alert_types = {a["type"] for a in alerts}
@@ -384,7 +394,7 @@ class TestCheckAlerts:
 
         srv._total_requests = 100
         srv._total_errors = 50
-        srv._request_durations_ms = []
+        srv._request_durations_ms = QuantileSketch()
         srv._consecutive_health_failures = 0
         alerts = self._alerts()
         alert = next(a for a in alerts if a["type"] == "high_error_rate")
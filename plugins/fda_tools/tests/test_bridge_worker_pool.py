@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for bridge/worker_pool.py -- warm worker pool for /execute.
+
+Tests cover:
+- Running scripts in-process with argv, stdout/stderr and exit codes
+- Worker reuse and per-job restoration of interpreter state (incl. logging)
+- Timeouts (one deadline for waiting plus running) killing and replacing the worker
+- Recycling after max_jobs, crash and dead-worker recovery, and the scripts-dir allowlist
+"""
+
+import threading
+import time
+
+import pytest
+
+from fda_tools.bridge.worker_pool import WarmWorkerPool
+from fda_tools.lib.subprocess_helpers import SubprocessAllowlistError, SubprocessTimeoutError
+
+
+@pytest.fixture
+def scripts_dir(tmp_path):
+    scripts = tmp_path / "scripts"
+    scripts.mkdir()
+    (scripts / "echo_args.py").write_text(
+        "import os, sys\n"
+        "print('args:', sys.argv[1:])\n"
+        "print('warning', file=sys.stderr)\n"
+        "os.environ['LEAKED'] = '1'\n"
+        "if __name__ == '__main__' and '--fail' in sys.argv:\n"
+        "    sys.exit(3)\n"
+    )
+    (scripts / "pid.py").write_text("import os\nprint(os.getpid(), os.environ.get('LEAKED'))\n")
+    (scripts / "sleepy.py").write_text("import time\ntime.sleep(30)\n")
+    (scripts / "boom.py").write_text("raise RuntimeError('boom')\n")
+    (scripts / "hard_exit.py").write_text("import os\nos._exit(7)\n")
+    (scripts / "nap.py").write_text("import sys, time\ntime.sleep(float(sys.argv[1]))\n")
+    (scripts / "log_info.py").write_text(
+        "import logging, sys\n"
+        "logging.basicConfig(level=logging.INFO)\n"
+        "logging.info('job %s', sys.argv[1])\n"
+    )
+    return scripts
+
+
+@pytest.fixture
+def pool(scripts_dir):
+    pool = WarmWorkerPool(scripts_dir=scripts_dir, cwd=scripts_dir.parent, size=1,
+                          max_jobs=100, preload=())
+    yield pool
+    pool.shutdown()
+
+
+class TestWarmWorkerPool:
+
+    def test_runs_script_with_args_and_exit_code(self, pool, scripts_dir):
+        result = pool.run(scripts_dir / "echo_args.py", ["--product-code", "DQY"], timeout=30)
+        assert result.returncode == 0
+        assert "args: ['--product-code', 'DQY']" in result.stdout
+        assert result.stderr == "warning\n"
+
+        failed = pool.run(scripts_dir / "echo_args.py", ["--fail"], timeout=30)
+        assert failed.returncode == 3
+
+        crashed = pool.run(scripts_dir / "boom.py", [], timeout=30)
+        assert crashed.returncode == 1
+        assert "RuntimeError: boom" in crashed.stderr
+
+    def test_worker_reused_and_state_restored(self, pool, scripts_dir):
+        first = pool.run(scripts_dir / "pid.py", [], timeout=30).stdout.split()
+        pool.run(scripts_dir / "echo_args.py", [], timeout=30)
+        second = pool.run(scripts_dir / "pid.py", [], timeout=30).stdout.split()
+        assert first[0] == second[0]  # same warm process
+        assert second[1] == "None"  # env change from the previous job rolled back
+        assert pool.get_stats()["jobs"] == 3
+
+    def test_logging_config_restored_between_jobs(self, pool, scripts_dir):
+        first = pool.run(scripts_dir / "log_info.py", ["1"], timeout=30)
+        second = pool.run(scripts_dir / "log_info.py", ["2"], timeout=30)
+        assert first.stderr == "INFO:root:job 1\n"
+        assert second.stderr == "INFO:root:job 2\n"
+
+    def test_timeout_covers_wait_and_run(self, pool, scripts_dir):
+        busy = threading.Thread(target=pool.run, args=(scripts_dir / "nap.py", ["1.0"]),
+                                kwargs={"timeout": 30})
+        busy.start()
+        time.sleep(0.05)
+        # ~0.95s waiting for the worker leaves ~0.55s for a 1s job
+        with pytest.raises(SubprocessTimeoutError):
+            pool.run(scripts_dir / "nap.py", ["1.0"], timeout=1.5)
+        busy.join()
+
+    def test_timeout_replaces_worker(self, pool, scripts_dir):
+        before = pool.run(scripts_dir / "pid.py", [], timeout=30).stdout.split()[0]
+        with pytest.raises(SubprocessTimeoutError):
+            pool.run(scripts_dir / "sleepy.py", [], timeout=0.5)
+        after = pool.run(scripts_dir / "pid.py", [], timeout=30).stdout.split()[0]
+        assert before != after
+        assert pool.get_stats()["timeouts"] == 1
+
+    def test_recycles_after_max_jobs(self, scripts_dir):
+        pool = WarmWorkerPool(scripts_dir=scripts_dir, cwd=scripts_dir, size=1, max_jobs=2, preload=())
+        try:
+            pids = [pool.run(scripts_dir / "pid.py", [], timeout=30).stdout.split()[0] for _ in range(3)]
+            assert pids[0] == pids[1] != pids[2]
+            assert pool.get_stats()["recycled"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_hard_exit_recovered(self, pool, scripts_dir):
+        result = pool.run(scripts_dir / "hard_exit.py", [], timeout=30)
+        assert result.returncode == 7
+        assert pool.run(scripts_dir / "pid.py", [], timeout=30).returncode == 0
+        assert pool.get_stats()["crashes"] == 1
+
+    def test_dead_idle_worker_replaced(self, pool, scripts_dir):
+        pool.start()
+        dead = pool._idle.queue[0]
+        dead.kill()
+        assert pool.run(scripts_dir / "pid.py", [], timeout=30).stdout.split()[0] != str(dead.process.pid)
+        assert dead.conn.closed
+
+    def test_no_worker_timeout_has_no_context(self, pool, scripts_dir):
+        busy = threading.Thread(target=pool.run, args=(scripts_dir / "nap.py", ["0.5"]),
+                                kwargs={"timeout": 30})
+        busy.start()
+        time.sleep(0.05)
+        with pytest.raises(SubprocessTimeoutError) as excinfo:
+            pool.run(scripts_dir / "pid.py", [], timeout=0.1)
+        busy.join()
+        assert excinfo.value.__suppress_context__
+
+    def test_allowlist(self, pool, scripts_dir, tmp_path):
+        outside = tmp_path / "outside.py"
+        outside.write_text("print('nope')\n")
+        with pytest.raises(SubprocessAllowlistError):
+            pool.run(outside, [], timeout=5)
+        with pytest.raises(SubprocessAllowlistError):
+            pool.run(scripts_dir / ".." / "outside.py", [], timeout=5)
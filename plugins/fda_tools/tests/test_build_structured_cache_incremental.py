@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental, parallel builds in scripts/build_structured_cache.py.
+
+Tests cover:
+- Incremental builds skipping documents with unchanged source text
+- Resuming an interrupted build from the per-document checkpoint
+- Section detection across a process pool
+- Legacy metadata enrichment with batched 510(k) queries
+"""
+
+import json
+
+import pytest
+
+build_structured_cache = pytest.importorskip("build_structured_cache")
+
+TEXT = "DEVICE DESCRIPTION\nA titanium bone screw with PEEK washer.\nINDICATIONS FOR USE\nFixation.\n"
+
+
+def _per_device_cache(tmp_path, count):
+    cache_dir = tmp_path / "cache"
+    (cache_dir / "devices").mkdir(parents=True)
+    index = {}
+    for i in range(count):
+        k_number = f"K21{i:04d}"
+        (cache_dir / "devices" / f"{k_number}.json").write_text(json.dumps({"text": TEXT * (i + 1)}))
+        index[k_number] = {"file_path": f"cache/devices/{k_number}.json"}
+    (cache_dir / "index.json").write_text(json.dumps(index))
+    return cache_dir / "index.json"
+
+
+def _build(index_file, output, **kwargs):
+    return build_structured_cache.build_structured_cache(index_file, output, update_index=False, **kwargs)
+
+
+class TestIncrementalBuild:
+
+    def test_unchanged_documents_skipped(self, tmp_path):
+        index_file = _per_device_cache(tmp_path, 4)
+        output = tmp_path / "structured"
+        assert _build(index_file, output) == {"structured": 4, "unchanged": 0}
+        assert _build(index_file, output, incremental=True) == {"structured": 0, "unchanged": 4}
+
+        (index_file.parent / "devices" / "K210002.json").write_text(json.dumps({"text": "changed " + TEXT}))
+        (output / "K210003.json").unlink()
+        assert _build(index_file, output, incremental=True) == {"structured": 2, "unchanged": 2}
+        assert json.loads((output / "K210002.json").read_text())["full_text"].startswith("changed")
+
+        # A full build ignores the recorded fingerprints
+        assert _build(index_file, output) == {"structured": 4, "unchanged": 0}
+        assert len(build_structured_cache.load_build_state(output)) == 4
+
+    def test_interrupted_build_resumes(self, tmp_path, monkeypatch):
+        index_file = _per_device_cache(tmp_path, 5)
+        output = tmp_path / "structured"
+        real_detect = build_structured_cache.detect_sections
+        calls = []
+
+        def failing_detect(text, *args, **kwargs):
+            calls.append(text)
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            return real_detect(text, *args, **kwargs)
+
+        monkeypatch.setattr(build_structured_cache, "detect_sections", failing_detect)
+        with pytest.raises(KeyboardInterrupt):
+            _build(index_file, output)
+        assert len(build_structured_cache.load_build_state(output)) == 2
+
+        monkeypatch.setattr(build_structured_cache, "detect_sections", real_detect)
+        assert _build(index_file, output, incremental=True) == {"structured": 3, "unchanged": 2}
+
+    def test_process_pool_matches_serial(self, tmp_path):
+        index_file = _per_device_cache(tmp_path, 6)
+        serial, parallel = tmp_path / "serial", tmp_path / "parallel"
+        _build(index_file, serial)
+        assert _build(index_file, parallel, workers=2)["structured"] == 6
+        for path in serial.glob("K*.json"):
+            expected = json.loads(path.read_text())
+            actual = json.loads((parallel / path.name).read_text())
+            assert actual["sections"] == expected["sections"]
+            assert actual["source_fingerprint"] == expected["source_fingerprint"]
+
+
+class TestLegacyMetadataBatching:
+
+    def test_metadata_fetched_in_batches(self, tmp_path, monkeypatch):
+        calls = []
+
+        class FakeClient:
+            def batch_510k(self, k_numbers, limit=None):
+                calls.append(list(k_numbers))
+                return {"results": [{"k_number": k, "product_code": "DQY"} for k in k_numbers
+                                    if k != "K200001"]}
+
+        monkeypatch.setattr(build_structured_cache, "FDAClient", FakeClient)
+        legacy = tmp_path / "pdf_data.json"
+        legacy.write_text(json.dumps({f"K20000{i}.pdf": {"text": TEXT} for i in range(5)}))
+        output = tmp_path / "structured"
+
+        counts = build_structured_cache.build_structured_cache(
+            legacy, output, source_type="legacy", update_index=False)
+        assert counts["structured"] == 5
+        assert calls == [[f"K20000{i}" for i in range(5)]]
+        assert json.loads((output / "K200000.json").read_text())["metadata"] == {"product_code": "DQY"}
+        assert json.loads((output / "K200001.json").read_text())["metadata"] == {}
+
+    def test_failed_enrichment_retried_incrementally(self, tmp_path, monkeypatch):
+        calls = []
+
+        class FakeClient:
+            def batch_510k(self, k_numbers, limit=None):
+                calls.append(list(k_numbers))
+                if len(calls) == 1:
+                    raise ConnectionError("openFDA unavailable")
+                return {"results": [{"k_number": k, "product_code": "DQY"} for k in k_numbers]}
+
+        monkeypatch.setattr(build_structured_cache, "FDAClient", FakeClient)
+        legacy = tmp_path / "pdf_data.json"
+        legacy.write_text(json.dumps({f"K20000{i}.pdf": {"text": TEXT} for i in range(3)}))
+        output = tmp_path / "structured"
+
+        assert _build(legacy, output, source_type="legacy") == {"structured": 3, "unchanged": 0}
+        assert json.loads((output / "K200000.json").read_text())["metadata"] == {}
+        assert build_structured_cache.load_build_state(output) == {}
+
+        assert _build(legacy, output, source_type="legacy", incremental=True) == {"structured": 3, "unchanged": 0}
+        assert json.loads((output / "K200000.json").read_text())["metadata"] == {"product_code": "DQY"}
+        assert _build(legacy, output, source_type="legacy", incremental=True) == {"structured": 0, "unchanged": 3}
+
+    def test_enrich_metadata_batch_splits(self):
+        class FakeClient:
+            def __init__(self):
+                self.calls = []
+
+            def batch_510k(self, k_numbers, limit=None):
+                self.calls.append(k_numbers)
+                return {"results": [{"k_number": k, "review_advisory_committee": "CV"} for k in k_numbers]}
+
+        client = FakeClient()
+        result = build_structured_cache.enrich_metadata_batch(
+            [f"K{i:06d}" for i in range(5)], client, batch_size=2)
+        assert [len(batch) for batch in client.calls] == [2, 2, 1]
+        assert result["K000004"] == {"review_panel": "CV"}
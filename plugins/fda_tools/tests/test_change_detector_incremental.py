@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Tests for watermark-based incremental detection in scripts/change_detector.py.
+
+Tests cover:
+- First run syncing untracked product codes in full, in OR'd batches
+- Later runs querying only the window after the stored watermarks
+- Fingerprints and watermarks saved together in fingerprints.db
+- Fingerprints from detect_changes() seeding the clearance watermark
+- API failures leaving the previous state untouched
+"""
+
+import json
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+import change_detector
+from change_detector import (
+    CLEARANCE_WATERMARK,
+    RECALL_WATERMARK,
+    _load_watermarks_sqlite,
+    detect_changes_incremental,
+)
+from fda_api_client import RecordIterationError
+from fda_data_store import load_manifest
+
+
+class FakeClient:
+    """iter_pages() over canned records, filtered like the openFDA search."""
+
+    def __init__(self, clearances=(), recalls=()):
+        self.records = {"510k": list(clearances), "recall": list(recalls)}
+        self.searches = []
+        self.fail = False
+
+    def iter_pages(self, endpoint, search=None, sort=None, **kwargs):
+        self.searches.append((endpoint, search))
+        if self.fail:
+            raise RecordIterationError("boom")
+        date_field = sort.split(":")[0]
+        codes = {part.split('"')[1] for part in search.split("+OR+")}
+        since = search.split(":[")[1][:8] if ":[" in search else ""
+        page = [r for r in self.records[endpoint]
+                if r["product_code"] in codes and r[date_field].replace("-", "") >= since]
+        if page:
+            yield page
+
+
+def _clearance(k_number, product_code, decision_date):
+    return {"k_number": k_number, "product_code": product_code,
+            "decision_date": decision_date, "device_name": f"Device {k_number}"}
+
+
+def _recall(recall_id, product_code, posted):
+    return {"product_res_number": recall_id, "product_code": product_code,
+            "event_date_posted": posted}
+
+
+@pytest.fixture
+def project(tmp_path):
+    project_dir = tmp_path / "proj"
+    project_dir.mkdir()
+    (project_dir / "data_manifest.json").write_text(json.dumps({
+        "project": "proj", "product_codes": ["DQY", "OVE", "GEI"], "queries": {},
+    }))
+    with patch("change_detector.get_projects_dir", return_value=str(tmp_path)):
+        yield str(project_dir)
+
+
+def _detect(client, **kwargs):
+    return detect_changes_incremental("proj", client=client, **kwargs)
+
+
+class TestIncrementalDetection:
+
+    def test_first_run_full_sync_in_one_batch(self, project):
+        client = FakeClient(
+            clearances=[_clearance("K250001", "DQY", "2025-03-01"),
+                        _clearance("K250002", "OVE", "2025-04-01"),
+                        _clearance("K250003", "DQY", "2025-05-01")],
+            recalls=[_recall("Z-1", "DQY", "2025-02-01")],
+        )
+        result = _detect(client)
+        assert result["status"] == "completed"
+        assert result["total_new_clearances"] == 3
+        assert result["total_new_recalls"] == 1
+        assert [endpoint for endpoint, _ in client.searches] == ["510k", "recall"]
+        assert ":[" not in client.searches[0][1]
+
+        assert _load_watermarks_sqlite(project) == {
+            CLEARANCE_WATERMARK: "20250501", RECALL_WATERMARK: "20250201"}
+        fp = load_manifest(project)["fingerprints"]["DQY"]
+        assert fp["known_k_numbers"] == ["K250001", "K250003"]
+        assert fp["latest_k_number"] == "K250003"
+        assert fp["clearance_count"] == 2
+        assert fp["known_recall_ids"] == ["Z-1"]
+
+    def test_second_run_queries_window_only(self, project):
+        client = FakeClient(clearances=[_clearance("K250001", "DQY", "2025-03-01")],
+                            recalls=[_recall("Z-1", "DQY", "2025-02-01")])
+        _detect(client)
+
+        client.records["510k"].append(_clearance("K250010", "GEI", "2025-06-01"))
+        client.records["recall"].append(_recall("Z-2", "OVE", "2025-06-02"))
+        client.searches.clear()
+        result = _detect(client)
+
+        assert result["total_new_clearances"] == 1
+        assert result["changes"][0]["product_code"] == "GEI"
+        assert result["total_new_recalls"] == 1
+        assert len(client.searches) == 2
+        for endpoint, search in client.searches:
+            assert search.count("product_code:") == 3
+        # Window reopens WATERMARK_LOOKBACK_DAYS before the watermark
+        assert "decision_date:[20250115+TO+" in client.searches[0][1]
+        assert _load_watermarks_sqlite(project)[CLEARANCE_WATERMARK] == "20250601"
+        fp = load_manifest(project)["fingerprints"]["OVE"]
+        assert fp["recall_count"] == 1
+        assert fp["known_recall_ids"] == ["Z-2"]
+
+        client.searches.clear()
+        assert _detect(client)["changes"] == []
+
+    def test_product_codes_batched(self, project, monkeypatch):
+        monkeypatch.setattr(change_detector, "OR_BATCH_SIZE", 2)
+        client = FakeClient()
+        _detect(client)
+        assert len([s for e, s in client.searches if e == "510k"]) == 2
+
+    def test_legacy_fingerprint_seeds_watermark(self, project):
+        manifest = load_manifest(project)
+        manifest["product_codes"] = ["DQY"]
+        manifest["fingerprints"] = {"DQY": {
+            "clearance_count": 149, "latest_k_number": "K251234",
+            "latest_decision_date": "20260115", "recall_count": 3,
+            "known_k_numbers": ["K251234"],
+        }}
+        (change_detector.Path(project) / "data_manifest.json").write_text(json.dumps(manifest))
+        client = FakeClient(clearances=[_clearance("K251234", "DQY", "2026-01-15"),
+                                        _clearance("K260001", "DQY", "2026-02-01")])
+        result = _detect(client)
+
+        assert "decision_date:[20251201+TO+" in client.searches[0][1]
+        assert result["total_new_clearances"] == 1
+        assert result["changes"][0]["details"] == {"previous_total": 149, "current_total": 150}
+        # No recall IDs were known yet: recalls are recounted in full
+        assert ":[" not in client.searches[1][1]
+        assert result["total_new_recalls"] == 0
+
+    def test_failure_leaves_state_untouched(self, project):
+        client = FakeClient(clearances=[_clearance("K250001", "DQY", "2025-03-01")])
+        _detect(client)
+        before = load_manifest(project)["fingerprints"]
+
+        client.fail = True
+        result = _detect(client)
+        assert result["status"] == "error"
+        assert load_manifest(project)["fingerprints"] == before
+        assert _load_watermarks_sqlite(project)[CLEARANCE_WATERMARK] == "20250301"
+
+    def test_state_written_in_one_transaction(self, project, monkeypatch):
+        client = FakeClient(clearances=[_clearance("K250001", "DQY", "2025-03-01")])
+        _detect(client)
+
+        real_init = change_detector._init_sqlite_db
+
+        class FailingConnection:
+            def __init__(self, conn):
+                self.conn = conn
+
+            def __getattr__(self, name):
+                return getattr(self.conn, name)
+
+            def __enter__(self):
+                return self.conn.__enter__()
+
+            def __exit__(self, *exc):
+                return self.conn.__exit__(*exc)
+
+            def executemany(self, sql, rows):
+                if "watermarks" in sql:
+                    raise sqlite3.OperationalError("disk I/O error")
+                return self.conn.executemany(sql, rows)
+
+        monkeypatch.setattr(change_detector, "_init_sqlite_db",
+                            lambda path: FailingConnection(real_init(path)))
+        client.records["510k"].append(_clearance("K250002", "OVE", "2025-04-01"))
+        assert _detect(client)["status"] == "error"
+
+        monkeypatch.setattr(change_detector, "_init_sqlite_db", real_init)
+        fingerprints = change_detector._list_fingerprints_sqlite(project)
+        assert fingerprints["OVE"]["known_k_numbers"] == []
+        assert os.path.exists(os.path.join(project, "fingerprints.db"))
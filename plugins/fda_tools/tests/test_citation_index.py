@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for lib/citation_index.py -- Aho-Corasick reverse citation index.
+
+Tests cover:
+- Automaton matches equal to per-pattern substring checks (overlaps, shared
+  prefixes, patterns that are suffixes of others)
+- Cites / cited-by maps built in one pass over a corpus
+- Re-indexing a document replaces its previous citations
+"""
+
+import random
+
+from fda_tools.lib.citation_index import AhoCorasick, CitationIndex
+
+
+class TestAhoCorasick:
+
+    def test_overlapping_and_nested_patterns(self):
+        matcher = AhoCorasick(["K123456", "K1234567", "234567", "DEN200045", "N1234", ""])
+        assert matcher.find_all("see K1234567 and DEN2000456") == {
+            "K123456", "K1234567", "234567", "DEN200045"}
+        assert matcher.find_all("k123456 lowercase") == set()
+        assert matcher.find_all("") == set()
+
+    def test_matches_substring_scan(self):
+        rng = random.Random(3)
+        patterns = [rng.choice("KPN") + "".join(rng.choice("0123") for _ in range(rng.randint(3, 6)))
+                    for _ in range(300)]
+        matcher = AhoCorasick(patterns)
+        for _ in range(50):
+            text = "".join(rng.choice("KPN0123 x") for _ in range(400))
+            assert matcher.find_all(text) == {p for p in patterns if p in text}
+
+    def test_no_patterns(self):
+        assert AhoCorasick([]).find_all("K123456") == set()
+
+
+class TestCitationIndex:
+
+    def test_from_documents(self):
+        pdf_data = {
+            "/pdfs/K241335.pdf": "Predicate: K190001. Reference K200002.",
+            "/pdfs/K200002.pdf": "This is K200002; predicate K190001.",
+            "/pdfs/K190001.pdf": None,
+        }
+        index = CitationIndex.from_documents(pdf_data, doc_id=lambda p: p.rsplit("/", 1)[-1][:-4])
+
+        assert len(index) == 3
+        assert index.cited_by("K190001") == ["K200002", "K241335"]
+        assert index.cited_by("K200002") == ["K241335"]  # self-mention excluded
+        assert index.citations("K241335") == ["K190001", "K200002"]
+        assert index.citations("K190001") == []
+        assert index.cited_by_map() == {"K190001": ["K200002", "K241335"],
+                                        "K200002": ["K241335"]}
+
+    def test_known_numbers_beyond_corpus(self):
+        index = CitationIndex.from_documents({"K1": "cites P170019 and K999999"},
+                                             device_numbers=["P170019", "K888888"])
+        assert index.citations("K1") == ["P170019"]
+
+    def test_reindex_replaces_citations(self):
+        index = CitationIndex(["K111111", "K222222"])
+        index.add_document("K300000", "K111111")
+        index.add_document("K300000", "K222222")
+        assert index.cited_by("K111111") == []
+        assert index.cited_by("K222222") == ["K300000"]
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests for OR-batching of single-record lookups in FDAClient.
+
+Tests cover:
+- prefetch_510k() fusing K-numbers into OR queries and priming per-ID cache
+- Not-found IDs cached as empty results only for complete batch responses
+- Expired entries re-batched rather than left to single lookups
+- Degraded batches leaving IDs to the single lookup
+- Micro-batch window coalescing concurrent get_510k() threads
+- UnifiedPredicateAnalyzer.analyze_batch and FDAEnrichment batch prefetch
+"""
+
+import json
+import threading
+import time
+import urllib.parse
+from unittest.mock import patch
+
+from fda_tools.lib.fda_enrichment import FDAEnrichment
+from fda_tools.scripts.fda_api_client import FDAClient
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+        self.headers = {}
+
+    def read(self):
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+
+class _OpenFDATransport:
+    """Answers k_number OR queries from a fixed record set."""
+
+    def __init__(self, known, delay=0.0, truncate=None):
+        self.known = set(known)
+        self.delay = delay
+        self.truncate = truncate
+        self.searches = []
+        self._lock = threading.Lock()
+
+    def open(self, url, headers=None, timeout=15):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+        search = query["search"][0]
+        with self._lock:
+            self.searches.append(search)
+        if self.delay:
+            time.sleep(self.delay)
+        ids = [part.split('"')[1] for part in search.split(" OR ")]
+        hits = [{"k_number": k, "device_name": f"Device {k}"} for k in ids if k in self.known]
+        total = len(hits)
+        if self.truncate is not None:
+            hits = hits[:self.truncate]
+        return _FakeResponse({"meta": {"results": {"total": total}}, "results": hits})
+
+    def get_stats(self):
+        return {"transport": "fake"}
+
+
+def _make_client(tmp_path, transport, **kwargs):
+    client = FDAClient(cache_dir=str(tmp_path), transport=transport, **kwargs)
+    client._cross_process_limiter = None
+    client._rate_limiter = None
+    client._retry_policy = None
+    return client
+
+
+class TestPrefetch:
+
+    def test_prefetch_primes_single_lookup_cache(self, tmp_path):
+        transport = _OpenFDATransport(["K000001", "K000002", "K000003"])
+        client = _make_client(tmp_path, transport)
+
+        assert client.prefetch_510k(["K000001", "K000002", "K000003", "K000004"]) == 4
+        assert len(transport.searches) == 1
+        assert 'k_number:"K000001" OR k_number:"K000002"' in transport.searches[0]
+
+        assert client.get_510k("K000002")["results"][0]["device_name"] == "Device K000002"
+        assert client.get_510k("K000004")["results"] == []
+        assert len(transport.searches) == 1
+        stats = client.cache_stats()
+        assert stats["session_batched_queries"] == 1
+        assert stats["session_batched_ids"] == 4
+
+    def test_prefetch_respects_batch_size_and_skips_cached(self, tmp_path):
+        transport = _OpenFDATransport([f"K{i:06d}" for i in range(7)])
+        client = _make_client(tmp_path, transport)
+
+        client.get_510k("K000000")
+        client.prefetch_510k([f"K{i:06d}" for i in range(7)], batch_size=3)
+        # One single lookup, then 6 uncached IDs in two OR queries
+        assert len(transport.searches) == 3
+        assert "K000000" not in transport.searches[1] + transport.searches[2]
+
+    def test_prefetch_rebatches_expired_entries(self, tmp_path):
+        transport = _OpenFDATransport(["K000001", "K000002"])
+        client = _make_client(tmp_path, transport)
+
+        client.prefetch_510k(["K000001", "K000002"])
+        with patch("fda_tools.scripts.fda_api_client.CACHE_TTL", -1):
+            assert client.prefetch_510k(["K000001", "K000002"]) == 2
+        assert len(transport.searches) == 2
+        assert "K000002" in transport.searches[1]
+
+    def test_truncated_response_does_not_cache_missing(self, tmp_path):
+        transport = _OpenFDATransport(["K000001", "K000002"], truncate=1)
+        client = _make_client(tmp_path, transport)
+
+        assert client.prefetch_510k(["K000001", "K000002"]) == 1
+        assert client.get_510k("K000002")["results"][0]["k_number"] == "K000002"
+        assert len(transport.searches) == 2
+
+    def test_degraded_batch_falls_back_to_single_lookup(self, tmp_path):
+        client = _make_client(tmp_path, _OpenFDATransport([]))
+        degraded = {"error": "down", "results": [], "degraded": True}
+        with patch.object(client, "_request", return_value=degraded) as mock_request:
+            assert client.prefetch_510k(["K000001", "K000002"]) == 0
+        assert mock_request.call_count == 1
+        assert client.cache_stats()["session_batched_queries"] == 0
+
+
+class TestMicroBatchWindow:
+
+    def test_concurrent_lookups_fused(self, tmp_path):
+        known = [f"K{i:06d}" for i in range(8)]
+        transport = _OpenFDATransport(known, delay=0.05)
+        client = _make_client(tmp_path, transport, batch_window=0.2)
+
+        results = {}
+
+        def worker(k):
+            results[k] = client.get_510k(k)
+
+        threads = [threading.Thread(target=worker, args=(k,)) for k in known]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+        assert len(transport.searches) == 1
+        assert all(results[k]["results"][0]["k_number"] == k for k in known)
+
+    def test_full_batch_flushes_before_window(self, tmp_path):
+        known = [f"K{i:06d}" for i in range(4)]
+        transport = _OpenFDATransport(known)
+        client = _make_client(tmp_path, transport, batch_window=5.0, batch_size=4)
+
+        threads = [threading.Thread(target=client.get_510k, args=(k,)) for k in known]
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+        assert time.monotonic() - start < 4.0
+        assert len(transport.searches) == 1
+
+
+class TestBatchCallers:
+
+    def test_analyze_batch_prefetches_510k(self, tmp_path):
+        from fda_tools.scripts.unified_predicate import UnifiedPredicateAnalyzer
+
+        known = ["K000001", "K000002", "K000003"]
+        transport = _OpenFDATransport(known)
+        client = _make_client(tmp_path, transport)
+        analyzer = UnifiedPredicateAnalyzer(client=client, pma_store=object())
+
+        results = analyzer.analyze_batch(known)
+        assert set(results) == set(known)
+        assert len(transport.searches) == 1
+
+    @patch.object(FDAEnrichment, "api_query")
+    def test_enrichment_prefetch_serves_validation(self, mock_api_query):
+        mock_api_query.return_value = {
+            "meta": {"results": {"total": 1}},
+            "results": [{"k_number": "K123456", "decision_description": "Substantially Equivalent",
+                         "expedited_review_flag": "N", "statement_or_summary": "Summary"}],
+        }
+        enricher = FDAEnrichment()
+        assert enricher.prefetch_510k_validations(["K123456", "K999999"]) == 2
+        assert mock_api_query.call_count == 1
+        assert 'k_number:"K123456" OR k_number:"K999999"' == mock_api_query.call_args.args[1]["search"]
+
+        assert enricher.get_510k_validation("K123456")["api_validated"] == "Yes"
+        assert enricher.get_510k_validation("K999999")["api_validated"] == "No"
+        assert mock_api_query.call_count == 1
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for FDAClient.iter_records -- search_after streaming pagination.
+
+Tests cover:
+- Following Link rel="Next" search_after tokens across pages
+- Checkpointing the resume token and resuming after a failure
+- Checkpoint removal on completion and rejection for a different query
+- Pages bypassing the response cache
+"""
+
+import io
+import json
+import urllib.error
+import urllib.parse
+
+import pytest
+
+from fda_tools.scripts.fda_api_client import FDAClient, RecordIterationError
+
+
+class _FakeResponse:
+    def __init__(self, payload, headers):
+        self._body = json.dumps(payload).encode()
+        self.headers = headers
+
+    def read(self):
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+
+class _PagedTransport:
+    """Serves ``total`` records in pages linked by search_after tokens."""
+
+    def __init__(self, total, fail_on_token=None):
+        self.total = total
+        self.fail_on_token = fail_on_token
+        self.calls = []
+
+    def open(self, url, headers=None, timeout=15):
+        query = {k: v[0] for k, v in urllib.parse.parse_qs(urllib.parse.urlparse(url).query).items()}
+        self.calls.append(query)
+        token = query.get("search_after")
+        if token is not None and token == self.fail_on_token:
+            raise urllib.error.HTTPError(url, 400, "Bad Request", {}, io.BytesIO(b""))
+        start = int(token.split("=")[1]) if token else 0
+        limit = int(query["limit"])
+        records = [{"k_number": f"K{i:06d}"} for i in range(start, min(start + limit, self.total))]
+        headers = {}
+        if start + limit < self.total:
+            next_query = dict(query, search_after=f"0={start + limit}")
+            headers["Link"] = (
+                f'<https://api.fda.gov/device/510k.json?{urllib.parse.urlencode(next_query)}>; '
+                f'rel="Next"'
+            )
+        return _FakeResponse({"meta": {"results": {"total": self.total}}, "results": records}, headers)
+
+    def get_stats(self):
+        return {"transport": "fake"}
+
+
+def _make_client(tmp_path, transport):
+    client = FDAClient(cache_dir=str(tmp_path / "cache"), transport=transport)
+    client._cross_process_limiter = None
+    client._rate_limiter = None
+    client._retry_policy = None
+    return client
+
+
+class TestIterRecords:
+
+    def test_streams_all_pages(self, tmp_path):
+        transport = _PagedTransport(total=25)
+        client = _make_client(tmp_path, transport)
+
+        ids = [r["k_number"] for r in client.iter_records(
+            "510k", search="decision_date:[20240101 TO 20241231]",
+            sort="decision_date:asc", page_size=10)]
+        assert ids == [f"K{i:06d}" for i in range(25)]
+        assert len(transport.calls) == 3
+        assert "search_after" not in transport.calls[0]
+        assert transport.calls[1]["search_after"] == "0=10"
+        assert transport.calls[2]["sort"] == "decision_date:asc"
+        # Pages are streamed, not cached
+        assert list((tmp_path / "cache").glob("*.json")) == []
+
+    def test_is_lazy(self, tmp_path):
+        transport = _PagedTransport(total=100)
+        client = _make_client(tmp_path, transport)
+        it = client.iter_records("510k", page_size=10)
+        next(it)
+        assert len(transport.calls) == 1
+
+    def test_resume_from_checkpoint_after_failure(self, tmp_path):
+        checkpoint = tmp_path / "cursor.json"
+        transport = _PagedTransport(total=30, fail_on_token="0=20")
+        client = _make_client(tmp_path, transport)
+
+        seen = []
+        with pytest.raises(RecordIterationError) as exc_info:
+            for record in client.iter_records("510k", page_size=10, checkpoint=checkpoint):
+                seen.append(record["k_number"])
+        assert len(seen) == 20
+        assert exc_info.value.resume_token == "0=20"
+        assert exc_info.value.yielded == 20
+        assert json.loads(checkpoint.read_text())["search_after"] == "0=20"
+
+        transport.fail_on_token = None
+        rest = [r["k_number"] for r in client.iter_records("510k", page_size=10, checkpoint=checkpoint)]
+        assert rest == [f"K{i:06d}" for i in range(20, 30)]
+        assert not checkpoint.exists()
+
+    def test_checkpoint_for_other_query_ignored(self, tmp_path):
+        checkpoint = tmp_path / "cursor.json"
+        checkpoint.write_text(json.dumps({
+            "query": {"endpoint": "510k", "search": "other", "sort": None},
+            "search_after": "0=20",
+        }))
+        client = _make_client(tmp_path, _PagedTransport(total=15))
+        records = list(client.iter_records("510k", page_size=10, checkpoint=checkpoint))
+        assert len(records) == 15
+
+    def test_iter_pages_yields_lists(self, tmp_path):
+        client = _make_client(tmp_path, _PagedTransport(total=25))
+        sizes = [len(page) for page in client.iter_pages("510k", page_size=10)]
+        assert sizes == [10, 10, 5]
+
+    def test_all_product_codes_uses_streaming(self, tmp_path):
+        transport = _PagedTransport(total=12)
+        client = _make_client(tmp_path, transport)
+        # _PagedTransport serves k_number records; map them to product codes
+        original_open = transport.open
+
+        def open_codes(url, headers=None, timeout=15):
+            resp = original_open(url, headers, timeout)
+            payload = json.loads(resp.read())
+            payload["results"] = [{"product_code": r["k_number"][-3:]} for r in payload["results"]]
+            return _FakeResponse(payload, resp.headers)
+
+        transport.open = open_codes
+        codes = client.get_all_product_codes(use_cache=False)
+        assert len(codes) == 12
+        assert transport.calls[0]["sort"] == "product_code:asc"
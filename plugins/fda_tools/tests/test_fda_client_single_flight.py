@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for FDAClient single-flight request coalescing.
+
+Tests cover:
+- Concurrent identical requests from threads share one API fetch
+- Followers receive independent copies of the leader's result
+- Distinct cache keys are never coalesced
+- A failing leader releases its followers with a degraded result
+- coalesced counter in cache_stats()
+"""
+
+import json
+import threading
+import time
+
+from fda_tools.scripts.fda_api_client import FDAClient
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+        self.headers = {}
+
+    def read(self):
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+
+class _FakeTransport:
+    """Transport returning canned payloads, tracking peak concurrency."""
+
+    def __init__(self, handler, delay=0.0):
+        self.handler = handler
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def open(self, url, headers=None, timeout=15):
+        with self._lock:
+            self.calls.append(url)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            return _FakeResponse(self.handler(url))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def get_stats(self):
+        return {"transport": "fake"}
+
+
+def _make_client(tmp_path, transport):
+    client = FDAClient(cache_dir=str(tmp_path), transport=transport)
+    client._cross_process_limiter = None
+    client._rate_limiter = None
+    client._retry_policy = None
+    return client
+
+
+class TestSingleFlight:
+    """Concurrent identical requests share one fetch."""
+
+    def test_threads_coalesce_identical_requests(self, tmp_path):
+        transport = _FakeTransport(lambda url: {"results": [{"k_number": "K241335"}]}, delay=0.2)
+        client = _make_client(tmp_path, transport)
+        results = []
+
+        def worker():
+            results.append(client.get_510k("K241335"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(transport.calls) == 1
+        assert len(results) == 8
+        assert all(r == results[0] for r in results)
+        # Followers receive copies, not the leader's object
+        assert len({id(r) for r in results}) == 8
+        assert client._stats["coalesced"] == 7
+        assert client._stats["misses"] == 1
+        assert client.cache_stats()["session_coalesced"] == 7
+
+    def test_distinct_keys_not_coalesced(self, tmp_path):
+        transport = _FakeTransport(lambda url: {"results": []}, delay=0.05)
+        client = _make_client(tmp_path, transport)
+        threads = [
+            threading.Thread(target=client.get_classification, args=(code,))
+            for code in ("DQY", "OVE", "MAX")
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(transport.calls) == 3
+        assert client._stats["coalesced"] == 0
+
+    def test_leader_failure_releases_followers(self, tmp_path):
+        started = threading.Event()
+
+        def handler(url):
+            started.set()
+            time.sleep(0.1)
+            raise RuntimeError("boom")
+
+        client = _make_client(tmp_path, _FakeTransport(handler))
+        client._fetch = lambda endpoint, params, key: handler(key)
+        errors, results = [], []
+
+        def leader():
+            try:
+                client.get_510k("K000001")
+            except RuntimeError as e:
+                errors.append(e)
+
+        t1 = threading.Thread(target=leader)
+        t1.start()
+        started.wait()
+        results.append(client.get_510k("K000001"))
+        t1.join()
+
+        assert len(errors) == 1
+        assert results[0]["degraded"] is True
+        assert client._inflight == {}
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for lib/flat_file_cache.py -- columnar cache of FDA flat files.
+
+Tests cover:
+- Typed date and review-time columns in the Arrow cache
+- Column projection, reuse of a current cache, and rebuild on a new source
+- Malformed rows kept by position, as the csv consumers read them, and byte-order marks
+- read_columns() without pyarrow
+"""
+
+import datetime
+import os
+
+import pytest
+
+from fda_tools.lib import flat_file_cache
+from fda_tools.lib.flat_file_cache import cache_path, load_table, read_columns
+
+PMN_HEADER = "KNUMBER|APPLICANT|DATERECEIVED|DECISIONDATE|PRODUCTCODE|ZIP"
+PMN_ROWS = [
+    "K240001|Acme Médical|01/02/2024|03/02/2024|DQY|01234",
+    "K240002|Beta Inc|12/30/2023|01/09/2024|OVE|99999",
+    "K240003|Gamma|bad date|01/09/2024|DQY|00001",
+]
+
+
+@pytest.fixture
+def pmn_file(tmp_path):
+    path = tmp_path / "pmn96cur.txt"
+    path.write_text("\n".join([PMN_HEADER] + PMN_ROWS) + "\n", encoding="latin-1")
+    return path
+
+
+class TestArrowCache:
+
+    @pytest.fixture(autouse=True)
+    def _require_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def test_typed_columns(self, pmn_file):
+        table = load_table(pmn_file)
+        assert cache_path(pmn_file).exists()
+        data = table.to_pydict()
+        assert data["KNUMBER"] == ["K240001", "K240002", "K240003"]
+        assert data["APPLICANT"][0] == "Acme Médical"
+        assert data["ZIP"] == ["01234", "99999", "00001"]  # leading zeros kept
+        assert data["DATERECEIVED"][0] == datetime.date(2024, 1, 2)
+        assert data["DATERECEIVED"][2] is None
+        assert data["REVIEWTIME"] == [60, 10, None]
+
+    def test_projection_and_reuse(self, pmn_file):
+        load_table(pmn_file)
+        mtime = cache_path(pmn_file).stat().st_mtime_ns
+        table = load_table(pmn_file, ["KNUMBER", "REVIEWTIME"])
+        assert table.column_names == ["KNUMBER", "REVIEWTIME"]
+        assert cache_path(pmn_file).stat().st_mtime_ns == mtime
+        assert read_columns(pmn_file, ["KNUMBER"], isin={"PRODUCTCODE": ["OVE"]}) == {"KNUMBER": ["K240002"]}
+
+    def test_rebuilt_when_source_changes(self, pmn_file):
+        load_table(pmn_file)
+        pmn_file.write_text(PMN_HEADER + "\n" + PMN_ROWS[1] + "\n", encoding="latin-1")
+        os.utime(pmn_file, ns=(1, 1))
+        assert load_table(pmn_file, ["KNUMBER"]).to_pydict() == {"KNUMBER": ["K240002"]}
+
+    def test_cache_used_without_source(self, pmn_file):
+        load_table(pmn_file)
+        pmn_file.unlink()
+        assert load_table(pmn_file, ["PRODUCTCODE"]).num_rows == 3
+        with pytest.raises(FileNotFoundError):
+            load_table(pmn_file.with_name("pmn9195.txt"))
+
+    def test_bom_and_short_rows(self, tmp_path):
+        path = tmp_path / "pma.txt"
+        path.write_bytes(b"\xef\xbb\xbfPMANUMBER|APPLICANT\nP170019|Acme\nP200024\n")
+        assert load_table(path).to_pydict() == {"PMANUMBER": ["P170019", "P200024"],
+                                                "APPLICANT": ["Acme", None]}
+        assert read_columns(path, ["PMANUMBER", "APPLICANT"]) == {"PMANUMBER": ["P170019", "P200024"],
+                                                                  "APPLICANT": ["Acme", None]}
+
+    def test_malformed_rows_kept_like_csv(self, tmp_path, caplog, monkeypatch):
+        path = tmp_path / "pmn96cur.txt"
+        path.write_text("\n".join([
+            PMN_HEADER,
+            PMN_ROWS[0],
+            "K000002|Stray | Pipe|01/02/2024|03/02/2024|DQY|01234",
+            "K000003|Short",
+            PMN_ROWS[1],
+        ]) + "\n", encoding="latin-1")
+        columns = read_columns(path, ["KNUMBER", "PRODUCTCODE"])
+        assert columns == {"KNUMBER": ["K240001", "K000002", "K000003", "K240002"],
+                           "PRODUCTCODE": ["DQY", "03/02/2024", None, "OVE"]}
+        assert "2 row(s) do not match" in caplog.text
+        monkeypatch.setattr(flat_file_cache, "_ARROW_AVAILABLE", False)
+        assert read_columns(path, ["KNUMBER", "PRODUCTCODE"]) == columns
+
+
+class TestFallback:
+
+    def test_read_columns_without_pyarrow(self, pmn_file, monkeypatch):
+        monkeypatch.setattr(flat_file_cache, "_ARROW_AVAILABLE", False)
+        columns = read_columns(pmn_file, ["KNUMBER", "PRODUCTCODE"])
+        assert columns == {
+            "KNUMBER": ["K240001", "K240002", "K240003"],
+            "PRODUCTCODE": ["DQY", "OVE", "DQY"],
+        }
+        assert read_columns(pmn_file, ["KNUMBER"], isin={"PRODUCTCODE": {"DQY"}}) == {
+            "KNUMBER": ["K240001", "K240003"],
+        }
+        assert not cache_path(pmn_file).exists()
+        with pytest.raises(KeyError):
+            read_columns(pmn_file, ["NOPE"])
+        with pytest.raises(ImportError):
+            load_table(pmn_file)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests for lib/http_transport.py -- pluggable keep-alive HTTP transport.
+
+Tests cover:
+- KeepAliveTransport connection reuse against a local HTTP/1.1 server
+- Idle eviction and pool size bounds
+- HTTPError raising for 4xx/5xx (urlopen-compatible contract)
+- Stale pooled connection retry
+- UrllibTransport delegating to urllib.request.urlopen with a shared SSL context
+- FDAClient routing requests through an injected transport
+"""
+
+import json
+import socket
+import ssl
+import threading
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fda_tools.lib.http_transport import (
+    KeepAliveTransport,
+    UrllibTransport,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        _Handler.connections.add(self.client_address)
+        if self.path.startswith("/missing"):
+            status, payload = 404, {"error": {"code": "NOT_FOUND"}}
+        elif self.path.startswith("/redirect"):
+            self.send_response(302)
+            self.send_header("Location", "/ok")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        else:
+            status, payload = 200, {"results": [{"path": self.path}], "meta": {"results": {"total": 1}}}
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """Local HTTP/1.1 keep-alive server on an ephemeral port."""
+    _Handler.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestKeepAliveTransport:
+    """Connection pooling behaviour."""
+
+    def test_reuses_connection_across_requests(self, http_server):
+        transport = KeepAliveTransport(pool_size=2)
+        try:
+            for i in range(5):
+                with transport.open(f"{http_server}/device/510k.json?i={i}") as resp:
+                    data = json.loads(resp.read())
+                assert data["results"][0]["path"] == f"/device/510k.json?i={i}"
+            stats = transport.get_stats()
+            assert stats["requests"] == 5
+            assert stats["connections_opened"] == 1
+            assert stats["connections_reused"] == 4
+            assert stats["reuse_ratio"] == 0.8
+            assert len(_Handler.connections) == 1
+        finally:
+            transport.close()
+
+    def test_http_error_raised_and_connection_kept(self, http_server):
+        transport = KeepAliveTransport()
+        try:
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                transport.open(f"{http_server}/missing")
+            assert exc_info.value.code == 404
+            assert json.loads(exc_info.value.read())["error"]["code"] == "NOT_FOUND"
+            with transport.open(f"{http_server}/ok") as resp:
+                assert resp.status == 200
+            assert transport.get_stats()["connections_opened"] == 1
+        finally:
+            transport.close()
+
+    def test_follows_redirect(self, http_server):
+        transport = KeepAliveTransport()
+        try:
+            with transport.open(f"{http_server}/redirect") as resp:
+                assert resp.geturl().endswith("/ok")
+                assert json.loads(resp.read())["results"][0]["path"] == "/ok"
+        finally:
+            transport.close()
+
+    def test_idle_connections_evicted(self, http_server):
+        transport = KeepAliveTransport(idle_timeout=0.0)
+        try:
+            transport.open(f"{http_server}/a").read()
+            transport.open(f"{http_server}/b").read()
+            stats = transport.get_stats()
+            assert stats["connections_opened"] == 2
+            assert stats["connections_reused"] == 0
+            assert stats["idle_evictions"] == 1
+        finally:
+            transport.close()
+
+    def test_pool_size_bounds_idle_connections(self, http_server):
+        transport = KeepAliveTransport(pool_size=1)
+        try:
+            key = ("http", "127.0.0.1", int(http_server.rsplit(":", 1)[1]))
+            conns = [transport._checkout(key, 5.0)[0] for _ in range(3)]
+            for conn in conns:
+                transport._release(key, conn)
+            assert transport.get_stats()["idle_connections"] == 1
+        finally:
+            transport.close()
+
+    def test_stale_pooled_connection_retried(self, http_server):
+        transport = KeepAliveTransport()
+        try:
+            transport.open(f"{http_server}/a").read()
+            # Simulate the idle connection being torn down underneath the pool
+            for pool in transport._pools.values():
+                for conn, _ in pool:
+                    conn.sock.shutdown(socket.SHUT_RDWR)
+            with transport.open(f"{http_server}/b") as resp:
+                assert resp.status == 200
+            stats = transport.get_stats()
+            assert stats["stale_retries"] == 1
+            assert stats["connections_opened"] == 2
+        finally:
+            transport.close()
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError):
+            KeepAliveTransport(pool_size=0)
+
+
+class TestUrllibTransport:
+    """Legacy urlopen transport with a shared SSL context."""
+
+    def test_passes_shared_ssl_context_to_urlopen(self):
+        transport = UrllibTransport()
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            transport.open("https://api.fda.gov/device/510k.json", {"User-Agent": "x"})
+            transport.open("https://api.fda.gov/device/pma.json", {"User-Agent": "x"})
+        contexts = [c.kwargs["context"] for c in mock_urlopen.call_args_list]
+        assert contexts[0] is contexts[1]
+        assert isinstance(contexts[0], ssl.SSLContext)
+        assert contexts[0].check_hostname is True
+        assert transport.get_stats()["connections_opened"] == 2
+
+
+class TestFDAClientTransport:
+    """FDAClient routes every API call through its transport."""
+
+    def test_client_uses_injected_transport(self, tmp_path):
+        from fda_tools.scripts.fda_api_client import FDAClient
+
+        response = MagicMock()
+        response.__enter__ = MagicMock(return_value=response)
+        response.__exit__ = MagicMock(return_value=False)
+        response.read.return_value = b'{"results": [{"k_number": "K241335"}]}'
+        response.headers = {}
+        transport = MagicMock()
+        transport.open.return_value = response
+        transport.get_stats.return_value = {"transport": "mock"}
+
+        client = FDAClient(cache_dir=str(tmp_path), transport=transport)
+        client._cross_process_limiter = None
+        client._rate_limiter = None
+
+        assert client.get_510k("K241335")["results"][0]["k_number"] == "K241335"
+        assert client.get_classification("DQY")["results"]
+        assert transport.open.call_count == 2
+        url = transport.open.call_args_list[0].args[0]
+        assert url.startswith("https://api.fda.gov/device/510k.json?")
+        assert client.cache_stats()["http_transport"] == {"transport": "mock"}
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for lib/memory_cache.py -- in-process LRU tier above the disk cache.
+
+Tests cover:
+- LRU ordering, entry cap and byte cap evictions
+- TTL expiry
+- Returned values are private copies
+- FDAClient serving repeated hits from memory and exposing counters
+"""
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from fda_tools.lib.memory_cache import MemoryLRUCache
+from fda_tools.scripts.fda_api_client import FDAClient
+
+
+class TestMemoryLRUCache:
+
+    def test_evicts_least_recently_used(self):
+        lru = MemoryLRUCache(max_entries=2)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        assert lru.get("a") == 1  # a is now most recent
+        lru.set("c", 3)
+        assert lru.get("b") is None
+        assert lru.get("a") == 1
+        assert lru.get("c") == 3
+        assert lru.get_stats()["evictions"] == 1
+
+    def test_byte_cap(self):
+        lru = MemoryLRUCache(max_entries=100, max_bytes=30)
+        lru.set("a", "x" * 10)   # 12 bytes serialized
+        lru.set("b", "y" * 10)
+        lru.set("c", "z" * 10)   # pushes total to 36 > 30
+        assert len(lru) == 2
+        assert lru.get("a") is None
+        lru.set("huge", "h" * 100)  # larger than the whole cache: not stored
+        assert lru.get("huge") is None
+        assert lru.get_stats()["bytes"] <= 30
+
+    def test_ttl_expiry(self):
+        lru = MemoryLRUCache(ttl_seconds=0.05)
+        lru.set("a", {"v": 1})
+        assert lru.get("a") == {"v": 1}
+        time.sleep(0.08)
+        assert lru.get("a") is None
+        stats = lru.get_stats()
+        assert stats["expirations"] == 1
+        assert stats["entries"] == 0
+
+    def test_returns_private_copies(self):
+        lru = MemoryLRUCache()
+        lru.set("a", {"results": [1]})
+        lru.get("a")["results"].append(2)
+        assert lru.get("a") == {"results": [1]}
+
+    def test_thread_safety(self):
+        lru = MemoryLRUCache(max_entries=50)
+
+        def worker(n):
+            for i in range(200):
+                lru.set(f"{n}-{i % 60}", i)
+                lru.get(f"{(n + 1) % 4}-{i % 60}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = lru.get_stats()
+        assert stats["entries"] == 50
+        assert stats["hits"] + stats["misses"] == 800
+
+    def test_invalid_caps(self):
+        with pytest.raises(ValueError):
+            MemoryLRUCache(max_entries=0)
+
+
+class TestFDAClientMemoryTier:
+
+    def _client(self, tmp_path, **kwargs):
+        client = FDAClient(cache_dir=str(tmp_path), **kwargs)
+        client._cross_process_limiter = None
+        client._rate_limiter = None
+        return client
+
+    def test_repeated_hits_skip_disk(self, tmp_path):
+        client = self._client(tmp_path, memory_cache_entries=16)
+        client._set_cached("k", {"results": ["x"]})
+
+        assert client._get_cached("k") == {"results": ["x"]}  # disk, promoted
+        with patch.object(client, "_get_disk_cached") as disk:
+            assert client._get_cached("k") == {"results": ["x"]}
+            assert client._get_cached("k") == {"results": ["x"]}
+        disk.assert_not_called()
+
+        stats = client.cache_stats()
+        assert stats["session_hits"] == 3
+        assert stats["memory_cache"]["hits"] == 2
+        assert stats["memory_cache"]["entries"] == 1
+
+    def test_write_replaces_memory_copy(self, tmp_path):
+        client = self._client(tmp_path, memory_cache_entries=16)
+        client._set_cached("k", {"v": 1})
+        client._get_cached("k")
+        client._set_cached("k", {"v": 2})
+        assert client._get_cached("k") == {"v": 2}
+
+    def test_clear_cache_clears_memory(self, tmp_path):
+        client = self._client(tmp_path, memory_cache_entries=16)
+        client._set_cached("k", {"v": 1})
+        client._get_cached("k")
+        client.clear_cache()
+        assert client._get_cached("k") is None
+
+    def test_disabled(self, tmp_path):
+        client = self._client(tmp_path, memory_cache_entries=0)
+        client._set_cached("k", {"v": 1})
+        client._get_cached("k")
+        (tmp_path / "k.json").write_text(json.dumps({"_cached_at": 0, "data": {}}))
+        assert client._get_cached("k") is None
+        assert "memory_cache" not in client.cache_stats()
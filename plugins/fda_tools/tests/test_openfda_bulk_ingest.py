@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/openfda_bulk_ingest.py -- bulk download ingestion.
+
+Tests cover:
+- Streaming parser yielding ``results`` items across buffer refills
+- Range-resumed partition downloads from a local stand-in server
+- End-to-end manifest -> download -> parse -> sink, with completed
+  partitions skipped on rerun
+- Cache sink populating FDAClient single-record lookups
+"""
+
+import io
+import json
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fda_tools.scripts.fda_api_client import FDAClient
+from fda_tools.scripts.openfda_bulk_ingest import (
+    BulkIngestor,
+    CacheSink,
+    download_partition,
+    get_partitions,
+    iter_json_array,
+)
+
+
+def _partition_zip(records):
+    payload = {
+        "meta": {"results": {"skip": 0, "limit": len(records), "total": len(records)}},
+        "results": records,
+    }
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("device-510k-0001-of-0001.json", json.dumps(payload, indent=1))
+    return buf.getvalue()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    files = {}
+    requests = []
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        _Handler.requests.append((self.path, self.headers.get("Range")))
+        if self.path == "/download.json":
+            base = f"http://127.0.0.1:{self.server.server_address[1]}"
+            body = json.dumps({"results": {"device": {
+                "510k": {"partitions": [
+                    {"file": f"{base}/device/510k/{name}", "records": 0}
+                    for name in sorted(_Handler.files)
+                ]},
+            }}}).encode()
+            status, start = 200, 0
+        else:
+            body = _Handler.files.get(self.path.split("/device/510k/", 1)[-1])
+            if body is None:
+                self.send_error(404)
+                return
+            status, start = 200, 0
+            range_header = self.headers.get("Range")
+            if range_header:
+                start = int(range_header.split("=")[1].rstrip("-"))
+                status = 206
+            body = body[start:]
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def download_server():
+    """Local stand-in for download.fda.gov serving the manifest and zips."""
+    _Handler.files = {}
+    _Handler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class _RecorderSink:
+    def __init__(self):
+        self.records = []
+
+    def write(self, endpoint, records):
+        self.records.extend((endpoint, r["k_number"]) for r in records)
+        return len(records)
+
+
+class TestStreamingParser:
+
+    def test_yields_results_and_skips_meta(self):
+        doc = {"meta": {"results": {"total": 3}, "note": "x]}"},
+               "results": [{"k_number": "K1", "n": 1.5}, {"k_number": "K2"}, 7]}
+        text = io.StringIO(json.dumps(doc, indent=2))
+        assert list(iter_json_array(text, chunk_size=5)) == doc["results"]
+
+    def test_results_before_meta_and_empty(self):
+        text = io.StringIO('{"results": [12345, -6.5e3], "meta": {}}')
+        assert list(iter_json_array(text, chunk_size=3)) == [12345, -6500.0]
+        assert list(iter_json_array(io.StringIO('{"results": []}'))) == []
+        assert list(iter_json_array(io.StringIO("{}"))) == []
+
+    def test_is_lazy(self):
+        class _Counting(io.StringIO):
+            reads = 0
+
+            def read(self, n=-1):
+                _Counting.reads += 1
+                return super().read(n)
+
+        records = [{"k_number": f"K{i:06d}", "pad": "x" * 100} for i in range(500)]
+        stream = _Counting(json.dumps({"results": records}))
+        it = iter_json_array(stream, chunk_size=256)
+        assert next(it)["k_number"] == "K000000"
+        assert _Counting.reads < 5
+
+    def test_malformed_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO('{"results": [1, 2')))
+
+
+class TestDownload:
+
+    def test_resumes_partial_download(self, download_server, tmp_path):
+        data = bytes(range(256)) * 40
+        _Handler.files["p1.zip"] = data
+        dest = tmp_path / "p1.zip"
+        (tmp_path / "p1.zip.part").write_bytes(data[:1000])
+
+        download_partition(f"{download_server}/device/510k/p1.zip", dest, chunk_size=512)
+        assert dest.read_bytes() == data
+        assert not (tmp_path / "p1.zip.part").exists()
+        assert _Handler.requests[-1][1] == "bytes=1000-"
+
+    def test_manifest_partitions(self):
+        manifest = {"results": {"device": {"event": {"partitions": [{"file": "a"}]}}}}
+        assert get_partitions(manifest, "maude") == [{"file": "a"}]
+        with pytest.raises(ValueError):
+            get_partitions(manifest, "510k")
+
+
+class TestBulkIngestor:
+
+    def test_end_to_end_and_rerun_skips(self, download_server, tmp_path):
+        _Handler.files["p1.zip"] = _partition_zip([{"k_number": f"K1{i:05d}"} for i in range(7)])
+        _Handler.files["p2.zip"] = _partition_zip([{"k_number": f"K2{i:05d}"} for i in range(5)])
+        sink = _RecorderSink()
+        ingestor = BulkIngestor(sink, download_dir=tmp_path,
+                                manifest_url=f"{download_server}/download.json",
+                                workers=2, batch_size=3)
+
+        summary = ingestor.run(["510k"])
+        assert summary["510k"]["records"] == 12
+        assert summary["510k"]["partitions"] == 2
+        assert summary["510k"]["errors"] == []
+        assert len(sink.records) == 12
+        assert list(tmp_path.rglob("*.zip")) == []  # removed after loading
+
+        rerun = BulkIngestor(_RecorderSink(), download_dir=tmp_path,
+                             manifest_url=f"{download_server}/download.json")
+        summary = rerun.run(["510k"])
+        assert summary["510k"]["skipped"] == 2
+        assert summary["510k"]["records"] == 0
+
+    def test_same_basename_in_different_directories(self, download_server, tmp_path):
+        _Handler.files["2023q1/device-0001-of-0001.json.zip"] = _partition_zip(
+            [{"k_number": f"K1{i:05d}"} for i in range(3)])
+        _Handler.files["2023q2/device-0001-of-0001.json.zip"] = _partition_zip(
+            [{"k_number": f"K2{i:05d}"} for i in range(4)])
+        sink = _RecorderSink()
+        ingestor = BulkIngestor(sink, download_dir=tmp_path,
+                                manifest_url=f"{download_server}/download.json", workers=1)
+        assert (ingestor._local_path("510k", f"{download_server}/device/510k/2023q1/p.zip")
+                != ingestor._local_path("510k", f"{download_server}/device/510k/2023q2/p.zip"))
+        summary = ingestor.run(["510k"])
+        assert summary["510k"]["records"] == 7
+        assert {k[:2] for _, k in sink.records} == {"K1", "K2"}
+
+    def test_cache_sink_serves_lookups(self, download_server, tmp_path):
+        _Handler.files["p1.zip"] = _partition_zip([
+            {"k_number": "K241335", "device_name": "Widget"},
+            {"k_number": "K230001", "device_name": "Gadget"},
+        ])
+        client = FDAClient(cache_dir=str(tmp_path / "cache"))
+        BulkIngestor(CacheSink(client), download_dir=tmp_path / "dl",
+                     manifest_url=f"{download_server}/download.json").run(["510k"])
+
+        result = client.get_510k("K241335")
+        assert result["results"][0]["device_name"] == "Widget"
+        assert client.cache_stats()["session_misses"] == 0
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the journaled manifest in scripts/pma_data_store.py.
+
+Tests cover:
+- Per-PMA updates appending one journal line without rewriting the snapshot
+- Running totals kept current and matching a full recount
+- Replay on load, compaction threshold, and save_manifest() compaction
+- Concurrent writers (separate stores and processes) not losing updates
+- Torn journal records and snapshots from an interrupted compaction
+"""
+
+import json
+import multiprocessing
+from unittest.mock import patch
+
+
+import pma_data_store
+from pma_data_store import JOURNAL_FILE, MANIFEST_FILE, PMADataStore
+
+
+def _store(path):
+    with patch("pma_data_store.FDAClient"):
+        return PMADataStore(cache_dir=str(path))
+
+
+def _mark_many(path, prefix, count):
+    store = _store(path)
+    for i in range(count):
+        store.mark_ssed_downloaded(f"P{prefix}{i:04d}", f"/tmp/{i}.pdf", 10, "http://x")
+
+
+class TestManifestJournal:
+
+    def test_updates_append_without_rewriting_snapshot(self, tmp_path):
+        store = _store(tmp_path)
+        store.update_manifest_entry("P170019", {"device_name": "CDx"})
+        snapshot_mtime = (tmp_path / MANIFEST_FILE).stat().st_mtime_ns
+
+        store.mark_ssed_downloaded("P170019", "/tmp/a.pdf", 120, "http://x")
+        store.mark_sections_extracted("P200024", 15, 9000)
+
+        assert (tmp_path / MANIFEST_FILE).stat().st_mtime_ns == snapshot_mtime
+        lines = (tmp_path / JOURNAL_FILE).read_text().splitlines()
+        assert len(lines) == 4  # header + three updates
+        manifest = store.get_manifest()
+        assert manifest["total_pmas"] == 2
+        assert manifest["total_sseds_downloaded"] == 1
+        assert manifest["total_sections_extracted"] == 1
+
+    def test_reload_replays_journal(self, tmp_path):
+        store = _store(tmp_path)
+        store.update_manifest_entry("P170019", {"device_name": "CDx"})
+        store.mark_ssed_downloaded("P170019", "/tmp/a.pdf", 120, "http://x")
+        store.cache_search_results("product_code:NMH", [{"pma_number": "P170019"}])
+        store.update_manifest_entry("P200024", {})
+        assert store.clear_pma("P200024") is True
+        assert store.clear_pma("P200024") is False
+
+        manifest = _store(tmp_path).get_manifest()
+        assert set(manifest["pma_entries"]) == {"P170019"}
+        entry = manifest["pma_entries"]["P170019"]
+        assert entry["device_name"] == "CDx"
+        assert entry["ssed_downloaded"] is True
+        assert manifest["total_sseds_downloaded"] == 1
+        assert manifest["search_cache"]["product_code:NMH"]["result_count"] == 1
+
+    def test_compacts_when_journal_outgrows_entries(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pma_data_store, "JOURNAL_COMPACT_MIN_RECORDS", 5)
+        store = _store(tmp_path)
+        for i in range(20):
+            store.update_manifest_entry("P170019", {"section_count": i})
+        assert len((tmp_path / JOURNAL_FILE).read_text().splitlines()) <= 7
+
+        snapshot = json.loads((tmp_path / MANIFEST_FILE).read_text())
+        journal_header = json.loads((tmp_path / JOURNAL_FILE).read_text().splitlines()[0])
+        assert snapshot["journal_generation"] == journal_header["generation"]
+        assert _store(tmp_path).get_manifest()["pma_entries"]["P170019"]["section_count"] == 19
+
+    def test_save_manifest_folds_direct_edits(self, tmp_path):
+        store = _store(tmp_path)
+        store.update_manifest_entry("P170019", {})
+        store.get_manifest()["pma_entries"]["P200024"] = {"ssed_downloaded": True}
+        store.save_manifest()
+        assert (tmp_path / JOURNAL_FILE).read_text().count("\n") == 1
+        manifest = _store(tmp_path).get_manifest()
+        assert manifest["total_pmas"] == 2
+        assert manifest["total_sseds_downloaded"] == 1
+
+    def test_two_stores_do_not_lose_updates(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pma_data_store, "JOURNAL_COMPACT_MIN_RECORDS", 3)
+        a, b = _store(tmp_path), _store(tmp_path)
+        a.get_manifest()
+        b.get_manifest()
+        for i in range(10):
+            a.update_manifest_entry(f"P1{i:05d}", {"ssed_downloaded": True})
+            b.update_manifest_entry(f"P2{i:05d}", {})
+        b.update_manifest_entry("P300000", {})  # Catches up on a's updates first
+        assert len(b.get_manifest()["pma_entries"]) == 21
+        assert _store(tmp_path).get_manifest()["total_sseds_downloaded"] == 10
+
+    def test_processes_do_not_lose_updates(self, tmp_path):
+        ctx = multiprocessing.get_context("spawn")
+        procs = [ctx.Process(target=_mark_many, args=(str(tmp_path), n, 40)) for n in (1, 2, 3)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join(60)
+            assert proc.exitcode == 0
+        manifest = _store(tmp_path).get_manifest()
+        assert manifest["total_pmas"] == 120
+        assert manifest["total_sseds_downloaded"] == 120
+
+    def test_torn_record_ignored(self, tmp_path):
+        store = _store(tmp_path)
+        store.update_manifest_entry("P170019", {"device_name": "CDx"})
+        with open(tmp_path / JOURNAL_FILE, "a") as f:
+            f.write('{"op":"entry","pma":"P2000')
+        reloaded = _store(tmp_path)
+        assert set(reloaded.get_manifest()["pma_entries"]) == {"P170019"}
+        reloaded.update_manifest_entry("P200024", {})
+        assert set(_store(tmp_path).get_manifest()["pma_entries"]) == {"P170019", "P200024"}
+
+    def test_stale_journal_after_interrupted_compaction(self, tmp_path):
+        store = _store(tmp_path)
+        store.update_manifest_entry("P170019", {"section_count": 1})
+        # Snapshot replaced by a newer generation but the journal never reset
+        snapshot = json.loads((tmp_path / MANIFEST_FILE).read_text())
+        snapshot["journal_generation"] = "f" * 32
+        (tmp_path / MANIFEST_FILE).write_text(json.dumps(snapshot))
+
+        reloaded = _store(tmp_path)
+        assert reloaded.get_manifest()["pma_entries"] == {}
+        reloaded.update_manifest_entry("P200024", {})
+        assert set(_store(tmp_path).get_manifest()["pma_entries"]) == {"P200024"}
+
+    def test_clear_all_removes_journal_state(self, tmp_path):
+        store = _store(tmp_path)
+        store.update_manifest_entry("P170019", {})
+        assert store.clear_all() == 1
+        assert _store(tmp_path).get_manifest()["pma_entries"] == {}
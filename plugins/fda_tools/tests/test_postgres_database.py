@@ -233,6 +233,54 @@ class TestUpsertRecord:
         assert any(expected_checksum in a for a in all_args)
 
 
+class TestUpsertMany:
+    def test_single_batched_statement(self, db, pool_mock):
+        conn, cur = _make_conn_mock()
+        pool_mock.getconn.return_value = conn
+        records = [
+            ("K000001", {"device_name": "A"}),
+            ("K000002", {"device_name": "B"}),
+            ("K000001", {"device_name": "A2"}),  # duplicate: last wins
+            ("", {"device_name": "no id"}),
+        ]
+
+        with patch("fda_tools.lib.postgres_database.execute_values") as ev:
+            count = db.upsert_many("510k", records, page_size=500)
+
+        assert count == 2
+        pool_mock.getconn.assert_called_once()
+        assert "app.user_id" in str(cur.execute.call_args_list[0])
+        ev.assert_called_once()
+        _, query, rows = ev.call_args[0]
+        assert ev.call_args[1]["page_size"] == 500
+        assert [row[0] for row in rows] == ["K000001", "K000002"]
+        assert rows[0][2] == "A2"
+        assert rows[0][-1] == db.compute_checksum({"device_name": "A2"})
+        conn.commit.assert_called_once()
+
+    @pytest.mark.parametrize("endpoint,record_id,data", TestUpsertRecord.ENDPOINTS)
+    def test_rows_match_upsert_record_columns(self, db, pool_mock, endpoint, record_id, data):
+        conn, _ = _make_conn_mock()
+        pool_mock.getconn.return_value = conn
+
+        with patch("fda_tools.lib.postgres_database.execute_values") as ev:
+            db.upsert_many(endpoint, [(record_id, data)])
+
+        rows = ev.call_args[0][2]
+        assert len(rows[0]) == len(db.UPSERT_COLUMNS[endpoint]) + 3
+        assert rows[0][0] == record_id
+
+    def test_empty_and_invalid(self, db, pool_mock):
+        assert db.upsert_many("510k", []) == 0
+        pool_mock.getconn.assert_not_called()
+        with pytest.raises(ValueError, match="Unknown endpoint"):
+            db.upsert_many("unknown", [("id1", {})])
+
+    def test_compute_checksums_matches_single(self, db):
+        records = [{"a": 1}, {"b": [2, 3]}, {}]
+        assert db.compute_checksums(records) == [db.compute_checksum(r) for r in records]
+
+
 # ---------------------------------------------------------------------------
 # 5. get_record
 # ---------------------------------------------------------------------------
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for lib/quantile_sketch.py -- bounded-memory DDSketch.
+
+Tests cover:
+- Quantiles within the relative-accuracy bound of exact sorted-list ranks
+- Negative, zero and single-value inputs
+- Bucket cap (fixed memory) and merging
+- Histogram percentiles and Prometheus buckets using the sketch
+"""
+
+import random
+
+import pytest
+
+from fda_tools.lib.quantile_sketch import QuantileSketch
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+class TestQuantileSketch:
+
+    @pytest.mark.parametrize("dist", ["lognormal", "uniform", "mixed_sign"])
+    def test_relative_accuracy(self, dist):
+        rng = random.Random(7)
+        if dist == "lognormal":
+            values = [rng.lognormvariate(3, 1.5) for _ in range(20000)]
+        elif dist == "uniform":
+            values = [rng.uniform(0.001, 30.0) for _ in range(20000)]
+        else:
+            values = [rng.gauss(0, 50) for _ in range(20000)] + [0.0] * 100
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.update(values)
+        for q in (0, 0.01, 0.25, 0.5, 0.9, 0.95, 0.99, 0.999, 1):
+            exact = _exact(values, q)
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.0101, abs=1e-9)
+        assert sketch.count == len(values)
+        assert sketch.sum == pytest.approx(sum(values))
+        assert sketch.quantile(0) == min(values)
+        assert sketch.quantile(1) == max(values)
+
+    def test_empty_and_single(self):
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) is None
+        sketch.add(42.0)
+        assert sketch.quantile(0.5) == 42.0  # clamped to observed min/max
+        with pytest.raises(ValueError):
+            sketch.quantile(1.5)
+
+    def test_bucket_cap(self):
+        sketch = QuantileSketch(relative_accuracy=0.01, max_buckets=64)
+        values = [1.1 ** i for i in range(500)]
+        sketch.update(values)
+        assert sketch.num_buckets <= 64
+        # Upper quantiles keep full accuracy; only the low tail is collapsed
+        assert sketch.quantile(0.99) == pytest.approx(_exact(values, 0.99), rel=0.0101)
+
+    def test_merge(self):
+        rng = random.Random(1)
+        a_values = [rng.expovariate(0.1) for _ in range(5000)]
+        b_values = [rng.expovariate(0.01) for _ in range(5000)]
+        a, b = QuantileSketch(), QuantileSketch()
+        a.update(a_values)
+        b.update(b_values)
+        merged = a.copy()
+        merged.merge(b)
+        assert merged.count == 10000
+        assert a.count == 5000  # copy() left the original untouched
+        assert merged.quantile(0.9) == pytest.approx(_exact(a_values + b_values, 0.9), rel=0.0101)
+        with pytest.raises(ValueError):
+            merged.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+class TestHistogramSketch:
+
+    def test_percentiles_and_buckets(self):
+        pytest.importorskip("psutil", reason="lib.monitoring requires psutil")
+        from fda_tools.lib.monitoring import Histogram
+
+        histogram = Histogram(name="h", help_text="h", buckets=[0.1, 1.0])
+        values = [0.05, 0.1, 0.5, 1.0, 2.0] * 2000
+        for value in values:
+            histogram.observe(value, labels={"endpoint": "x"})
+        assert histogram.get_percentile(50, {"endpoint": "x"}) == pytest.approx(0.5, rel=0.0101)
+        assert histogram.get_percentile(100, {"endpoint": "x"}) == 2.0
+        assert histogram.get_percentile(50) == 0.0  # no unlabelled observations
+        assert histogram._bucket_counts["endpoint=x"] == [4000, 4000, 2000]
+        assert histogram.get_sketch({"endpoint": "x"}).num_buckets == 5
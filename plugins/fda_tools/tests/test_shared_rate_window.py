@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for lib/shared_rate_window.py and the "mmap" backend of
+CrossProcessRateLimiter.
+
+Tests cover:
+- Sliding-window admission and exact wait-until-free times
+- Window shared between processes through the mapped file
+- Re-initialization of a file with a bad header
+- CrossProcessRateLimiter acquire/try_acquire/get_status/reset on the mmap backend
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from fda_tools.lib.cross_process_rate_limiter import CrossProcessRateLimiter
+from fda_tools.lib.shared_rate_window import SharedRequestWindow
+
+
+def _grab(path, capacity, attempts, results):
+    window = SharedRequestWindow(path, capacity)
+    results.put(sum(1 for _ in range(attempts) if window.try_acquire() == 0))
+    window.close()
+
+
+class TestSharedRequestWindow:
+
+    def test_admits_capacity_then_reports_wait(self, tmp_path):
+        with SharedRequestWindow(tmp_path / "w", capacity=3, window_seconds=60) as window:
+            assert [window.try_acquire(now=100.0 + i) for i in range(3)] == [0.0, 0.0, 0.0]
+            assert window.try_acquire(now=110.0) == pytest.approx(50.0)
+            assert window.try_acquire(now=160.0) == 0.0  # first slot aged out
+            assert window.try_acquire(now=160.5) == pytest.approx(0.5)
+            assert window.timestamps(now=161.5) == [102.0, 160.0]
+
+    def test_record_and_reset(self, tmp_path):
+        with SharedRequestWindow(tmp_path / "w", capacity=2, window_seconds=60) as window:
+            window.record(now=1000.0)
+            window.record(now=1001.0)
+            assert window.try_acquire(now=1002.0) > 0
+            window.reset()
+            assert window.timestamps(now=1002.0) == []
+            assert window.try_acquire(now=1002.0) == 0.0
+
+    def test_state_shared_between_handles_and_bad_header_reset(self, tmp_path):
+        path = tmp_path / "w"
+        first = SharedRequestWindow(path, capacity=2)
+        second = SharedRequestWindow(path, capacity=2)
+        assert first.try_acquire() == 0.0
+        assert second.try_acquire() == 0.0
+        assert first.try_acquire() > 0
+        first.close()
+        second.close()
+
+        path.write_bytes(b"garbage")
+        with SharedRequestWindow(path, capacity=2) as window:
+            assert window.timestamps() == []
+
+    def test_processes_never_exceed_capacity(self, tmp_path):
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        procs = [ctx.Process(target=_grab, args=(str(tmp_path / "w"), 25, 20, results)) for _ in range(4)]
+        for proc in procs:
+            proc.start()
+        granted = [results.get(timeout=60) for _ in procs]
+        for proc in procs:
+            proc.join(10)
+        assert sum(granted) == 25
+
+
+class TestMmapBackend:
+
+    def test_acquire_try_acquire_status(self, tmp_path):
+        limiter = CrossProcessRateLimiter(data_dir=str(tmp_path), requests_per_minute=3, backend="mmap")
+        assert limiter.acquire(timeout=1)
+        assert limiter.try_acquire()
+        assert asyncio.run(limiter.acquire_async(timeout=1))
+        assert not limiter.try_acquire()
+
+        start = time.time()
+        assert not limiter.acquire(timeout=0.5)
+        assert time.time() - start < 0.5  # next slot is ~60s away: no pointless wait
+
+        status = limiter.get_status()
+        assert status["requests_last_minute"] == 3
+        assert status["available"] == 0
+        assert status["backend"] == "mmap"
+        assert status["state_file"].endswith(".rate_limit_3.window")
+        assert limiter.health_check()["healthy"]
+        assert limiter.get_stats()["total_requests"] == 3
+
+        limiter.reset()
+        assert limiter.get_status()["requests_last_minute"] == 0
+
+    def test_acquire_async_checks_window_off_loop(self, tmp_path):
+        limiter = CrossProcessRateLimiter(data_dir=str(tmp_path), requests_per_minute=3, backend="mmap")
+        window_try_acquire = limiter._window.try_acquire
+        threads = []
+
+        def recording_try_acquire():
+            threads.append(threading.get_ident())
+            return window_try_acquire()
+
+        limiter._window.try_acquire = recording_try_acquire
+        assert asyncio.run(limiter.acquire_async(timeout=1))
+        assert threads and threading.get_ident() not in threads
+
+    def test_limiters_share_window(self, tmp_path):
+        a = CrossProcessRateLimiter(data_dir=str(tmp_path), requests_per_minute=2, backend="mmap")
+        b = CrossProcessRateLimiter(data_dir=str(tmp_path), requests_per_minute=2, backend="mmap")
+        assert a.try_acquire()
+        b.record_request()
+        assert not a.try_acquire()
+        assert b.get_status()["requests_last_minute"] == 2
+
+    def test_unknown_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            CrossProcessRateLimiter(data_dir=str(tmp_path), backend="redis")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for similarity_engine.py -- vectorized pairwise similarity.
+
+Tests cover:
+- Scores identical to compute_similarity() for cosine, jaccard and auto
+- Chunked computation matching unchunked results
+- Progress reporting and input validation
+- pairwise_similarity_matrix using the engine with an unchanged schema
+"""
+
+import random
+
+import pytest
+
+import similarity_engine  # type: ignore
+from section_analytics import compute_similarity, pairwise_similarity_matrix  # type: ignore
+from similarity_engine import pairwise_scores  # type: ignore
+
+
+_VOCAB = ("biocompatibility cytotoxicity sensitization irritation ISO 10993 fatigue "
+          "torsion PEEK titanium wireless Bluetooth sterilization EO shelf life "
+          "clinical study endpoint").split()
+
+
+def _texts(n, seed=7):
+    rng = random.Random(seed)
+    texts = []
+    for i in range(n):
+        length = rng.choice([5, 20, 150, 400])
+        vocab = _VOCAB if i % 3 else _VOCAB[:4]  # some low-diversity texts
+        texts.append(" ".join(rng.choice(vocab) for _ in range(length)) + ".")
+    texts.append("!!! ---")  # non-empty text with no tokens
+    return texts
+
+
+class TestPairwiseScores:
+
+    @pytest.mark.parametrize("method", ["cosine", "jaccard", "auto"])
+    def test_matches_compute_similarity(self, method):
+        texts = _texts(14)
+        scores = pairwise_scores(texts, method=method)
+        assert len(scores) == len(texts) * (len(texts) - 1) // 2
+        for i, j, score in scores:
+            assert score == compute_similarity(texts[i], texts[j], method=method), (i, j)
+
+    def test_chunked_equals_unchunked(self):
+        texts = _texts(11)
+        assert pairwise_scores(texts, "cosine", chunk_size=3) == pairwise_scores(texts, "cosine")
+
+    def test_row_major_order(self):
+        scores = pairwise_scores(["a b", "b c", "c d", "d e"], "jaccard")
+        assert [(i, j) for i, j, _ in scores] == [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+
+    def test_progress_and_validation(self):
+        calls = []
+        pairwise_scores(_texts(4), "cosine", progress_callback=lambda d, t: calls.append((d, t)))
+        assert calls[-1] == (10, 10)
+        with pytest.raises(ValueError):
+            pairwise_scores(["a", "b"], "sequence")
+        with pytest.raises(ValueError):
+            pairwise_scores(["a", "b"], "cosine", chunk_size=0)
+
+    def test_python_backend(self, monkeypatch):
+        texts = _texts(6)
+        expected = pairwise_scores(texts, "auto")
+        monkeypatch.setattr(similarity_engine, "_SCIPY_AVAILABLE", False)
+        assert similarity_engine.get_backend() == "python"
+        assert pairwise_scores(texts, "auto") == expected
+
+
+class TestPairwiseMatrixIntegration:
+
+    def test_same_result_as_per_pair(self, monkeypatch):
+        data = {f"K{i:06d}": {"sections": {"clinical_testing": {"text": t}}}
+                for i, t in enumerate(_texts(9))}
+        vectorized = pairwise_similarity_matrix(data, "clinical_testing", method="cosine",
+                                                use_cache=False)
+
+        import section_analytics  # type: ignore
+        monkeypatch.setattr(section_analytics, "SIMILARITY_ENGINE_AVAILABLE", False)
+        looped = pairwise_similarity_matrix(data, "clinical_testing", method="cosine",
+                                            use_cache=False)
+        for key in ("scores", "statistics", "most_similar_pair", "least_similar_pair",
+                    "pairs_computed", "devices_compared"):
+            assert vectorized[key] == looped[key]
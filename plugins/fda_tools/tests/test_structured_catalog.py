@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Tests for lib/structured_catalog.py -- metadata catalog of the structured text cache.
+
+Tests cover:
+- Selecting documents by product code, year range and limit
+- Section texts read by byte offset, only when accessed
+- Files without locatable offsets or changed since cataloguing
+- Incremental sync: added, changed and removed documents
+- compare_sections and cross_product_compare selecting through the catalog
+- build_structured_cache cataloguing files as it writes them
+"""
+
+import json
+import os
+
+import pytest
+
+from fda_tools.lib.structured_catalog import (
+    CATALOG_DB_NAME,
+    LazySections,
+    StructuredCatalog,
+    section_offsets,
+)
+
+DOCS = {
+    "K200001": ("DQY", "2020-03-01", {
+        "biocompatibility": "Tested per ISO 10993-5 and \"ISO 10993-10\".",
+        "clinical_testing": "No clinical data.",
+    }),
+    "K210002": ("dqy", "2021-07-15", {"biocompatibility": "Résumé: ISO 10993-1 ≤ limits."}),
+    "K220003": ("OVE", "2022-01-10", {"clinical_testing": "Clinical study of 40 patients."}),
+    "K230004": ("DQY", "", {"device_description": "Catheter."}),
+}
+
+
+def _doc(k_number, product_code, decision_date, sections):
+    return {
+        "k_number": k_number,
+        "decision_date": decision_date,
+        "full_text": " ".join(sections.values()) * 50,
+        "sections": {name: {"text": text, "tier": "tier1"} for name, text in sections.items()},
+        "ocr_quality": "HIGH",
+        "ocr_confidence": 0.98,
+        "metadata": {"product_code": product_code},
+    }
+
+
+@pytest.fixture
+def structured_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    directory = tmp_path / "fda-510k-data" / "extraction" / "structured_text_cache"
+    directory.mkdir(parents=True)
+    for k_number, (product_code, decision_date, sections) in DOCS.items():
+        doc = _doc(k_number, product_code, decision_date, sections)
+        (directory / f"{k_number}.json").write_text(json.dumps(doc, indent=2))
+    (directory / "manifest.json").write_text(json.dumps({"total_devices": 4}))
+    return directory
+
+
+@pytest.fixture
+def catalog(structured_dir):
+    catalog = StructuredCatalog(structured_dir)
+    catalog.sync()
+    yield catalog
+    catalog.close()
+
+
+class TestSelect:
+
+    def test_select_by_product_code_and_year(self, catalog):
+        assert len(catalog) == 4
+        assert list(catalog.select(["DQY"])) == ["K210002", "K200001", "K230004"]
+        assert list(catalog.select(["dqy"], year_start=2021)) == ["K210002"]
+        assert list(catalog.select(year_start=2020, year_end=2021)) == ["K210002", "K200001"]
+        assert list(catalog.select(limit=1)) == ["K220003"]
+        assert catalog.select([]) == {}
+
+    def test_document_fields(self, catalog):
+        doc = catalog.select(["OVE"])["K220003"]
+        assert doc["product_code"] == "OVE"
+        assert doc["metadata"] == {"product_code": "OVE"}
+        assert doc["decision_date"] == "2022-01-10"
+        assert doc["ocr_quality"] == "HIGH"
+        assert "full_text" not in doc
+        assert "device_name" not in doc
+
+
+class TestLazySections:
+
+    def test_sections_read_on_access(self, catalog, structured_dir):
+        sections = catalog.select(["DQY"])["K200001"]["sections"]
+        assert isinstance(sections, LazySections)
+        assert list(sections) == ["biocompatibility", "clinical_testing"]
+        assert "predicate_se" not in sections
+        expected = DOCS["K200001"][2]["biocompatibility"]
+        assert sections["biocompatibility"] == {"text": expected, "tier": "tier1"}
+        assert catalog.select(["DQY"])["K210002"]["sections"]["biocompatibility"]["text"] == \
+            DOCS["K210002"][2]["biocompatibility"]
+        with pytest.raises(KeyError):
+            sections["predicate_se"]
+
+    def test_offsets_point_at_section_text(self, structured_dir):
+        raw = (structured_dir / "K200001.json").read_bytes()
+        doc = json.loads(raw)
+        for name, (offset, length) in section_offsets(raw, doc).items():
+            assert json.loads(raw[offset:offset + length]) == doc["sections"][name]["text"]
+
+    def test_unlocatable_text_parsed_whole(self, tmp_path):
+        doc = _doc("K200009", "DQY", "2020-01-01", {"biocompatibility": "Résumé"})
+        path = tmp_path / "K200009.json"
+        path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
+        catalog = StructuredCatalog(tmp_path)
+        catalog.sync()
+        assert section_offsets(path.read_bytes(), doc) == {"biocompatibility": None}
+        assert catalog.select()["K200009"]["sections"]["biocompatibility"]["text"] == "Résumé"
+
+    def test_file_changed_after_select(self, catalog, structured_dir):
+        sections = catalog.select(["OVE"])["K220003"]["sections"]
+        doc = _doc("K220003", "OVE", "2022-01-10", {"clinical_testing": "Rewritten."})
+        (structured_dir / "K220003.json").write_text(json.dumps(doc))
+        assert sections["clinical_testing"]["text"] == "Rewritten."
+
+
+class TestSync:
+
+    def test_incremental_sync(self, catalog, structured_dir):
+        assert catalog.sync(force=True) == {"added": 0, "updated": 0, "removed": 0, "unchanged": 4}
+
+        (structured_dir / "K230004.json").unlink()
+        doc = _doc("K220003", "OVF", "2022-01-10", {"clinical_testing": "x"})
+        path = structured_dir / "K220003.json"
+        path.write_text(json.dumps(doc))
+        os.utime(path, ns=(1, 1))
+        (structured_dir / "K240005.json").write_text(json.dumps(_doc("K240005", "OVE", "2024-02-02", {})))
+        assert catalog.sync() == {"added": 1, "updated": 1, "removed": 1, "unchanged": 2}
+        assert list(catalog.select(["OVE", "OVF"])) == ["K240005", "K220003"]
+        assert StructuredCatalog.exists(structured_dir)
+        assert (structured_dir / CATALOG_DB_NAME).exists()
+
+    def test_file_rewritten_in_place(self, catalog, structured_dir):
+        catalog.sync()
+        dir_mtime = structured_dir.stat().st_mtime_ns
+        path = structured_dir / "K220003.json"
+        path.write_text(json.dumps(_doc("K220003", "OVF", "2022-01-10", {"clinical_testing": "x"})))
+        os.utime(path, ns=(1, 1))
+        assert structured_dir.stat().st_mtime_ns == dir_mtime
+        assert catalog.sync() == {"added": 0, "updated": 1, "removed": 0, "unchanged": 3}
+        assert list(catalog.select(["OVF"])) == ["K220003"]
+
+
+class TestConsumers:
+
+    def test_compare_sections_selects_through_catalog(self, structured_dir):
+        compare_sections = pytest.importorskip("compare_sections")
+        cache = compare_sections.load_structured_cache(["DQY"], 2020, 2021)
+        assert set(cache) == {"K200001", "K210002"}
+        assert StructuredCatalog.exists(structured_dir)
+
+        batch = compare_sections.extract_sections_batch(cache, ["clinical_testing"])
+        assert list(batch) == ["K200001"]
+        assert batch["K200001"]["sections"]["clinical_testing"]["word_count"] == 3
+        assert batch["K200001"]["product_code"] == "DQY"
+
+    def test_compare_sections_without_catalog(self, structured_dir, monkeypatch):
+        compare_sections = pytest.importorskip("compare_sections")
+        monkeypatch.setattr(compare_sections, "_CATALOG_AVAILABLE", False)
+        cache = compare_sections.load_structured_cache(["DQY"], 2020, 2021)
+        assert set(cache) == {"K200001", "K210002"}
+        assert not StructuredCatalog.exists(structured_dir)
+
+    def test_cross_product_compare_with_catalog(self, catalog):
+        section_analytics = pytest.importorskip("section_analytics")
+        result = section_analytics.cross_product_compare(
+            ["DQY", "OVE"], ["clinical_testing"], catalog)
+        comparison = result["comparison"]["clinical_testing"]
+        assert comparison["DQY"]["device_count"] == 3
+        assert comparison["DQY"]["devices_with_section"] == 1
+        assert comparison["OVE"]["avg_word_count"] == 5.0
+
+    def test_build_catalogs_written_files(self, tmp_path):
+        build_structured_cache = pytest.importorskip("build_structured_cache")
+        cache_dir = tmp_path / "cache"
+        (cache_dir / "devices").mkdir(parents=True)
+        text = "DEVICE DESCRIPTION\nA PEEK spacer.\nINDICATIONS FOR USE\nFusion.\n"
+        (cache_dir / "devices" / "K250001.json").write_text(json.dumps(
+            {"text": text, "metadata": {"product_code": "MAX"}}))
+        (cache_dir / "index.json").write_text(json.dumps(
+            {"K250001": {"file_path": "cache/devices/K250001.json"}}))
+        output = tmp_path / "structured"
+        build_structured_cache.build_structured_cache(
+            cache_dir / "index.json", output, update_index=False)
+
+        catalog = StructuredCatalog(output)
+        sections = catalog.select(["MAX"])["K250001"]["sections"]
+        assert sections["device_description"]["text"].startswith("DEVICE DESCRIPTION")
+        assert sections["device_description"]["tier"] == "tier1"
+        assert catalog.sync(force=True) == {"added": 0, "updated": 0, "removed": 0, "unchanged": 1}
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for lib/text_corpus.py -- memory-mapped read-only text corpus.
+
+Tests cover:
+- Round trip of unicode, empty and missing documents
+- Atomic write replacing an existing corpus
+- Pool workers attaching to the corpus by path (no text in initargs)
+"""
+
+import json
+from multiprocessing import Pool
+
+import pytest
+
+from fda_tools.lib.text_corpus import MappedCorpus, write_corpus
+
+
+_WORKER_CORPUS = None
+
+
+def _attach(path):
+    global _WORKER_CORPUS
+    _WORKER_CORPUS = MappedCorpus(path)
+
+
+def _length(key):
+    return key, len(_WORKER_CORPUS.get(key))
+
+
+class TestMappedCorpus:
+
+    def test_round_trip(self, tmp_path):
+        docs = {"/pdfs/K1.pdf": "Predicate K190001 — µm ±5%", "/pdfs/K2.pdf": "", "/pdfs/K3.pdf": None}
+        assert write_corpus(tmp_path / "corpus", docs.items()) == 3
+
+        with MappedCorpus(tmp_path / "corpus") as corpus:
+            assert len(corpus) == 3
+            assert corpus.get("/pdfs/K1.pdf") == docs["/pdfs/K1.pdf"]
+            assert corpus["/pdfs/K2.pdf"] == ""
+            assert corpus.get("/pdfs/K3.pdf") == ""
+            assert corpus.get("/pdfs/missing.pdf") is None
+            assert "/pdfs/K1.pdf" in corpus
+            assert list(corpus) == list(docs)
+            with pytest.raises(KeyError):
+                corpus["/pdfs/missing.pdf"]
+
+    def test_empty_corpus(self, tmp_path):
+        write_corpus(tmp_path / "corpus", [])
+        with MappedCorpus(tmp_path / "corpus") as corpus:
+            assert len(corpus) == 0
+            assert corpus.get("x") is None
+
+    def test_rewrite_and_version_check(self, tmp_path):
+        write_corpus(tmp_path / "corpus", [("a", "old text")])
+        write_corpus(tmp_path / "corpus", [("a", "new")])
+        assert MappedCorpus(tmp_path / "corpus")["a"] == "new"
+        assert not list(tmp_path.glob("*.tmp"))
+
+        (tmp_path / "corpus.idx").write_text(json.dumps({"version": 99, "documents": {}}))
+        with pytest.raises(ValueError):
+            MappedCorpus(tmp_path / "corpus")
+
+    def test_pool_workers_attach_by_path(self, tmp_path):
+        docs = {f"doc{i}": "x" * i for i in range(50)}
+        write_corpus(tmp_path / "corpus", docs.items())
+        with Pool(2, initializer=_attach, initargs=(str(tmp_path / "corpus"),)) as pool:
+            results = dict(pool.map(_length, list(docs)))
+        assert results == {key: len(text) for key, text in docs.items()}
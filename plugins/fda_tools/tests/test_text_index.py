@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for lib/text_index.py -- inverted index over the structured text cache.
+
+Tests cover:
+- Word and phrase lookups with section and K-number filters
+- Incremental sync: added, changed (including rewritten in place) and removed documents
+- Product-code map parsed once from the pmn files
+- full_text_search answering from the index with the same results as a scan
+- build_structured_cache indexing files as it writes them
+"""
+
+import json
+import os
+
+import pytest
+
+from fda_tools.lib.text_index import INDEX_DB_NAME, StructuredTextIndex, tokenize
+from fda_tools.scripts import full_text_search
+
+
+DOCS = {
+    "K200001": {
+        "device_description": "Wireless pulse oximeter with Bluetooth Low Energy radio.",
+        "predicate_se": "Substantially equivalent to K190001; both use Bluetooth.",
+    },
+    "K200002": {
+        "device_description": "Wired sensor. Low energy consumption; no bluetooth radio.",
+        "biocompatibility": "PEEK housing tested per ISO 10993.",
+    },
+    "K200003": {
+        "performance_testing": "Bluetooth low energy low energy range testing.",
+    },
+}
+
+
+def _write_doc(directory, k_number, sections):
+    doc = {
+        "k_number": k_number,
+        "full_text": "\n\n".join(sections.values()),
+        "sections": {name: {"text": text} for name, text in sections.items()},
+    }
+    path = directory / f"{k_number}.json"
+    path.write_text(json.dumps(doc))
+    return doc, path
+
+
+@pytest.fixture
+def structured_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    directory = tmp_path / "fda-510k-data" / "extraction" / "structured_text_cache"
+    directory.mkdir(parents=True)
+    for k_number, sections in DOCS.items():
+        _write_doc(directory, k_number, sections)
+    return directory
+
+
+class TestStructuredTextIndex:
+
+    def test_tokenize_offsets(self):
+        assert tokenize("PEEK, titanium-alloy") == [("peek", 0), ("titanium", 6), ("alloy", 15)]
+
+    def test_word_and_phrase_lookup(self, structured_dir):
+        index = StructuredTextIndex(structured_dir)
+        assert index.sync() == {"added": 3, "updated": 0, "removed": 0, "unchanged": 0}
+
+        sections = {(k, s) for k, s, _ in index.find("bluetooth")}
+        assert ("K200001", "predicate_se") in sections
+        assert ("K200002", "device_description") in sections
+
+        phrase = index.find("Bluetooth Low Energy", sections=["device_description",
+                                                               "performance_testing"])
+        assert phrase == [("K200001", "device_description", 29),
+                          ("K200003", "performance_testing", 0)]
+        assert index.find("low energy", k_numbers=["K200002"], sections=["device_description"]) == [
+            ("K200002", "device_description", 14)]
+        # Both words occur in K200002, but not adjacent
+        assert index.find("energy radio", k_numbers=["K200002"]) == []
+        assert index.find("titanium") == []
+
+    def test_incremental_sync(self, structured_dir):
+        index = StructuredTextIndex(structured_dir)
+        index.sync()
+        assert index.sync() == {"added": 0, "updated": 0, "removed": 0, "unchanged": 3}
+
+        (structured_dir / "K200003.json").unlink()
+        _, path = _write_doc(structured_dir, "K200001", {"device_description": "Titanium stem."})
+        os.utime(path, ns=(1, 1))  # distinct mtime even on coarse filesystems
+        counts = index.sync(force=True)
+        assert counts == {"added": 0, "updated": 1, "removed": 1, "unchanged": 1}
+        assert len(index) == 2
+        assert index.find("titanium") == [("K200001", "device_description", 0),
+                                          ("K200001", "full_text", 0)]
+        assert [h for h in index.find("bluetooth") if h[0] == "K200001"] == []
+
+    def test_file_rewritten_in_place(self, structured_dir):
+        index = StructuredTextIndex(structured_dir)
+        index.sync()
+        dir_mtime = structured_dir.stat().st_mtime_ns
+        _, path = _write_doc(structured_dir, "K200002", {"device_description": "Titanium stem."})
+        os.utime(path, ns=(1, 1))
+        assert structured_dir.stat().st_mtime_ns == dir_mtime
+        assert index.sync() == {"added": 0, "updated": 1, "removed": 0, "unchanged": 2}
+        assert index.find("titanium", sections=["device_description"]) == [
+            ("K200002", "device_description", 0)]
+
+    def test_product_code_map_cached(self, structured_dir, tmp_path):
+        pmn = tmp_path / "pmn96cur.txt"
+        row = ["K200001"] + [""] * 13 + ["DQA"]
+        pmn.write_text("|".join(row) + "\n" + "|".join(["K200002"] + [""] * 13 + ["OVE"]) + "\n")
+        index = StructuredTextIndex(structured_dir)
+        assert index.k_numbers_for_product_codes(["DQA"], [pmn]) == {"K200001": "DQA"}
+
+        pmn.write_text("garbage")  # same signature check: size changed -> reparsed
+        assert index.k_numbers_for_product_codes(["DQA"], [pmn]) == {}
+
+
+class TestFullTextSearchIndexed:
+
+    @pytest.mark.parametrize("terms,sections", [
+        (["bluetooth"], None),
+        (["Bluetooth Low Energy", "PEEK"], None),
+        (["low energy"], ["device_description"]),
+        (["ISO 10993", "missing-term"], None),
+    ])
+    def test_index_matches_scan(self, structured_dir, terms, sections):
+        scanned = full_text_search.search_all_sections(terms, sections=sections, use_index=False)
+        StructuredTextIndex(structured_dir).sync()
+        indexed = full_text_search.search_all_sections(terms, sections=sections)
+        assert indexed == scanned
+        assert indexed or terms[0] == "ISO 10993" and scanned == []
+
+    def test_index_does_not_load_unmatched_docs(self, structured_dir, monkeypatch):
+        StructuredTextIndex(structured_dir).sync()
+        opened = []
+        real_open = open
+
+        def tracking_open(path, *args, **kwargs):
+            opened.append(str(path))
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", tracking_open)
+        results = full_text_search.search_all_sections(["PEEK"])
+        assert {r["k_number"] for r in results} == {"K200002"}
+        assert [p for p in opened if p.endswith(".json")] == [
+            str(structured_dir / "K200002.json")]
+
+
+class TestBuildStructuredCacheIndexing:
+
+    def test_build_indexes_written_files(self, tmp_path):
+        build_structured_cache = pytest.importorskip("build_structured_cache")
+        cache_dir = tmp_path / "cache"
+        (cache_dir / "devices").mkdir(parents=True)
+        (cache_dir / "devices" / "K210001.json").write_text(json.dumps({
+            "text": "DEVICE DESCRIPTION\nA titanium bone screw with PEEK washer.\n" * 3,
+        }))
+        (cache_dir / "index.json").write_text(json.dumps({
+            "K210001": {"file_path": "cache/devices/K210001.json"},
+        }))
+        output = tmp_path / "structured"
+        build_structured_cache.build_structured_cache(cache_dir / "index.json", output)
+
+        assert (output / INDEX_DB_NAME).exists()
+        index = StructuredTextIndex(output)
+        assert {k for k, _, _ in index.find("titanium bone screw")} == {"K210001"}
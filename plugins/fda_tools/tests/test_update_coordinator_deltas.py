@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for delta refresh in scripts/update_coordinator.py.
+
+Tests cover:
+- refresh_endpoint() upserting each fetched page in one batch, no re-fetches
+- A failed page leaving last_refresh where it was
+- detect_deltas() + apply_updates() reusing the records fetched during detection
+- Batched lookups for IDs detection did not fetch
+- Endpoints without a delta window
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("psycopg2", reason="update_coordinator requires psycopg2")
+
+from fda_tools.scripts.fda_api_client import RecordIterationError
+from fda_tools.scripts.update_coordinator import UpdateCoordinator
+
+
+class FakeClient:
+    def __init__(self, pages):
+        self.pages = pages
+        self.iter_calls = []
+        self.requests = []
+
+    def iter_pages(self, endpoint, search=None, sort=None, checkpoint=None, **kwargs):
+        self.iter_calls.append((endpoint, search, sort))
+        for page in self.pages:
+            if isinstance(page, Exception):
+                raise page
+            yield page
+
+    def _request(self, endpoint, params):
+        self.requests.append(params)
+        return {"results": [{"k_number": "K000009", "device_name": "late"}]}
+
+
+@pytest.fixture
+def coordinator(tmp_path):
+    coordinator = UpdateCoordinator.__new__(UpdateCoordinator)
+    coordinator.state_file = tmp_path / "blue_green_state.json"
+    coordinator.green_db = MagicMock()
+    coordinator.green_db.upsert_many.side_effect = lambda endpoint, records: len(list(records))
+    coordinator._delta_records = {}
+    return coordinator
+
+
+PAGES = [
+    [{"k_number": "K000001"}, {"k_number": "K000002"}],
+    [{"k_number": "K000003"}, {"device_name": "no id"}],
+]
+
+
+class TestRefreshEndpoint:
+
+    def test_upserts_each_page(self, coordinator):
+        coordinator.api_client = FakeClient(PAGES)
+        assert coordinator.refresh_endpoint("510k", since_timestamp=1.7e9) == 3
+        assert coordinator.green_db.upsert_many.call_count == 2
+        assert coordinator.api_client.requests == []
+        endpoint, search, sort = coordinator.api_client.iter_calls[0]
+        assert search.startswith("decision_date:[")
+        assert sort == "decision_date:asc"
+
+    def test_stops_on_page_failure(self, coordinator):
+        coordinator.api_client = FakeClient([PAGES[0], RecordIterationError("boom")])
+        with pytest.raises(RecordIterationError):
+            coordinator.refresh_endpoint("510k", since_timestamp=1.7e9)
+        assert coordinator.green_db.upsert_many.call_count == 1
+
+    def test_main_keeps_last_refresh_on_failure(self, coordinator, monkeypatch):
+        import sys
+        from fda_tools.scripts import update_coordinator
+
+        coordinator.api_client = FakeClient([PAGES[0], RecordIterationError("boom")])
+        coordinator._ensure_green_db = lambda: None
+        coordinator.blue_db = MagicMock()
+        state = {"last_refresh": {"510k": 1.7e9}}
+        saved = []
+        coordinator._load_state = lambda: state
+        coordinator._save_state = saved.append
+        monkeypatch.setattr(update_coordinator, "UpdateCoordinator", lambda: coordinator)
+        monkeypatch.setattr(sys, "argv", ["update_coordinator.py", "refresh", "--endpoint", "510k"])
+        assert update_coordinator.main() == 1
+        assert saved == []
+        assert state["last_refresh"]["510k"] == 1.7e9
+
+    def test_no_delta_window(self, coordinator):
+        coordinator.api_client = FakeClient(PAGES)
+        assert coordinator.refresh_endpoint("classification", since_timestamp=1.7e9) == 0
+        assert coordinator.refresh_endpoint("510k", since_timestamp=None) == 0
+        assert coordinator.api_client.iter_calls == []
+
+
+class TestDetectAndApply:
+
+    def test_apply_reuses_detected_records(self, coordinator):
+        coordinator.api_client = FakeClient(PAGES)
+        ids = coordinator.detect_deltas("510k", since_timestamp=1.7e9)
+        assert ids == ["K000001", "K000002", "K000003"]
+
+        assert coordinator.apply_updates("510k", ids) == 3
+        assert coordinator.api_client.requests == []
+        coordinator.green_db.upsert_many.assert_called_once()
+        assert coordinator._delta_records["510k"] == {}
+
+    def test_missing_ids_fetched_in_batches(self, coordinator):
+        coordinator.api_client = FakeClient([])
+        assert coordinator.apply_updates("510k", ["K000009", "K000010"]) == 1
+        assert len(coordinator.api_client.requests) == 1
+        assert coordinator.api_client.requests[0]["search"] == 'k_number:"K000009"+k_number:"K000010"'
+
+    def test_no_ids(self, coordinator):
+        assert coordinator.apply_updates("510k", []) == 0
+        coordinator.green_db.upsert_many.assert_not_called()